@@ -1,1680 +1,1686 @@
 -- Jerarquia generada automaticamente desde CSV
+DELETE FROM NOMBRE_ALIAS;
 DELETE FROM PARROQUIAS;
 DELETE FROM CANTONES;
 DELETE FROM PROVINCIAS;
 COMMIT;
-INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE) VALUES (1, '01', 'Azuay');
-INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE) VALUES (2, '02', 'BolÃ­var');
-INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE) VALUES (3, '03', 'CaÃ±ar');
-INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE) VALUES (4, '04', 'Carchi');
-INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE) VALUES (5, '05', 'Cotopaxi');
-INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE) VALUES (6, '06', 'Chimborazo');
-INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE) VALUES (7, '07', 'El Oro');
-INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE) VALUES (8, '08', 'Esmeraldas');
-INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE) VALUES (9, '09', 'Guayas');
-INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE) VALUES (10, '10', 'Imbabura');
-INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE) VALUES (11, '11', 'Loja');
-INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE) VALUES (12, '12', 'Los Rios');
-INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE) VALUES (13, '13', 'Manabi');
-INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE) VALUES (14, '14', 'Morona Santiago');
-INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE) VALUES (15, '15', 'Napo');
-INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE) VALUES (16, '16', 'Pastaza');
-INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE) VALUES (17, '17', 'Pichincha');
-INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE) VALUES (18, '18', 'Tungurahua');
-INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE) VALUES (19, '19', 'Zamora Chinchipe');
-INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE) VALUES (20, '20', 'GalÃ¡pagos');
-INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE) VALUES (21, '21', 'SucumbÃ­os');
-INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE) VALUES (22, '22', 'Orellana');
-INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE) VALUES (23, '23', 'Santo Domingo de Los TsÃ¡chilas');
-INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE) VALUES (24, '24', 'Santa Elena');
-INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE) VALUES (25, '25', 'Zonas No Delimitadas');
+INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1, '01', 'Azuay', 'AZUAY');
+INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (2, '02', 'Bolívar', 'BOLIVAR');
+INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (3, '03', 'Cañar', 'CANAR');
+INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (4, '04', 'Carchi', 'CARCHI');
+INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (5, '05', 'Cotopaxi', 'COTOPAXI');
+INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (6, '06', 'Chimborazo', 'CHIMBORAZO');
+INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (7, '07', 'El Oro', 'EL ORO');
+INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (8, '08', 'Esmeraldas', 'ESMERALDAS');
+INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (9, '09', 'Guayas', 'GUAYAS');
+INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (10, '10', 'Imbabura', 'IMBABURA');
+INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (11, '11', 'Loja', 'LOJA');
+INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (12, '12', 'Los Rios', 'LOS RIOS');
+INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (13, '13', 'Manabi', 'MANABI');
+INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (14, '14', 'Morona Santiago', 'MORONA SANTIAGO');
+INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (15, '15', 'Napo', 'NAPO');
+INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (16, '16', 'Pastaza', 'PASTAZA');
+INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (17, '17', 'Pichincha', 'PICHINCHA');
+INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (18, '18', 'Tungurahua', 'TUNGURAHUA');
+INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (19, '19', 'Zamora Chinchipe', 'ZAMORA CHINCHIPE');
+INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (20, '20', 'Galápagos', 'GALAPAGOS');
+INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (21, '21', 'Sucumbíos', 'SUCUMBIOS');
+INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (22, '22', 'Orellana', 'ORELLANA');
+INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (23, '23', 'Santo Domingo de Los Tsáchilas', 'SANTO DOMINGO DE LOS TSACHILAS');
+INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (24, '24', 'Santa Elena', 'SANTA ELENA');
+INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (25, '25', 'Zonas No Delimitadas', 'ZONAS NO DELIMITADAS');
 
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (1, 1, '0101', 'Cuenca');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (2, 1, '0102', 'GirÃ³n');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (3, 1, '0103', 'Gualaceo');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (4, 1, '0104', 'NabÃ³n');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (5, 1, '0105', 'Paute');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (6, 1, '0106', 'Pucara');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (7, 1, '0107', 'San Fernando');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (8, 1, '0108', 'Santa Isabel');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (9, 1, '0109', 'Sigsig');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (10, 1, '0110', 'OÃ±a');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (11, 1, '0111', 'Chordeleg');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (12, 1, '0112', 'El Pan');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (13, 1, '0113', 'Sevilla de Oro');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (14, 1, '0114', 'Guachapala');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (15, 1, '0115', 'Camilo Ponce EnrÃ­quez');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (16, 2, '0201', 'Guaranda');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (17, 2, '0202', 'Chillanes');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (18, 2, '0203', 'Chimbo');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (19, 2, '0204', 'EcheandÃ­a');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (20, 2, '0205', 'San Miguel');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (21, 2, '0206', 'Caluma');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (22, 2, '0207', 'Las Naves');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (23, 3, '0301', 'Azogues');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (24, 3, '0302', 'BibliÃ¡n');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (25, 3, '0303', 'CaÃ±ar');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (26, 3, '0304', 'La Troncal');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (27, 3, '0305', 'El Tambo');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (28, 3, '0306', 'DÃ©leg');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (29, 3, '0307', 'Suscal');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (30, 4, '0401', 'TulcÃ¡n');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (31, 4, '0402', 'BolÃ­var');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (32, 4, '0403', 'Espejo');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (33, 4, '0404', 'Mira');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (34, 4, '0405', 'MontÃºfar');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (35, 4, '0406', 'San Pedro de Huaca');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (36, 5, '0501', 'Latacunga');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (37, 5, '0502', 'La ManÃ¡');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (38, 5, '0503', 'Pangua');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (39, 5, '0504', 'Pujili');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (40, 5, '0505', 'Salcedo');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (41, 5, '0506', 'SaquisilÃ­');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (42, 5, '0507', 'Sigchos');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (43, 6, '0601', 'Riobamba');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (44, 6, '0602', 'Alausi');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (45, 6, '0603', 'Colta');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (46, 6, '0604', 'Chambo');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (47, 6, '0605', 'Chunchi');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (48, 6, '0606', 'Guamote');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (49, 6, '0607', 'Guano');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (50, 6, '0608', 'Pallatanga');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (51, 6, '0609', 'Penipe');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (52, 6, '0610', 'CumandÃ¡');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (53, 7, '0701', 'Machala');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (54, 7, '0702', 'Arenillas');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (55, 7, '0703', 'Atahualpa');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (56, 7, '0704', 'Balsas');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (57, 7, '0705', 'Chilla');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (58, 7, '0706', 'El Guabo');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (59, 7, '0707', 'Huaquillas');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (60, 7, '0708', 'MarcabelÃ­');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (61, 7, '0709', 'Pasaje');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (62, 7, '0710', 'PiÃ±as');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (63, 7, '0711', 'Portovelo');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (64, 7, '0712', 'Santa Rosa');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (65, 7, '0713', 'Zaruma');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (66, 7, '0714', 'Las Lajas');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (67, 8, '0801', 'Esmeraldas');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (68, 8, '0802', 'Eloy Alfaro');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (69, 8, '0803', 'Muisne');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (70, 8, '0804', 'QuinindÃ©');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (71, 8, '0805', 'San Lorenzo');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (72, 8, '0806', 'Atacames');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (73, 8, '0807', 'Rioverde');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (74, 8, '0808', 'La Concordia');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (75, 9, '0901', 'Guayaquil');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (76, 9, '0902', 'Alfredo Baquerizo Moreno (JujÃ¡n)');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (77, 9, '0903', 'Balao');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (78, 9, '0904', 'Balzar');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (79, 9, '0905', 'Colimes');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (80, 9, '0906', 'Daule');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (81, 9, '0907', 'DurÃ¡n');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (82, 9, '0908', 'El Empalme');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (83, 9, '0909', 'El Triunfo');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (84, 9, '0910', 'Milagro');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (85, 9, '0911', 'Naranjal');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (86, 9, '0912', 'Naranjito');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (87, 9, '0913', 'Palestina');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (88, 9, '0914', 'Pedro Carbo');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (89, 9, '0915', 'SamborondÃ³n');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (90, 9, '0916', 'Santa LucÃ­a');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (91, 9, '0917', 'Salitre (Urbina Jado)');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (92, 9, '0918', 'San Jacinto de Yaguachi');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (93, 9, '0919', 'Playas');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (94, 9, '0920', 'SimÃ³n BolÃ­var');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (95, 9, '0921', 'Coronel Marcelino MaridueÃ±a');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (96, 9, '0922', 'Lomas de Sargentillo');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (97, 9, '0923', 'Nobol');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (98, 9, '0924', 'General Antonio Elizalde');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (99, 9, '0925', 'Isidro Ayora');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (100, 10, '1001', 'Ibarra');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (101, 10, '1002', 'Antonio Ante');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (102, 10, '1003', 'Cotacachi');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (103, 10, '1004', 'Otavalo');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (104, 10, '1005', 'Pimampiro');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (105, 10, '1006', 'San Miguel de UrcuquÃ­');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (106, 11, '1101', 'Loja');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (107, 11, '1102', 'Calvas');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (108, 11, '1103', 'Catamayo');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (109, 11, '1104', 'Celica');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (110, 11, '1105', 'Chaguarpamba');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (111, 11, '1106', 'EspÃ­ndola');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (112, 11, '1107', 'GonzanamÃ¡');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (113, 11, '1108', 'MacarÃ¡');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (114, 11, '1109', 'Paltas');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (115, 11, '1110', 'Puyango');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (116, 11, '1111', 'Saraguro');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (117, 11, '1112', 'Sozoranga');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (118, 11, '1113', 'Zapotillo');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (119, 11, '1114', 'Pindal');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (120, 11, '1115', 'Quilanga');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (121, 11, '1116', 'Olmedo');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (122, 12, '1201', 'Babahoyo');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (123, 12, '1202', 'Baba');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (124, 12, '1203', 'Montalvo');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (125, 12, '1204', 'Puebloviejo');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (126, 12, '1205', 'Quevedo');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (127, 12, '1206', 'Urdaneta');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (128, 12, '1207', 'Ventanas');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (129, 12, '1208', 'VÃ­nces');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (130, 12, '1209', 'Palenque');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (131, 12, '1210', 'Buena FÃ©');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (132, 12, '1211', 'Valencia');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (133, 12, '1212', 'Mocache');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (134, 12, '1213', 'Quinsaloma');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (135, 13, '1301', 'Portoviejo');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (136, 13, '1302', 'BolÃ­var');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (137, 13, '1303', 'Chone');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (138, 13, '1304', 'El Carmen');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (139, 13, '1305', 'Flavio Alfaro');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (140, 13, '1306', 'Jipijapa');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (141, 13, '1307', 'JunÃ­n');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (142, 13, '1308', 'Manta');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (143, 13, '1309', 'Montecristi');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (144, 13, '1310', 'PajÃ¡n');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (145, 13, '1311', 'Pichincha');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (146, 13, '1312', 'Rocafuerte');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (147, 13, '1313', 'Santa Ana');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (148, 13, '1314', 'Sucre');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (149, 13, '1315', 'Tosagua');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (150, 13, '1316', '24 de Mayo');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (151, 13, '1317', 'Pedernales');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (152, 13, '1318', 'Olmedo');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (153, 13, '1319', 'Puerto LÃ³pez');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (154, 13, '1320', 'Jama');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (155, 13, '1321', 'JaramijÃ³');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (156, 13, '1322', 'San Vicente');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (157, 14, '1401', 'Morona');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (158, 14, '1402', 'Gualaquiza');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (159, 14, '1403', 'LimÃ³n Indanza');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (160, 14, '1404', 'Palora');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (161, 14, '1405', 'Santiago');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (162, 14, '1406', 'SucÃºa');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (163, 14, '1407', 'Huamboya');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (164, 14, '1408', 'San Juan Bosco');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (165, 14, '1409', 'Taisha');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (166, 14, '1410', 'LogroÃ±o');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (167, 14, '1411', 'Pablo Sexto');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (168, 14, '1412', 'Tiwintza');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (169, 15, '1501', 'Tena');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (170, 15, '1502', 'Archidona');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (171, 15, '1503', 'El Chaco');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (172, 15, '1504', 'Quijos');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (173, 15, '1505', 'Carlos Julio Arosemena Tola');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (174, 16, '1601', 'Pastaza');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (175, 16, '1602', 'Mera');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (176, 16, '1603', 'Santa Clara');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (177, 16, '1604', 'Arajuno');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (178, 17, '1701', 'Quito');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (179, 17, '1702', 'Cayambe');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (180, 17, '1703', 'Mejia');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (181, 17, '1704', 'Pedro Moncayo');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (182, 17, '1705', 'RumiÃ±ahui');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (183, 17, '1706', 'San Miguel de Los Bancos');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (184, 17, '1707', 'Pedro Vicente Maldonado');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (185, 17, '1708', 'Puerto Quito');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (186, 18, '1801', 'Ambato');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (187, 18, '1802', 'BaÃ±os de Agua Santa');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (188, 18, '1803', 'Cevallos');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (189, 18, '1804', 'Mocha');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (190, 18, '1805', 'Patate');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (191, 18, '1806', 'Quero');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (192, 18, '1807', 'San Pedro de Pelileo');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (193, 18, '1808', 'Santiago de PÃ­llaro');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (194, 18, '1809', 'Tisaleo');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (195, 19, '1901', 'Zamora');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (196, 19, '1902', 'Chinchipe');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (197, 19, '1903', 'Nangaritza');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (198, 19, '1904', 'Yacuambi');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (199, 19, '1905', 'Yantzaza (Yanzatza)');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (200, 19, '1906', 'El Pangui');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (201, 19, '1907', 'Centinela del CÃ³ndor');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (202, 19, '1908', 'Palanda');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (203, 19, '1909', 'Paquisha');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (204, 20, '2001', 'San CristÃ³bal');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (205, 20, '2002', 'Isabela');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (206, 20, '2003', 'Santa Cruz');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (207, 21, '2101', 'Lago Agrio');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (208, 21, '2102', 'Gonzalo Pizarro');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (209, 21, '2103', 'Putumayo');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (210, 21, '2104', 'Shushufindi');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (211, 21, '2105', 'SucumbÃ­os');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (212, 21, '2106', 'Cascales');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (213, 21, '2107', 'Cuyabeno');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (214, 22, '2201', 'Orellana');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (215, 22, '2202', 'Aguarico');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (216, 22, '2203', 'La Joya de Los Sachas');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (217, 22, '2204', 'Loreto');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (218, 23, '2301', 'Santo Domingo');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (219, 24, '2401', 'Santa Elena');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (220, 24, '2402', 'La Libertad');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (221, 24, '2403', 'Salinas');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (222, 25, '2501', 'Las Golondrinas');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (223, 25, '2502', 'Manga del Cura');
-INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) VALUES (224, 25, '2503', 'El Piedrero');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1, 1, '0101', 'Cuenca', 'CUENCA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (2, 1, '0102', 'GirÃ³n', 'GIRON');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (3, 1, '0103', 'Gualaceo', 'GUALACEO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (4, 1, '0104', 'NabÃ³n', 'NABON');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (5, 1, '0105', 'Paute', 'PAUTE');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (6, 1, '0106', 'Pucara', 'PUCARA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (7, 1, '0107', 'San Fernando', 'SAN FERNANDO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (8, 1, '0108', 'Santa Isabel', 'SANTA ISABEL');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (9, 1, '0109', 'Sigsig', 'SIGSIG');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (10, 1, '0110', 'OÃ±a', 'ONA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (11, 1, '0111', 'Chordeleg', 'CHORDELEG');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (12, 1, '0112', 'El Pan', 'EL PAN');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (13, 1, '0113', 'Sevilla de Oro', 'SEVILLA DE ORO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (14, 1, '0114', 'Guachapala', 'GUACHAPALA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (15, 1, '0115', 'Camilo Ponce EnrÃ­quez', 'CAMILO PONCE ENRIQUEZ');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (16, 2, '0201', 'Guaranda', 'GUARANDA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (17, 2, '0202', 'Chillanes', 'CHILLANES');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (18, 2, '0203', 'Chimbo', 'CHIMBO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (19, 2, '0204', 'EcheandÃ­a', 'ECHEANDIA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (20, 2, '0205', 'San Miguel', 'SAN MIGUEL');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (21, 2, '0206', 'Caluma', 'CALUMA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (22, 2, '0207', 'Las Naves', 'LAS NAVES');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (23, 3, '0301', 'Azogues', 'AZOGUES');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (24, 3, '0302', 'BibliÃ¡n', 'BIBLIAN');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (25, 3, '0303', 'CaÃ±ar', 'CANAR');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (26, 3, '0304', 'La Troncal', 'LA TRONCAL');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (27, 3, '0305', 'El Tambo', 'EL TAMBO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (28, 3, '0306', 'DÃ©leg', 'DELEG');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (29, 3, '0307', 'Suscal', 'SUSCAL');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (30, 4, '0401', 'TulcÃ¡n', 'TULCAN');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (31, 4, '0402', 'BolÃ­var', 'BOLIVAR');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (32, 4, '0403', 'Espejo', 'ESPEJO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (33, 4, '0404', 'Mira', 'MIRA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (34, 4, '0405', 'MontÃºfar', 'MONTUFAR');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (35, 4, '0406', 'San Pedro de Huaca', 'SAN PEDRO DE HUACA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (36, 5, '0501', 'Latacunga', 'LATACUNGA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (37, 5, '0502', 'La ManÃ¡', 'LA MANA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (38, 5, '0503', 'Pangua', 'PANGUA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (39, 5, '0504', 'Pujili', 'PUJILI');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (40, 5, '0505', 'Salcedo', 'SALCEDO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (41, 5, '0506', 'SaquisilÃ­', 'SAQUISILI');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (42, 5, '0507', 'Sigchos', 'SIGCHOS');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (43, 6, '0601', 'Riobamba', 'RIOBAMBA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (44, 6, '0602', 'Alausi', 'ALAUSI');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (45, 6, '0603', 'Colta', 'COLTA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (46, 6, '0604', 'Chambo', 'CHAMBO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (47, 6, '0605', 'Chunchi', 'CHUNCHI');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (48, 6, '0606', 'Guamote', 'GUAMOTE');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (49, 6, '0607', 'Guano', 'GUANO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (50, 6, '0608', 'Pallatanga', 'PALLATANGA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (51, 6, '0609', 'Penipe', 'PENIPE');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (52, 6, '0610', 'CumandÃ¡', 'CUMANDA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (53, 7, '0701', 'Machala', 'MACHALA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (54, 7, '0702', 'Arenillas', 'ARENILLAS');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (55, 7, '0703', 'Atahualpa', 'ATAHUALPA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (56, 7, '0704', 'Balsas', 'BALSAS');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (57, 7, '0705', 'Chilla', 'CHILLA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (58, 7, '0706', 'El Guabo', 'EL GUABO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (59, 7, '0707', 'Huaquillas', 'HUAQUILLAS');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (60, 7, '0708', 'MarcabelÃ­', 'MARCABELI');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (61, 7, '0709', 'Pasaje', 'PASAJE');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (62, 7, '0710', 'PiÃ±as', 'PINAS');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (63, 7, '0711', 'Portovelo', 'PORTOVELO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (64, 7, '0712', 'Santa Rosa', 'SANTA ROSA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (65, 7, '0713', 'Zaruma', 'ZARUMA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (66, 7, '0714', 'Las Lajas', 'LAS LAJAS');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (67, 8, '0801', 'Esmeraldas', 'ESMERALDAS');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (68, 8, '0802', 'Eloy Alfaro', 'ELOY ALFARO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (69, 8, '0803', 'Muisne', 'MUISNE');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (70, 8, '0804', 'QuinindÃ©', 'QUININDE');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (71, 8, '0805', 'San Lorenzo', 'SAN LORENZO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (72, 8, '0806', 'Atacames', 'ATACAMES');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (73, 8, '0807', 'Rioverde', 'RIOVERDE');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (74, 8, '0808', 'La Concordia', 'LA CONCORDIA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (75, 9, '0901', 'Guayaquil', 'GUAYAQUIL');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (76, 9, '0902', 'Alfredo Baquerizo Moreno (JujÃ¡n)', 'ALFREDO BAQUERIZO MORENO JUJAN');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (77, 9, '0903', 'Balao', 'BALAO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (78, 9, '0904', 'Balzar', 'BALZAR');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (79, 9, '0905', 'Colimes', 'COLIMES');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (80, 9, '0906', 'Daule', 'DAULE');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (81, 9, '0907', 'DurÃ¡n', 'DURAN');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (82, 9, '0908', 'El Empalme', 'EL EMPALME');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (83, 9, '0909', 'El Triunfo', 'EL TRIUNFO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (84, 9, '0910', 'Milagro', 'MILAGRO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (85, 9, '0911', 'Naranjal', 'NARANJAL');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (86, 9, '0912', 'Naranjito', 'NARANJITO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (87, 9, '0913', 'Palestina', 'PALESTINA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (88, 9, '0914', 'Pedro Carbo', 'PEDRO CARBO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (89, 9, '0915', 'SamborondÃ³n', 'SAMBORONDON');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (90, 9, '0916', 'Santa LucÃ­a', 'SANTA LUCIA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (91, 9, '0917', 'Salitre (Urbina Jado)', 'SALITRE URBINA JADO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (92, 9, '0918', 'San Jacinto de Yaguachi', 'SAN JACINTO DE YAGUACHI');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (93, 9, '0919', 'Playas', 'PLAYAS');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (94, 9, '0920', 'SimÃ³n BolÃ­var', 'SIMON BOLIVAR');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (95, 9, '0921', 'Coronel Marcelino MaridueÃ±a', 'CORONEL MARCELINO MARIDUENA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (96, 9, '0922', 'Lomas de Sargentillo', 'LOMAS DE SARGENTILLO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (97, 9, '0923', 'Nobol', 'NOBOL');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (98, 9, '0924', 'General Antonio Elizalde', 'GENERAL ANTONIO ELIZALDE');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (99, 9, '0925', 'Isidro Ayora', 'ISIDRO AYORA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (100, 10, '1001', 'Ibarra', 'IBARRA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (101, 10, '1002', 'Antonio Ante', 'ANTONIO ANTE');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (102, 10, '1003', 'Cotacachi', 'COTACACHI');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (103, 10, '1004', 'Otavalo', 'OTAVALO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (104, 10, '1005', 'Pimampiro', 'PIMAMPIRO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (105, 10, '1006', 'San Miguel de UrcuquÃ­', 'SAN MIGUEL DE URCUQUI');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (106, 11, '1101', 'Loja', 'LOJA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (107, 11, '1102', 'Calvas', 'CALVAS');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (108, 11, '1103', 'Catamayo', 'CATAMAYO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (109, 11, '1104', 'Celica', 'CELICA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (110, 11, '1105', 'Chaguarpamba', 'CHAGUARPAMBA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (111, 11, '1106', 'EspÃ­ndola', 'ESPINDOLA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (112, 11, '1107', 'GonzanamÃ¡', 'GONZANAMA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (113, 11, '1108', 'MacarÃ¡', 'MACARA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (114, 11, '1109', 'Paltas', 'PALTAS');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (115, 11, '1110', 'Puyango', 'PUYANGO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (116, 11, '1111', 'Saraguro', 'SARAGURO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (117, 11, '1112', 'Sozoranga', 'SOZORANGA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (118, 11, '1113', 'Zapotillo', 'ZAPOTILLO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (119, 11, '1114', 'Pindal', 'PINDAL');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (120, 11, '1115', 'Quilanga', 'QUILANGA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (121, 11, '1116', 'Olmedo', 'OLMEDO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (122, 12, '1201', 'Babahoyo', 'BABAHOYO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (123, 12, '1202', 'Baba', 'BABA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (124, 12, '1203', 'Montalvo', 'MONTALVO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (125, 12, '1204', 'Puebloviejo', 'PUEBLOVIEJO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (126, 12, '1205', 'Quevedo', 'QUEVEDO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (127, 12, '1206', 'Urdaneta', 'URDANETA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (128, 12, '1207', 'Ventanas', 'VENTANAS');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (129, 12, '1208', 'VÃ­nces', 'VINCES');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (130, 12, '1209', 'Palenque', 'PALENQUE');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (131, 12, '1210', 'Buena FÃ©', 'BUENA FE');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (132, 12, '1211', 'Valencia', 'VALENCIA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (133, 12, '1212', 'Mocache', 'MOCACHE');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (134, 12, '1213', 'Quinsaloma', 'QUINSALOMA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (135, 13, '1301', 'Portoviejo', 'PORTOVIEJO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (136, 13, '1302', 'BolÃ­var', 'BOLIVAR');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (137, 13, '1303', 'Chone', 'CHONE');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (138, 13, '1304', 'El Carmen', 'EL CARMEN');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (139, 13, '1305', 'Flavio Alfaro', 'FLAVIO ALFARO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (140, 13, '1306', 'Jipijapa', 'JIPIJAPA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (141, 13, '1307', 'JunÃ­n', 'JUNIN');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (142, 13, '1308', 'Manta', 'MANTA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (143, 13, '1309', 'Montecristi', 'MONTECRISTI');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (144, 13, '1310', 'PajÃ¡n', 'PAJAN');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (145, 13, '1311', 'Pichincha', 'PICHINCHA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (146, 13, '1312', 'Rocafuerte', 'ROCAFUERTE');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (147, 13, '1313', 'Santa Ana', 'SANTA ANA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (148, 13, '1314', 'Sucre', 'SUCRE');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (149, 13, '1315', 'Tosagua', 'TOSAGUA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (150, 13, '1316', '24 de Mayo', '24 DE MAYO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (151, 13, '1317', 'Pedernales', 'PEDERNALES');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (152, 13, '1318', 'Olmedo', 'OLMEDO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (153, 13, '1319', 'Puerto LÃ³pez', 'PUERTO LOPEZ');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (154, 13, '1320', 'Jama', 'JAMA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (155, 13, '1321', 'JaramijÃ³', 'JARAMIJO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (156, 13, '1322', 'San Vicente', 'SAN VICENTE');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (157, 14, '1401', 'Morona', 'MORONA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (158, 14, '1402', 'Gualaquiza', 'GUALAQUIZA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (159, 14, '1403', 'LimÃ³n Indanza', 'LIMON INDANZA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (160, 14, '1404', 'Palora', 'PALORA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (161, 14, '1405', 'Santiago', 'SANTIAGO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (162, 14, '1406', 'SucÃºa', 'SUCUA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (163, 14, '1407', 'Huamboya', 'HUAMBOYA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (164, 14, '1408', 'San Juan Bosco', 'SAN JUAN BOSCO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (165, 14, '1409', 'Taisha', 'TAISHA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (166, 14, '1410', 'LogroÃ±o', 'LOGRONO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (167, 14, '1411', 'Pablo Sexto', 'PABLO SEXTO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (168, 14, '1412', 'Tiwintza', 'TIWINTZA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (169, 15, '1501', 'Tena', 'TENA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (170, 15, '1502', 'Archidona', 'ARCHIDONA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (171, 15, '1503', 'El Chaco', 'EL CHACO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (172, 15, '1504', 'Quijos', 'QUIJOS');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (173, 15, '1505', 'Carlos Julio Arosemena Tola', 'CARLOS JULIO AROSEMENA TOLA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (174, 16, '1601', 'Pastaza', 'PASTAZA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (175, 16, '1602', 'Mera', 'MERA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (176, 16, '1603', 'Santa Clara', 'SANTA CLARA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (177, 16, '1604', 'Arajuno', 'ARAJUNO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (178, 17, '1701', 'Quito', 'QUITO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (179, 17, '1702', 'Cayambe', 'CAYAMBE');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (180, 17, '1703', 'Mejia', 'MEJIA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (181, 17, '1704', 'Pedro Moncayo', 'PEDRO MONCAYO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (182, 17, '1705', 'RumiÃ±ahui', 'RUMINAHUI');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (183, 17, '1706', 'San Miguel de Los Bancos', 'SAN MIGUEL DE LOS BANCOS');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (184, 17, '1707', 'Pedro Vicente Maldonado', 'PEDRO VICENTE MALDONADO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (185, 17, '1708', 'Puerto Quito', 'PUERTO QUITO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (186, 18, '1801', 'Ambato', 'AMBATO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (187, 18, '1802', 'BaÃ±os de Agua Santa', 'BANOS DE AGUA SANTA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (188, 18, '1803', 'Cevallos', 'CEVALLOS');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (189, 18, '1804', 'Mocha', 'MOCHA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (190, 18, '1805', 'Patate', 'PATATE');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (191, 18, '1806', 'Quero', 'QUERO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (192, 18, '1807', 'San Pedro de Pelileo', 'SAN PEDRO DE PELILEO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (193, 18, '1808', 'Santiago de PÃ­llaro', 'SANTIAGO DE PILLARO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (194, 18, '1809', 'Tisaleo', 'TISALEO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (195, 19, '1901', 'Zamora', 'ZAMORA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (196, 19, '1902', 'Chinchipe', 'CHINCHIPE');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (197, 19, '1903', 'Nangaritza', 'NANGARITZA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (198, 19, '1904', 'Yacuambi', 'YACUAMBI');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (199, 19, '1905', 'Yantzaza (Yanzatza)', 'YANTZAZA YANZATZA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (200, 19, '1906', 'El Pangui', 'EL PANGUI');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (201, 19, '1907', 'Centinela del CÃ³ndor', 'CENTINELA DEL CONDOR');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (202, 19, '1908', 'Palanda', 'PALANDA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (203, 19, '1909', 'Paquisha', 'PAQUISHA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (204, 20, '2001', 'San CristÃ³bal', 'SAN CRISTOBAL');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (205, 20, '2002', 'Isabela', 'ISABELA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (206, 20, '2003', 'Santa Cruz', 'SANTA CRUZ');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (207, 21, '2101', 'Lago Agrio', 'LAGO AGRIO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (208, 21, '2102', 'Gonzalo Pizarro', 'GONZALO PIZARRO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (209, 21, '2103', 'Putumayo', 'PUTUMAYO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (210, 21, '2104', 'Shushufindi', 'SHUSHUFINDI');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (211, 21, '2105', 'SucumbÃ­os', 'SUCUMBIOS');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (212, 21, '2106', 'Cascales', 'CASCALES');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (213, 21, '2107', 'Cuyabeno', 'CUYABENO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (214, 22, '2201', 'Orellana', 'ORELLANA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (215, 22, '2202', 'Aguarico', 'AGUARICO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (216, 22, '2203', 'La Joya de Los Sachas', 'LA JOYA DE LOS SACHAS');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (217, 22, '2204', 'Loreto', 'LORETO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (218, 23, '2301', 'Santo Domingo', 'SANTO DOMINGO');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (219, 24, '2401', 'Santa Elena', 'SANTA ELENA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (220, 24, '2402', 'La Libertad', 'LA LIBERTAD');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (221, 24, '2403', 'Salinas', 'SALINAS');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (222, 25, '2501', 'Las Golondrinas', 'LAS GOLONDRINAS');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (223, 25, '2502', 'Manga del Cura', 'MANGA DEL CURA');
+INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (224, 25, '2503', 'El Piedrero', 'EL PIEDRERO');
 
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1, 1, '010101', 'Bellavista');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (2, 1, '010102', 'CaÃ±aribamba');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (3, 1, '010103', 'El BatÃ¡n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (4, 1, '010104', 'El Sagrario');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (5, 1, '010105', 'El Vecino');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (6, 1, '010106', 'Gil RamÃ­rez DÃ¡valos');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (7, 1, '010107', 'HuaynacÃ¡pac');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (8, 1, '010108', 'MachÃ¡ngara');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (9, 1, '010109', 'Monay');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (10, 1, '010110', 'San Blas');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (11, 1, '010111', 'San SebastiÃ¡n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (12, 1, '010112', 'Sucre');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (13, 1, '010113', 'Totoracocha');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (14, 1, '010114', 'Yanuncay');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (15, 1, '010115', 'Hermano Miguel');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (16, 1, '010116', 'Cuenca');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (17, 1, '010117', 'BaÃ±os');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (18, 1, '010118', 'Cumbe');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (19, 1, '010119', 'Chaucha');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (20, 1, '010120', 'Checa (Jidcay)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (21, 1, '010121', 'Chiquintad');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (22, 1, '010122', 'Llacao');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (23, 1, '010123', 'Molleturo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (24, 1, '010124', 'Nulti');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (25, 1, '010125', 'Octavio Cordero Palacios (Santa Rosa)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (26, 1, '010126', 'Paccha');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (27, 1, '010127', 'Quingeo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (28, 1, '010128', 'Ricaurte');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (29, 1, '010129', 'San JoaquÃ­n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (30, 1, '010130', 'Santa Ana');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (31, 1, '010131', 'SayausÃ­');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (32, 1, '010132', 'Sidcay');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (33, 1, '010133', 'Sinincay');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (34, 1, '010134', 'Tarqui');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (35, 1, '010135', 'Turi');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (36, 1, '010136', 'Valle');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (37, 1, '010137', 'Victoria del Portete (Irquis)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (38, 2, '010201', 'GirÃ³n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (39, 2, '010202', 'AsunciÃ³n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (40, 2, '010203', 'San Gerardo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (41, 3, '010301', 'Gualaceo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (42, 3, '010302', 'Chordeleg');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (43, 3, '010303', 'Daniel CÃ³rdova Toral (El Oriente)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (44, 3, '010304', 'JadÃ¡n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (45, 3, '010305', 'Mariano Moreno');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (46, 3, '010306', 'Principal');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (47, 3, '010307', 'Remigio Crespo Toral (GÃºlag)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (48, 3, '010308', 'San Juan');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (49, 3, '010309', 'Zhidmad');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (50, 3, '010310', 'Luis Cordero Vega');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (51, 3, '010311', 'SimÃ³n BolÃ­var (Cab. En GaÃ±anzol)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (52, 4, '010401', 'NabÃ³n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (53, 4, '010402', 'Cochapata');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (54, 4, '010403', 'El Progreso (Cab.En Zhota)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (55, 4, '010404', 'Las Nieves (Chaya)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (56, 4, '010405', 'OÃ±a');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (57, 5, '010501', 'Paute');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (58, 5, '010502', 'Amaluza');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (59, 5, '010503', 'BulÃ¡n (JosÃ© VÃ­ctor Izquierdo)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (60, 5, '010504', 'ChicÃ¡n (Guillermo Ortega)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (61, 5, '010505', 'El Cabo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (62, 5, '010506', 'Guachapala');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (63, 5, '010507', 'Guarainag');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (64, 5, '010508', 'Palmas');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (65, 5, '010509', 'Pan');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (66, 5, '010510', 'San CristÃ³bal (Carlos OrdÃ³Ã±ez Lazo)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (67, 5, '010511', 'Sevilla de Oro');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (68, 5, '010512', 'Tomebamba');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (69, 5, '010513', 'Dug Dug');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (70, 6, '010601', 'PucarÃ¡');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (71, 6, '010602', 'Camilo Ponce EnrÃ­quez (Cab. En RÃ­o 7 de Mollepongo)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (72, 6, '010603', 'San Rafael de Sharug');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (73, 7, '010701', 'San Fernando');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (74, 7, '010702', 'ChumblÃ­n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (75, 8, '010801', 'Santa Isabel (Chaguarurco)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (76, 8, '010802', 'AbdÃ³n CalderÃ³n (La UniÃ³n)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (77, 8, '010803', 'El Carmen de PijilÃ­');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (78, 8, '010804', 'Zhaglli (Shaglli)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (79, 8, '010805', 'San Salvador de CaÃ±aribamba');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (80, 9, '010901', 'Sigsig');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (81, 9, '010902', 'Cuchil (Cutchil)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (82, 9, '010903', 'Gima');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (83, 9, '010904', 'Guel');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (84, 9, '010905', 'Ludo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (85, 9, '010906', 'San BartolomÃ©');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (86, 9, '010907', 'San JosÃ© de Raranga');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (87, 10, '011001', 'San Felipe de OÃ±a Cabecera Cantonal');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (88, 10, '011002', 'Susudel');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (89, 11, '011101', 'Chordeleg');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (90, 11, '011102', 'Principal');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (91, 11, '011103', 'La UniÃ³n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (92, 11, '011104', 'Luis Galarza Orellana (Cab.En Delegsol)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (93, 11, '011105', 'San MartÃ­n de Puzhio');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (94, 12, '011201', 'El Pan');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (95, 12, '011202', 'Amaluza');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (96, 12, '011203', 'Palmas');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (97, 12, '011204', 'San Vicente');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (98, 13, '011301', 'Sevilla de Oro');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (99, 13, '011302', 'Amaluza');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (100, 13, '011303', 'Palmas');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (101, 14, '011401', 'Guachapala');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (102, 15, '011501', 'Camilo Ponce EnrÃ­quez');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (103, 15, '011502', 'El Carmen de PijilÃ­');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (104, 16, '020101', 'Ãngel Polibio ChÃ¡ves');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (105, 16, '020102', 'Gabriel Ignacio Veintimilla');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (106, 16, '020103', 'Guanujo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (107, 16, '020104', 'Guaranda');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (108, 16, '020105', 'Facundo Vela');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (109, 16, '020106', 'Guanujo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (110, 16, '020107', 'Julio E. Moreno (CatanahuÃ¡n Grande)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (111, 16, '020108', 'Las Naves');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (112, 16, '020109', 'Salinas');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (113, 16, '020110', 'San Lorenzo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (114, 16, '020111', 'San SimÃ³n (Yacoto)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (115, 16, '020112', 'Santa FÃ© (Santa FÃ©)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (116, 16, '020113', 'SimiÃ¡tug');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (117, 16, '020114', 'San Luis de Pambil');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (118, 17, '020201', 'Chillanes');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (119, 17, '020202', 'San JosÃ© del Tambo (Tambopamba)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (120, 18, '020301', 'San JosÃ© de Chimbo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (121, 18, '020302', 'AsunciÃ³n (Asancoto)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (122, 18, '020303', 'Caluma');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (123, 18, '020304', 'Magdalena (Chapacoto)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (124, 18, '020305', 'San SebastiÃ¡n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (125, 18, '020306', 'Telimbela');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (126, 19, '020401', 'EcheandÃ­a');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (127, 20, '020501', 'San Miguel');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (128, 20, '020502', 'Balsapamba');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (129, 20, '020503', 'BilovÃ¡n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (130, 20, '020504', 'RÃ©gulo de Mora');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (131, 20, '020505', 'San Pablo (San Pablo de Atenas)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (132, 20, '020506', 'Santiago');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (133, 20, '020507', 'San Vicente');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (134, 21, '020601', 'Caluma');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (135, 22, '020701', 'Las Mercedes');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (136, 22, '020702', 'Las Naves');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (137, 22, '020703', 'Las Naves');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (138, 23, '030101', 'Aurelio Bayas MartÃ­nez');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (139, 23, '030102', 'Azogues');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (140, 23, '030103', 'Borrero');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (141, 23, '030104', 'San Francisco');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (142, 23, '030105', 'Azogues');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (143, 23, '030106', 'Cojitambo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (144, 23, '030107', 'DÃ©leg');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (145, 23, '030108', 'GuapÃ¡n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (146, 23, '030109', 'Javier Loyola (Chuquipata)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (147, 23, '030110', 'Luis Cordero');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (148, 23, '030111', 'Pindilig');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (149, 23, '030112', 'Rivera');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (150, 23, '030113', 'San Miguel');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (151, 23, '030114', 'Solano');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (152, 23, '030115', 'Taday');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (153, 24, '030201', 'BibliÃ¡n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (154, 24, '030202', 'NazÃ³n (Cab. En Pampa de DomÃ­nguez)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (155, 24, '030203', 'San Francisco de Sageo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (156, 24, '030204', 'Turupamba');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (157, 24, '030205', 'JerusalÃ©n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (158, 25, '030301', 'CaÃ±ar');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (159, 25, '030302', 'Chontamarca');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (160, 25, '030303', 'Chorocopte');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (161, 25, '030304', 'General Morales (Socarte)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (162, 25, '030305', 'Gualleturo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (163, 25, '030306', 'Honorato VÃ¡squez (Tambo Viejo)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (164, 25, '030307', 'Ingapirca');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (165, 25, '030308', 'Juncal');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (166, 25, '030309', 'San Antonio');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (167, 25, '030310', 'Suscal');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (168, 25, '030311', 'Tambo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (169, 25, '030312', 'Zhud');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (170, 25, '030313', 'Ventura');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (171, 25, '030314', 'Ducur');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (172, 26, '030401', 'La Troncal');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (173, 26, '030402', 'Manuel J. Calle');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (174, 26, '030403', 'Pancho Negro');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (175, 27, '030501', 'El Tambo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (176, 28, '030601', 'DÃ©leg');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (177, 28, '030602', 'Solano');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (178, 29, '030701', 'Suscal');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (179, 30, '040101', 'GonzÃ¡lez SuÃ¡rez');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (180, 30, '040102', 'TulcÃ¡n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (181, 30, '040103', 'TulcÃ¡n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (182, 30, '040104', 'El Carmelo (El Pun)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (183, 30, '040105', 'Huaca');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (184, 30, '040106', 'Julio Andrade (Orejuela)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (185, 30, '040107', 'Maldonado');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (186, 30, '040108', 'Pioter');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (187, 30, '040109', 'Tobar Donoso (La Bocana de CamumbÃ­)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (188, 30, '040110', 'TufiÃ±o');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (189, 30, '040111', 'Urbina (Taya)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (190, 30, '040112', 'El Chical');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (191, 30, '040113', 'Mariscal Sucre');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (192, 30, '040114', 'Santa Martha de Cuba');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (193, 31, '040201', 'BolÃ­var');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (194, 31, '040202', 'GarcÃ­a Moreno');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (195, 31, '040203', 'Los Andes');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (196, 31, '040204', 'Monte Olivo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (197, 31, '040205', 'San Vicente de Pusir');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (198, 31, '040206', 'San Rafael');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (199, 32, '040301', 'El Ãngel');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (200, 32, '040302', '27 de Septiembre');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (201, 32, '040303', 'El Angel');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (202, 32, '040304', 'El Goaltal');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (203, 32, '040305', 'La Libertad (Alizo)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (204, 32, '040306', 'San Isidro');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (205, 33, '040401', 'Mira (Chontahuasi)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (206, 33, '040402', 'ConcepciÃ³n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (207, 33, '040403', 'JijÃ³n Y CaamaÃ±o (Cab. En RÃ­o Blanco)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (208, 33, '040404', 'Juan Montalvo (San Ignacio de Quil)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (209, 34, '040501', 'GonzÃ¡lez SuÃ¡rez');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (210, 34, '040502', 'San JosÃ©');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (211, 34, '040503', 'San Gabriel');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (212, 34, '040504', 'CristÃ³bal ColÃ³n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (213, 34, '040505', 'ChitÃ¡n de Navarrete');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (214, 34, '040506', 'FernÃ¡ndez Salvador');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (215, 34, '040507', 'La Paz');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (216, 34, '040508', 'Piartal');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (217, 35, '040601', 'Huaca');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (218, 35, '040602', 'Mariscal Sucre');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (219, 36, '050101', 'Eloy Alfaro (San Felipe)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (220, 36, '050102', 'Ignacio Flores (Parque Flores)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (221, 36, '050103', 'Juan Montalvo (San SebastiÃ¡n)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (222, 36, '050104', 'La Matriz');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (223, 36, '050105', 'San Buenaventura');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (224, 36, '050106', 'Latacunga');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (225, 36, '050107', 'Alaques (AlÃ¡quez)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (226, 36, '050108', 'Belisario Quevedo (GuanailÃ­n)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (227, 36, '050109', 'Guaitacama (Guaytacama)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (228, 36, '050110', 'Joseguango Bajo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (229, 36, '050111', 'Las Pampas');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (230, 36, '050112', 'MulalÃ³');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (231, 36, '050113', '11 de Noviembre (Ilinchisi)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (232, 36, '050114', 'PoalÃ³');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (233, 36, '050115', 'San Juan de Pastocalle');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (234, 36, '050116', 'Sigchos');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (235, 36, '050117', 'TanicuchÃ­');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (236, 36, '050118', 'Toacaso');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (237, 36, '050119', 'Palo Quemado');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (238, 37, '050201', 'El Carmen');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (239, 37, '050202', 'La ManÃ¡');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (240, 37, '050203', 'El Triunfo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (241, 37, '050204', 'La ManÃ¡');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (242, 37, '050205', 'Guasaganda (Cab.En Guasaganda');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (243, 37, '050206', 'Pucayacu');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (244, 38, '050301', 'El CorazÃ³n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (245, 38, '050302', 'Moraspungo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (246, 38, '050303', 'Pinllopata');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (247, 38, '050304', 'RamÃ³n CampaÃ±a');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (248, 39, '050401', 'PujilÃ­');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (249, 39, '050402', 'Angamarca');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (250, 39, '050403', 'ChucchilÃ¡n (ChugchilÃ¡n)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (251, 39, '050404', 'Guangaje');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (252, 39, '050405', 'IsinlibÃ­ (IsinlivÃ­)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (253, 39, '050406', 'La Victoria');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (254, 39, '050407', 'PilalÃ³');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (255, 39, '050408', 'Tingo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (256, 39, '050409', 'Zumbahua');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (257, 40, '050501', 'San Miguel');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (258, 40, '050502', 'Antonio JosÃ© HolguÃ­n (Santa LucÃ­a)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (259, 40, '050503', 'Cusubamba');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (260, 40, '050504', 'Mulalillo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (261, 40, '050505', 'Mulliquindil (Santa Ana)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (262, 40, '050506', 'Pansaleo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (263, 41, '050601', 'SaquisilÃ­');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (264, 41, '050602', 'Canchagua');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (265, 41, '050603', 'ChantilÃ­n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (266, 41, '050604', 'Cochapamba');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (267, 42, '050701', 'Sigchos');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (268, 42, '050702', 'ChugchillÃ¡n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (269, 42, '050703', 'IsinlivÃ­');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (270, 42, '050704', 'Las Pampas');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (271, 42, '050705', 'Palo Quemado');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (272, 43, '060101', 'Lizarzaburu');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (273, 43, '060102', 'Maldonado');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (274, 43, '060103', 'Velasco');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (275, 43, '060104', 'Veloz');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (276, 43, '060105', 'YaruquÃ­es');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (277, 43, '060106', 'Riobamba');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (278, 43, '060107', 'Cacha (Cab. En MachÃ¡ngara)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (279, 43, '060108', 'Calpi');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (280, 43, '060109', 'CubijÃ­es');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (281, 43, '060110', 'Flores');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (282, 43, '060111', 'LicÃ¡n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (283, 43, '060112', 'Licto');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (284, 43, '060113', 'PungalÃ¡');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (285, 43, '060114', 'PunÃ­n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (286, 43, '060115', 'Quimiag');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (287, 43, '060116', 'San Juan');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (288, 43, '060117', 'San Luis');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (289, 44, '060201', 'AlausÃ­');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (290, 44, '060202', 'Achupallas');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (291, 44, '060203', 'CumandÃ¡');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (292, 44, '060204', 'Guasuntos');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (293, 44, '060205', 'Huigra');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (294, 44, '060206', 'Multitud');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (295, 44, '060207', 'PistishÃ­ (Nariz del Diablo)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (296, 44, '060208', 'Pumallacta');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (297, 44, '060209', 'Sevilla');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (298, 44, '060210', 'Sibambe');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (299, 44, '060211', 'TixÃ¡n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (300, 45, '060301', 'Cajabamba');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (301, 45, '060302', 'Sicalpa');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (302, 45, '060303', 'Villa La UniÃ³n (Cajabamba)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (303, 45, '060304', 'CaÃ±i');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (304, 45, '060305', 'Columbe');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (305, 45, '060306', 'Juan de Velasco (Pangor)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (306, 45, '060307', 'Santiago de Quito (Cab. En San Antonio de Quito)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (307, 46, '060401', 'Chambo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (308, 47, '060501', 'Chunchi');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (309, 47, '060502', 'Capzol');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (310, 47, '060503', 'Compud');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (311, 47, '060504', 'Gonzol');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (312, 47, '060505', 'Llagos');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (313, 48, '060601', 'Guamote');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (314, 48, '060602', 'Cebadas');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (315, 48, '060603', 'Palmira');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (316, 49, '060701', 'El Rosario');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (317, 49, '060702', 'La Matriz');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (318, 49, '060703', 'Guano');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (319, 49, '060704', 'Guanando');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (320, 49, '060705', 'Ilapo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (321, 49, '060706', 'La Providencia');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (322, 49, '060707', 'San AndrÃ©s');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (323, 49, '060708', 'San Gerardo de PacaicaguÃ¡n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (324, 49, '060709', 'San Isidro de PatulÃº');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (325, 49, '060710', 'San JosÃ© del Chazo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (326, 49, '060711', 'Santa FÃ© de GalÃ¡n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (327, 49, '060712', 'ValparaÃ­so');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (328, 50, '060801', 'Pallatanga');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (329, 51, '060901', 'Penipe');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (330, 51, '060902', 'El Altar');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (331, 51, '060903', 'Matus');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (332, 51, '060904', 'Puela');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (333, 51, '060905', 'San Antonio de Bayushig');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (334, 51, '060906', 'La Candelaria');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (335, 51, '060907', 'Bilbao (Cab.En Quilluyacu)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (336, 52, '061001', 'CumandÃ¡');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (337, 53, '070101', 'La Providencia');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (338, 53, '070102', 'Machala');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (339, 53, '070103', 'Puerto BolÃ­var');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (340, 53, '070104', 'Nueve de Mayo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (341, 53, '070105', 'El Cambio');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (342, 53, '070106', 'Machala');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (343, 53, '070107', 'El Cambio');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (344, 53, '070108', 'El Retiro');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (345, 54, '070201', 'Arenillas');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (346, 54, '070202', 'Chacras');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (347, 54, '070203', 'La Libertad');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (348, 54, '070204', 'Las Lajas (Cab. En La Victoria)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (349, 54, '070205', 'Palmales');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (350, 54, '070206', 'CarcabÃ³n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (351, 55, '070301', 'Paccha');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (352, 55, '070302', 'Ayapamba');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (353, 55, '070303', 'Cordoncillo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (354, 55, '070304', 'Milagro');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (355, 55, '070305', 'San JosÃ©');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (356, 55, '070306', 'San Juan de Cerro Azul');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (357, 56, '070401', 'Balsas');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (358, 56, '070402', 'BellamarÃ­a');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (359, 57, '070501', 'Chilla');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (360, 58, '070601', 'El Guabo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (361, 58, '070602', 'Barbones (Sucre)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (362, 58, '070603', 'La Iberia');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (363, 58, '070604', 'Tendales (Cab.En Puerto Tendales)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (364, 58, '070605', 'RÃ­o Bonito');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (365, 59, '070701', 'Ecuador');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (366, 59, '070702', 'El ParaÃ­so');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (367, 59, '070703', 'Hualtaco');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (368, 59, '070704', 'Milton Reyes');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (369, 59, '070705', 'UniÃ³n Lojana');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (370, 59, '070706', 'Huaquillas');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (371, 60, '070801', 'MarcabelÃ­');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (372, 60, '070802', 'El Ingenio');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (373, 61, '070901', 'BolÃ­var');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (374, 61, '070902', 'Loma de Franco');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (375, 61, '070903', 'Ochoa LeÃ³n (Matriz)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (376, 61, '070904', 'Tres Cerritos');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (377, 61, '070905', 'Pasaje');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (378, 61, '070906', 'Buenavista');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (379, 61, '070907', 'Casacay');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (380, 61, '070908', 'La PeaÃ±a');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (381, 61, '070909', 'Progreso');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (382, 61, '070910', 'Uzhcurrumi');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (383, 61, '070911', 'CaÃ±aquemada');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (384, 62, '071001', 'La Matriz');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (385, 62, '071002', 'La Susaya');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (386, 62, '071003', 'PiÃ±as Grande');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (387, 62, '071004', 'PiÃ±as');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (388, 62, '071005', 'Capiro (Cab. En La Capilla de Capiro)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (389, 62, '071006', 'La Bocana');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (390, 62, '071007', 'Moromoro (Cab. En El Vado)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (391, 62, '071008', 'Piedras');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (392, 62, '071009', 'San Roque (Ambrosio Maldonado)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (393, 62, '071010', 'Saracay');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (394, 63, '071101', 'Portovelo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (395, 63, '071102', 'Curtincapa');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (396, 63, '071103', 'Morales');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (397, 63, '071104', 'SalatÃ­');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (398, 64, '071201', 'Santa Rosa');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (399, 64, '071202', 'Puerto JelÃ­');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (400, 64, '071203', 'Balneario JambelÃ­ (SatÃ©lite)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (401, 64, '071204', 'JumÃ³n (SatÃ©lite)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (402, 64, '071205', 'Nuevo Santa Rosa');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (403, 64, '071206', 'Santa Rosa');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (404, 64, '071207', 'Bellavista');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (405, 64, '071208', 'JambelÃ­');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (406, 64, '071209', 'La Avanzada');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (407, 64, '071210', 'San Antonio');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (408, 64, '071211', 'Torata');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (409, 64, '071212', 'Victoria');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (410, 64, '071213', 'BellamarÃ­a');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (411, 65, '071301', 'Zaruma');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (412, 65, '071302', 'AbaÃ±Ã­n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (413, 65, '071303', 'Arcapamba');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (414, 65, '071304', 'GuanazÃ¡n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (415, 65, '071305', 'GuizhaguiÃ±a');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (416, 65, '071306', 'Huertas');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (417, 65, '071307', 'Malvas');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (418, 65, '071308', 'Muluncay Grande');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (419, 65, '071309', 'Sinsao');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (420, 65, '071310', 'Salvias');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (421, 66, '071401', 'La Victoria');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (422, 66, '071402', 'Platanillos');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (423, 66, '071403', 'Valle Hermoso');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (424, 66, '071404', 'La Victoria');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (425, 66, '071405', 'La Libertad');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (426, 66, '071406', 'El ParaÃ­so');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (427, 66, '071407', 'San Isidro');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (428, 67, '080101', 'BartolomÃ© Ruiz (CÃ©sar Franco CarriÃ³n)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (429, 67, '080102', '5 de Agosto');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (430, 67, '080103', 'Esmeraldas');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (431, 67, '080104', 'Luis Tello (Las Palmas)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (432, 67, '080105', 'SimÃ³n Plata Torres');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (433, 67, '080106', 'Esmeraldas');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (434, 67, '080107', 'Atacames');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (435, 67, '080108', 'Camarones (Cab. En San Vicente)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (436, 67, '080109', 'Crnel. Carlos Concha Torres (Cab.En Huele)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (437, 67, '080110', 'Chinca');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (438, 67, '080111', 'Chontaduro');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (439, 67, '080112', 'ChumundÃ©');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (440, 67, '080113', 'Lagarto');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (441, 67, '080114', 'La UniÃ³n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (442, 67, '080115', 'Majua');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (443, 67, '080116', 'Montalvo (Cab. En Horqueta)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (444, 67, '080117', 'RÃ­o Verde');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (445, 67, '080118', 'Rocafuerte');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (446, 67, '080119', 'San Mateo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (447, 67, '080120', 'SÃºa (Cab. En La Bocana)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (448, 67, '080121', 'Tabiazo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (449, 67, '080122', 'Tachina');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (450, 67, '080123', 'TonchigÃ¼e');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (451, 67, '080124', 'Vuelta Larga');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (452, 68, '080201', 'Valdez (Limones)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (453, 68, '080202', 'Anchayacu');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (454, 68, '080203', 'Atahualpa (Cab. En Camarones)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (455, 68, '080204', 'BorbÃ³n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (456, 68, '080205', 'La Tola');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (457, 68, '080206', 'Luis Vargas Torres (Cab. En Playa de Oro)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (458, 68, '080207', 'Maldonado');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (459, 68, '080208', 'Pampanal de BolÃ­var');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (460, 68, '080209', 'San Francisco de Onzole');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (461, 68, '080210', 'Santo Domingo de Onzole');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (462, 68, '080211', 'Selva Alegre');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (463, 68, '080212', 'TelembÃ­');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (464, 68, '080213', 'ColÃ³n Eloy del MarÃ­a');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (465, 68, '080214', 'San JosÃ© de Cayapas');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (466, 68, '080215', 'TimbirÃ©');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (467, 69, '080301', 'Muisne');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (468, 69, '080302', 'BolÃ­var');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (469, 69, '080303', 'Daule');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (470, 69, '080304', 'Galera');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (471, 69, '080305', 'Quingue (Olmedo Perdomo Franco)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (472, 69, '080306', 'Salima');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (473, 69, '080307', 'San Francisco');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (474, 69, '080308', 'San Gregorio');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (475, 69, '080309', 'San JosÃ© de Chamanga (Cab.En Chamanga)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (476, 70, '080401', 'Rosa ZÃ¡rate (QuinindÃ©)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (477, 70, '080402', 'Cube');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (478, 70, '080403', 'Chura (Chancama) (Cab. En El Yerbero)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (479, 70, '080404', 'Malimpia');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (480, 70, '080405', 'Viche');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (481, 70, '080406', 'La UniÃ³n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (482, 71, '080501', 'San Lorenzo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (483, 71, '080502', 'Alto Tambo (Cab. En Guadual)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (484, 71, '080503', 'AncÃ³n (Pichangal) (Cab. En Palma Real)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (485, 71, '080504', 'CalderÃ³n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (486, 71, '080505', 'Carondelet');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (487, 71, '080506', '5 de Junio (Cab. En Uimbi)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (488, 71, '080507', 'ConcepciÃ³n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (489, 71, '080508', 'Mataje (Cab. En Santander)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (490, 71, '080509', 'San Javier de CachavÃ­ (Cab. En San Javier)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (491, 71, '080510', 'Santa Rita');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (492, 71, '080511', 'Tambillo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (493, 71, '080512', 'TululbÃ­ (Cab. En Ricaurte)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (494, 71, '080513', 'Urbina');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (495, 72, '080601', 'Atacames');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (496, 72, '080602', 'La UniÃ³n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (497, 72, '080603', 'SÃºa (Cab. En La Bocana)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (498, 72, '080604', 'TonchigÃ¼e');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (499, 72, '080605', 'Tonsupa');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (500, 73, '080701', 'Rioverde');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (501, 73, '080702', 'Chontaduro');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (502, 73, '080703', 'ChumundÃ©');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (503, 73, '080704', 'Lagarto');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (504, 73, '080705', 'Montalvo (Cab. En Horqueta)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (505, 73, '080706', 'Rocafuerte');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (506, 74, '080801', 'La Concordia');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (507, 74, '080802', 'Monterrey');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (508, 74, '080803', 'La Villegas');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (509, 74, '080804', 'Plan Piloto');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (510, 75, '090101', 'Ayacucho');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (511, 75, '090102', 'BolÃ­var (Sagrario)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (512, 75, '090103', 'Carbo (ConcepciÃ³n)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (513, 75, '090104', 'Febres Cordero');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (514, 75, '090105', 'GarcÃ­a Moreno');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (515, 75, '090106', 'Letamendi');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (516, 75, '090107', 'Nueve de Octubre');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (517, 75, '090108', 'Olmedo (San Alejo)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (518, 75, '090109', 'Roca');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (519, 75, '090110', 'Rocafuerte');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (520, 75, '090111', 'Sucre');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (521, 75, '090112', 'Tarqui');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (522, 75, '090113', 'Urdaneta');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (523, 75, '090114', 'Ximena');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (524, 75, '090115', 'Pascuales');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (525, 75, '090116', 'Guayaquil');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (526, 75, '090117', 'ChongÃ³n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (527, 75, '090118', 'Juan GÃ³mez RendÃ³n (Progreso)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (528, 75, '090119', 'Morro');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (529, 75, '090120', 'Pascuales');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (530, 75, '090121', 'Playas (Gral. Villamil)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (531, 75, '090122', 'Posorja');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (532, 75, '090123', 'PunÃ¡');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (533, 75, '090124', 'Tenguel');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (534, 76, '090201', 'Alfredo Baquerizo Moreno (JujÃ¡n)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (535, 77, '090301', 'Balao');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (536, 78, '090401', 'Balzar');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (537, 79, '090501', 'Colimes');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (538, 79, '090502', 'San Jacinto');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (539, 80, '090601', 'Daule');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (540, 80, '090602', 'La Aurora (SatÃ©lite)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (541, 80, '090603', 'Banife');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (542, 80, '090604', 'Emiliano Caicedo Marcos');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (543, 80, '090605', 'Magro');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (544, 80, '090606', 'Padre Juan Bautista Aguirre');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (545, 80, '090607', 'Santa Clara');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (546, 80, '090608', 'Vicente Piedrahita');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (547, 80, '090609', 'Daule');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (548, 80, '090610', 'Isidro Ayora (Soledad)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (549, 80, '090611', 'Juan Bautista Aguirre (Los Tintos)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (550, 80, '090612', 'Laurel');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (551, 80, '090613', 'Limonal');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (552, 80, '090614', 'Lomas de Sargentillo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (553, 80, '090615', 'Los Lojas (Enrique Baquerizo Moreno)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (554, 80, '090616', 'Piedrahita (Nobol)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (555, 81, '090701', 'Eloy Alfaro (DurÃ¡n)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (556, 81, '090702', 'El Recreo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (557, 81, '090703', 'Eloy Alfaro (DurÃ¡n)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (558, 82, '090801', 'Velasco Ibarra (El Empalme)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (559, 82, '090802', 'Guayas (Pueblo Nuevo)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (560, 82, '090803', 'El Rosario');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (561, 83, '090901', 'El Triunfo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (562, 84, '091001', 'Milagro');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (563, 84, '091002', 'Chobo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (564, 84, '091003', 'General Elizalde (Bucay)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (565, 84, '091004', 'Mariscal Sucre (Huaques)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (566, 84, '091005', 'Roberto Astudillo (Cab. En Cruce de Venecia)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (567, 85, '091101', 'Naranjal');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (568, 85, '091102', 'JesÃºs MarÃ­a');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (569, 85, '091103', 'San Carlos');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (570, 85, '091104', 'Santa Rosa de Flandes');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (571, 85, '091105', 'Taura');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (572, 86, '091201', 'Naranjito');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (573, 87, '091301', 'Palestina');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (574, 88, '091401', 'Pedro Carbo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (575, 88, '091402', 'Valle de La Virgen');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (576, 88, '091403', 'Sabanilla');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (577, 89, '091501', 'SamborondÃ³n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (578, 89, '091502', 'La Puntilla (SatÃ©lite)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (579, 89, '091503', 'SamborondÃ³n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (580, 89, '091504', 'Tarifa');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (581, 90, '091601', 'Santa LucÃ­a');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (582, 91, '091701', 'Bocana');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (583, 91, '091702', 'Candilejos');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (584, 91, '091703', 'Central');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (585, 91, '091704', 'ParaÃ­so');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (586, 91, '091705', 'San Mateo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (587, 91, '091706', 'El Salitre (Las Ramas)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (588, 91, '091707', 'Gral. Vernaza (Dos Esteros)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (589, 91, '091708', 'La Victoria (Ãauza)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (590, 91, '091709', 'Junquillal');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (591, 92, '091801', 'San Jacinto de Yaguachi');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (592, 92, '091802', 'Crnel. Lorenzo de Garaicoa (Pedregal)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (593, 92, '091803', 'Crnel. Marcelino MaridueÃ±a (San Carlos)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (594, 92, '091804', 'Gral. Pedro J. Montero (Boliche)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (595, 92, '091805', 'SimÃ³n BolÃ­var');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (596, 92, '091806', 'Yaguachi Viejo (Cone)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (597, 92, '091807', 'Virgen de FÃ¡tima');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (598, 93, '091901', 'General Villamil (Playas)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (599, 94, '092001', 'SimÃ³n BolÃ­var');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (600, 94, '092002', 'Crnel.Lorenzo de Garaicoa (Pedregal)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (601, 95, '092101', 'Coronel Marcelino MaridueÃ±a (San Carlos)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (602, 96, '092201', 'Lomas de Sargentillo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (603, 96, '092202', 'Isidro Ayora (Soledad)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (604, 97, '092301', 'Narcisa de JesÃºs');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (605, 98, '092401', 'General Antonio Elizalde (Bucay)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (606, 99, '092501', 'Isidro Ayora');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (607, 100, '100101', 'Caranqui');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (608, 100, '100102', 'Guayaquil de Alpachaca');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (609, 100, '100103', 'Sagrario');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (610, 100, '100104', 'San Francisco');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (611, 100, '100105', 'La Dolorosa del Priorato');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (612, 100, '100106', 'San Miguel de Ibarra');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (613, 100, '100107', 'AmbuquÃ­');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (614, 100, '100108', 'Angochagua');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (615, 100, '100109', 'Carolina');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (616, 100, '100110', 'La Esperanza');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (617, 100, '100111', 'Lita');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (618, 100, '100112', 'Salinas');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (619, 100, '100113', 'San Antonio');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (620, 101, '100201', 'Andrade MarÃ­n (Lourdes)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (621, 101, '100202', 'Atuntaqui');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (622, 101, '100203', 'Atuntaqui');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (623, 101, '100204', 'Imbaya (San Luis de Cobuendo)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (624, 101, '100205', 'San Francisco de Natabuela');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (625, 101, '100206', 'San JosÃ© de Chaltura');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (626, 101, '100207', 'San Roque');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (627, 102, '100301', 'Sagrario');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (628, 102, '100302', 'San Francisco');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (629, 102, '100303', 'Cotacachi');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (630, 102, '100304', 'Apuela');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (631, 102, '100305', 'GarcÃ­a Moreno (Llurimagua)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (632, 102, '100306', 'Imantag');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (633, 102, '100307', 'PeÃ±aherrera');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (634, 102, '100308', 'Plaza GutiÃ©rrez (Calvario)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (635, 102, '100309', 'Quiroga');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (636, 102, '100310', '6 de Julio de Cuellaje (Cab. En Cuellaje)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (637, 102, '100311', 'Vacas Galindo (El Churo) (Cab.En San Miguel Alto');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (638, 103, '100401', 'JordÃ¡n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (639, 103, '100402', 'San Luis');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (640, 103, '100403', 'Otavalo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (641, 103, '100404', 'Dr. Miguel Egas Cabezas (Peguche)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (642, 103, '100405', 'Eugenio Espejo (CalpaquÃ­)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (643, 103, '100406', 'GonzÃ¡lez SuÃ¡rez');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (644, 103, '100407', 'PataquÃ­');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (645, 103, '100408', 'San JosÃ© de Quichinche');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (646, 103, '100409', 'San Juan de IlumÃ¡n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (647, 103, '100410', 'San Pablo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (648, 103, '100411', 'San Rafael');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (649, 103, '100412', 'Selva Alegre (Cab.En San Miguel de Pamplona)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (650, 104, '100501', 'Pimampiro');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (651, 104, '100502', 'ChugÃ¡');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (652, 104, '100503', 'Mariano Acosta');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (653, 104, '100504', 'San Francisco de Sigsipamba');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (654, 105, '100601', 'UrcuquÃ­ Cabecera Cantonal');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (655, 105, '100602', 'CahuasquÃ­');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (656, 105, '100603', 'La Merced de Buenos Aires');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (657, 105, '100604', 'Pablo Arenas');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (658, 105, '100605', 'San Blas');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (659, 105, '100606', 'Tumbabiro');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (660, 106, '110101', 'El Sagrario');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (661, 106, '110102', 'San SebastiÃ¡n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (662, 106, '110103', 'Sucre');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (663, 106, '110104', 'Valle');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (664, 106, '110105', 'Loja');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (665, 106, '110106', 'Chantaco');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (666, 106, '110107', 'Chuquiribamba');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (667, 106, '110108', 'El Cisne');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (668, 106, '110109', 'Gualel');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (669, 106, '110110', 'Jimbilla');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (670, 106, '110111', 'Malacatos (Valladolid)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (671, 106, '110112', 'San Lucas');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (672, 106, '110113', 'San Pedro de Vilcabamba');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (673, 106, '110114', 'Santiago');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (674, 106, '110115', 'Taquil (Miguel RiofrÃ­o)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (675, 106, '110116', 'Vilcabamba (Victoria)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (676, 106, '110117', 'Yangana (Arsenio Castillo)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (677, 106, '110118', 'Quinara');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (678, 107, '110201', 'Cariamanga');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (679, 107, '110202', 'Chile');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (680, 107, '110203', 'San Vicente');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (681, 107, '110204', 'Cariamanga');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (682, 107, '110205', 'Colaisaca');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (683, 107, '110206', 'El Lucero');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (684, 107, '110207', 'Utuana');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (685, 107, '110208', 'SanguillÃ­n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (686, 108, '110301', 'Catamayo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (687, 108, '110302', 'San JosÃ©');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (688, 108, '110303', 'Catamayo (La Toma)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (689, 108, '110304', 'El Tambo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (690, 108, '110305', 'Guayquichuma');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (691, 108, '110306', 'San Pedro de La Bendita');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (692, 108, '110307', 'Zambi');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (693, 109, '110401', 'Celica');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (694, 109, '110402', 'Cruzpamba (Cab. En Carlos Bustamante)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (695, 109, '110403', 'Chaquinal');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (696, 109, '110404', '12 de Diciembre (Cab. En Achiotes)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (697, 109, '110405', 'Pindal (Federico PÃ¡ez)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (698, 109, '110406', 'Pozul (San Juan de Pozul)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (699, 109, '110407', 'Sabanilla');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (700, 109, '110408', 'Tnte. Maximiliano RodrÃ­guez Loaiza');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (701, 110, '110501', 'Chaguarpamba');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (702, 110, '110502', 'Buenavista');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (703, 110, '110503', 'El Rosario');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (704, 110, '110504', 'Santa Rufina');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (705, 110, '110505', 'Amarillos');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (706, 111, '110601', 'Amaluza');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (707, 111, '110602', 'Bellavista');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (708, 111, '110603', 'Jimbura');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (709, 111, '110604', 'Santa Teresita');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (710, 111, '110605', '27 de Abril (Cab. En La Naranja)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (711, 111, '110606', 'El Ingenio');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (712, 111, '110607', 'El Airo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (713, 112, '110701', 'GonzanamÃ¡');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (714, 112, '110702', 'Changaimina (La Libertad)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (715, 112, '110703', 'Fundochamba');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (716, 112, '110704', 'Nambacola');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (717, 112, '110705', 'Purunuma (Eguiguren)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (718, 112, '110706', 'Quilanga (La Paz)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (719, 112, '110707', 'Sacapalca');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (720, 112, '110708', 'San Antonio de Las Aradas (Cab. En Las Aradas)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (721, 113, '110801', 'General Eloy Alfaro (San SebastiÃ¡n)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (722, 113, '110802', 'MacarÃ¡ (Manuel Enrique Rengel Suquilanda)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (723, 113, '110803', 'MacarÃ¡');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (724, 113, '110804', 'Larama');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (725, 113, '110805', 'La Victoria');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (726, 113, '110806', 'Sabiango (La Capilla)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (727, 114, '110901', 'Catacocha');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (728, 114, '110902', 'Lourdes');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (729, 114, '110903', 'Catacocha');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (730, 114, '110904', 'CangonamÃ¡');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (731, 114, '110905', 'GuachanamÃ¡');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (732, 114, '110906', 'La Tingue');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (733, 114, '110907', 'Lauro Guerrero');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (734, 114, '110908', 'Olmedo (Santa BÃ¡rbara)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (735, 114, '110909', 'Orianga');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (736, 114, '110910', 'San Antonio');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (737, 114, '110911', 'Casanga');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (738, 114, '110912', 'Yamana');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (739, 115, '111001', 'Alamor');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (740, 115, '111002', 'Ciano');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (741, 115, '111003', 'El Arenal');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (742, 115, '111004', 'El Limo (Mariana de JesÃºs)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (743, 115, '111005', 'Mercadillo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (744, 115, '111006', 'Vicentino');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (745, 116, '111101', 'Saraguro');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (746, 116, '111102', 'El ParaÃ­so de CelÃ©n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (747, 116, '111103', 'El TablÃ³n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (748, 116, '111104', 'Lluzhapa');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (749, 116, '111105', 'ManÃº');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (750, 116, '111106', 'San Antonio de Qumbe (Cumbe)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (751, 116, '111107', 'San Pablo de Tenta');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (752, 116, '111108', 'San SebastiÃ¡n de YÃºluc');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (753, 116, '111109', 'Selva Alegre');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (754, 116, '111110', 'Urdaneta (Paquishapa)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (755, 116, '111111', 'Sumaypamba');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (756, 117, '111201', 'Sozoranga');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (757, 117, '111202', 'Nueva FÃ¡tima');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (758, 117, '111203', 'Tacamoros');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (759, 118, '111301', 'Zapotillo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (760, 118, '111302', 'Mangahurco (Cazaderos)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (761, 118, '111303', 'Garzareal');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (762, 118, '111304', 'Limones');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (763, 118, '111305', 'Paletillas');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (764, 118, '111306', 'Bolaspamba');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (765, 119, '111401', 'Pindal');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (766, 119, '111402', 'Chaquinal');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (767, 119, '111403', '12 de Diciembre (Cab.En Achiotes)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (768, 119, '111404', 'Milagros');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (769, 120, '111501', 'Quilanga');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (770, 120, '111502', 'Fundochamba');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (771, 120, '111503', 'San Antonio de Las Aradas (Cab. En Las Aradas)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (772, 121, '111601', 'Olmedo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (773, 121, '111602', 'La Tingue');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (774, 122, '120101', 'Clemente Baquerizo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (775, 122, '120102', 'Dr. Camilo Ponce');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (776, 122, '120103', 'Barreiro');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (777, 122, '120104', 'El Salto');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (778, 122, '120105', 'Babahoyo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (779, 122, '120106', 'Barreiro (Santa Rita)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (780, 122, '120107', 'Caracol');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (781, 122, '120108', 'Febres Cordero (Las Juntas)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (782, 122, '120109', 'Pimocha');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (783, 122, '120110', 'La UniÃ³n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (784, 123, '120201', 'Baba');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (785, 123, '120202', 'Guare');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (786, 123, '120203', 'Isla de Bejucal');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (787, 124, '120301', 'Montalvo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (788, 125, '120401', 'Puebloviejo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (789, 125, '120402', 'Puerto Pechiche');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (790, 125, '120403', 'San Juan');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (791, 126, '120501', 'Quevedo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (792, 126, '120502', 'San Camilo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (793, 126, '120503', 'San JosÃ©');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (794, 126, '120504', 'GuayacÃ¡n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (795, 126, '120505', 'NicolÃ¡s Infante DÃ­az');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (796, 126, '120506', 'San CristÃ³bal');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (797, 126, '120507', 'Siete de Octubre');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (798, 126, '120508', '24 de Mayo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (799, 126, '120509', 'Venus del RÃ­o Quevedo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (800, 126, '120510', 'Viva Alfaro');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (801, 126, '120511', 'Quevedo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (802, 126, '120512', 'Buena FÃ©');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (803, 126, '120513', 'Mocache');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (804, 126, '120514', 'San Carlos');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (805, 126, '120515', 'Valencia');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (806, 126, '120516', 'La Esperanza');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (807, 127, '120601', 'Catarama');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (808, 127, '120602', 'Ricaurte');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (809, 128, '120701', '10 de Noviembre');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (810, 128, '120702', 'Ventanas');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (811, 128, '120703', 'Quinsaloma');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (812, 128, '120704', 'Zapotal');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (813, 128, '120705', 'Chacarita');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (814, 128, '120706', 'Los Ãngeles');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (815, 129, '120801', 'Vinces');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (816, 129, '120802', 'Antonio Sotomayor (Cab. En Playas de Vinces)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (817, 129, '120803', 'Palenque');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (818, 130, '120901', 'Palenque');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (819, 131, '121001', 'San Jacinto de Buena FÃ©');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (820, 131, '121002', '7 de Agosto');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (821, 131, '121003', '11 de Octubre');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (822, 131, '121004', 'San Jacinto de Buena FÃ©');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (823, 131, '121005', 'Patricia Pilar');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (824, 132, '121101', 'Valencia');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (825, 133, '121201', 'Mocache');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (826, 134, '121301', 'Quinsaloma');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (827, 135, '130101', 'Portoviejo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (828, 135, '130102', '12 de Marzo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (829, 135, '130103', 'ColÃ³n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (830, 135, '130104', 'PicoazÃ¡');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (831, 135, '130105', 'San Pablo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (832, 135, '130106', 'AndrÃ©s de Vera');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (833, 135, '130107', 'Francisco Pacheco');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (834, 135, '130108', '18 de Octubre');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (835, 135, '130109', 'SimÃ³n BolÃ­var');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (836, 135, '130110', 'Portoviejo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (837, 135, '130111', 'AbdÃ³n CalderÃ³n (San Francisco)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (838, 135, '130112', 'Alhajuela (Bajo Grande)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (839, 135, '130113', 'Crucita');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (840, 135, '130114', 'Pueblo Nuevo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (841, 135, '130115', 'Riochico (RÃ­o Chico)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (842, 135, '130116', 'San PlÃ¡cido');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (843, 135, '130117', 'Chirijos');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (844, 136, '130201', 'Calceta');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (845, 136, '130202', 'Membrillo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (846, 136, '130203', 'Quiroga');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (847, 137, '130301', 'Chone');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (848, 137, '130302', 'Santa Rita');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (849, 137, '130303', 'Chone');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (850, 137, '130304', 'BoyacÃ¡');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (851, 137, '130305', 'Canuto');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (852, 137, '130306', 'Convento');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (853, 137, '130307', 'Chibunga');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (854, 137, '130308', 'Eloy Alfaro');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (855, 137, '130309', 'Ricaurte');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (856, 137, '130310', 'San Antonio');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (857, 138, '130401', 'El Carmen');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (858, 138, '130402', '4 de Diciembre');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (859, 138, '130403', 'El Carmen');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (860, 138, '130404', 'Wilfrido Loor Moreira (Maicito)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (861, 138, '130405', 'San Pedro de Suma');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (862, 139, '130501', 'Flavio Alfaro');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (863, 139, '130502', 'San Francisco de Novillo (Cab. En');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (864, 139, '130503', 'Zapallo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (865, 140, '130601', 'Dr. Miguel MorÃ¡n Lucio');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (866, 140, '130602', 'Manuel Inocencio Parrales Y Guale');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (867, 140, '130603', 'San Lorenzo de Jipijapa');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (868, 140, '130604', 'Jipijapa');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (869, 140, '130605', 'AmÃ©rica');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (870, 140, '130606', 'El Anegado (Cab. En Eloy Alfaro)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (871, 140, '130607', 'Julcuy');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (872, 140, '130608', 'La UniÃ³n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (873, 140, '130609', 'Machalilla');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (874, 140, '130610', 'Membrillal');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (875, 140, '130611', 'Pedro Pablo GÃ³mez');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (876, 140, '130612', 'Puerto de Cayo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (877, 140, '130613', 'Puerto LÃ³pez');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (878, 141, '130701', 'JunÃ­n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (879, 142, '130801', 'Los Esteros');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (880, 142, '130802', 'Manta');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (881, 142, '130803', 'San Mateo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (882, 142, '130804', 'Tarqui');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (883, 142, '130805', 'Eloy Alfaro');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (884, 142, '130806', 'Manta');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (885, 142, '130807', 'San Lorenzo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (886, 142, '130808', 'Santa Marianita (Boca de Pacoche)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (887, 143, '130901', 'Anibal San AndrÃ©s');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (888, 143, '130902', 'Montecristi');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (889, 143, '130903', 'El Colorado');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (890, 143, '130904', 'General Eloy Alfaro');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (891, 143, '130905', 'Leonidas ProaÃ±o');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (892, 143, '130906', 'Montecristi');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (893, 143, '130907', 'JaramijÃ³');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (894, 143, '130908', 'La Pila');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (895, 144, '131001', 'PajÃ¡n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (896, 144, '131002', 'Campozano (La Palma de PajÃ¡n)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (897, 144, '131003', 'Cascol');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (898, 144, '131004', 'Guale');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (899, 144, '131005', 'Lascano');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (900, 145, '131101', 'Pichincha');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (901, 145, '131102', 'Barraganete');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (902, 145, '131103', 'San SebastiÃ¡n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (903, 146, '131201', 'Rocafuerte');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (904, 147, '131301', 'Santa Ana');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (905, 147, '131302', 'Lodana');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (906, 147, '131303', 'Santa Ana de Vuelta Larga');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (907, 147, '131304', 'Ayacucho');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (908, 147, '131305', 'Honorato VÃ¡squez (Cab. En VÃ¡squez)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (909, 147, '131306', 'La UniÃ³n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (910, 147, '131307', 'Olmedo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (911, 147, '131308', 'San Pablo (Cab. En Pueblo Nuevo)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (912, 148, '131401', 'BahÃ­a de CarÃ¡quez');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (913, 148, '131402', 'Leonidas Plaza GutiÃ©rrez');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (914, 148, '131403', 'BahÃ­a de CarÃ¡quez');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (915, 148, '131404', 'Canoa');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (916, 148, '131405', 'CojimÃ­es');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (917, 148, '131406', 'CharapotÃ³');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (918, 148, '131407', '10 de Agosto');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (919, 148, '131408', 'Jama');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (920, 148, '131409', 'Pedernales');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (921, 148, '131410', 'San Isidro');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (922, 148, '131411', 'San Vicente');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (923, 149, '131501', 'Tosagua');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (924, 149, '131502', 'Bachillero');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (925, 149, '131503', 'Angel Pedro Giler (La Estancilla)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (926, 150, '131601', 'Sucre');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (927, 150, '131602', 'Bellavista');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (928, 150, '131603', 'Noboa');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (929, 150, '131604', 'Arq. Sixto DurÃ¡n BallÃ©n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (930, 151, '131701', 'Pedernales');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (931, 151, '131702', 'CojimÃ­es');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (932, 151, '131703', '10 de Agosto');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (933, 151, '131704', 'Atahualpa');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (934, 152, '131801', 'Olmedo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (935, 153, '131901', 'Puerto LÃ³pez');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (936, 153, '131902', 'Machalilla');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (937, 153, '131903', 'Salango');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (938, 154, '132001', 'Jama');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (939, 155, '132101', 'JaramijÃ³');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (940, 156, '132201', 'San Vicente');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (941, 156, '132202', 'Canoa');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (942, 157, '140101', 'Macas');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (943, 157, '140102', 'Alshi (Cab. En 9 de Octubre)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (944, 157, '140103', 'Chiguaza');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (945, 157, '140104', 'General ProaÃ±o');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (946, 157, '140105', 'Huasaga (Cab.En Wampuik)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (947, 157, '140106', 'Macuma');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (948, 157, '140107', 'San Isidro');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (949, 157, '140108', 'Sevilla Don Bosco');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (950, 157, '140109', 'SinaÃ­');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (951, 157, '140110', 'Taisha');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (952, 157, '140111', 'ZuÃ±a (ZÃºÃ±ac)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (953, 157, '140112', 'Tuutinentza');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (954, 157, '140113', 'Cuchaentza');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (955, 157, '140114', 'San JosÃ© de Morona');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (956, 157, '140115', 'RÃ­o Blanco');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (957, 158, '140201', 'Gualaquiza');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (958, 158, '140202', 'Mercedes Molina');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (959, 158, '140203', 'Gualaquiza');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (960, 158, '140204', 'Amazonas (Rosario de Cuyes)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (961, 158, '140205', 'Bermejos');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (962, 158, '140206', 'Bomboiza');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (963, 158, '140207', 'ChigÃ¼inda');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (964, 158, '140208', 'El Rosario');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (965, 158, '140209', 'Nueva Tarqui');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (966, 158, '140210', 'San Miguel de Cuyes');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (967, 158, '140211', 'El Ideal');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (968, 159, '140301', 'General Leonidas Plaza GutiÃ©rrez (LimÃ³n)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (969, 159, '140302', 'Indanza');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (970, 159, '140303', 'Pan de AzÃºcar');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (971, 159, '140304', 'San Antonio (Cab. En San Antonio Centro');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (972, 159, '140305', 'San Carlos de LimÃ³n (San Carlos del');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (973, 159, '140306', 'San Juan Bosco');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (974, 159, '140307', 'San Miguel de Conchay');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (975, 159, '140308', 'Santa Susana de Chiviaza (Cab. En Chiviaza)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (976, 159, '140309', 'Yunganza (Cab. En El Rosario)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (977, 160, '140401', 'Palora (Metzera)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (978, 160, '140402', 'Arapicos');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (979, 160, '140403', 'CumandÃ¡ (Cab. En Colonia AgrÃ­cola Sevilla del Oro)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (980, 160, '140404', 'Huamboya');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (981, 160, '140405', 'Sangay (Cab. En Nayamanaca)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (982, 161, '140501', 'Santiago de MÃ©ndez');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (983, 161, '140502', 'Copal');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (984, 161, '140503', 'Chupianza');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (985, 161, '140504', 'Patuca');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (986, 161, '140505', 'San Luis de El Acho (Cab. En El Acho)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (987, 161, '140506', 'Santiago');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (988, 161, '140507', 'Tayuza');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (989, 161, '140508', 'San Francisco de Chinimbimi');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (990, 162, '140601', 'SucÃºa');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (991, 162, '140602', 'AsunciÃ³n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (992, 162, '140603', 'Huambi');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (993, 162, '140604', 'LogroÃ±o');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (994, 162, '140605', 'Yaupi');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (995, 162, '140606', 'Santa Marianita de JesÃºs');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (996, 163, '140701', 'Huamboya');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (997, 163, '140702', 'Chiguaza');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (998, 163, '140703', 'Pablo Sexto');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (999, 164, '140801', 'San Juan Bosco');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1000, 164, '140802', 'Pan de AzÃºcar');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1001, 164, '140803', 'San Carlos de LimÃ³n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1002, 164, '140804', 'San Jacinto de Wakambeis');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1003, 164, '140805', 'Santiago de Pananza');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1004, 165, '140901', 'Taisha');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1005, 165, '140902', 'Huasaga (Cab. En Wampuik)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1006, 165, '140903', 'Macuma');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1007, 165, '140904', 'Tuutinentza');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1008, 165, '140905', 'Pumpuentsa');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1009, 166, '141001', 'LogroÃ±o');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1010, 166, '141002', 'Yaupi');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1011, 166, '141003', 'Shimpis');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1012, 167, '141101', 'Pablo Sexto');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1013, 168, '141201', 'Santiago');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1014, 168, '141202', 'San JosÃ© de Morona');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1015, 169, '150101', 'Tena');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1016, 169, '150102', 'Ahuano');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1017, 169, '150103', 'Carlos Julio Arosemena Tola (Zatza-Yacu)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1018, 169, '150104', 'Chontapunta');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1019, 169, '150105', 'Pano');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1020, 169, '150106', 'Puerto Misahualli');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1021, 169, '150107', 'Puerto Napo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1022, 169, '150108', 'TÃ¡lag');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1023, 169, '150109', 'San Juan de Muyuna');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1024, 170, '150201', 'Archidona');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1025, 170, '150202', 'Avila');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1026, 170, '150203', 'Cotundo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1027, 170, '150204', 'Loreto');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1028, 170, '150205', 'San Pablo de Ushpayacu');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1029, 170, '150206', 'Puerto Murialdo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1030, 171, '150301', 'El Chaco');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1031, 171, '150302', 'Gonzalo DÃ­az de Pineda (El BombÃ³n)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1032, 171, '150303', 'Linares');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1033, 171, '150304', 'Oyacachi');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1034, 171, '150305', 'Santa Rosa');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1035, 171, '150306', 'Sardinas');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1036, 172, '150401', 'Baeza');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1037, 172, '150402', 'Cosanga');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1038, 172, '150403', 'Cuyuja');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1039, 172, '150404', 'Papallacta');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1040, 172, '150405', 'San Francisco de Borja (Virgilio DÃ¡vila)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1041, 172, '150406', 'San JosÃ© del Payamino');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1042, 172, '150407', 'Sumaco');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1043, 173, '150501', 'Carlos Julio Arosemena Tola');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1044, 174, '160101', 'Puyo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1045, 174, '160102', 'Arajuno');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1046, 174, '160103', 'Canelos');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1047, 174, '160104', 'Curaray');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1048, 174, '160105', 'Diez de Agosto');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1049, 174, '160106', 'FÃ¡tima');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1050, 174, '160107', 'Montalvo (Andoas)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1051, 174, '160108', 'Pomona');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1052, 174, '160109', 'RÃ­o Corrientes');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1053, 174, '160110', 'RÃ­o Tigre');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1054, 174, '160111', 'Santa Clara');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1055, 174, '160112', 'Sarayacu');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1056, 174, '160113', 'SimÃ³n BolÃ­var (Cab. En Mushullacta)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1057, 174, '160114', 'Tarqui');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1058, 174, '160115', 'Teniente Hugo Ortiz');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1059, 174, '160116', 'Veracruz (Indillama) (Cab. En Indillama)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1060, 174, '160117', 'El Triunfo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1061, 175, '160201', 'Mera');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1062, 175, '160202', 'Madre Tierra');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1063, 175, '160203', 'Shell');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1064, 176, '160301', 'Santa Clara');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1065, 176, '160302', 'San JosÃ©');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1066, 177, '160401', 'Arajuno');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1067, 177, '160402', 'Curaray');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1068, 178, '170101', 'Belisario Quevedo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1069, 178, '170102', 'CarcelÃ©n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1070, 178, '170103', 'Centro HistÃ³rico');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1071, 178, '170104', 'Cochapamba');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1072, 178, '170105', 'ComitÃ© del Pueblo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1073, 178, '170106', 'Cotocollao');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1074, 178, '170107', 'Chilibulo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1075, 178, '170108', 'Chillogallo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1076, 178, '170109', 'Chimbacalle');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1077, 178, '170110', 'El Condado');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1078, 178, '170111', 'GuamanÃ­');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1079, 178, '170112', 'IÃ±aquito');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1080, 178, '170113', 'ItchimbÃ­a');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1081, 178, '170114', 'Jipijapa');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1082, 178, '170115', 'Kennedy');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1083, 178, '170116', 'La Argelia');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1084, 178, '170117', 'La ConcepciÃ³n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1085, 178, '170118', 'La Ecuatoriana');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1086, 178, '170119', 'La Ferroviaria');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1087, 178, '170120', 'La Libertad');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1088, 178, '170121', 'La Magdalena');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1089, 178, '170122', 'La Mena');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1090, 178, '170123', 'Mariscal Sucre');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1091, 178, '170124', 'Ponceano');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1092, 178, '170125', 'PuengasÃ­');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1093, 178, '170126', 'Quitumbe');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1094, 178, '170127', 'Rumipamba');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1095, 178, '170128', 'San Bartolo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1096, 178, '170129', 'San Isidro del Inca');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1097, 178, '170130', 'San Juan');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1098, 178, '170131', 'Solanda');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1099, 178, '170132', 'Turubamba');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1100, 178, '170133', 'Quito Distrito Metropolitano');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1101, 178, '170134', 'AlangasÃ­');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1102, 178, '170135', 'AmaguaÃ±a');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1103, 178, '170136', 'Atahualpa');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1104, 178, '170137', 'CalacalÃ­');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1105, 178, '170138', 'CalderÃ³n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1106, 178, '170139', 'Conocoto');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1107, 178, '170140', 'CumbayÃ¡');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1108, 178, '170141', 'Chavezpamba');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1109, 178, '170142', 'Checa');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1110, 178, '170143', 'El Quinche');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1111, 178, '170144', 'Gualea');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1112, 178, '170145', 'Guangopolo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1113, 178, '170146', 'Guayllabamba');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1114, 178, '170147', 'La Merced');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1115, 178, '170148', 'Llano Chico');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1116, 178, '170149', 'Lloa');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1117, 178, '170150', 'Mindo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1118, 178, '170151', 'Nanegal');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1119, 178, '170152', 'Nanegalito');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1120, 178, '170153', 'NayÃ³n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1121, 178, '170154', 'Nono');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1122, 178, '170155', 'Pacto');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1123, 178, '170156', 'Pedro Vicente Maldonado');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1124, 178, '170157', 'Perucho');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1125, 178, '170158', 'Pifo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1126, 178, '170159', 'PÃ­ntag');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1127, 178, '170160', 'Pomasqui');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1128, 178, '170161', 'PuÃ©llaro');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1129, 178, '170162', 'Puembo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1130, 178, '170163', 'San Antonio');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1131, 178, '170164', 'San JosÃ© de Minas');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1132, 178, '170165', 'San Miguel de Los Bancos');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1133, 178, '170166', 'Tababela');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1134, 178, '170167', 'Tumbaco');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1135, 178, '170168', 'YaruquÃ­');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1136, 178, '170169', 'Zambiza');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1137, 178, '170170', 'Puerto Quito');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1138, 179, '170201', 'Ayora');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1139, 179, '170202', 'Cayambe');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1140, 179, '170203', 'Juan Montalvo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1141, 179, '170204', 'Cayambe');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1142, 179, '170205', 'AscÃ¡zubi');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1143, 179, '170206', 'Cangahua');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1144, 179, '170207', 'Olmedo (Pesillo)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1145, 179, '170208', 'OtÃ³n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1146, 179, '170209', 'Santa Rosa de Cuzubamba');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1147, 180, '170301', 'Machachi');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1148, 180, '170302', 'AlÃ³ag');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1149, 180, '170303', 'AloasÃ­');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1150, 180, '170304', 'Cutuglahua');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1151, 180, '170305', 'El Chaupi');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1152, 180, '170306', 'Manuel Cornejo Astorga (Tandapi)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1153, 180, '170307', 'Tambillo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1154, 180, '170308', 'Uyumbicho');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1155, 181, '170401', 'Tabacundo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1156, 181, '170402', 'La Esperanza');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1157, 181, '170403', 'MalchinguÃ­');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1158, 181, '170404', 'Tocachi');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1159, 181, '170405', 'Tupigachi');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1160, 182, '170501', 'SangolquÃ­');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1161, 182, '170502', 'San Pedro de Taboada');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1162, 182, '170503', 'San Rafael');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1163, 182, '170504', 'Sangolqui');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1164, 182, '170505', 'Cotogchoa');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1165, 182, '170506', 'Rumipamba');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1166, 183, '170601', 'San Miguel de Los Bancos');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1167, 183, '170602', 'Mindo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1168, 183, '170603', 'Pedro Vicente Maldonado');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1169, 183, '170604', 'Puerto Quito');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1170, 184, '170701', 'Pedro Vicente Maldonado');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1171, 185, '170801', 'Puerto Quito');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1172, 186, '180101', 'Atocha â Ficoa');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1173, 186, '180102', 'Celiano Monge');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1174, 186, '180103', 'Huachi Chico');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1175, 186, '180104', 'Huachi Loreto');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1176, 186, '180105', 'La Merced');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1177, 186, '180106', 'La PenÃ­nsula');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1178, 186, '180107', 'Matriz');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1179, 186, '180108', 'Pishilata');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1180, 186, '180109', 'San Francisco');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1181, 186, '180110', 'Ambato');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1182, 186, '180111', 'Ambatillo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1183, 186, '180112', 'Atahualpa (Chisalata)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1184, 186, '180113', 'Augusto N. MartÃ­nez (Mundugleo)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1185, 186, '180114', 'Constantino FernÃ¡ndez (Cab. En Cullitahua)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1186, 186, '180115', 'Huachi Grande');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1187, 186, '180116', 'Izamba');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1188, 186, '180117', 'Juan Benigno Vela');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1189, 186, '180118', 'Montalvo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1190, 186, '180119', 'Pasa');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1191, 186, '180120', 'Picaigua');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1192, 186, '180121', 'PilagÃ¼Ã­n (PilahÃ¼Ã­n)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1193, 186, '180122', 'Quisapincha (Quizapincha)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1194, 186, '180123', 'San BartolomÃ© de Pinllog');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1195, 186, '180124', 'San Fernando (Pasa San Fernando)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1196, 186, '180125', 'Santa Rosa');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1197, 186, '180126', 'Totoras');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1198, 186, '180127', 'Cunchibamba');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1199, 186, '180128', 'Unamuncho');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1200, 187, '180201', 'BaÃ±os de Agua Santa');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1201, 187, '180202', 'Lligua');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1202, 187, '180203', 'RÃ­o Negro');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1203, 187, '180204', 'RÃ­o Verde');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1204, 187, '180205', 'Ulba');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1205, 188, '180301', 'Cevallos');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1206, 189, '180401', 'Mocha');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1207, 189, '180402', 'PinguilÃ­');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1208, 190, '180501', 'Patate');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1209, 190, '180502', 'El Triunfo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1210, 190, '180503', 'Los Andes (Cab. En Poatug)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1211, 190, '180504', 'Sucre (Cab. En Sucre-Patate Urcu)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1212, 191, '180601', 'Quero');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1213, 191, '180602', 'Rumipamba');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1214, 191, '180603', 'Yanayacu - Mochapata (Cab. En Yanayacu)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1215, 192, '180701', 'Pelileo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1216, 192, '180702', 'Pelileo Grande');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1217, 192, '180703', 'Pelileo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1218, 192, '180704', 'BenÃ­tez (Pachanlica)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1219, 192, '180705', 'BolÃ­var');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1220, 192, '180706', 'CotalÃ³');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1221, 192, '180707', 'Chiquicha (Cab. En Chiquicha Grande)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1222, 192, '180708', 'El Rosario (Rumichaca)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1223, 192, '180709', 'GarcÃ­a Moreno (Chumaqui)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1224, 192, '180710', 'GuambalÃ³ (HuambalÃ³)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1225, 192, '180711', 'Salasaca');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1226, 193, '180801', 'Ciudad Nueva');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1227, 193, '180802', 'PÃ­llaro');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1228, 193, '180803', 'PÃ­llaro');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1229, 193, '180804', 'Baquerizo Moreno');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1230, 193, '180805', 'Emilio MarÃ­a TerÃ¡n (Rumipamba)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1231, 193, '180806', 'Marcos Espinel (Chacata)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1232, 193, '180807', 'Presidente Urbina (Chagrapamba -Patzucul)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1233, 193, '180808', 'San AndrÃ©s');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1234, 193, '180809', 'San JosÃ© de PoalÃ³');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1235, 193, '180810', 'San Miguelito');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1236, 194, '180901', 'Tisaleo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1237, 194, '180902', 'Quinchicoto');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1238, 195, '190101', 'El LimÃ³n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1239, 195, '190102', 'Zamora');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1240, 195, '190103', 'Zamora');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1241, 195, '190104', 'Cumbaratza');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1242, 195, '190105', 'Guadalupe');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1243, 195, '190106', 'Imbana (La Victoria de Imbana)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1244, 195, '190107', 'Paquisha');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1245, 195, '190108', 'Sabanilla');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1246, 195, '190109', 'Timbara');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1247, 195, '190110', 'Zumbi');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1248, 195, '190111', 'San Carlos de Las Minas');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1249, 196, '190201', 'Zumba');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1250, 196, '190202', 'Chito');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1251, 196, '190203', 'El Chorro');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1252, 196, '190204', 'El Porvenir del Carmen');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1253, 196, '190205', 'La Chonta');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1254, 196, '190206', 'Palanda');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1255, 196, '190207', 'Pucapamba');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1256, 196, '190208', 'San Francisco del Vergel');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1257, 196, '190209', 'Valladolid');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1258, 196, '190210', 'San AndrÃ©s');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1259, 197, '190301', 'Guayzimi');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1260, 197, '190302', 'Zurmi');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1261, 197, '190303', 'Nuevo ParaÃ­so');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1262, 198, '190401', '28 de Mayo (San JosÃ© de Yacuambi)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1263, 198, '190402', 'La Paz');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1264, 198, '190403', 'Tutupali');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1265, 199, '190501', 'Yantzaza (Yanzatza)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1266, 199, '190502', 'ChicaÃ±a');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1267, 199, '190503', 'El Pangui');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1268, 199, '190504', 'Los Encuentros');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1269, 200, '190601', 'El Pangui');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1270, 200, '190602', 'El Guisme');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1271, 200, '190603', 'Pachicutza');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1272, 200, '190604', 'Tundayme');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1273, 201, '190701', 'Zumbi');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1274, 201, '190702', 'Paquisha');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1275, 201, '190703', 'Triunfo-Dorado');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1276, 201, '190704', 'Panguintza');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1277, 202, '190801', 'Palanda');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1278, 202, '190802', 'El Porvenir del Carmen');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1279, 202, '190803', 'San Francisco del Vergel');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1280, 202, '190804', 'Valladolid');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1281, 202, '190805', 'La Canela');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1282, 203, '190901', 'Paquisha');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1283, 203, '190902', 'Bellavista');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1284, 203, '190903', 'Nuevo Quito');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1285, 204, '200101', 'Puerto Baquerizo Moreno');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1286, 204, '200102', 'El Progreso');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1287, 204, '200103', 'Isla Santa MarÃ­a (Floreana) (Cab. En Pto. Velasco Ibarra)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1288, 205, '200201', 'Puerto Villamil');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1289, 205, '200202', 'TomÃ¡s de Berlanga (Santo TomÃ¡s)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1290, 206, '200301', 'Puerto Ayora');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1291, 206, '200302', 'Bellavista');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1292, 206, '200303', 'Santa Rosa (Incluye La Isla Baltra)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1293, 207, '210101', 'Nueva Loja');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1294, 207, '210102', 'Cuyabeno');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1295, 207, '210103', 'Dureno');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1296, 207, '210104', 'General FarfÃ¡n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1297, 207, '210105', 'Tarapoa');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1298, 207, '210106', 'El Eno');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1299, 207, '210107', 'Pacayacu');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1300, 207, '210108', 'JambelÃ­');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1301, 207, '210109', 'Santa Cecilia');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1302, 207, '210110', 'Aguas Negras');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1303, 208, '210201', 'El Dorado de Cascales');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1304, 208, '210202', 'El Reventador');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1305, 208, '210203', 'Gonzalo Pizarro');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1306, 208, '210204', 'LumbaquÃ­');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1307, 208, '210205', 'Puerto Libre');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1308, 208, '210206', 'Santa Rosa de SucumbÃ­os');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1309, 209, '210301', 'Puerto El Carmen del Putumayo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1310, 209, '210302', 'Palma Roja');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1311, 209, '210303', 'Puerto BolÃ­var (Puerto MontÃºfar)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1312, 209, '210304', 'Puerto RodrÃ­guez');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1313, 209, '210305', 'Santa Elena');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1314, 210, '210401', 'Shushufindi');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1315, 210, '210402', 'Limoncocha');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1316, 210, '210403', 'PaÃ±acocha');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1317, 210, '210404', 'San Roque (Cab. En San Vicente)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1318, 210, '210405', 'San Pedro de Los Cofanes');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1319, 210, '210406', 'Siete de Julio');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1320, 211, '210501', 'La Bonita');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1321, 211, '210502', 'El PlayÃ³n de San Francisco');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1322, 211, '210503', 'La SofÃ­a');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1323, 211, '210504', 'Rosa Florida');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1324, 211, '210505', 'Santa BÃ¡rbara');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1325, 212, '210601', 'El Dorado de Cascales');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1326, 212, '210602', 'Santa Rosa de SucumbÃ­os');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1327, 212, '210603', 'Sevilla');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1328, 213, '210701', 'Tarapoa');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1329, 213, '210702', 'Cuyabeno');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1330, 213, '210703', 'Aguas Negras');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1331, 214, '220101', 'Puerto Francisco de Orellana (El Coca)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1332, 214, '220102', 'Dayuma');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1333, 214, '220103', 'Taracoa (Nueva Esperanza: Yuca)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1334, 214, '220104', 'Alejandro Labaka');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1335, 214, '220105', 'El Dorado');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1336, 214, '220106', 'El EdÃ©n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1337, 214, '220107', 'GarcÃ­a Moreno');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1338, 214, '220108', 'InÃ©s Arango (Cab. En Western)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1339, 214, '220109', 'La Belleza');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1340, 214, '220110', 'Nuevo ParaÃ­so (Cab. En UniÃ³n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1341, 214, '220111', 'San JosÃ© de Guayusa');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1342, 214, '220112', 'San Luis de Armenia');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1343, 215, '220201', 'Tipitini');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1344, 215, '220202', 'Nuevo Rocafuerte');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1345, 215, '220203', 'CapitÃ¡n Augusto Rivadeneyra');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1346, 215, '220204', 'Cononaco');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1347, 215, '220205', 'Santa MarÃ­a de Huiririma');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1348, 215, '220206', 'Tiputini');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1349, 215, '220207', 'YasunÃ­');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1350, 216, '220301', 'La Joya de Los Sachas');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1351, 216, '220302', 'Enokanqui');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1352, 216, '220303', 'Pompeya');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1353, 216, '220304', 'San Carlos');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1354, 216, '220305', 'San SebastiÃ¡n del Coca');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1355, 216, '220306', 'Lago San Pedro');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1356, 216, '220307', 'Rumipamba');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1357, 216, '220308', 'Tres de Noviembre');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1358, 216, '220309', 'UniÃ³n MilagreÃ±a');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1359, 217, '220401', 'Loreto');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1360, 217, '220402', 'Avila (Cab. En Huiruno)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1361, 217, '220403', 'Puerto Murialdo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1362, 217, '220404', 'San JosÃ© de Payamino');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1363, 217, '220405', 'San JosÃ© de Dahuano');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1364, 217, '220406', 'San Vicente de Huaticocha');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1365, 218, '230101', 'Abraham CalazacÃ³n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1366, 218, '230102', 'BombolÃ­');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1367, 218, '230103', 'Chiguilpe');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1368, 218, '230104', 'RÃ­o Toachi');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1369, 218, '230105', 'RÃ­o Verde');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1370, 218, '230106', 'Santo Domingo de Los Colorados');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1371, 218, '230107', 'Zaracay');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1372, 218, '230108', 'Santo Domingo de Los Colorados');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1373, 218, '230109', 'AlluriquÃ­n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1374, 218, '230110', 'Puerto LimÃ³n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1375, 218, '230111', 'Luz de AmÃ©rica');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1376, 218, '230112', 'San Jacinto del BÃºa');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1377, 218, '230113', 'Valle Hermoso');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1378, 218, '230114', 'El Esfuerzo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1379, 218, '230115', 'Santa MarÃ­a del Toachi');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1380, 219, '240101', 'Ballenita');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1381, 219, '240102', 'Santa Elena');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1382, 219, '240103', 'Santa Elena');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1383, 219, '240104', 'Atahualpa');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1384, 219, '240105', 'Colonche');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1385, 219, '240106', 'Chanduy');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1386, 219, '240107', 'Manglaralto');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1387, 219, '240108', 'SimÃ³n BolÃ­var (Julio Moreno)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1388, 219, '240109', 'San JosÃ© de AncÃ³n');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1389, 220, '240201', 'La Libertad');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1390, 221, '240301', 'Carlos Espinoza Larrea');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1391, 221, '240302', 'Gral. Alberto EnrÃ­quez Gallo');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1392, 221, '240303', 'Vicente Rocafuerte');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1393, 221, '240304', 'Santa Rosa');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1394, 221, '240305', 'Salinas');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1395, 221, '240306', 'Anconcito');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1396, 221, '240307', 'JosÃ© Luis Tamayo (Muey)');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1397, 222, '250101', 'Las Golondrinas');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1398, 222, '250102', 'Manga del Cura');
-INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) VALUES (1399, 222, '250103', 'El Piedrero');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1, 1, '010101', 'Bellavista', 'BELLAVISTA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (2, 1, '010102', 'CaÃ±aribamba', 'CANARIBAMBA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (3, 1, '010103', 'El BatÃ¡n', 'EL BATAN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (4, 1, '010104', 'El Sagrario', 'EL SAGRARIO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (5, 1, '010105', 'El Vecino', 'EL VECINO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (6, 1, '010106', 'Gil RamÃ­rez DÃ¡valos', 'GIL RAMIREZ DAVALOS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (7, 1, '010107', 'HuaynacÃ¡pac', 'HUAYNACAPAC');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (8, 1, '010108', 'MachÃ¡ngara', 'MACHANGARA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (9, 1, '010109', 'Monay', 'MONAY');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (10, 1, '010110', 'San Blas', 'SAN BLAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (11, 1, '010111', 'San SebastiÃ¡n', 'SAN SEBASTIAN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (12, 1, '010112', 'Sucre', 'SUCRE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (13, 1, '010113', 'Totoracocha', 'TOTORACOCHA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (14, 1, '010114', 'Yanuncay', 'YANUNCAY');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (15, 1, '010115', 'Hermano Miguel', 'HERMANO MIGUEL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (16, 1, '010116', 'Cuenca', 'CUENCA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (17, 1, '010117', 'BaÃ±os', 'BANOS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (18, 1, '010118', 'Cumbe', 'CUMBE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (19, 1, '010119', 'Chaucha', 'CHAUCHA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (20, 1, '010120', 'Checa (Jidcay)', 'CHECA JIDCAY');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (21, 1, '010121', 'Chiquintad', 'CHIQUINTAD');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (22, 1, '010122', 'Llacao', 'LLACAO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (23, 1, '010123', 'Molleturo', 'MOLLETURO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (24, 1, '010124', 'Nulti', 'NULTI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (25, 1, '010125', 'Octavio Cordero Palacios (Santa Rosa)', 'OCTAVIO CORDERO PALACIOS SANTA ROSA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (26, 1, '010126', 'Paccha', 'PACCHA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (27, 1, '010127', 'Quingeo', 'QUINGEO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (28, 1, '010128', 'Ricaurte', 'RICAURTE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (29, 1, '010129', 'San JoaquÃ­n', 'SAN JOAQUIN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (30, 1, '010130', 'Santa Ana', 'SANTA ANA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (31, 1, '010131', 'SayausÃ­', 'SAYAUSI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (32, 1, '010132', 'Sidcay', 'SIDCAY');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (33, 1, '010133', 'Sinincay', 'SININCAY');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (34, 1, '010134', 'Tarqui', 'TARQUI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (35, 1, '010135', 'Turi', 'TURI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (36, 1, '010136', 'Valle', 'VALLE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (37, 1, '010137', 'Victoria del Portete (Irquis)', 'VICTORIA DEL PORTETE IRQUIS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (38, 2, '010201', 'GirÃ³n', 'GIRON');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (39, 2, '010202', 'AsunciÃ³n', 'ASUNCION');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (40, 2, '010203', 'San Gerardo', 'SAN GERARDO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (41, 3, '010301', 'Gualaceo', 'GUALACEO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (42, 3, '010302', 'Chordeleg', 'CHORDELEG');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (43, 3, '010303', 'Daniel CÃ³rdova Toral (El Oriente)', 'DANIEL CORDOVA TORAL EL ORIENTE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (44, 3, '010304', 'JadÃ¡n', 'JADAN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (45, 3, '010305', 'Mariano Moreno', 'MARIANO MORENO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (46, 3, '010306', 'Principal', 'PRINCIPAL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (47, 3, '010307', 'Remigio Crespo Toral (GÃºlag)', 'REMIGIO CRESPO TORAL GULAG');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (48, 3, '010308', 'San Juan', 'SAN JUAN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (49, 3, '010309', 'Zhidmad', 'ZHIDMAD');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (50, 3, '010310', 'Luis Cordero Vega', 'LUIS CORDERO VEGA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (51, 3, '010311', 'SimÃ³n BolÃ­var (Cab. En GaÃ±anzol)', 'SIMON BOLIVAR CAB EN GANANZOL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (52, 4, '010401', 'NabÃ³n', 'NABON');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (53, 4, '010402', 'Cochapata', 'COCHAPATA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (54, 4, '010403', 'El Progreso (Cab.En Zhota)', 'EL PROGRESO CAB EN ZHOTA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (55, 4, '010404', 'Las Nieves (Chaya)', 'LAS NIEVES CHAYA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (56, 4, '010405', 'OÃ±a', 'ONA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (57, 5, '010501', 'Paute', 'PAUTE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (58, 5, '010502', 'Amaluza', 'AMALUZA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (59, 5, '010503', 'BulÃ¡n (JosÃ© VÃ­ctor Izquierdo)', 'BULAN JOSE VICTOR IZQUIERDO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (60, 5, '010504', 'ChicÃ¡n (Guillermo Ortega)', 'CHICAN GUILLERMO ORTEGA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (61, 5, '010505', 'El Cabo', 'EL CABO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (62, 5, '010506', 'Guachapala', 'GUACHAPALA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (63, 5, '010507', 'Guarainag', 'GUARAINAG');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (64, 5, '010508', 'Palmas', 'PALMAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (65, 5, '010509', 'Pan', 'PAN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (66, 5, '010510', 'San CristÃ³bal (Carlos OrdÃ³Ã±ez Lazo)', 'SAN CRISTOBAL CARLOS ORDONEZ LAZO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (67, 5, '010511', 'Sevilla de Oro', 'SEVILLA DE ORO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (68, 5, '010512', 'Tomebamba', 'TOMEBAMBA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (69, 5, '010513', 'Dug Dug', 'DUG DUG');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (70, 6, '010601', 'PucarÃ¡', 'PUCARA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (71, 6, '010602', 'Camilo Ponce EnrÃ­quez (Cab. En RÃ­o 7 de Mollepongo)', 'CAMILO PONCE ENRIQUEZ CAB EN RIO 7 DE MOLLEPONGO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (72, 6, '010603', 'San Rafael de Sharug', 'SAN RAFAEL DE SHARUG');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (73, 7, '010701', 'San Fernando', 'SAN FERNANDO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (74, 7, '010702', 'ChumblÃ­n', 'CHUMBLIN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (75, 8, '010801', 'Santa Isabel (Chaguarurco)', 'SANTA ISABEL CHAGUARURCO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (76, 8, '010802', 'AbdÃ³n CalderÃ³n (La UniÃ³n)', 'ABDON CALDERON LA UNION');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (77, 8, '010803', 'El Carmen de PijilÃ­', 'EL CARMEN DE PIJILI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (78, 8, '010804', 'Zhaglli (Shaglli)', 'ZHAGLLI SHAGLLI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (79, 8, '010805', 'San Salvador de CaÃ±aribamba', 'SAN SALVADOR DE CANARIBAMBA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (80, 9, '010901', 'Sigsig', 'SIGSIG');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (81, 9, '010902', 'Cuchil (Cutchil)', 'CUCHIL CUTCHIL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (82, 9, '010903', 'Gima', 'GIMA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (83, 9, '010904', 'Guel', 'GUEL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (84, 9, '010905', 'Ludo', 'LUDO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (85, 9, '010906', 'San BartolomÃ©', 'SAN BARTOLOME');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (86, 9, '010907', 'San JosÃ© de Raranga', 'SAN JOSE DE RARANGA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (87, 10, '011001', 'San Felipe de OÃ±a Cabecera Cantonal', 'SAN FELIPE DE ONA CABECERA CANTONAL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (88, 10, '011002', 'Susudel', 'SUSUDEL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (89, 11, '011101', 'Chordeleg', 'CHORDELEG');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (90, 11, '011102', 'Principal', 'PRINCIPAL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (91, 11, '011103', 'La UniÃ³n', 'LA UNION');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (92, 11, '011104', 'Luis Galarza Orellana (Cab.En Delegsol)', 'LUIS GALARZA ORELLANA CAB EN DELEGSOL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (93, 11, '011105', 'San MartÃ­n de Puzhio', 'SAN MARTIN DE PUZHIO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (94, 12, '011201', 'El Pan', 'EL PAN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (95, 12, '011202', 'Amaluza', 'AMALUZA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (96, 12, '011203', 'Palmas', 'PALMAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (97, 12, '011204', 'San Vicente', 'SAN VICENTE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (98, 13, '011301', 'Sevilla de Oro', 'SEVILLA DE ORO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (99, 13, '011302', 'Amaluza', 'AMALUZA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (100, 13, '011303', 'Palmas', 'PALMAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (101, 14, '011401', 'Guachapala', 'GUACHAPALA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (102, 15, '011501', 'Camilo Ponce EnrÃ­quez', 'CAMILO PONCE ENRIQUEZ');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (103, 15, '011502', 'El Carmen de PijilÃ­', 'EL CARMEN DE PIJILI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (104, 16, '020101', 'Ãngel Polibio ChÃ¡ves', 'ANGEL POLIBIO CHAVES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (105, 16, '020102', 'Gabriel Ignacio Veintimilla', 'GABRIEL IGNACIO VEINTIMILLA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (106, 16, '020103', 'Guanujo', 'GUANUJO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (107, 16, '020104', 'Guaranda', 'GUARANDA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (108, 16, '020105', 'Facundo Vela', 'FACUNDO VELA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (109, 16, '020106', 'Guanujo', 'GUANUJO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (110, 16, '020107', 'Julio E. Moreno (CatanahuÃ¡n Grande)', 'JULIO E MORENO CATANAHUAN GRANDE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (111, 16, '020108', 'Las Naves', 'LAS NAVES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (112, 16, '020109', 'Salinas', 'SALINAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (113, 16, '020110', 'San Lorenzo', 'SAN LORENZO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (114, 16, '020111', 'San SimÃ³n (Yacoto)', 'SAN SIMON YACOTO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (115, 16, '020112', 'Santa FÃ© (Santa FÃ©)', 'SANTA FE SANTA FE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (116, 16, '020113', 'SimiÃ¡tug', 'SIMIATUG');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (117, 16, '020114', 'San Luis de Pambil', 'SAN LUIS DE PAMBIL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (118, 17, '020201', 'Chillanes', 'CHILLANES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (119, 17, '020202', 'San JosÃ© del Tambo (Tambopamba)', 'SAN JOSE DEL TAMBO TAMBOPAMBA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (120, 18, '020301', 'San JosÃ© de Chimbo', 'SAN JOSE DE CHIMBO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (121, 18, '020302', 'AsunciÃ³n (Asancoto)', 'ASUNCION ASANCOTO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (122, 18, '020303', 'Caluma', 'CALUMA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (123, 18, '020304', 'Magdalena (Chapacoto)', 'MAGDALENA CHAPACOTO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (124, 18, '020305', 'San SebastiÃ¡n', 'SAN SEBASTIAN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (125, 18, '020306', 'Telimbela', 'TELIMBELA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (126, 19, '020401', 'EcheandÃ­a', 'ECHEANDIA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (127, 20, '020501', 'San Miguel', 'SAN MIGUEL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (128, 20, '020502', 'Balsapamba', 'BALSAPAMBA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (129, 20, '020503', 'BilovÃ¡n', 'BILOVAN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (130, 20, '020504', 'RÃ©gulo de Mora', 'REGULO DE MORA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (131, 20, '020505', 'San Pablo (San Pablo de Atenas)', 'SAN PABLO SAN PABLO DE ATENAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (132, 20, '020506', 'Santiago', 'SANTIAGO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (133, 20, '020507', 'San Vicente', 'SAN VICENTE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (134, 21, '020601', 'Caluma', 'CALUMA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (135, 22, '020701', 'Las Mercedes', 'LAS MERCEDES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (136, 22, '020702', 'Las Naves', 'LAS NAVES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (137, 22, '020703', 'Las Naves', 'LAS NAVES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (138, 23, '030101', 'Aurelio Bayas MartÃ­nez', 'AURELIO BAYAS MARTINEZ');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (139, 23, '030102', 'Azogues', 'AZOGUES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (140, 23, '030103', 'Borrero', 'BORRERO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (141, 23, '030104', 'San Francisco', 'SAN FRANCISCO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (142, 23, '030105', 'Azogues', 'AZOGUES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (143, 23, '030106', 'Cojitambo', 'COJITAMBO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (144, 23, '030107', 'DÃ©leg', 'DELEG');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (145, 23, '030108', 'GuapÃ¡n', 'GUAPAN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (146, 23, '030109', 'Javier Loyola (Chuquipata)', 'JAVIER LOYOLA CHUQUIPATA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (147, 23, '030110', 'Luis Cordero', 'LUIS CORDERO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (148, 23, '030111', 'Pindilig', 'PINDILIG');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (149, 23, '030112', 'Rivera', 'RIVERA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (150, 23, '030113', 'San Miguel', 'SAN MIGUEL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (151, 23, '030114', 'Solano', 'SOLANO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (152, 23, '030115', 'Taday', 'TADAY');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (153, 24, '030201', 'BibliÃ¡n', 'BIBLIAN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (154, 24, '030202', 'NazÃ³n (Cab. En Pampa de DomÃ­nguez)', 'NAZON CAB EN PAMPA DE DOMINGUEZ');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (155, 24, '030203', 'San Francisco de Sageo', 'SAN FRANCISCO DE SAGEO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (156, 24, '030204', 'Turupamba', 'TURUPAMBA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (157, 24, '030205', 'JerusalÃ©n', 'JERUSALEN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (158, 25, '030301', 'CaÃ±ar', 'CANAR');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (159, 25, '030302', 'Chontamarca', 'CHONTAMARCA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (160, 25, '030303', 'Chorocopte', 'CHOROCOPTE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (161, 25, '030304', 'General Morales (Socarte)', 'GENERAL MORALES SOCARTE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (162, 25, '030305', 'Gualleturo', 'GUALLETURO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (163, 25, '030306', 'Honorato VÃ¡squez (Tambo Viejo)', 'HONORATO VASQUEZ TAMBO VIEJO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (164, 25, '030307', 'Ingapirca', 'INGAPIRCA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (165, 25, '030308', 'Juncal', 'JUNCAL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (166, 25, '030309', 'San Antonio', 'SAN ANTONIO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (167, 25, '030310', 'Suscal', 'SUSCAL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (168, 25, '030311', 'Tambo', 'TAMBO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (169, 25, '030312', 'Zhud', 'ZHUD');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (170, 25, '030313', 'Ventura', 'VENTURA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (171, 25, '030314', 'Ducur', 'DUCUR');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (172, 26, '030401', 'La Troncal', 'LA TRONCAL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (173, 26, '030402', 'Manuel J. Calle', 'MANUEL J CALLE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (174, 26, '030403', 'Pancho Negro', 'PANCHO NEGRO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (175, 27, '030501', 'El Tambo', 'EL TAMBO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (176, 28, '030601', 'DÃ©leg', 'DELEG');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (177, 28, '030602', 'Solano', 'SOLANO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (178, 29, '030701', 'Suscal', 'SUSCAL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (179, 30, '040101', 'GonzÃ¡lez SuÃ¡rez', 'GONZALEZ SUAREZ');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (180, 30, '040102', 'TulcÃ¡n', 'TULCAN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (181, 30, '040103', 'TulcÃ¡n', 'TULCAN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (182, 30, '040104', 'El Carmelo (El Pun)', 'EL CARMELO EL PUN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (183, 30, '040105', 'Huaca', 'HUACA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (184, 30, '040106', 'Julio Andrade (Orejuela)', 'JULIO ANDRADE OREJUELA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (185, 30, '040107', 'Maldonado', 'MALDONADO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (186, 30, '040108', 'Pioter', 'PIOTER');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (187, 30, '040109', 'Tobar Donoso (La Bocana de CamumbÃ­)', 'TOBAR DONOSO LA BOCANA DE CAMUMBI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (188, 30, '040110', 'TufiÃ±o', 'TUFINO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (189, 30, '040111', 'Urbina (Taya)', 'URBINA TAYA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (190, 30, '040112', 'El Chical', 'EL CHICAL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (191, 30, '040113', 'Mariscal Sucre', 'MARISCAL SUCRE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (192, 30, '040114', 'Santa Martha de Cuba', 'SANTA MARTHA DE CUBA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (193, 31, '040201', 'BolÃ­var', 'BOLIVAR');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (194, 31, '040202', 'GarcÃ­a Moreno', 'GARCIA MORENO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (195, 31, '040203', 'Los Andes', 'LOS ANDES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (196, 31, '040204', 'Monte Olivo', 'MONTE OLIVO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (197, 31, '040205', 'San Vicente de Pusir', 'SAN VICENTE DE PUSIR');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (198, 31, '040206', 'San Rafael', 'SAN RAFAEL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (199, 32, '040301', 'El Ãngel', 'EL ANGEL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (200, 32, '040302', '27 de Septiembre', '27 DE SEPTIEMBRE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (201, 32, '040303', 'El Angel', 'EL ANGEL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (202, 32, '040304', 'El Goaltal', 'EL GOALTAL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (203, 32, '040305', 'La Libertad (Alizo)', 'LA LIBERTAD ALIZO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (204, 32, '040306', 'San Isidro', 'SAN ISIDRO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (205, 33, '040401', 'Mira (Chontahuasi)', 'MIRA CHONTAHUASI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (206, 33, '040402', 'ConcepciÃ³n', 'CONCEPCION');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (207, 33, '040403', 'JijÃ³n Y CaamaÃ±o (Cab. En RÃ­o Blanco)', 'JIJON Y CAAMANO CAB EN RIO BLANCO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (208, 33, '040404', 'Juan Montalvo (San Ignacio de Quil)', 'JUAN MONTALVO SAN IGNACIO DE QUIL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (209, 34, '040501', 'GonzÃ¡lez SuÃ¡rez', 'GONZALEZ SUAREZ');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (210, 34, '040502', 'San JosÃ©', 'SAN JOSE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (211, 34, '040503', 'San Gabriel', 'SAN GABRIEL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (212, 34, '040504', 'CristÃ³bal ColÃ³n', 'CRISTOBAL COLON');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (213, 34, '040505', 'ChitÃ¡n de Navarrete', 'CHITAN DE NAVARRETE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (214, 34, '040506', 'FernÃ¡ndez Salvador', 'FERNANDEZ SALVADOR');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (215, 34, '040507', 'La Paz', 'LA PAZ');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (216, 34, '040508', 'Piartal', 'PIARTAL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (217, 35, '040601', 'Huaca', 'HUACA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (218, 35, '040602', 'Mariscal Sucre', 'MARISCAL SUCRE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (219, 36, '050101', 'Eloy Alfaro (San Felipe)', 'ELOY ALFARO SAN FELIPE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (220, 36, '050102', 'Ignacio Flores (Parque Flores)', 'IGNACIO FLORES PARQUE FLORES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (221, 36, '050103', 'Juan Montalvo (San SebastiÃ¡n)', 'JUAN MONTALVO SAN SEBASTIAN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (222, 36, '050104', 'La Matriz', 'LA MATRIZ');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (223, 36, '050105', 'San Buenaventura', 'SAN BUENAVENTURA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (224, 36, '050106', 'Latacunga', 'LATACUNGA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (225, 36, '050107', 'Alaques (AlÃ¡quez)', 'ALAQUES ALAQUEZ');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (226, 36, '050108', 'Belisario Quevedo (GuanailÃ­n)', 'BELISARIO QUEVEDO GUANAILIN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (227, 36, '050109', 'Guaitacama (Guaytacama)', 'GUAITACAMA GUAYTACAMA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (228, 36, '050110', 'Joseguango Bajo', 'JOSEGUANGO BAJO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (229, 36, '050111', 'Las Pampas', 'LAS PAMPAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (230, 36, '050112', 'MulalÃ³', 'MULALO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (231, 36, '050113', '11 de Noviembre (Ilinchisi)', '11 DE NOVIEMBRE ILINCHISI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (232, 36, '050114', 'PoalÃ³', 'POALO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (233, 36, '050115', 'San Juan de Pastocalle', 'SAN JUAN DE PASTOCALLE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (234, 36, '050116', 'Sigchos', 'SIGCHOS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (235, 36, '050117', 'TanicuchÃ­', 'TANICUCHI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (236, 36, '050118', 'Toacaso', 'TOACASO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (237, 36, '050119', 'Palo Quemado', 'PALO QUEMADO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (238, 37, '050201', 'El Carmen', 'EL CARMEN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (239, 37, '050202', 'La ManÃ¡', 'LA MANA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (240, 37, '050203', 'El Triunfo', 'EL TRIUNFO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (241, 37, '050204', 'La ManÃ¡', 'LA MANA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (242, 37, '050205', 'Guasaganda (Cab.En Guasaganda', 'GUASAGANDA CAB EN GUASAGANDA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (243, 37, '050206', 'Pucayacu', 'PUCAYACU');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (244, 38, '050301', 'El CorazÃ³n', 'EL CORAZON');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (245, 38, '050302', 'Moraspungo', 'MORASPUNGO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (246, 38, '050303', 'Pinllopata', 'PINLLOPATA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (247, 38, '050304', 'RamÃ³n CampaÃ±a', 'RAMON CAMPANA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (248, 39, '050401', 'PujilÃ­', 'PUJILI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (249, 39, '050402', 'Angamarca', 'ANGAMARCA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (250, 39, '050403', 'ChucchilÃ¡n (ChugchilÃ¡n)', 'CHUCCHILAN CHUGCHILAN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (251, 39, '050404', 'Guangaje', 'GUANGAJE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (252, 39, '050405', 'IsinlibÃ­ (IsinlivÃ­)', 'ISINLIBI ISINLIVI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (253, 39, '050406', 'La Victoria', 'LA VICTORIA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (254, 39, '050407', 'PilalÃ³', 'PILALO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (255, 39, '050408', 'Tingo', 'TINGO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (256, 39, '050409', 'Zumbahua', 'ZUMBAHUA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (257, 40, '050501', 'San Miguel', 'SAN MIGUEL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (258, 40, '050502', 'Antonio JosÃ© HolguÃ­n (Santa LucÃ­a)', 'ANTONIO JOSE HOLGUIN SANTA LUCIA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (259, 40, '050503', 'Cusubamba', 'CUSUBAMBA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (260, 40, '050504', 'Mulalillo', 'MULALILLO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (261, 40, '050505', 'Mulliquindil (Santa Ana)', 'MULLIQUINDIL SANTA ANA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (262, 40, '050506', 'Pansaleo', 'PANSALEO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (263, 41, '050601', 'SaquisilÃ­', 'SAQUISILI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (264, 41, '050602', 'Canchagua', 'CANCHAGUA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (265, 41, '050603', 'ChantilÃ­n', 'CHANTILIN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (266, 41, '050604', 'Cochapamba', 'COCHAPAMBA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (267, 42, '050701', 'Sigchos', 'SIGCHOS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (268, 42, '050702', 'ChugchillÃ¡n', 'CHUGCHILLAN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (269, 42, '050703', 'IsinlivÃ­', 'ISINLIVI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (270, 42, '050704', 'Las Pampas', 'LAS PAMPAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (271, 42, '050705', 'Palo Quemado', 'PALO QUEMADO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (272, 43, '060101', 'Lizarzaburu', 'LIZARZABURU');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (273, 43, '060102', 'Maldonado', 'MALDONADO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (274, 43, '060103', 'Velasco', 'VELASCO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (275, 43, '060104', 'Veloz', 'VELOZ');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (276, 43, '060105', 'YaruquÃ­es', 'YARUQUIES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (277, 43, '060106', 'Riobamba', 'RIOBAMBA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (278, 43, '060107', 'Cacha (Cab. En MachÃ¡ngara)', 'CACHA CAB EN MACHANGARA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (279, 43, '060108', 'Calpi', 'CALPI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (280, 43, '060109', 'CubijÃ­es', 'CUBIJIES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (281, 43, '060110', 'Flores', 'FLORES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (282, 43, '060111', 'LicÃ¡n', 'LICAN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (283, 43, '060112', 'Licto', 'LICTO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (284, 43, '060113', 'PungalÃ¡', 'PUNGALA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (285, 43, '060114', 'PunÃ­n', 'PUNIN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (286, 43, '060115', 'Quimiag', 'QUIMIAG');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (287, 43, '060116', 'San Juan', 'SAN JUAN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (288, 43, '060117', 'San Luis', 'SAN LUIS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (289, 44, '060201', 'AlausÃ­', 'ALAUSI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (290, 44, '060202', 'Achupallas', 'ACHUPALLAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (291, 44, '060203', 'CumandÃ¡', 'CUMANDA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (292, 44, '060204', 'Guasuntos', 'GUASUNTOS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (293, 44, '060205', 'Huigra', 'HUIGRA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (294, 44, '060206', 'Multitud', 'MULTITUD');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (295, 44, '060207', 'PistishÃ­ (Nariz del Diablo)', 'PISTISHI NARIZ DEL DIABLO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (296, 44, '060208', 'Pumallacta', 'PUMALLACTA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (297, 44, '060209', 'Sevilla', 'SEVILLA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (298, 44, '060210', 'Sibambe', 'SIBAMBE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (299, 44, '060211', 'TixÃ¡n', 'TIXAN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (300, 45, '060301', 'Cajabamba', 'CAJABAMBA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (301, 45, '060302', 'Sicalpa', 'SICALPA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (302, 45, '060303', 'Villa La UniÃ³n (Cajabamba)', 'VILLA LA UNION CAJABAMBA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (303, 45, '060304', 'CaÃ±i', 'CANI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (304, 45, '060305', 'Columbe', 'COLUMBE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (305, 45, '060306', 'Juan de Velasco (Pangor)', 'JUAN DE VELASCO PANGOR');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (306, 45, '060307', 'Santiago de Quito (Cab. En San Antonio de Quito)', 'SANTIAGO DE QUITO CAB EN SAN ANTONIO DE QUITO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (307, 46, '060401', 'Chambo', 'CHAMBO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (308, 47, '060501', 'Chunchi', 'CHUNCHI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (309, 47, '060502', 'Capzol', 'CAPZOL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (310, 47, '060503', 'Compud', 'COMPUD');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (311, 47, '060504', 'Gonzol', 'GONZOL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (312, 47, '060505', 'Llagos', 'LLAGOS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (313, 48, '060601', 'Guamote', 'GUAMOTE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (314, 48, '060602', 'Cebadas', 'CEBADAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (315, 48, '060603', 'Palmira', 'PALMIRA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (316, 49, '060701', 'El Rosario', 'EL ROSARIO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (317, 49, '060702', 'La Matriz', 'LA MATRIZ');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (318, 49, '060703', 'Guano', 'GUANO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (319, 49, '060704', 'Guanando', 'GUANANDO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (320, 49, '060705', 'Ilapo', 'ILAPO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (321, 49, '060706', 'La Providencia', 'LA PROVIDENCIA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (322, 49, '060707', 'San AndrÃ©s', 'SAN ANDRES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (323, 49, '060708', 'San Gerardo de PacaicaguÃ¡n', 'SAN GERARDO DE PACAICAGUAN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (324, 49, '060709', 'San Isidro de PatulÃº', 'SAN ISIDRO DE PATULU');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (325, 49, '060710', 'San JosÃ© del Chazo', 'SAN JOSE DEL CHAZO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (326, 49, '060711', 'Santa FÃ© de GalÃ¡n', 'SANTA FE DE GALAN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (327, 49, '060712', 'ValparaÃ­so', 'VALPARAISO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (328, 50, '060801', 'Pallatanga', 'PALLATANGA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (329, 51, '060901', 'Penipe', 'PENIPE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (330, 51, '060902', 'El Altar', 'EL ALTAR');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (331, 51, '060903', 'Matus', 'MATUS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (332, 51, '060904', 'Puela', 'PUELA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (333, 51, '060905', 'San Antonio de Bayushig', 'SAN ANTONIO DE BAYUSHIG');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (334, 51, '060906', 'La Candelaria', 'LA CANDELARIA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (335, 51, '060907', 'Bilbao (Cab.En Quilluyacu)', 'BILBAO CAB EN QUILLUYACU');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (336, 52, '061001', 'CumandÃ¡', 'CUMANDA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (337, 53, '070101', 'La Providencia', 'LA PROVIDENCIA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (338, 53, '070102', 'Machala', 'MACHALA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (339, 53, '070103', 'Puerto BolÃ­var', 'PUERTO BOLIVAR');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (340, 53, '070104', 'Nueve de Mayo', 'NUEVE DE MAYO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (341, 53, '070105', 'El Cambio', 'EL CAMBIO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (342, 53, '070106', 'Machala', 'MACHALA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (343, 53, '070107', 'El Cambio', 'EL CAMBIO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (344, 53, '070108', 'El Retiro', 'EL RETIRO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (345, 54, '070201', 'Arenillas', 'ARENILLAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (346, 54, '070202', 'Chacras', 'CHACRAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (347, 54, '070203', 'La Libertad', 'LA LIBERTAD');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (348, 54, '070204', 'Las Lajas (Cab. En La Victoria)', 'LAS LAJAS CAB EN LA VICTORIA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (349, 54, '070205', 'Palmales', 'PALMALES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (350, 54, '070206', 'CarcabÃ³n', 'CARCABON');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (351, 55, '070301', 'Paccha', 'PACCHA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (352, 55, '070302', 'Ayapamba', 'AYAPAMBA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (353, 55, '070303', 'Cordoncillo', 'CORDONCILLO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (354, 55, '070304', 'Milagro', 'MILAGRO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (355, 55, '070305', 'San JosÃ©', 'SAN JOSE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (356, 55, '070306', 'San Juan de Cerro Azul', 'SAN JUAN DE CERRO AZUL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (357, 56, '070401', 'Balsas', 'BALSAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (358, 56, '070402', 'BellamarÃ­a', 'BELLAMARIA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (359, 57, '070501', 'Chilla', 'CHILLA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (360, 58, '070601', 'El Guabo', 'EL GUABO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (361, 58, '070602', 'Barbones (Sucre)', 'BARBONES SUCRE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (362, 58, '070603', 'La Iberia', 'LA IBERIA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (363, 58, '070604', 'Tendales (Cab.En Puerto Tendales)', 'TENDALES CAB EN PUERTO TENDALES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (364, 58, '070605', 'RÃ­o Bonito', 'RIO BONITO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (365, 59, '070701', 'Ecuador', 'ECUADOR');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (366, 59, '070702', 'El ParaÃ­so', 'EL PARAISO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (367, 59, '070703', 'Hualtaco', 'HUALTACO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (368, 59, '070704', 'Milton Reyes', 'MILTON REYES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (369, 59, '070705', 'UniÃ³n Lojana', 'UNION LOJANA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (370, 59, '070706', 'Huaquillas', 'HUAQUILLAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (371, 60, '070801', 'MarcabelÃ­', 'MARCABELI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (372, 60, '070802', 'El Ingenio', 'EL INGENIO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (373, 61, '070901', 'BolÃ­var', 'BOLIVAR');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (374, 61, '070902', 'Loma de Franco', 'LOMA DE FRANCO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (375, 61, '070903', 'Ochoa LeÃ³n (Matriz)', 'OCHOA LEON MATRIZ');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (376, 61, '070904', 'Tres Cerritos', 'TRES CERRITOS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (377, 61, '070905', 'Pasaje', 'PASAJE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (378, 61, '070906', 'Buenavista', 'BUENAVISTA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (379, 61, '070907', 'Casacay', 'CASACAY');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (380, 61, '070908', 'La PeaÃ±a', 'LA PEANA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (381, 61, '070909', 'Progreso', 'PROGRESO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (382, 61, '070910', 'Uzhcurrumi', 'UZHCURRUMI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (383, 61, '070911', 'CaÃ±aquemada', 'CANAQUEMADA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (384, 62, '071001', 'La Matriz', 'LA MATRIZ');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (385, 62, '071002', 'La Susaya', 'LA SUSAYA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (386, 62, '071003', 'PiÃ±as Grande', 'PINAS GRANDE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (387, 62, '071004', 'PiÃ±as', 'PINAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (388, 62, '071005', 'Capiro (Cab. En La Capilla de Capiro)', 'CAPIRO CAB EN LA CAPILLA DE CAPIRO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (389, 62, '071006', 'La Bocana', 'LA BOCANA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (390, 62, '071007', 'Moromoro (Cab. En El Vado)', 'MOROMORO CAB EN EL VADO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (391, 62, '071008', 'Piedras', 'PIEDRAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (392, 62, '071009', 'San Roque (Ambrosio Maldonado)', 'SAN ROQUE AMBROSIO MALDONADO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (393, 62, '071010', 'Saracay', 'SARACAY');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (394, 63, '071101', 'Portovelo', 'PORTOVELO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (395, 63, '071102', 'Curtincapa', 'CURTINCAPA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (396, 63, '071103', 'Morales', 'MORALES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (397, 63, '071104', 'SalatÃ­', 'SALATI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (398, 64, '071201', 'Santa Rosa', 'SANTA ROSA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (399, 64, '071202', 'Puerto JelÃ­', 'PUERTO JELI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (400, 64, '071203', 'Balneario JambelÃ­ (SatÃ©lite)', 'BALNEARIO JAMBELI SATELITE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (401, 64, '071204', 'JumÃ³n (SatÃ©lite)', 'JUMON SATELITE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (402, 64, '071205', 'Nuevo Santa Rosa', 'NUEVO SANTA ROSA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (403, 64, '071206', 'Santa Rosa', 'SANTA ROSA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (404, 64, '071207', 'Bellavista', 'BELLAVISTA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (405, 64, '071208', 'JambelÃ­', 'JAMBELI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (406, 64, '071209', 'La Avanzada', 'LA AVANZADA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (407, 64, '071210', 'San Antonio', 'SAN ANTONIO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (408, 64, '071211', 'Torata', 'TORATA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (409, 64, '071212', 'Victoria', 'VICTORIA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (410, 64, '071213', 'BellamarÃ­a', 'BELLAMARIA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (411, 65, '071301', 'Zaruma', 'ZARUMA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (412, 65, '071302', 'AbaÃ±Ã­n', 'ABANIN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (413, 65, '071303', 'Arcapamba', 'ARCAPAMBA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (414, 65, '071304', 'GuanazÃ¡n', 'GUANAZAN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (415, 65, '071305', 'GuizhaguiÃ±a', 'GUIZHAGUINA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (416, 65, '071306', 'Huertas', 'HUERTAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (417, 65, '071307', 'Malvas', 'MALVAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (418, 65, '071308', 'Muluncay Grande', 'MULUNCAY GRANDE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (419, 65, '071309', 'Sinsao', 'SINSAO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (420, 65, '071310', 'Salvias', 'SALVIAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (421, 66, '071401', 'La Victoria', 'LA VICTORIA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (422, 66, '071402', 'Platanillos', 'PLATANILLOS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (423, 66, '071403', 'Valle Hermoso', 'VALLE HERMOSO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (424, 66, '071404', 'La Victoria', 'LA VICTORIA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (425, 66, '071405', 'La Libertad', 'LA LIBERTAD');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (426, 66, '071406', 'El ParaÃ­so', 'EL PARAISO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (427, 66, '071407', 'San Isidro', 'SAN ISIDRO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (428, 67, '080101', 'BartolomÃ© Ruiz (CÃ©sar Franco CarriÃ³n)', 'BARTOLOME RUIZ CESAR FRANCO CARRION');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (429, 67, '080102', '5 de Agosto', '5 DE AGOSTO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (430, 67, '080103', 'Esmeraldas', 'ESMERALDAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (431, 67, '080104', 'Luis Tello (Las Palmas)', 'LUIS TELLO LAS PALMAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (432, 67, '080105', 'SimÃ³n Plata Torres', 'SIMON PLATA TORRES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (433, 67, '080106', 'Esmeraldas', 'ESMERALDAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (434, 67, '080107', 'Atacames', 'ATACAMES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (435, 67, '080108', 'Camarones (Cab. En San Vicente)', 'CAMARONES CAB EN SAN VICENTE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (436, 67, '080109', 'Crnel. Carlos Concha Torres (Cab.En Huele)', 'CRNEL CARLOS CONCHA TORRES CAB EN HUELE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (437, 67, '080110', 'Chinca', 'CHINCA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (438, 67, '080111', 'Chontaduro', 'CHONTADURO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (439, 67, '080112', 'ChumundÃ©', 'CHUMUNDE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (440, 67, '080113', 'Lagarto', 'LAGARTO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (441, 67, '080114', 'La UniÃ³n', 'LA UNION');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (442, 67, '080115', 'Majua', 'MAJUA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (443, 67, '080116', 'Montalvo (Cab. En Horqueta)', 'MONTALVO CAB EN HORQUETA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (444, 67, '080117', 'RÃ­o Verde', 'RIO VERDE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (445, 67, '080118', 'Rocafuerte', 'ROCAFUERTE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (446, 67, '080119', 'San Mateo', 'SAN MATEO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (447, 67, '080120', 'SÃºa (Cab. En La Bocana)', 'SUA CAB EN LA BOCANA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (448, 67, '080121', 'Tabiazo', 'TABIAZO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (449, 67, '080122', 'Tachina', 'TACHINA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (450, 67, '080123', 'TonchigÃ¼e', 'TONCHIGUE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (451, 67, '080124', 'Vuelta Larga', 'VUELTA LARGA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (452, 68, '080201', 'Valdez (Limones)', 'VALDEZ LIMONES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (453, 68, '080202', 'Anchayacu', 'ANCHAYACU');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (454, 68, '080203', 'Atahualpa (Cab. En Camarones)', 'ATAHUALPA CAB EN CAMARONES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (455, 68, '080204', 'BorbÃ³n', 'BORBON');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (456, 68, '080205', 'La Tola', 'LA TOLA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (457, 68, '080206', 'Luis Vargas Torres (Cab. En Playa de Oro)', 'LUIS VARGAS TORRES CAB EN PLAYA DE ORO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (458, 68, '080207', 'Maldonado', 'MALDONADO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (459, 68, '080208', 'Pampanal de BolÃ­var', 'PAMPANAL DE BOLIVAR');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (460, 68, '080209', 'San Francisco de Onzole', 'SAN FRANCISCO DE ONZOLE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (461, 68, '080210', 'Santo Domingo de Onzole', 'SANTO DOMINGO DE ONZOLE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (462, 68, '080211', 'Selva Alegre', 'SELVA ALEGRE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (463, 68, '080212', 'TelembÃ­', 'TELEMBI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (464, 68, '080213', 'ColÃ³n Eloy del MarÃ­a', 'COLON ELOY DEL MARIA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (465, 68, '080214', 'San JosÃ© de Cayapas', 'SAN JOSE DE CAYAPAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (466, 68, '080215', 'TimbirÃ©', 'TIMBIRE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (467, 69, '080301', 'Muisne', 'MUISNE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (468, 69, '080302', 'BolÃ­var', 'BOLIVAR');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (469, 69, '080303', 'Daule', 'DAULE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (470, 69, '080304', 'Galera', 'GALERA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (471, 69, '080305', 'Quingue (Olmedo Perdomo Franco)', 'QUINGUE OLMEDO PERDOMO FRANCO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (472, 69, '080306', 'Salima', 'SALIMA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (473, 69, '080307', 'San Francisco', 'SAN FRANCISCO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (474, 69, '080308', 'San Gregorio', 'SAN GREGORIO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (475, 69, '080309', 'San JosÃ© de Chamanga (Cab.En Chamanga)', 'SAN JOSE DE CHAMANGA CAB EN CHAMANGA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (476, 70, '080401', 'Rosa ZÃ¡rate (QuinindÃ©)', 'ROSA ZARATE QUININDE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (477, 70, '080402', 'Cube', 'CUBE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (478, 70, '080403', 'Chura (Chancama) (Cab. En El Yerbero)', 'CHURA CHANCAMA CAB EN EL YERBERO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (479, 70, '080404', 'Malimpia', 'MALIMPIA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (480, 70, '080405', 'Viche', 'VICHE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (481, 70, '080406', 'La UniÃ³n', 'LA UNION');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (482, 71, '080501', 'San Lorenzo', 'SAN LORENZO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (483, 71, '080502', 'Alto Tambo (Cab. En Guadual)', 'ALTO TAMBO CAB EN GUADUAL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (484, 71, '080503', 'AncÃ³n (Pichangal) (Cab. En Palma Real)', 'ANCON PICHANGAL CAB EN PALMA REAL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (485, 71, '080504', 'CalderÃ³n', 'CALDERON');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (486, 71, '080505', 'Carondelet', 'CARONDELET');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (487, 71, '080506', '5 de Junio (Cab. En Uimbi)', '5 DE JUNIO CAB EN UIMBI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (488, 71, '080507', 'ConcepciÃ³n', 'CONCEPCION');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (489, 71, '080508', 'Mataje (Cab. En Santander)', 'MATAJE CAB EN SANTANDER');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (490, 71, '080509', 'San Javier de CachavÃ­ (Cab. En San Javier)', 'SAN JAVIER DE CACHAVI CAB EN SAN JAVIER');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (491, 71, '080510', 'Santa Rita', 'SANTA RITA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (492, 71, '080511', 'Tambillo', 'TAMBILLO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (493, 71, '080512', 'TululbÃ­ (Cab. En Ricaurte)', 'TULULBI CAB EN RICAURTE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (494, 71, '080513', 'Urbina', 'URBINA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (495, 72, '080601', 'Atacames', 'ATACAMES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (496, 72, '080602', 'La UniÃ³n', 'LA UNION');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (497, 72, '080603', 'SÃºa (Cab. En La Bocana)', 'SUA CAB EN LA BOCANA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (498, 72, '080604', 'TonchigÃ¼e', 'TONCHIGUE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (499, 72, '080605', 'Tonsupa', 'TONSUPA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (500, 73, '080701', 'Rioverde', 'RIOVERDE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (501, 73, '080702', 'Chontaduro', 'CHONTADURO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (502, 73, '080703', 'ChumundÃ©', 'CHUMUNDE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (503, 73, '080704', 'Lagarto', 'LAGARTO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (504, 73, '080705', 'Montalvo (Cab. En Horqueta)', 'MONTALVO CAB EN HORQUETA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (505, 73, '080706', 'Rocafuerte', 'ROCAFUERTE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (506, 74, '080801', 'La Concordia', 'LA CONCORDIA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (507, 74, '080802', 'Monterrey', 'MONTERREY');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (508, 74, '080803', 'La Villegas', 'LA VILLEGAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (509, 74, '080804', 'Plan Piloto', 'PLAN PILOTO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (510, 75, '090101', 'Ayacucho', 'AYACUCHO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (511, 75, '090102', 'BolÃ­var (Sagrario)', 'BOLIVAR SAGRARIO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (512, 75, '090103', 'Carbo (ConcepciÃ³n)', 'CARBO CONCEPCION');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (513, 75, '090104', 'Febres Cordero', 'FEBRES CORDERO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (514, 75, '090105', 'GarcÃ­a Moreno', 'GARCIA MORENO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (515, 75, '090106', 'Letamendi', 'LETAMENDI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (516, 75, '090107', 'Nueve de Octubre', 'NUEVE DE OCTUBRE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (517, 75, '090108', 'Olmedo (San Alejo)', 'OLMEDO SAN ALEJO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (518, 75, '090109', 'Roca', 'ROCA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (519, 75, '090110', 'Rocafuerte', 'ROCAFUERTE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (520, 75, '090111', 'Sucre', 'SUCRE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (521, 75, '090112', 'Tarqui', 'TARQUI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (522, 75, '090113', 'Urdaneta', 'URDANETA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (523, 75, '090114', 'Ximena', 'XIMENA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (524, 75, '090115', 'Pascuales', 'PASCUALES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (525, 75, '090116', 'Guayaquil', 'GUAYAQUIL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (526, 75, '090117', 'ChongÃ³n', 'CHONGON');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (527, 75, '090118', 'Juan GÃ³mez RendÃ³n (Progreso)', 'JUAN GOMEZ RENDON PROGRESO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (528, 75, '090119', 'Morro', 'MORRO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (529, 75, '090120', 'Pascuales', 'PASCUALES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (530, 75, '090121', 'Playas (Gral. Villamil)', 'PLAYAS GRAL VILLAMIL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (531, 75, '090122', 'Posorja', 'POSORJA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (532, 75, '090123', 'PunÃ¡', 'PUNA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (533, 75, '090124', 'Tenguel', 'TENGUEL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (534, 76, '090201', 'Alfredo Baquerizo Moreno (JujÃ¡n)', 'ALFREDO BAQUERIZO MORENO JUJAN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (535, 77, '090301', 'Balao', 'BALAO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (536, 78, '090401', 'Balzar', 'BALZAR');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (537, 79, '090501', 'Colimes', 'COLIMES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (538, 79, '090502', 'San Jacinto', 'SAN JACINTO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (539, 80, '090601', 'Daule', 'DAULE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (540, 80, '090602', 'La Aurora (SatÃ©lite)', 'LA AURORA SATELITE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (541, 80, '090603', 'Banife', 'BANIFE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (542, 80, '090604', 'Emiliano Caicedo Marcos', 'EMILIANO CAICEDO MARCOS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (543, 80, '090605', 'Magro', 'MAGRO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (544, 80, '090606', 'Padre Juan Bautista Aguirre', 'PADRE JUAN BAUTISTA AGUIRRE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (545, 80, '090607', 'Santa Clara', 'SANTA CLARA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (546, 80, '090608', 'Vicente Piedrahita', 'VICENTE PIEDRAHITA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (547, 80, '090609', 'Daule', 'DAULE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (548, 80, '090610', 'Isidro Ayora (Soledad)', 'ISIDRO AYORA SOLEDAD');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (549, 80, '090611', 'Juan Bautista Aguirre (Los Tintos)', 'JUAN BAUTISTA AGUIRRE LOS TINTOS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (550, 80, '090612', 'Laurel', 'LAUREL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (551, 80, '090613', 'Limonal', 'LIMONAL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (552, 80, '090614', 'Lomas de Sargentillo', 'LOMAS DE SARGENTILLO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (553, 80, '090615', 'Los Lojas (Enrique Baquerizo Moreno)', 'LOS LOJAS ENRIQUE BAQUERIZO MORENO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (554, 80, '090616', 'Piedrahita (Nobol)', 'PIEDRAHITA NOBOL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (555, 81, '090701', 'Eloy Alfaro (DurÃ¡n)', 'ELOY ALFARO DURAN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (556, 81, '090702', 'El Recreo', 'EL RECREO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (557, 81, '090703', 'Eloy Alfaro (DurÃ¡n)', 'ELOY ALFARO DURAN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (558, 82, '090801', 'Velasco Ibarra (El Empalme)', 'VELASCO IBARRA EL EMPALME');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (559, 82, '090802', 'Guayas (Pueblo Nuevo)', 'GUAYAS PUEBLO NUEVO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (560, 82, '090803', 'El Rosario', 'EL ROSARIO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (561, 83, '090901', 'El Triunfo', 'EL TRIUNFO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (562, 84, '091001', 'Milagro', 'MILAGRO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (563, 84, '091002', 'Chobo', 'CHOBO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (564, 84, '091003', 'General Elizalde (Bucay)', 'GENERAL ELIZALDE BUCAY');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (565, 84, '091004', 'Mariscal Sucre (Huaques)', 'MARISCAL SUCRE HUAQUES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (566, 84, '091005', 'Roberto Astudillo (Cab. En Cruce de Venecia)', 'ROBERTO ASTUDILLO CAB EN CRUCE DE VENECIA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (567, 85, '091101', 'Naranjal', 'NARANJAL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (568, 85, '091102', 'JesÃºs MarÃ­a', 'JESUS MARIA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (569, 85, '091103', 'San Carlos', 'SAN CARLOS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (570, 85, '091104', 'Santa Rosa de Flandes', 'SANTA ROSA DE FLANDES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (571, 85, '091105', 'Taura', 'TAURA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (572, 86, '091201', 'Naranjito', 'NARANJITO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (573, 87, '091301', 'Palestina', 'PALESTINA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (574, 88, '091401', 'Pedro Carbo', 'PEDRO CARBO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (575, 88, '091402', 'Valle de La Virgen', 'VALLE DE LA VIRGEN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (576, 88, '091403', 'Sabanilla', 'SABANILLA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (577, 89, '091501', 'SamborondÃ³n', 'SAMBORONDON');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (578, 89, '091502', 'La Puntilla (SatÃ©lite)', 'LA PUNTILLA SATELITE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (579, 89, '091503', 'SamborondÃ³n', 'SAMBORONDON');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (580, 89, '091504', 'Tarifa', 'TARIFA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (581, 90, '091601', 'Santa LucÃ­a', 'SANTA LUCIA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (582, 91, '091701', 'Bocana', 'BOCANA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (583, 91, '091702', 'Candilejos', 'CANDILEJOS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (584, 91, '091703', 'Central', 'CENTRAL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (585, 91, '091704', 'ParaÃ­so', 'PARAISO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (586, 91, '091705', 'San Mateo', 'SAN MATEO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (587, 91, '091706', 'El Salitre (Las Ramas)', 'EL SALITRE LAS RAMAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (588, 91, '091707', 'Gral. Vernaza (Dos Esteros)', 'GRAL VERNAZA DOS ESTEROS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (589, 91, '091708', 'La Victoria (Ãauza)', 'LA VICTORIA NAUZA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (590, 91, '091709', 'Junquillal', 'JUNQUILLAL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (591, 92, '091801', 'San Jacinto de Yaguachi', 'SAN JACINTO DE YAGUACHI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (592, 92, '091802', 'Crnel. Lorenzo de Garaicoa (Pedregal)', 'CRNEL LORENZO DE GARAICOA PEDREGAL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (593, 92, '091803', 'Crnel. Marcelino MaridueÃ±a (San Carlos)', 'CRNEL MARCELINO MARIDUENA SAN CARLOS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (594, 92, '091804', 'Gral. Pedro J. Montero (Boliche)', 'GRAL PEDRO J MONTERO BOLICHE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (595, 92, '091805', 'SimÃ³n BolÃ­var', 'SIMON BOLIVAR');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (596, 92, '091806', 'Yaguachi Viejo (Cone)', 'YAGUACHI VIEJO CONE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (597, 92, '091807', 'Virgen de FÃ¡tima', 'VIRGEN DE FATIMA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (598, 93, '091901', 'General Villamil (Playas)', 'GENERAL VILLAMIL PLAYAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (599, 94, '092001', 'SimÃ³n BolÃ­var', 'SIMON BOLIVAR');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (600, 94, '092002', 'Crnel.Lorenzo de Garaicoa (Pedregal)', 'CRNEL LORENZO DE GARAICOA PEDREGAL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (601, 95, '092101', 'Coronel Marcelino MaridueÃ±a (San Carlos)', 'CORONEL MARCELINO MARIDUENA SAN CARLOS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (602, 96, '092201', 'Lomas de Sargentillo', 'LOMAS DE SARGENTILLO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (603, 96, '092202', 'Isidro Ayora (Soledad)', 'ISIDRO AYORA SOLEDAD');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (604, 97, '092301', 'Narcisa de JesÃºs', 'NARCISA DE JESUS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (605, 98, '092401', 'General Antonio Elizalde (Bucay)', 'GENERAL ANTONIO ELIZALDE BUCAY');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (606, 99, '092501', 'Isidro Ayora', 'ISIDRO AYORA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (607, 100, '100101', 'Caranqui', 'CARANQUI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (608, 100, '100102', 'Guayaquil de Alpachaca', 'GUAYAQUIL DE ALPACHACA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (609, 100, '100103', 'Sagrario', 'SAGRARIO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (610, 100, '100104', 'San Francisco', 'SAN FRANCISCO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (611, 100, '100105', 'La Dolorosa del Priorato', 'LA DOLOROSA DEL PRIORATO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (612, 100, '100106', 'San Miguel de Ibarra', 'SAN MIGUEL DE IBARRA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (613, 100, '100107', 'AmbuquÃ­', 'AMBUQUI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (614, 100, '100108', 'Angochagua', 'ANGOCHAGUA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (615, 100, '100109', 'Carolina', 'CAROLINA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (616, 100, '100110', 'La Esperanza', 'LA ESPERANZA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (617, 100, '100111', 'Lita', 'LITA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (618, 100, '100112', 'Salinas', 'SALINAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (619, 100, '100113', 'San Antonio', 'SAN ANTONIO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (620, 101, '100201', 'Andrade MarÃ­n (Lourdes)', 'ANDRADE MARIN LOURDES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (621, 101, '100202', 'Atuntaqui', 'ATUNTAQUI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (622, 101, '100203', 'Atuntaqui', 'ATUNTAQUI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (623, 101, '100204', 'Imbaya (San Luis de Cobuendo)', 'IMBAYA SAN LUIS DE COBUENDO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (624, 101, '100205', 'San Francisco de Natabuela', 'SAN FRANCISCO DE NATABUELA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (625, 101, '100206', 'San JosÃ© de Chaltura', 'SAN JOSE DE CHALTURA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (626, 101, '100207', 'San Roque', 'SAN ROQUE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (627, 102, '100301', 'Sagrario', 'SAGRARIO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (628, 102, '100302', 'San Francisco', 'SAN FRANCISCO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (629, 102, '100303', 'Cotacachi', 'COTACACHI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (630, 102, '100304', 'Apuela', 'APUELA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (631, 102, '100305', 'GarcÃ­a Moreno (Llurimagua)', 'GARCIA MORENO LLURIMAGUA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (632, 102, '100306', 'Imantag', 'IMANTAG');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (633, 102, '100307', 'PeÃ±aherrera', 'PENAHERRERA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (634, 102, '100308', 'Plaza GutiÃ©rrez (Calvario)', 'PLAZA GUTIERREZ CALVARIO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (635, 102, '100309', 'Quiroga', 'QUIROGA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (636, 102, '100310', '6 de Julio de Cuellaje (Cab. En Cuellaje)', '6 DE JULIO DE CUELLAJE CAB EN CUELLAJE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (637, 102, '100311', 'Vacas Galindo (El Churo) (Cab.En San Miguel Alto', 'VACAS GALINDO EL CHURO CAB EN SAN MIGUEL ALTO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (638, 103, '100401', 'JordÃ¡n', 'JORDAN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (639, 103, '100402', 'San Luis', 'SAN LUIS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (640, 103, '100403', 'Otavalo', 'OTAVALO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (641, 103, '100404', 'Dr. Miguel Egas Cabezas (Peguche)', 'DR MIGUEL EGAS CABEZAS PEGUCHE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (642, 103, '100405', 'Eugenio Espejo (CalpaquÃ­)', 'EUGENIO ESPEJO CALPAQUI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (643, 103, '100406', 'GonzÃ¡lez SuÃ¡rez', 'GONZALEZ SUAREZ');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (644, 103, '100407', 'PataquÃ­', 'PATAQUI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (645, 103, '100408', 'San JosÃ© de Quichinche', 'SAN JOSE DE QUICHINCHE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (646, 103, '100409', 'San Juan de IlumÃ¡n', 'SAN JUAN DE ILUMAN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (647, 103, '100410', 'San Pablo', 'SAN PABLO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (648, 103, '100411', 'San Rafael', 'SAN RAFAEL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (649, 103, '100412', 'Selva Alegre (Cab.En San Miguel de Pamplona)', 'SELVA ALEGRE CAB EN SAN MIGUEL DE PAMPLONA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (650, 104, '100501', 'Pimampiro', 'PIMAMPIRO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (651, 104, '100502', 'ChugÃ¡', 'CHUGA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (652, 104, '100503', 'Mariano Acosta', 'MARIANO ACOSTA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (653, 104, '100504', 'San Francisco de Sigsipamba', 'SAN FRANCISCO DE SIGSIPAMBA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (654, 105, '100601', 'UrcuquÃ­ Cabecera Cantonal', 'URCUQUI CABECERA CANTONAL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (655, 105, '100602', 'CahuasquÃ­', 'CAHUASQUI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (656, 105, '100603', 'La Merced de Buenos Aires', 'LA MERCED DE BUENOS AIRES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (657, 105, '100604', 'Pablo Arenas', 'PABLO ARENAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (658, 105, '100605', 'San Blas', 'SAN BLAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (659, 105, '100606', 'Tumbabiro', 'TUMBABIRO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (660, 106, '110101', 'El Sagrario', 'EL SAGRARIO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (661, 106, '110102', 'San SebastiÃ¡n', 'SAN SEBASTIAN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (662, 106, '110103', 'Sucre', 'SUCRE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (663, 106, '110104', 'Valle', 'VALLE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (664, 106, '110105', 'Loja', 'LOJA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (665, 106, '110106', 'Chantaco', 'CHANTACO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (666, 106, '110107', 'Chuquiribamba', 'CHUQUIRIBAMBA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (667, 106, '110108', 'El Cisne', 'EL CISNE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (668, 106, '110109', 'Gualel', 'GUALEL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (669, 106, '110110', 'Jimbilla', 'JIMBILLA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (670, 106, '110111', 'Malacatos (Valladolid)', 'MALACATOS VALLADOLID');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (671, 106, '110112', 'San Lucas', 'SAN LUCAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (672, 106, '110113', 'San Pedro de Vilcabamba', 'SAN PEDRO DE VILCABAMBA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (673, 106, '110114', 'Santiago', 'SANTIAGO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (674, 106, '110115', 'Taquil (Miguel RiofrÃ­o)', 'TAQUIL MIGUEL RIOFRIO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (675, 106, '110116', 'Vilcabamba (Victoria)', 'VILCABAMBA VICTORIA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (676, 106, '110117', 'Yangana (Arsenio Castillo)', 'YANGANA ARSENIO CASTILLO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (677, 106, '110118', 'Quinara', 'QUINARA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (678, 107, '110201', 'Cariamanga', 'CARIAMANGA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (679, 107, '110202', 'Chile', 'CHILE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (680, 107, '110203', 'San Vicente', 'SAN VICENTE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (681, 107, '110204', 'Cariamanga', 'CARIAMANGA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (682, 107, '110205', 'Colaisaca', 'COLAISACA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (683, 107, '110206', 'El Lucero', 'EL LUCERO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (684, 107, '110207', 'Utuana', 'UTUANA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (685, 107, '110208', 'SanguillÃ­n', 'SANGUILLIN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (686, 108, '110301', 'Catamayo', 'CATAMAYO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (687, 108, '110302', 'San JosÃ©', 'SAN JOSE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (688, 108, '110303', 'Catamayo (La Toma)', 'CATAMAYO LA TOMA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (689, 108, '110304', 'El Tambo', 'EL TAMBO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (690, 108, '110305', 'Guayquichuma', 'GUAYQUICHUMA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (691, 108, '110306', 'San Pedro de La Bendita', 'SAN PEDRO DE LA BENDITA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (692, 108, '110307', 'Zambi', 'ZAMBI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (693, 109, '110401', 'Celica', 'CELICA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (694, 109, '110402', 'Cruzpamba (Cab. En Carlos Bustamante)', 'CRUZPAMBA CAB EN CARLOS BUSTAMANTE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (695, 109, '110403', 'Chaquinal', 'CHAQUINAL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (696, 109, '110404', '12 de Diciembre (Cab. En Achiotes)', '12 DE DICIEMBRE CAB EN ACHIOTES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (697, 109, '110405', 'Pindal (Federico PÃ¡ez)', 'PINDAL FEDERICO PAEZ');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (698, 109, '110406', 'Pozul (San Juan de Pozul)', 'POZUL SAN JUAN DE POZUL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (699, 109, '110407', 'Sabanilla', 'SABANILLA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (700, 109, '110408', 'Tnte. Maximiliano RodrÃ­guez Loaiza', 'TNTE MAXIMILIANO RODRIGUEZ LOAIZA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (701, 110, '110501', 'Chaguarpamba', 'CHAGUARPAMBA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (702, 110, '110502', 'Buenavista', 'BUENAVISTA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (703, 110, '110503', 'El Rosario', 'EL ROSARIO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (704, 110, '110504', 'Santa Rufina', 'SANTA RUFINA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (705, 110, '110505', 'Amarillos', 'AMARILLOS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (706, 111, '110601', 'Amaluza', 'AMALUZA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (707, 111, '110602', 'Bellavista', 'BELLAVISTA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (708, 111, '110603', 'Jimbura', 'JIMBURA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (709, 111, '110604', 'Santa Teresita', 'SANTA TERESITA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (710, 111, '110605', '27 de Abril (Cab. En La Naranja)', '27 DE ABRIL CAB EN LA NARANJA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (711, 111, '110606', 'El Ingenio', 'EL INGENIO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (712, 111, '110607', 'El Airo', 'EL AIRO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (713, 112, '110701', 'GonzanamÃ¡', 'GONZANAMA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (714, 112, '110702', 'Changaimina (La Libertad)', 'CHANGAIMINA LA LIBERTAD');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (715, 112, '110703', 'Fundochamba', 'FUNDOCHAMBA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (716, 112, '110704', 'Nambacola', 'NAMBACOLA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (717, 112, '110705', 'Purunuma (Eguiguren)', 'PURUNUMA EGUIGUREN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (718, 112, '110706', 'Quilanga (La Paz)', 'QUILANGA LA PAZ');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (719, 112, '110707', 'Sacapalca', 'SACAPALCA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (720, 112, '110708', 'San Antonio de Las Aradas (Cab. En Las Aradas)', 'SAN ANTONIO DE LAS ARADAS CAB EN LAS ARADAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (721, 113, '110801', 'General Eloy Alfaro (San SebastiÃ¡n)', 'GENERAL ELOY ALFARO SAN SEBASTIAN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (722, 113, '110802', 'MacarÃ¡ (Manuel Enrique Rengel Suquilanda)', 'MACARA MANUEL ENRIQUE RENGEL SUQUILANDA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (723, 113, '110803', 'MacarÃ¡', 'MACARA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (724, 113, '110804', 'Larama', 'LARAMA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (725, 113, '110805', 'La Victoria', 'LA VICTORIA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (726, 113, '110806', 'Sabiango (La Capilla)', 'SABIANGO LA CAPILLA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (727, 114, '110901', 'Catacocha', 'CATACOCHA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (728, 114, '110902', 'Lourdes', 'LOURDES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (729, 114, '110903', 'Catacocha', 'CATACOCHA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (730, 114, '110904', 'CangonamÃ¡', 'CANGONAMA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (731, 114, '110905', 'GuachanamÃ¡', 'GUACHANAMA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (732, 114, '110906', 'La Tingue', 'LA TINGUE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (733, 114, '110907', 'Lauro Guerrero', 'LAURO GUERRERO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (734, 114, '110908', 'Olmedo (Santa BÃ¡rbara)', 'OLMEDO SANTA BARBARA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (735, 114, '110909', 'Orianga', 'ORIANGA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (736, 114, '110910', 'San Antonio', 'SAN ANTONIO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (737, 114, '110911', 'Casanga', 'CASANGA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (738, 114, '110912', 'Yamana', 'YAMANA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (739, 115, '111001', 'Alamor', 'ALAMOR');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (740, 115, '111002', 'Ciano', 'CIANO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (741, 115, '111003', 'El Arenal', 'EL ARENAL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (742, 115, '111004', 'El Limo (Mariana de JesÃºs)', 'EL LIMO MARIANA DE JESUS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (743, 115, '111005', 'Mercadillo', 'MERCADILLO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (744, 115, '111006', 'Vicentino', 'VICENTINO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (745, 116, '111101', 'Saraguro', 'SARAGURO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (746, 116, '111102', 'El ParaÃ­so de CelÃ©n', 'EL PARAISO DE CELEN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (747, 116, '111103', 'El TablÃ³n', 'EL TABLON');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (748, 116, '111104', 'Lluzhapa', 'LLUZHAPA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (749, 116, '111105', 'ManÃº', 'MANU');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (750, 116, '111106', 'San Antonio de Qumbe (Cumbe)', 'SAN ANTONIO DE QUMBE CUMBE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (751, 116, '111107', 'San Pablo de Tenta', 'SAN PABLO DE TENTA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (752, 116, '111108', 'San SebastiÃ¡n de YÃºluc', 'SAN SEBASTIAN DE YULUC');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (753, 116, '111109', 'Selva Alegre', 'SELVA ALEGRE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (754, 116, '111110', 'Urdaneta (Paquishapa)', 'URDANETA PAQUISHAPA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (755, 116, '111111', 'Sumaypamba', 'SUMAYPAMBA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (756, 117, '111201', 'Sozoranga', 'SOZORANGA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (757, 117, '111202', 'Nueva FÃ¡tima', 'NUEVA FATIMA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (758, 117, '111203', 'Tacamoros', 'TACAMOROS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (759, 118, '111301', 'Zapotillo', 'ZAPOTILLO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (760, 118, '111302', 'Mangahurco (Cazaderos)', 'MANGAHURCO CAZADEROS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (761, 118, '111303', 'Garzareal', 'GARZAREAL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (762, 118, '111304', 'Limones', 'LIMONES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (763, 118, '111305', 'Paletillas', 'PALETILLAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (764, 118, '111306', 'Bolaspamba', 'BOLASPAMBA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (765, 119, '111401', 'Pindal', 'PINDAL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (766, 119, '111402', 'Chaquinal', 'CHAQUINAL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (767, 119, '111403', '12 de Diciembre (Cab.En Achiotes)', '12 DE DICIEMBRE CAB EN ACHIOTES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (768, 119, '111404', 'Milagros', 'MILAGROS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (769, 120, '111501', 'Quilanga', 'QUILANGA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (770, 120, '111502', 'Fundochamba', 'FUNDOCHAMBA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (771, 120, '111503', 'San Antonio de Las Aradas (Cab. En Las Aradas)', 'SAN ANTONIO DE LAS ARADAS CAB EN LAS ARADAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (772, 121, '111601', 'Olmedo', 'OLMEDO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (773, 121, '111602', 'La Tingue', 'LA TINGUE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (774, 122, '120101', 'Clemente Baquerizo', 'CLEMENTE BAQUERIZO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (775, 122, '120102', 'Dr. Camilo Ponce', 'DR CAMILO PONCE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (776, 122, '120103', 'Barreiro', 'BARREIRO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (777, 122, '120104', 'El Salto', 'EL SALTO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (778, 122, '120105', 'Babahoyo', 'BABAHOYO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (779, 122, '120106', 'Barreiro (Santa Rita)', 'BARREIRO SANTA RITA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (780, 122, '120107', 'Caracol', 'CARACOL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (781, 122, '120108', 'Febres Cordero (Las Juntas)', 'FEBRES CORDERO LAS JUNTAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (782, 122, '120109', 'Pimocha', 'PIMOCHA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (783, 122, '120110', 'La UniÃ³n', 'LA UNION');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (784, 123, '120201', 'Baba', 'BABA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (785, 123, '120202', 'Guare', 'GUARE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (786, 123, '120203', 'Isla de Bejucal', 'ISLA DE BEJUCAL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (787, 124, '120301', 'Montalvo', 'MONTALVO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (788, 125, '120401', 'Puebloviejo', 'PUEBLOVIEJO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (789, 125, '120402', 'Puerto Pechiche', 'PUERTO PECHICHE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (790, 125, '120403', 'San Juan', 'SAN JUAN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (791, 126, '120501', 'Quevedo', 'QUEVEDO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (792, 126, '120502', 'San Camilo', 'SAN CAMILO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (793, 126, '120503', 'San JosÃ©', 'SAN JOSE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (794, 126, '120504', 'GuayacÃ¡n', 'GUAYACAN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (795, 126, '120505', 'NicolÃ¡s Infante DÃ­az', 'NICOLAS INFANTE DIAZ');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (796, 126, '120506', 'San CristÃ³bal', 'SAN CRISTOBAL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (797, 126, '120507', 'Siete de Octubre', 'SIETE DE OCTUBRE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (798, 126, '120508', '24 de Mayo', '24 DE MAYO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (799, 126, '120509', 'Venus del RÃ­o Quevedo', 'VENUS DEL RIO QUEVEDO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (800, 126, '120510', 'Viva Alfaro', 'VIVA ALFARO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (801, 126, '120511', 'Quevedo', 'QUEVEDO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (802, 126, '120512', 'Buena FÃ©', 'BUENA FE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (803, 126, '120513', 'Mocache', 'MOCACHE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (804, 126, '120514', 'San Carlos', 'SAN CARLOS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (805, 126, '120515', 'Valencia', 'VALENCIA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (806, 126, '120516', 'La Esperanza', 'LA ESPERANZA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (807, 127, '120601', 'Catarama', 'CATARAMA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (808, 127, '120602', 'Ricaurte', 'RICAURTE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (809, 128, '120701', '10 de Noviembre', '10 DE NOVIEMBRE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (810, 128, '120702', 'Ventanas', 'VENTANAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (811, 128, '120703', 'Quinsaloma', 'QUINSALOMA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (812, 128, '120704', 'Zapotal', 'ZAPOTAL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (813, 128, '120705', 'Chacarita', 'CHACARITA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (814, 128, '120706', 'Los Ãngeles', 'LOS ANGELES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (815, 129, '120801', 'Vinces', 'VINCES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (816, 129, '120802', 'Antonio Sotomayor (Cab. En Playas de Vinces)', 'ANTONIO SOTOMAYOR CAB EN PLAYAS DE VINCES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (817, 129, '120803', 'Palenque', 'PALENQUE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (818, 130, '120901', 'Palenque', 'PALENQUE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (819, 131, '121001', 'San Jacinto de Buena FÃ©', 'SAN JACINTO DE BUENA FE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (820, 131, '121002', '7 de Agosto', '7 DE AGOSTO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (821, 131, '121003', '11 de Octubre', '11 DE OCTUBRE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (822, 131, '121004', 'San Jacinto de Buena FÃ©', 'SAN JACINTO DE BUENA FE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (823, 131, '121005', 'Patricia Pilar', 'PATRICIA PILAR');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (824, 132, '121101', 'Valencia', 'VALENCIA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (825, 133, '121201', 'Mocache', 'MOCACHE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (826, 134, '121301', 'Quinsaloma', 'QUINSALOMA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (827, 135, '130101', 'Portoviejo', 'PORTOVIEJO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (828, 135, '130102', '12 de Marzo', '12 DE MARZO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (829, 135, '130103', 'ColÃ³n', 'COLON');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (830, 135, '130104', 'PicoazÃ¡', 'PICOAZA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (831, 135, '130105', 'San Pablo', 'SAN PABLO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (832, 135, '130106', 'AndrÃ©s de Vera', 'ANDRES DE VERA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (833, 135, '130107', 'Francisco Pacheco', 'FRANCISCO PACHECO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (834, 135, '130108', '18 de Octubre', '18 DE OCTUBRE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (835, 135, '130109', 'SimÃ³n BolÃ­var', 'SIMON BOLIVAR');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (836, 135, '130110', 'Portoviejo', 'PORTOVIEJO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (837, 135, '130111', 'AbdÃ³n CalderÃ³n (San Francisco)', 'ABDON CALDERON SAN FRANCISCO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (838, 135, '130112', 'Alhajuela (Bajo Grande)', 'ALHAJUELA BAJO GRANDE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (839, 135, '130113', 'Crucita', 'CRUCITA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (840, 135, '130114', 'Pueblo Nuevo', 'PUEBLO NUEVO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (841, 135, '130115', 'Riochico (RÃ­o Chico)', 'RIOCHICO RIO CHICO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (842, 135, '130116', 'San PlÃ¡cido', 'SAN PLACIDO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (843, 135, '130117', 'Chirijos', 'CHIRIJOS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (844, 136, '130201', 'Calceta', 'CALCETA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (845, 136, '130202', 'Membrillo', 'MEMBRILLO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (846, 136, '130203', 'Quiroga', 'QUIROGA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (847, 137, '130301', 'Chone', 'CHONE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (848, 137, '130302', 'Santa Rita', 'SANTA RITA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (849, 137, '130303', 'Chone', 'CHONE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (850, 137, '130304', 'BoyacÃ¡', 'BOYACA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (851, 137, '130305', 'Canuto', 'CANUTO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (852, 137, '130306', 'Convento', 'CONVENTO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (853, 137, '130307', 'Chibunga', 'CHIBUNGA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (854, 137, '130308', 'Eloy Alfaro', 'ELOY ALFARO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (855, 137, '130309', 'Ricaurte', 'RICAURTE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (856, 137, '130310', 'San Antonio', 'SAN ANTONIO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (857, 138, '130401', 'El Carmen', 'EL CARMEN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (858, 138, '130402', '4 de Diciembre', '4 DE DICIEMBRE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (859, 138, '130403', 'El Carmen', 'EL CARMEN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (860, 138, '130404', 'Wilfrido Loor Moreira (Maicito)', 'WILFRIDO LOOR MOREIRA MAICITO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (861, 138, '130405', 'San Pedro de Suma', 'SAN PEDRO DE SUMA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (862, 139, '130501', 'Flavio Alfaro', 'FLAVIO ALFARO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (863, 139, '130502', 'San Francisco de Novillo (Cab. En', 'SAN FRANCISCO DE NOVILLO CAB EN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (864, 139, '130503', 'Zapallo', 'ZAPALLO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (865, 140, '130601', 'Dr. Miguel MorÃ¡n Lucio', 'DR MIGUEL MORAN LUCIO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (866, 140, '130602', 'Manuel Inocencio Parrales Y Guale', 'MANUEL INOCENCIO PARRALES Y GUALE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (867, 140, '130603', 'San Lorenzo de Jipijapa', 'SAN LORENZO DE JIPIJAPA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (868, 140, '130604', 'Jipijapa', 'JIPIJAPA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (869, 140, '130605', 'AmÃ©rica', 'AMERICA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (870, 140, '130606', 'El Anegado (Cab. En Eloy Alfaro)', 'EL ANEGADO CAB EN ELOY ALFARO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (871, 140, '130607', 'Julcuy', 'JULCUY');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (872, 140, '130608', 'La UniÃ³n', 'LA UNION');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (873, 140, '130609', 'Machalilla', 'MACHALILLA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (874, 140, '130610', 'Membrillal', 'MEMBRILLAL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (875, 140, '130611', 'Pedro Pablo GÃ³mez', 'PEDRO PABLO GOMEZ');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (876, 140, '130612', 'Puerto de Cayo', 'PUERTO DE CAYO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (877, 140, '130613', 'Puerto LÃ³pez', 'PUERTO LOPEZ');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (878, 141, '130701', 'JunÃ­n', 'JUNIN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (879, 142, '130801', 'Los Esteros', 'LOS ESTEROS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (880, 142, '130802', 'Manta', 'MANTA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (881, 142, '130803', 'San Mateo', 'SAN MATEO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (882, 142, '130804', 'Tarqui', 'TARQUI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (883, 142, '130805', 'Eloy Alfaro', 'ELOY ALFARO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (884, 142, '130806', 'Manta', 'MANTA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (885, 142, '130807', 'San Lorenzo', 'SAN LORENZO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (886, 142, '130808', 'Santa Marianita (Boca de Pacoche)', 'SANTA MARIANITA BOCA DE PACOCHE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (887, 143, '130901', 'Anibal San AndrÃ©s', 'ANIBAL SAN ANDRES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (888, 143, '130902', 'Montecristi', 'MONTECRISTI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (889, 143, '130903', 'El Colorado', 'EL COLORADO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (890, 143, '130904', 'General Eloy Alfaro', 'GENERAL ELOY ALFARO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (891, 143, '130905', 'Leonidas ProaÃ±o', 'LEONIDAS PROANO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (892, 143, '130906', 'Montecristi', 'MONTECRISTI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (893, 143, '130907', 'JaramijÃ³', 'JARAMIJO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (894, 143, '130908', 'La Pila', 'LA PILA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (895, 144, '131001', 'PajÃ¡n', 'PAJAN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (896, 144, '131002', 'Campozano (La Palma de PajÃ¡n)', 'CAMPOZANO LA PALMA DE PAJAN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (897, 144, '131003', 'Cascol', 'CASCOL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (898, 144, '131004', 'Guale', 'GUALE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (899, 144, '131005', 'Lascano', 'LASCANO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (900, 145, '131101', 'Pichincha', 'PICHINCHA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (901, 145, '131102', 'Barraganete', 'BARRAGANETE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (902, 145, '131103', 'San SebastiÃ¡n', 'SAN SEBASTIAN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (903, 146, '131201', 'Rocafuerte', 'ROCAFUERTE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (904, 147, '131301', 'Santa Ana', 'SANTA ANA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (905, 147, '131302', 'Lodana', 'LODANA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (906, 147, '131303', 'Santa Ana de Vuelta Larga', 'SANTA ANA DE VUELTA LARGA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (907, 147, '131304', 'Ayacucho', 'AYACUCHO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (908, 147, '131305', 'Honorato VÃ¡squez (Cab. En VÃ¡squez)', 'HONORATO VASQUEZ CAB EN VASQUEZ');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (909, 147, '131306', 'La UniÃ³n', 'LA UNION');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (910, 147, '131307', 'Olmedo', 'OLMEDO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (911, 147, '131308', 'San Pablo (Cab. En Pueblo Nuevo)', 'SAN PABLO CAB EN PUEBLO NUEVO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (912, 148, '131401', 'BahÃ­a de CarÃ¡quez', 'BAHIA DE CARAQUEZ');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (913, 148, '131402', 'Leonidas Plaza GutiÃ©rrez', 'LEONIDAS PLAZA GUTIERREZ');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (914, 148, '131403', 'BahÃ­a de CarÃ¡quez', 'BAHIA DE CARAQUEZ');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (915, 148, '131404', 'Canoa', 'CANOA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (916, 148, '131405', 'CojimÃ­es', 'COJIMIES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (917, 148, '131406', 'CharapotÃ³', 'CHARAPOTO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (918, 148, '131407', '10 de Agosto', '10 DE AGOSTO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (919, 148, '131408', 'Jama', 'JAMA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (920, 148, '131409', 'Pedernales', 'PEDERNALES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (921, 148, '131410', 'San Isidro', 'SAN ISIDRO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (922, 148, '131411', 'San Vicente', 'SAN VICENTE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (923, 149, '131501', 'Tosagua', 'TOSAGUA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (924, 149, '131502', 'Bachillero', 'BACHILLERO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (925, 149, '131503', 'Angel Pedro Giler (La Estancilla)', 'ANGEL PEDRO GILER LA ESTANCILLA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (926, 150, '131601', 'Sucre', 'SUCRE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (927, 150, '131602', 'Bellavista', 'BELLAVISTA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (928, 150, '131603', 'Noboa', 'NOBOA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (929, 150, '131604', 'Arq. Sixto DurÃ¡n BallÃ©n', 'ARQ SIXTO DURAN BALLEN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (930, 151, '131701', 'Pedernales', 'PEDERNALES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (931, 151, '131702', 'CojimÃ­es', 'COJIMIES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (932, 151, '131703', '10 de Agosto', '10 DE AGOSTO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (933, 151, '131704', 'Atahualpa', 'ATAHUALPA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (934, 152, '131801', 'Olmedo', 'OLMEDO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (935, 153, '131901', 'Puerto LÃ³pez', 'PUERTO LOPEZ');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (936, 153, '131902', 'Machalilla', 'MACHALILLA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (937, 153, '131903', 'Salango', 'SALANGO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (938, 154, '132001', 'Jama', 'JAMA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (939, 155, '132101', 'JaramijÃ³', 'JARAMIJO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (940, 156, '132201', 'San Vicente', 'SAN VICENTE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (941, 156, '132202', 'Canoa', 'CANOA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (942, 157, '140101', 'Macas', 'MACAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (943, 157, '140102', 'Alshi (Cab. En 9 de Octubre)', 'ALSHI CAB EN 9 DE OCTUBRE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (944, 157, '140103', 'Chiguaza', 'CHIGUAZA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (945, 157, '140104', 'General ProaÃ±o', 'GENERAL PROANO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (946, 157, '140105', 'Huasaga (Cab.En Wampuik)', 'HUASAGA CAB EN WAMPUIK');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (947, 157, '140106', 'Macuma', 'MACUMA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (948, 157, '140107', 'San Isidro', 'SAN ISIDRO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (949, 157, '140108', 'Sevilla Don Bosco', 'SEVILLA DON BOSCO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (950, 157, '140109', 'SinaÃ­', 'SINAI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (951, 157, '140110', 'Taisha', 'TAISHA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (952, 157, '140111', 'ZuÃ±a (ZÃºÃ±ac)', 'ZUNA ZUNAC');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (953, 157, '140112', 'Tuutinentza', 'TUUTINENTZA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (954, 157, '140113', 'Cuchaentza', 'CUCHAENTZA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (955, 157, '140114', 'San JosÃ© de Morona', 'SAN JOSE DE MORONA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (956, 157, '140115', 'RÃ­o Blanco', 'RIO BLANCO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (957, 158, '140201', 'Gualaquiza', 'GUALAQUIZA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (958, 158, '140202', 'Mercedes Molina', 'MERCEDES MOLINA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (959, 158, '140203', 'Gualaquiza', 'GUALAQUIZA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (960, 158, '140204', 'Amazonas (Rosario de Cuyes)', 'AMAZONAS ROSARIO DE CUYES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (961, 158, '140205', 'Bermejos', 'BERMEJOS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (962, 158, '140206', 'Bomboiza', 'BOMBOIZA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (963, 158, '140207', 'ChigÃ¼inda', 'CHIGUINDA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (964, 158, '140208', 'El Rosario', 'EL ROSARIO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (965, 158, '140209', 'Nueva Tarqui', 'NUEVA TARQUI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (966, 158, '140210', 'San Miguel de Cuyes', 'SAN MIGUEL DE CUYES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (967, 158, '140211', 'El Ideal', 'EL IDEAL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (968, 159, '140301', 'General Leonidas Plaza GutiÃ©rrez (LimÃ³n)', 'GENERAL LEONIDAS PLAZA GUTIERREZ LIMON');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (969, 159, '140302', 'Indanza', 'INDANZA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (970, 159, '140303', 'Pan de AzÃºcar', 'PAN DE AZUCAR');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (971, 159, '140304', 'San Antonio (Cab. En San Antonio Centro', 'SAN ANTONIO CAB EN SAN ANTONIO CENTRO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (972, 159, '140305', 'San Carlos de LimÃ³n (San Carlos del', 'SAN CARLOS DE LIMON SAN CARLOS DEL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (973, 159, '140306', 'San Juan Bosco', 'SAN JUAN BOSCO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (974, 159, '140307', 'San Miguel de Conchay', 'SAN MIGUEL DE CONCHAY');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (975, 159, '140308', 'Santa Susana de Chiviaza (Cab. En Chiviaza)', 'SANTA SUSANA DE CHIVIAZA CAB EN CHIVIAZA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (976, 159, '140309', 'Yunganza (Cab. En El Rosario)', 'YUNGANZA CAB EN EL ROSARIO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (977, 160, '140401', 'Palora (Metzera)', 'PALORA METZERA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (978, 160, '140402', 'Arapicos', 'ARAPICOS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (979, 160, '140403', 'CumandÃ¡ (Cab. En Colonia AgrÃ­cola Sevilla del Oro)', 'CUMANDA CAB EN COLONIA AGRICOLA SEVILLA DEL ORO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (980, 160, '140404', 'Huamboya', 'HUAMBOYA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (981, 160, '140405', 'Sangay (Cab. En Nayamanaca)', 'SANGAY CAB EN NAYAMANACA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (982, 161, '140501', 'Santiago de MÃ©ndez', 'SANTIAGO DE MENDEZ');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (983, 161, '140502', 'Copal', 'COPAL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (984, 161, '140503', 'Chupianza', 'CHUPIANZA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (985, 161, '140504', 'Patuca', 'PATUCA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (986, 161, '140505', 'San Luis de El Acho (Cab. En El Acho)', 'SAN LUIS DE EL ACHO CAB EN EL ACHO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (987, 161, '140506', 'Santiago', 'SANTIAGO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (988, 161, '140507', 'Tayuza', 'TAYUZA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (989, 161, '140508', 'San Francisco de Chinimbimi', 'SAN FRANCISCO DE CHINIMBIMI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (990, 162, '140601', 'SucÃºa', 'SUCUA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (991, 162, '140602', 'AsunciÃ³n', 'ASUNCION');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (992, 162, '140603', 'Huambi', 'HUAMBI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (993, 162, '140604', 'LogroÃ±o', 'LOGRONO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (994, 162, '140605', 'Yaupi', 'YAUPI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (995, 162, '140606', 'Santa Marianita de JesÃºs', 'SANTA MARIANITA DE JESUS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (996, 163, '140701', 'Huamboya', 'HUAMBOYA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (997, 163, '140702', 'Chiguaza', 'CHIGUAZA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (998, 163, '140703', 'Pablo Sexto', 'PABLO SEXTO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (999, 164, '140801', 'San Juan Bosco', 'SAN JUAN BOSCO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1000, 164, '140802', 'Pan de AzÃºcar', 'PAN DE AZUCAR');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1001, 164, '140803', 'San Carlos de LimÃ³n', 'SAN CARLOS DE LIMON');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1002, 164, '140804', 'San Jacinto de Wakambeis', 'SAN JACINTO DE WAKAMBEIS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1003, 164, '140805', 'Santiago de Pananza', 'SANTIAGO DE PANANZA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1004, 165, '140901', 'Taisha', 'TAISHA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1005, 165, '140902', 'Huasaga (Cab. En Wampuik)', 'HUASAGA CAB EN WAMPUIK');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1006, 165, '140903', 'Macuma', 'MACUMA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1007, 165, '140904', 'Tuutinentza', 'TUUTINENTZA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1008, 165, '140905', 'Pumpuentsa', 'PUMPUENTSA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1009, 166, '141001', 'LogroÃ±o', 'LOGRONO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1010, 166, '141002', 'Yaupi', 'YAUPI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1011, 166, '141003', 'Shimpis', 'SHIMPIS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1012, 167, '141101', 'Pablo Sexto', 'PABLO SEXTO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1013, 168, '141201', 'Santiago', 'SANTIAGO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1014, 168, '141202', 'San JosÃ© de Morona', 'SAN JOSE DE MORONA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1015, 169, '150101', 'Tena', 'TENA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1016, 169, '150102', 'Ahuano', 'AHUANO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1017, 169, '150103', 'Carlos Julio Arosemena Tola (Zatza-Yacu)', 'CARLOS JULIO AROSEMENA TOLA ZATZA YACU');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1018, 169, '150104', 'Chontapunta', 'CHONTAPUNTA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1019, 169, '150105', 'Pano', 'PANO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1020, 169, '150106', 'Puerto Misahualli', 'PUERTO MISAHUALLI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1021, 169, '150107', 'Puerto Napo', 'PUERTO NAPO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1022, 169, '150108', 'TÃ¡lag', 'TALAG');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1023, 169, '150109', 'San Juan de Muyuna', 'SAN JUAN DE MUYUNA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1024, 170, '150201', 'Archidona', 'ARCHIDONA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1025, 170, '150202', 'Avila', 'AVILA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1026, 170, '150203', 'Cotundo', 'COTUNDO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1027, 170, '150204', 'Loreto', 'LORETO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1028, 170, '150205', 'San Pablo de Ushpayacu', 'SAN PABLO DE USHPAYACU');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1029, 170, '150206', 'Puerto Murialdo', 'PUERTO MURIALDO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1030, 171, '150301', 'El Chaco', 'EL CHACO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1031, 171, '150302', 'Gonzalo DÃ­az de Pineda (El BombÃ³n)', 'GONZALO DIAZ DE PINEDA EL BOMBON');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1032, 171, '150303', 'Linares', 'LINARES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1033, 171, '150304', 'Oyacachi', 'OYACACHI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1034, 171, '150305', 'Santa Rosa', 'SANTA ROSA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1035, 171, '150306', 'Sardinas', 'SARDINAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1036, 172, '150401', 'Baeza', 'BAEZA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1037, 172, '150402', 'Cosanga', 'COSANGA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1038, 172, '150403', 'Cuyuja', 'CUYUJA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1039, 172, '150404', 'Papallacta', 'PAPALLACTA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1040, 172, '150405', 'San Francisco de Borja (Virgilio DÃ¡vila)', 'SAN FRANCISCO DE BORJA VIRGILIO DAVILA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1041, 172, '150406', 'San JosÃ© del Payamino', 'SAN JOSE DEL PAYAMINO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1042, 172, '150407', 'Sumaco', 'SUMACO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1043, 173, '150501', 'Carlos Julio Arosemena Tola', 'CARLOS JULIO AROSEMENA TOLA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1044, 174, '160101', 'Puyo', 'PUYO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1045, 174, '160102', 'Arajuno', 'ARAJUNO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1046, 174, '160103', 'Canelos', 'CANELOS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1047, 174, '160104', 'Curaray', 'CURARAY');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1048, 174, '160105', 'Diez de Agosto', 'DIEZ DE AGOSTO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1049, 174, '160106', 'FÃ¡tima', 'FATIMA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1050, 174, '160107', 'Montalvo (Andoas)', 'MONTALVO ANDOAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1051, 174, '160108', 'Pomona', 'POMONA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1052, 174, '160109', 'RÃ­o Corrientes', 'RIO CORRIENTES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1053, 174, '160110', 'RÃ­o Tigre', 'RIO TIGRE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1054, 174, '160111', 'Santa Clara', 'SANTA CLARA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1055, 174, '160112', 'Sarayacu', 'SARAYACU');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1056, 174, '160113', 'SimÃ³n BolÃ­var (Cab. En Mushullacta)', 'SIMON BOLIVAR CAB EN MUSHULLACTA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1057, 174, '160114', 'Tarqui', 'TARQUI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1058, 174, '160115', 'Teniente Hugo Ortiz', 'TENIENTE HUGO ORTIZ');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1059, 174, '160116', 'Veracruz (Indillama) (Cab. En Indillama)', 'VERACRUZ INDILLAMA CAB EN INDILLAMA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1060, 174, '160117', 'El Triunfo', 'EL TRIUNFO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1061, 175, '160201', 'Mera', 'MERA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1062, 175, '160202', 'Madre Tierra', 'MADRE TIERRA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1063, 175, '160203', 'Shell', 'SHELL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1064, 176, '160301', 'Santa Clara', 'SANTA CLARA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1065, 176, '160302', 'San JosÃ©', 'SAN JOSE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1066, 177, '160401', 'Arajuno', 'ARAJUNO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1067, 177, '160402', 'Curaray', 'CURARAY');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1068, 178, '170101', 'Belisario Quevedo', 'BELISARIO QUEVEDO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1069, 178, '170102', 'CarcelÃ©n', 'CARCELEN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1070, 178, '170103', 'Centro HistÃ³rico', 'CENTRO HISTORICO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1071, 178, '170104', 'Cochapamba', 'COCHAPAMBA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1072, 178, '170105', 'ComitÃ© del Pueblo', 'COMITE DEL PUEBLO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1073, 178, '170106', 'Cotocollao', 'COTOCOLLAO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1074, 178, '170107', 'Chilibulo', 'CHILIBULO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1075, 178, '170108', 'Chillogallo', 'CHILLOGALLO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1076, 178, '170109', 'Chimbacalle', 'CHIMBACALLE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1077, 178, '170110', 'El Condado', 'EL CONDADO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1078, 178, '170111', 'GuamanÃ­', 'GUAMANI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1079, 178, '170112', 'IÃ±aquito', 'INAQUITO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1080, 178, '170113', 'ItchimbÃ­a', 'ITCHIMBIA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1081, 178, '170114', 'Jipijapa', 'JIPIJAPA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1082, 178, '170115', 'Kennedy', 'KENNEDY');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1083, 178, '170116', 'La Argelia', 'LA ARGELIA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1084, 178, '170117', 'La ConcepciÃ³n', 'LA CONCEPCION');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1085, 178, '170118', 'La Ecuatoriana', 'LA ECUATORIANA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1086, 178, '170119', 'La Ferroviaria', 'LA FERROVIARIA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1087, 178, '170120', 'La Libertad', 'LA LIBERTAD');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1088, 178, '170121', 'La Magdalena', 'LA MAGDALENA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1089, 178, '170122', 'La Mena', 'LA MENA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1090, 178, '170123', 'Mariscal Sucre', 'MARISCAL SUCRE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1091, 178, '170124', 'Ponceano', 'PONCEANO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1092, 178, '170125', 'PuengasÃ­', 'PUENGASI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1093, 178, '170126', 'Quitumbe', 'QUITUMBE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1094, 178, '170127', 'Rumipamba', 'RUMIPAMBA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1095, 178, '170128', 'San Bartolo', 'SAN BARTOLO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1096, 178, '170129', 'San Isidro del Inca', 'SAN ISIDRO DEL INCA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1097, 178, '170130', 'San Juan', 'SAN JUAN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1098, 178, '170131', 'Solanda', 'SOLANDA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1099, 178, '170132', 'Turubamba', 'TURUBAMBA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1100, 178, '170133', 'Quito Distrito Metropolitano', 'QUITO DISTRITO METROPOLITANO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1101, 178, '170134', 'AlangasÃ­', 'ALANGASI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1102, 178, '170135', 'AmaguaÃ±a', 'AMAGUANA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1103, 178, '170136', 'Atahualpa', 'ATAHUALPA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1104, 178, '170137', 'CalacalÃ­', 'CALACALI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1105, 178, '170138', 'CalderÃ³n', 'CALDERON');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1106, 178, '170139', 'Conocoto', 'CONOCOTO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1107, 178, '170140', 'CumbayÃ¡', 'CUMBAYA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1108, 178, '170141', 'Chavezpamba', 'CHAVEZPAMBA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1109, 178, '170142', 'Checa', 'CHECA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1110, 178, '170143', 'El Quinche', 'EL QUINCHE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1111, 178, '170144', 'Gualea', 'GUALEA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1112, 178, '170145', 'Guangopolo', 'GUANGOPOLO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1113, 178, '170146', 'Guayllabamba', 'GUAYLLABAMBA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1114, 178, '170147', 'La Merced', 'LA MERCED');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1115, 178, '170148', 'Llano Chico', 'LLANO CHICO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1116, 178, '170149', 'Lloa', 'LLOA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1117, 178, '170150', 'Mindo', 'MINDO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1118, 178, '170151', 'Nanegal', 'NANEGAL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1119, 178, '170152', 'Nanegalito', 'NANEGALITO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1120, 178, '170153', 'NayÃ³n', 'NAYON');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1121, 178, '170154', 'Nono', 'NONO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1122, 178, '170155', 'Pacto', 'PACTO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1123, 178, '170156', 'Pedro Vicente Maldonado', 'PEDRO VICENTE MALDONADO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1124, 178, '170157', 'Perucho', 'PERUCHO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1125, 178, '170158', 'Pifo', 'PIFO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1126, 178, '170159', 'PÃ­ntag', 'PINTAG');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1127, 178, '170160', 'Pomasqui', 'POMASQUI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1128, 178, '170161', 'PuÃ©llaro', 'PUELLARO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1129, 178, '170162', 'Puembo', 'PUEMBO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1130, 178, '170163', 'San Antonio', 'SAN ANTONIO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1131, 178, '170164', 'San JosÃ© de Minas', 'SAN JOSE DE MINAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1132, 178, '170165', 'San Miguel de Los Bancos', 'SAN MIGUEL DE LOS BANCOS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1133, 178, '170166', 'Tababela', 'TABABELA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1134, 178, '170167', 'Tumbaco', 'TUMBACO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1135, 178, '170168', 'YaruquÃ­', 'YARUQUI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1136, 178, '170169', 'Zambiza', 'ZAMBIZA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1137, 178, '170170', 'Puerto Quito', 'PUERTO QUITO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1138, 179, '170201', 'Ayora', 'AYORA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1139, 179, '170202', 'Cayambe', 'CAYAMBE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1140, 179, '170203', 'Juan Montalvo', 'JUAN MONTALVO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1141, 179, '170204', 'Cayambe', 'CAYAMBE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1142, 179, '170205', 'AscÃ¡zubi', 'ASCAZUBI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1143, 179, '170206', 'Cangahua', 'CANGAHUA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1144, 179, '170207', 'Olmedo (Pesillo)', 'OLMEDO PESILLO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1145, 179, '170208', 'OtÃ³n', 'OTON');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1146, 179, '170209', 'Santa Rosa de Cuzubamba', 'SANTA ROSA DE CUZUBAMBA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1147, 180, '170301', 'Machachi', 'MACHACHI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1148, 180, '170302', 'AlÃ³ag', 'ALOAG');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1149, 180, '170303', 'AloasÃ­', 'ALOASI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1150, 180, '170304', 'Cutuglahua', 'CUTUGLAHUA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1151, 180, '170305', 'El Chaupi', 'EL CHAUPI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1152, 180, '170306', 'Manuel Cornejo Astorga (Tandapi)', 'MANUEL CORNEJO ASTORGA TANDAPI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1153, 180, '170307', 'Tambillo', 'TAMBILLO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1154, 180, '170308', 'Uyumbicho', 'UYUMBICHO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1155, 181, '170401', 'Tabacundo', 'TABACUNDO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1156, 181, '170402', 'La Esperanza', 'LA ESPERANZA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1157, 181, '170403', 'MalchinguÃ­', 'MALCHINGUI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1158, 181, '170404', 'Tocachi', 'TOCACHI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1159, 181, '170405', 'Tupigachi', 'TUPIGACHI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1160, 182, '170501', 'SangolquÃ­', 'SANGOLQUI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1161, 182, '170502', 'San Pedro de Taboada', 'SAN PEDRO DE TABOADA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1162, 182, '170503', 'San Rafael', 'SAN RAFAEL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1163, 182, '170504', 'Sangolqui', 'SANGOLQUI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1164, 182, '170505', 'Cotogchoa', 'COTOGCHOA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1165, 182, '170506', 'Rumipamba', 'RUMIPAMBA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1166, 183, '170601', 'San Miguel de Los Bancos', 'SAN MIGUEL DE LOS BANCOS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1167, 183, '170602', 'Mindo', 'MINDO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1168, 183, '170603', 'Pedro Vicente Maldonado', 'PEDRO VICENTE MALDONADO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1169, 183, '170604', 'Puerto Quito', 'PUERTO QUITO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1170, 184, '170701', 'Pedro Vicente Maldonado', 'PEDRO VICENTE MALDONADO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1171, 185, '170801', 'Puerto Quito', 'PUERTO QUITO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1172, 186, '180101', 'Atocha â Ficoa', 'ATOCHA A FICOA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1173, 186, '180102', 'Celiano Monge', 'CELIANO MONGE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1174, 186, '180103', 'Huachi Chico', 'HUACHI CHICO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1175, 186, '180104', 'Huachi Loreto', 'HUACHI LORETO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1176, 186, '180105', 'La Merced', 'LA MERCED');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1177, 186, '180106', 'La PenÃ­nsula', 'LA PENINSULA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1178, 186, '180107', 'Matriz', 'MATRIZ');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1179, 186, '180108', 'Pishilata', 'PISHILATA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1180, 186, '180109', 'San Francisco', 'SAN FRANCISCO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1181, 186, '180110', 'Ambato', 'AMBATO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1182, 186, '180111', 'Ambatillo', 'AMBATILLO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1183, 186, '180112', 'Atahualpa (Chisalata)', 'ATAHUALPA CHISALATA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1184, 186, '180113', 'Augusto N. MartÃ­nez (Mundugleo)', 'AUGUSTO N MARTINEZ MUNDUGLEO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1185, 186, '180114', 'Constantino FernÃ¡ndez (Cab. En Cullitahua)', 'CONSTANTINO FERNANDEZ CAB EN CULLITAHUA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1186, 186, '180115', 'Huachi Grande', 'HUACHI GRANDE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1187, 186, '180116', 'Izamba', 'IZAMBA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1188, 186, '180117', 'Juan Benigno Vela', 'JUAN BENIGNO VELA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1189, 186, '180118', 'Montalvo', 'MONTALVO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1190, 186, '180119', 'Pasa', 'PASA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1191, 186, '180120', 'Picaigua', 'PICAIGUA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1192, 186, '180121', 'PilagÃ¼Ã­n (PilahÃ¼Ã­n)', 'PILAGUIN PILAHUIN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1193, 186, '180122', 'Quisapincha (Quizapincha)', 'QUISAPINCHA QUIZAPINCHA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1194, 186, '180123', 'San BartolomÃ© de Pinllog', 'SAN BARTOLOME DE PINLLOG');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1195, 186, '180124', 'San Fernando (Pasa San Fernando)', 'SAN FERNANDO PASA SAN FERNANDO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1196, 186, '180125', 'Santa Rosa', 'SANTA ROSA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1197, 186, '180126', 'Totoras', 'TOTORAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1198, 186, '180127', 'Cunchibamba', 'CUNCHIBAMBA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1199, 186, '180128', 'Unamuncho', 'UNAMUNCHO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1200, 187, '180201', 'BaÃ±os de Agua Santa', 'BANOS DE AGUA SANTA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1201, 187, '180202', 'Lligua', 'LLIGUA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1202, 187, '180203', 'RÃ­o Negro', 'RIO NEGRO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1203, 187, '180204', 'RÃ­o Verde', 'RIO VERDE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1204, 187, '180205', 'Ulba', 'ULBA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1205, 188, '180301', 'Cevallos', 'CEVALLOS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1206, 189, '180401', 'Mocha', 'MOCHA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1207, 189, '180402', 'PinguilÃ­', 'PINGUILI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1208, 190, '180501', 'Patate', 'PATATE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1209, 190, '180502', 'El Triunfo', 'EL TRIUNFO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1210, 190, '180503', 'Los Andes (Cab. En Poatug)', 'LOS ANDES CAB EN POATUG');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1211, 190, '180504', 'Sucre (Cab. En Sucre-Patate Urcu)', 'SUCRE CAB EN SUCRE PATATE URCU');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1212, 191, '180601', 'Quero', 'QUERO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1213, 191, '180602', 'Rumipamba', 'RUMIPAMBA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1214, 191, '180603', 'Yanayacu - Mochapata (Cab. En Yanayacu)', 'YANAYACU MOCHAPATA CAB EN YANAYACU');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1215, 192, '180701', 'Pelileo', 'PELILEO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1216, 192, '180702', 'Pelileo Grande', 'PELILEO GRANDE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1217, 192, '180703', 'Pelileo', 'PELILEO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1218, 192, '180704', 'BenÃ­tez (Pachanlica)', 'BENITEZ PACHANLICA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1219, 192, '180705', 'BolÃ­var', 'BOLIVAR');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1220, 192, '180706', 'CotalÃ³', 'COTALO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1221, 192, '180707', 'Chiquicha (Cab. En Chiquicha Grande)', 'CHIQUICHA CAB EN CHIQUICHA GRANDE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1222, 192, '180708', 'El Rosario (Rumichaca)', 'EL ROSARIO RUMICHACA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1223, 192, '180709', 'GarcÃ­a Moreno (Chumaqui)', 'GARCIA MORENO CHUMAQUI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1224, 192, '180710', 'GuambalÃ³ (HuambalÃ³)', 'GUAMBALO HUAMBALO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1225, 192, '180711', 'Salasaca', 'SALASACA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1226, 193, '180801', 'Ciudad Nueva', 'CIUDAD NUEVA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1227, 193, '180802', 'PÃ­llaro', 'PILLARO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1228, 193, '180803', 'PÃ­llaro', 'PILLARO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1229, 193, '180804', 'Baquerizo Moreno', 'BAQUERIZO MORENO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1230, 193, '180805', 'Emilio MarÃ­a TerÃ¡n (Rumipamba)', 'EMILIO MARIA TERAN RUMIPAMBA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1231, 193, '180806', 'Marcos Espinel (Chacata)', 'MARCOS ESPINEL CHACATA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1232, 193, '180807', 'Presidente Urbina (Chagrapamba -Patzucul)', 'PRESIDENTE URBINA CHAGRAPAMBA PATZUCUL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1233, 193, '180808', 'San AndrÃ©s', 'SAN ANDRES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1234, 193, '180809', 'San JosÃ© de PoalÃ³', 'SAN JOSE DE POALO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1235, 193, '180810', 'San Miguelito', 'SAN MIGUELITO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1236, 194, '180901', 'Tisaleo', 'TISALEO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1237, 194, '180902', 'Quinchicoto', 'QUINCHICOTO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1238, 195, '190101', 'El LimÃ³n', 'EL LIMON');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1239, 195, '190102', 'Zamora', 'ZAMORA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1240, 195, '190103', 'Zamora', 'ZAMORA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1241, 195, '190104', 'Cumbaratza', 'CUMBARATZA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1242, 195, '190105', 'Guadalupe', 'GUADALUPE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1243, 195, '190106', 'Imbana (La Victoria de Imbana)', 'IMBANA LA VICTORIA DE IMBANA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1244, 195, '190107', 'Paquisha', 'PAQUISHA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1245, 195, '190108', 'Sabanilla', 'SABANILLA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1246, 195, '190109', 'Timbara', 'TIMBARA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1247, 195, '190110', 'Zumbi', 'ZUMBI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1248, 195, '190111', 'San Carlos de Las Minas', 'SAN CARLOS DE LAS MINAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1249, 196, '190201', 'Zumba', 'ZUMBA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1250, 196, '190202', 'Chito', 'CHITO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1251, 196, '190203', 'El Chorro', 'EL CHORRO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1252, 196, '190204', 'El Porvenir del Carmen', 'EL PORVENIR DEL CARMEN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1253, 196, '190205', 'La Chonta', 'LA CHONTA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1254, 196, '190206', 'Palanda', 'PALANDA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1255, 196, '190207', 'Pucapamba', 'PUCAPAMBA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1256, 196, '190208', 'San Francisco del Vergel', 'SAN FRANCISCO DEL VERGEL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1257, 196, '190209', 'Valladolid', 'VALLADOLID');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1258, 196, '190210', 'San AndrÃ©s', 'SAN ANDRES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1259, 197, '190301', 'Guayzimi', 'GUAYZIMI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1260, 197, '190302', 'Zurmi', 'ZURMI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1261, 197, '190303', 'Nuevo ParaÃ­so', 'NUEVO PARAISO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1262, 198, '190401', '28 de Mayo (San JosÃ© de Yacuambi)', '28 DE MAYO SAN JOSE DE YACUAMBI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1263, 198, '190402', 'La Paz', 'LA PAZ');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1264, 198, '190403', 'Tutupali', 'TUTUPALI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1265, 199, '190501', 'Yantzaza (Yanzatza)', 'YANTZAZA YANZATZA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1266, 199, '190502', 'ChicaÃ±a', 'CHICANA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1267, 199, '190503', 'El Pangui', 'EL PANGUI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1268, 199, '190504', 'Los Encuentros', 'LOS ENCUENTROS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1269, 200, '190601', 'El Pangui', 'EL PANGUI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1270, 200, '190602', 'El Guisme', 'EL GUISME');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1271, 200, '190603', 'Pachicutza', 'PACHICUTZA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1272, 200, '190604', 'Tundayme', 'TUNDAYME');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1273, 201, '190701', 'Zumbi', 'ZUMBI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1274, 201, '190702', 'Paquisha', 'PAQUISHA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1275, 201, '190703', 'Triunfo-Dorado', 'TRIUNFO DORADO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1276, 201, '190704', 'Panguintza', 'PANGUINTZA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1277, 202, '190801', 'Palanda', 'PALANDA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1278, 202, '190802', 'El Porvenir del Carmen', 'EL PORVENIR DEL CARMEN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1279, 202, '190803', 'San Francisco del Vergel', 'SAN FRANCISCO DEL VERGEL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1280, 202, '190804', 'Valladolid', 'VALLADOLID');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1281, 202, '190805', 'La Canela', 'LA CANELA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1282, 203, '190901', 'Paquisha', 'PAQUISHA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1283, 203, '190902', 'Bellavista', 'BELLAVISTA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1284, 203, '190903', 'Nuevo Quito', 'NUEVO QUITO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1285, 204, '200101', 'Puerto Baquerizo Moreno', 'PUERTO BAQUERIZO MORENO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1286, 204, '200102', 'El Progreso', 'EL PROGRESO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1287, 204, '200103', 'Isla Santa MarÃ­a (Floreana) (Cab. En Pto. Velasco Ibarra)', 'ISLA SANTA MARIA FLOREANA CAB EN PTO VELASCO IBARRA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1288, 205, '200201', 'Puerto Villamil', 'PUERTO VILLAMIL');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1289, 205, '200202', 'TomÃ¡s de Berlanga (Santo TomÃ¡s)', 'TOMAS DE BERLANGA SANTO TOMAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1290, 206, '200301', 'Puerto Ayora', 'PUERTO AYORA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1291, 206, '200302', 'Bellavista', 'BELLAVISTA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1292, 206, '200303', 'Santa Rosa (Incluye La Isla Baltra)', 'SANTA ROSA INCLUYE LA ISLA BALTRA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1293, 207, '210101', 'Nueva Loja', 'NUEVA LOJA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1294, 207, '210102', 'Cuyabeno', 'CUYABENO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1295, 207, '210103', 'Dureno', 'DURENO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1296, 207, '210104', 'General FarfÃ¡n', 'GENERAL FARFAN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1297, 207, '210105', 'Tarapoa', 'TARAPOA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1298, 207, '210106', 'El Eno', 'EL ENO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1299, 207, '210107', 'Pacayacu', 'PACAYACU');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1300, 207, '210108', 'JambelÃ­', 'JAMBELI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1301, 207, '210109', 'Santa Cecilia', 'SANTA CECILIA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1302, 207, '210110', 'Aguas Negras', 'AGUAS NEGRAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1303, 208, '210201', 'El Dorado de Cascales', 'EL DORADO DE CASCALES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1304, 208, '210202', 'El Reventador', 'EL REVENTADOR');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1305, 208, '210203', 'Gonzalo Pizarro', 'GONZALO PIZARRO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1306, 208, '210204', 'LumbaquÃ­', 'LUMBAQUI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1307, 208, '210205', 'Puerto Libre', 'PUERTO LIBRE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1308, 208, '210206', 'Santa Rosa de SucumbÃ­os', 'SANTA ROSA DE SUCUMBIOS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1309, 209, '210301', 'Puerto El Carmen del Putumayo', 'PUERTO EL CARMEN DEL PUTUMAYO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1310, 209, '210302', 'Palma Roja', 'PALMA ROJA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1311, 209, '210303', 'Puerto BolÃ­var (Puerto MontÃºfar)', 'PUERTO BOLIVAR PUERTO MONTUFAR');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1312, 209, '210304', 'Puerto RodrÃ­guez', 'PUERTO RODRIGUEZ');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1313, 209, '210305', 'Santa Elena', 'SANTA ELENA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1314, 210, '210401', 'Shushufindi', 'SHUSHUFINDI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1315, 210, '210402', 'Limoncocha', 'LIMONCOCHA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1316, 210, '210403', 'PaÃ±acocha', 'PANACOCHA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1317, 210, '210404', 'San Roque (Cab. En San Vicente)', 'SAN ROQUE CAB EN SAN VICENTE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1318, 210, '210405', 'San Pedro de Los Cofanes', 'SAN PEDRO DE LOS COFANES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1319, 210, '210406', 'Siete de Julio', 'SIETE DE JULIO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1320, 211, '210501', 'La Bonita', 'LA BONITA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1321, 211, '210502', 'El PlayÃ³n de San Francisco', 'EL PLAYON DE SAN FRANCISCO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1322, 211, '210503', 'La SofÃ­a', 'LA SOFIA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1323, 211, '210504', 'Rosa Florida', 'ROSA FLORIDA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1324, 211, '210505', 'Santa BÃ¡rbara', 'SANTA BARBARA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1325, 212, '210601', 'El Dorado de Cascales', 'EL DORADO DE CASCALES');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1326, 212, '210602', 'Santa Rosa de SucumbÃ­os', 'SANTA ROSA DE SUCUMBIOS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1327, 212, '210603', 'Sevilla', 'SEVILLA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1328, 213, '210701', 'Tarapoa', 'TARAPOA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1329, 213, '210702', 'Cuyabeno', 'CUYABENO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1330, 213, '210703', 'Aguas Negras', 'AGUAS NEGRAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1331, 214, '220101', 'Puerto Francisco de Orellana (El Coca)', 'PUERTO FRANCISCO DE ORELLANA EL COCA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1332, 214, '220102', 'Dayuma', 'DAYUMA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1333, 214, '220103', 'Taracoa (Nueva Esperanza: Yuca)', 'TARACOA NUEVA ESPERANZA YUCA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1334, 214, '220104', 'Alejandro Labaka', 'ALEJANDRO LABAKA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1335, 214, '220105', 'El Dorado', 'EL DORADO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1336, 214, '220106', 'El EdÃ©n', 'EL EDEN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1337, 214, '220107', 'GarcÃ­a Moreno', 'GARCIA MORENO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1338, 214, '220108', 'InÃ©s Arango (Cab. En Western)', 'INES ARANGO CAB EN WESTERN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1339, 214, '220109', 'La Belleza', 'LA BELLEZA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1340, 214, '220110', 'Nuevo ParaÃ­so (Cab. En UniÃ³n', 'NUEVO PARAISO CAB EN UNION');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1341, 214, '220111', 'San JosÃ© de Guayusa', 'SAN JOSE DE GUAYUSA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1342, 214, '220112', 'San Luis de Armenia', 'SAN LUIS DE ARMENIA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1343, 215, '220201', 'Tipitini', 'TIPITINI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1344, 215, '220202', 'Nuevo Rocafuerte', 'NUEVO ROCAFUERTE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1345, 215, '220203', 'CapitÃ¡n Augusto Rivadeneyra', 'CAPITAN AUGUSTO RIVADENEYRA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1346, 215, '220204', 'Cononaco', 'CONONACO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1347, 215, '220205', 'Santa MarÃ­a de Huiririma', 'SANTA MARIA DE HUIRIRIMA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1348, 215, '220206', 'Tiputini', 'TIPUTINI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1349, 215, '220207', 'YasunÃ­', 'YASUNI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1350, 216, '220301', 'La Joya de Los Sachas', 'LA JOYA DE LOS SACHAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1351, 216, '220302', 'Enokanqui', 'ENOKANQUI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1352, 216, '220303', 'Pompeya', 'POMPEYA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1353, 216, '220304', 'San Carlos', 'SAN CARLOS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1354, 216, '220305', 'San SebastiÃ¡n del Coca', 'SAN SEBASTIAN DEL COCA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1355, 216, '220306', 'Lago San Pedro', 'LAGO SAN PEDRO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1356, 216, '220307', 'Rumipamba', 'RUMIPAMBA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1357, 216, '220308', 'Tres de Noviembre', 'TRES DE NOVIEMBRE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1358, 216, '220309', 'UniÃ³n MilagreÃ±a', 'UNION MILAGRENA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1359, 217, '220401', 'Loreto', 'LORETO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1360, 217, '220402', 'Avila (Cab. En Huiruno)', 'AVILA CAB EN HUIRUNO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1361, 217, '220403', 'Puerto Murialdo', 'PUERTO MURIALDO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1362, 217, '220404', 'San JosÃ© de Payamino', 'SAN JOSE DE PAYAMINO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1363, 217, '220405', 'San JosÃ© de Dahuano', 'SAN JOSE DE DAHUANO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1364, 217, '220406', 'San Vicente de Huaticocha', 'SAN VICENTE DE HUATICOCHA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1365, 218, '230101', 'Abraham CalazacÃ³n', 'ABRAHAM CALAZACON');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1366, 218, '230102', 'BombolÃ­', 'BOMBOLI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1367, 218, '230103', 'Chiguilpe', 'CHIGUILPE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1368, 218, '230104', 'RÃ­o Toachi', 'RIO TOACHI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1369, 218, '230105', 'RÃ­o Verde', 'RIO VERDE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1370, 218, '230106', 'Santo Domingo de Los Colorados', 'SANTO DOMINGO DE LOS COLORADOS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1371, 218, '230107', 'Zaracay', 'ZARACAY');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1372, 218, '230108', 'Santo Domingo de Los Colorados', 'SANTO DOMINGO DE LOS COLORADOS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1373, 218, '230109', 'AlluriquÃ­n', 'ALLURIQUIN');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1374, 218, '230110', 'Puerto LimÃ³n', 'PUERTO LIMON');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1375, 218, '230111', 'Luz de AmÃ©rica', 'LUZ DE AMERICA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1376, 218, '230112', 'San Jacinto del BÃºa', 'SAN JACINTO DEL BUA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1377, 218, '230113', 'Valle Hermoso', 'VALLE HERMOSO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1378, 218, '230114', 'El Esfuerzo', 'EL ESFUERZO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1379, 218, '230115', 'Santa MarÃ­a del Toachi', 'SANTA MARIA DEL TOACHI');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1380, 219, '240101', 'Ballenita', 'BALLENITA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1381, 219, '240102', 'Santa Elena', 'SANTA ELENA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1382, 219, '240103', 'Santa Elena', 'SANTA ELENA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1383, 219, '240104', 'Atahualpa', 'ATAHUALPA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1384, 219, '240105', 'Colonche', 'COLONCHE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1385, 219, '240106', 'Chanduy', 'CHANDUY');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1386, 219, '240107', 'Manglaralto', 'MANGLARALTO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1387, 219, '240108', 'SimÃ³n BolÃ­var (Julio Moreno)', 'SIMON BOLIVAR JULIO MORENO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1388, 219, '240109', 'San JosÃ© de AncÃ³n', 'SAN JOSE DE ANCON');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1389, 220, '240201', 'La Libertad', 'LA LIBERTAD');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1390, 221, '240301', 'Carlos Espinoza Larrea', 'CARLOS ESPINOZA LARREA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1391, 221, '240302', 'Gral. Alberto EnrÃ­quez Gallo', 'GRAL ALBERTO ENRIQUEZ GALLO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1392, 221, '240303', 'Vicente Rocafuerte', 'VICENTE ROCAFUERTE');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1393, 221, '240304', 'Santa Rosa', 'SANTA ROSA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1394, 221, '240305', 'Salinas', 'SALINAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1395, 221, '240306', 'Anconcito', 'ANCONCITO');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1396, 221, '240307', 'JosÃ© Luis Tamayo (Muey)', 'JOSE LUIS TAMAYO MUEY');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1397, 222, '250101', 'Las Golondrinas', 'LAS GOLONDRINAS');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1398, 222, '250102', 'Manga del Cura', 'MANGA DEL CURA');
+INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE, NOMBRE_CLAVE) VALUES (1399, 222, '250103', 'El Piedrero', 'EL PIEDRERO');
+
+INSERT INTO NOMBRE_ALIAS (TIPO, ALIAS_CLAVE, CLAVE) VALUES ('PROVINCIA', 'CHIMBORAZO PROVINCE', 'CHIMBORAZO');
+INSERT INTO NOMBRE_ALIAS (TIPO, ALIAS_CLAVE, CLAVE) VALUES ('PROVINCIA', 'MORONA SANTIAGO PROVINCE', 'MORONA SANTIAGO');
+INSERT INTO NOMBRE_ALIAS (TIPO, ALIAS_CLAVE, CLAVE) VALUES ('PROVINCIA', 'ORELLANA PROVINCE', 'ORELLANA');
+INSERT INTO NOMBRE_ALIAS (TIPO, ALIAS_CLAVE, CLAVE) VALUES ('PROVINCIA', 'PASTAZA PROVINCE', 'PASTAZA');
+INSERT INTO NOMBRE_ALIAS (TIPO, ALIAS_CLAVE, CLAVE) VALUES ('PROVINCIA', 'TUNGURAHUA PROVINCE', 'TUNGURAHUA');
 COMMIT;
 
 DECLARE
-    v_target  NUMBER;
-    v_current NUMBER;
+    PROCEDURE realinear(
+        p_secuencia IN VARCHAR2, p_tabla IN VARCHAR2, p_columna IN VARCHAR2, p_cache IN PLS_INTEGER
+    ) IS
+        v_target  NUMBER;
+        v_current NUMBER;
+    BEGIN
+        EXECUTE IMMEDIATE 'SELECT NVL(MAX(' || p_columna || '), 0) FROM ' || p_tabla INTO v_target;
+        EXECUTE IMMEDIATE 'SELECT ' || p_secuencia || '.NEXTVAL FROM DUAL' INTO v_current;
+        IF v_current < v_target THEN
+            EXECUTE IMMEDIATE 'ALTER SEQUENCE ' || p_secuencia || ' INCREMENT BY ' || (v_target - v_current);
+            EXECUTE IMMEDIATE 'SELECT ' || p_secuencia || '.NEXTVAL FROM DUAL' INTO v_current;
+            EXECUTE IMMEDIATE 'ALTER SEQUENCE ' || p_secuencia || ' INCREMENT BY 1';
+        END IF;
+        EXECUTE IMMEDIATE 'ALTER SEQUENCE ' || p_secuencia || ' CACHE ' || p_cache;
+    END;
 BEGIN
-    SELECT NVL(MAX(PROVINCIAID), 0) INTO v_target FROM PROVINCIAS;
-    SELECT SEQ_PROVINCIA.NEXTVAL INTO v_current FROM DUAL;
-    WHILE v_current <= v_target LOOP
-        SELECT SEQ_PROVINCIA.NEXTVAL INTO v_current FROM DUAL;
-    END LOOP;
-
-    SELECT NVL(MAX(CANTONID), 0) INTO v_target FROM CANTONES;
-    SELECT SEQ_CANTON.NEXTVAL INTO v_current FROM DUAL;
-    WHILE v_current <= v_target LOOP
-        SELECT SEQ_CANTON.NEXTVAL INTO v_current FROM DUAL;
-    END LOOP;
-
-    SELECT NVL(MAX(PARROQUIAID), 0) INTO v_target FROM PARROQUIAS;
-    SELECT SEQ_PARROQUIA.NEXTVAL INTO v_current FROM DUAL;
-    WHILE v_current <= v_target LOOP
-        SELECT SEQ_PARROQUIA.NEXTVAL INTO v_current FROM DUAL;
-    END LOOP;
+    realinear('SEQ_PROVINCIA', 'PROVINCIAS', 'PROVINCIAID', 20);
+    realinear('SEQ_CANTON', 'CANTONES', 'CANTONID', 20);
+    realinear('SEQ_PARROQUIA', 'PARROQUIAS', 'PARROQUIAID', 100);
 END;
 /
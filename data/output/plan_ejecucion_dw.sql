@@ -1,22 +1,87 @@
 -- Plan de ejecucion para construir OLTP enriquecido + DW
+-- Modo de ETL: full
 SET DEFINE OFF;
 SET ECHO ON;
 SET FEEDBACK ON;
 SET SERVEROUTPUT ON;
+SET TIMING ON;
 WHENEVER SQLERROR CONTINUE;
+SPOOL data/output/logs/plan_ejecucion_dw.log
 -- Si las tablas base estan en otro esquema, descomenta y ajusta:
 -- ALTER SESSION SET CURRENT_SCHEMA=ESQUEMAORIGINAL;
+@scripts/sql/etl/00_create_etl_run_log.sql
+EXEC ETL_RUN_INICIO('full')
+PROMPT ETL_PASO|1|scripts/sql/oltp/00_create_base_tables.sql
+EXEC ETL_PASO_INICIO(1, 'scripts/sql/oltp/00_create_base_tables.sql')
 @scripts/sql/oltp/00_create_base_tables.sql
+EXEC ETL_PASO_FIN(1)
+PROMPT ETL_PASO|2|scripts/sql/oltp/00_require_base_tables.sql
+EXEC ETL_PASO_INICIO(2, 'scripts/sql/oltp/00_require_base_tables.sql')
 @scripts/sql/oltp/00_require_base_tables.sql
+EXEC ETL_PASO_FIN(2)
+PROMPT ETL_PASO|3|scripts/sql/oltp/05_seed_transactional_data.sql
+EXEC ETL_PASO_INICIO(3, 'scripts/sql/oltp/05_seed_transactional_data.sql')
 @scripts/sql/oltp/05_seed_transactional_data.sql
+EXEC ETL_PASO_FIN(3)
+PROMPT ETL_PASO|4|scripts/sql/oltp/01_create_ciudad_table.sql
+EXEC ETL_PASO_INICIO(4, 'scripts/sql/oltp/01_create_ciudad_table.sql')
 @scripts/sql/oltp/01_create_ciudad_table.sql
+EXEC ETL_PASO_FIN(4)
+PROMPT ETL_PASO|5|data/output/ciudades/insert_ciudad.sql
+EXEC ETL_PASO_INICIO(5, 'data/output/ciudades/insert_ciudad.sql')
 @data/output/ciudades/insert_ciudad.sql
+EXEC ETL_PASO_FIN(5)
+PROMPT ETL_PASO|6|scripts/sql/oltp/02_add_ciudad_to_clientes.sql
+EXEC ETL_PASO_INICIO(6, 'scripts/sql/oltp/02_add_ciudad_to_clientes.sql')
 @scripts/sql/oltp/02_add_ciudad_to_clientes.sql
+EXEC ETL_PASO_FIN(6)
+PROMPT ETL_PASO|7|scripts/sql/oltp/03_assign_random_city_to_clients.sql
+EXEC ETL_PASO_INICIO(7, 'scripts/sql/oltp/03_assign_random_city_to_clients.sql')
 @scripts/sql/oltp/03_assign_random_city_to_clients.sql
+EXEC ETL_PASO_FIN(7)
+PROMPT ETL_PASO|8|scripts/sql/oltp/04_create_province_canton_parish_tables.sql
+EXEC ETL_PASO_INICIO(8, 'scripts/sql/oltp/04_create_province_canton_parish_tables.sql')
 @scripts/sql/oltp/04_create_province_canton_parish_tables.sql
+EXEC ETL_PASO_FIN(8)
+PROMPT ETL_PASO|9|data/output/jerarquia/insert_jerarquia.sql
+EXEC ETL_PASO_INICIO(9, 'data/output/jerarquia/insert_jerarquia.sql')
 @data/output/jerarquia/insert_jerarquia.sql
+EXEC ETL_PASO_FIN(9)
+PROMPT ETL_PASO|10|scripts/sql/oltp/06_create_ciudad_ubicacion_table.sql
+EXEC ETL_PASO_INICIO(10, 'scripts/sql/oltp/06_create_ciudad_ubicacion_table.sql')
+@scripts/sql/oltp/06_create_ciudad_ubicacion_table.sql
+EXEC ETL_PASO_FIN(10)
+PROMPT ETL_PASO|11|data/output/ciudades/insert_ciudad_ubicacion.sql
+EXEC ETL_PASO_INICIO(11, 'data/output/ciudades/insert_ciudad_ubicacion.sql')
+@data/output/ciudades/insert_ciudad_ubicacion.sql
+EXEC ETL_PASO_FIN(11)
+PROMPT ETL_PASO|12|scripts/sql/dw/01_dw_star_schema_and_top_product_view.sql
+EXEC ETL_PASO_INICIO(12, 'scripts/sql/dw/01_dw_star_schema_and_top_product_view.sql')
 @scripts/sql/dw/01_dw_star_schema_and_top_product_view.sql
+EXEC ETL_PASO_FIN(12)
+PROMPT ETL_PASO|13|scripts/sql/dw/02_dw_aggregates.sql
+EXEC ETL_PASO_INICIO(13, 'scripts/sql/dw/02_dw_aggregates.sql')
+@scripts/sql/dw/02_dw_aggregates.sql
+EXEC ETL_PASO_FIN(13)
+PROMPT ETL_PASO|14|scripts/sql/dw/03_dw_fact_storage.sql
+EXEC ETL_PASO_INICIO(14, 'scripts/sql/dw/03_dw_fact_storage.sql')
+@scripts/sql/dw/03_dw_fact_storage.sql
+EXEC ETL_PASO_FIN(14)
+PROMPT ETL_PASO|15|scripts/sql/etl/reset_dw_watermark.sql
+EXEC ETL_PASO_INICIO(15, 'scripts/sql/etl/reset_dw_watermark.sql')
+@scripts/sql/etl/reset_dw_watermark.sql
+EXEC ETL_PASO_FIN(15)
+PROMPT ETL_PASO|16|scripts/sql/etl/load_dw_from_oltp.sql
+EXEC ETL_PASO_INICIO(16, 'scripts/sql/etl/load_dw_from_oltp.sql')
 @scripts/sql/etl/load_dw_from_oltp.sql
+EXEC ETL_PASO_FIN(16)
+PROMPT ETL_PASO|17|scripts/sql/etl/refresh_dw_aggregates.sql
+EXEC ETL_PASO_INICIO(17, 'scripts/sql/etl/refresh_dw_aggregates.sql')
+@scripts/sql/etl/refresh_dw_aggregates.sql
+EXEC ETL_PASO_FIN(17)
+PROMPT ETL_FIN
+EXEC ETL_RUN_FIN
+SET TIMING OFF;
 
 PROMPT ===== Verificacion rapida =====;
 PROMPT Conteo de ciudades en CIUDAD:;
@@ -31,3 +96,10 @@ PROMPT Conteos jerarquía provincial:
 SELECT COUNT(*) AS TOTAL_PROVINCIAS FROM PROVINCIAS;
 SELECT COUNT(*) AS TOTAL_CANTONES FROM CANTONES;
 SELECT COUNT(*) AS TOTAL_PARROQUIAS FROM PARROQUIAS;
+PROMPT Ciudades enlazadas a canton/parroquia por metodo:
+SELECT METODO, COUNT(*) AS TOTAL FROM CIUDAD_UBICACION GROUP BY METODO ORDER BY METODO;
+PROMPT Marca de agua de la carga de hechos:
+SELECT Proceso, UltimoOrdenID, UltimaFechaOrden, Estado, OrdenesCargadas FROM ETL_CONTROL;
+PROMPT Pasos mas lentos de esta corrida (ETL_RUN_LOG):
+SELECT * FROM (SELECT Paso, Script, Objeto, ROUND(Segundos, 2) AS Segundos, Filas FROM ETL_RUN_LOG WHERE RunID = (SELECT MAX(RunID) FROM ETL_RUN_LOG) AND Paso > 0 ORDER BY Segundos DESC NULLS LAST) WHERE ROWNUM <= 10;
+SPOOL OFF
@@ -0,0 +1,15 @@
+-- Plan por sesiones (sesion_00) para construir OLTP enriquecido + DW
+-- Modo de ETL: full
+SET DEFINE OFF;
+SET ECHO ON;
+SET FEEDBACK ON;
+SET SERVEROUTPUT ON;
+SET TIMING ON;
+WHENEVER SQLERROR CONTINUE;
+SPOOL data/output/logs/plan_ejecucion_dw_sesion_00.log
+-- Si las tablas base estan en otro esquema, descomenta y ajusta:
+-- ALTER SESSION SET CURRENT_SCHEMA=ESQUEMAORIGINAL;
+@scripts/sql/etl/00_create_etl_run_log.sql
+EXEC ETL_RUN_INICIO('full')
+SPOOL OFF
+EXIT
@@ -0,0 +1,25 @@
+-- Plan por sesiones (sesion_01) para construir OLTP enriquecido + DW
+-- Modo de ETL: full
+SET DEFINE OFF;
+SET ECHO ON;
+SET FEEDBACK ON;
+SET SERVEROUTPUT ON;
+SET TIMING ON;
+WHENEVER SQLERROR CONTINUE;
+SPOOL data/output/logs/plan_ejecucion_dw_sesion_01.log
+-- Si las tablas base estan en otro esquema, descomenta y ajusta:
+-- ALTER SESSION SET CURRENT_SCHEMA=ESQUEMAORIGINAL;
+PROMPT ETL_PASO|1|scripts/sql/oltp/00_create_base_tables.sql
+EXEC ETL_PASO_INICIO(1, 'scripts/sql/oltp/00_create_base_tables.sql')
+@scripts/sql/oltp/00_create_base_tables.sql
+EXEC ETL_PASO_FIN(1)
+PROMPT ETL_PASO|2|scripts/sql/oltp/00_require_base_tables.sql
+EXEC ETL_PASO_INICIO(2, 'scripts/sql/oltp/00_require_base_tables.sql')
+@scripts/sql/oltp/00_require_base_tables.sql
+EXEC ETL_PASO_FIN(2)
+PROMPT ETL_PASO|3|scripts/sql/oltp/05_seed_transactional_data.sql
+EXEC ETL_PASO_INICIO(3, 'scripts/sql/oltp/05_seed_transactional_data.sql')
+@scripts/sql/oltp/05_seed_transactional_data.sql
+EXEC ETL_PASO_FIN(3)
+SPOOL OFF
+EXIT
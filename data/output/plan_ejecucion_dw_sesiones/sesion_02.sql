@@ -0,0 +1,21 @@
+-- Plan por sesiones (sesion_02) para construir OLTP enriquecido + DW
+-- Modo de ETL: full
+SET DEFINE OFF;
+SET ECHO ON;
+SET FEEDBACK ON;
+SET SERVEROUTPUT ON;
+SET TIMING ON;
+WHENEVER SQLERROR CONTINUE;
+SPOOL data/output/logs/plan_ejecucion_dw_sesion_02.log
+-- Si las tablas base estan en otro esquema, descomenta y ajusta:
+-- ALTER SESSION SET CURRENT_SCHEMA=ESQUEMAORIGINAL;
+PROMPT ETL_PASO|4|scripts/sql/oltp/01_create_ciudad_table.sql
+EXEC ETL_PASO_INICIO(4, 'scripts/sql/oltp/01_create_ciudad_table.sql')
+@scripts/sql/oltp/01_create_ciudad_table.sql
+EXEC ETL_PASO_FIN(4)
+PROMPT ETL_PASO|5|data/output/ciudades/insert_ciudad.sql
+EXEC ETL_PASO_INICIO(5, 'data/output/ciudades/insert_ciudad.sql')
+@data/output/ciudades/insert_ciudad.sql
+EXEC ETL_PASO_FIN(5)
+SPOOL OFF
+EXIT
@@ -0,0 +1,21 @@
+-- Plan por sesiones (sesion_03) para construir OLTP enriquecido + DW
+-- Modo de ETL: full
+SET DEFINE OFF;
+SET ECHO ON;
+SET FEEDBACK ON;
+SET SERVEROUTPUT ON;
+SET TIMING ON;
+WHENEVER SQLERROR CONTINUE;
+SPOOL data/output/logs/plan_ejecucion_dw_sesion_03.log
+-- Si las tablas base estan en otro esquema, descomenta y ajusta:
+-- ALTER SESSION SET CURRENT_SCHEMA=ESQUEMAORIGINAL;
+PROMPT ETL_PASO|6|scripts/sql/oltp/02_add_ciudad_to_clientes.sql
+EXEC ETL_PASO_INICIO(6, 'scripts/sql/oltp/02_add_ciudad_to_clientes.sql')
+@scripts/sql/oltp/02_add_ciudad_to_clientes.sql
+EXEC ETL_PASO_FIN(6)
+PROMPT ETL_PASO|7|scripts/sql/oltp/03_assign_random_city_to_clients.sql
+EXEC ETL_PASO_INICIO(7, 'scripts/sql/oltp/03_assign_random_city_to_clients.sql')
+@scripts/sql/oltp/03_assign_random_city_to_clients.sql
+EXEC ETL_PASO_FIN(7)
+SPOOL OFF
+EXIT
@@ -0,0 +1,21 @@
+-- Plan por sesiones (sesion_04) para construir OLTP enriquecido + DW
+-- Modo de ETL: full
+SET DEFINE OFF;
+SET ECHO ON;
+SET FEEDBACK ON;
+SET SERVEROUTPUT ON;
+SET TIMING ON;
+WHENEVER SQLERROR CONTINUE;
+SPOOL data/output/logs/plan_ejecucion_dw_sesion_04.log
+-- Si las tablas base estan en otro esquema, descomenta y ajusta:
+-- ALTER SESSION SET CURRENT_SCHEMA=ESQUEMAORIGINAL;
+PROMPT ETL_PASO|8|scripts/sql/oltp/04_create_province_canton_parish_tables.sql
+EXEC ETL_PASO_INICIO(8, 'scripts/sql/oltp/04_create_province_canton_parish_tables.sql')
+@scripts/sql/oltp/04_create_province_canton_parish_tables.sql
+EXEC ETL_PASO_FIN(8)
+PROMPT ETL_PASO|9|data/output/jerarquia/insert_jerarquia.sql
+EXEC ETL_PASO_INICIO(9, 'data/output/jerarquia/insert_jerarquia.sql')
+@data/output/jerarquia/insert_jerarquia.sql
+EXEC ETL_PASO_FIN(9)
+SPOOL OFF
+EXIT
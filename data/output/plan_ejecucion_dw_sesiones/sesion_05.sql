@@ -0,0 +1,21 @@
+-- Plan por sesiones (sesion_05) para construir OLTP enriquecido + DW
+-- Modo de ETL: full
+SET DEFINE OFF;
+SET ECHO ON;
+SET FEEDBACK ON;
+SET SERVEROUTPUT ON;
+SET TIMING ON;
+WHENEVER SQLERROR CONTINUE;
+SPOOL data/output/logs/plan_ejecucion_dw_sesion_05.log
+-- Si las tablas base estan en otro esquema, descomenta y ajusta:
+-- ALTER SESSION SET CURRENT_SCHEMA=ESQUEMAORIGINAL;
+PROMPT ETL_PASO|10|scripts/sql/oltp/06_create_ciudad_ubicacion_table.sql
+EXEC ETL_PASO_INICIO(10, 'scripts/sql/oltp/06_create_ciudad_ubicacion_table.sql')
+@scripts/sql/oltp/06_create_ciudad_ubicacion_table.sql
+EXEC ETL_PASO_FIN(10)
+PROMPT ETL_PASO|11|data/output/ciudades/insert_ciudad_ubicacion.sql
+EXEC ETL_PASO_INICIO(11, 'data/output/ciudades/insert_ciudad_ubicacion.sql')
+@data/output/ciudades/insert_ciudad_ubicacion.sql
+EXEC ETL_PASO_FIN(11)
+SPOOL OFF
+EXIT
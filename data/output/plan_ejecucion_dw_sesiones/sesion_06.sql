@@ -0,0 +1,17 @@
+-- Plan por sesiones (sesion_06) para construir OLTP enriquecido + DW
+-- Modo de ETL: full
+SET DEFINE OFF;
+SET ECHO ON;
+SET FEEDBACK ON;
+SET SERVEROUTPUT ON;
+SET TIMING ON;
+WHENEVER SQLERROR CONTINUE;
+SPOOL data/output/logs/plan_ejecucion_dw_sesion_06.log
+-- Si las tablas base estan en otro esquema, descomenta y ajusta:
+-- ALTER SESSION SET CURRENT_SCHEMA=ESQUEMAORIGINAL;
+PROMPT ETL_PASO|12|scripts/sql/dw/01_dw_star_schema_and_top_product_view.sql
+EXEC ETL_PASO_INICIO(12, 'scripts/sql/dw/01_dw_star_schema_and_top_product_view.sql')
+@scripts/sql/dw/01_dw_star_schema_and_top_product_view.sql
+EXEC ETL_PASO_FIN(12)
+SPOOL OFF
+EXIT
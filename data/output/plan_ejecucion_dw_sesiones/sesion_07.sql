@@ -0,0 +1,21 @@
+-- Plan por sesiones (sesion_07) para construir OLTP enriquecido + DW
+-- Modo de ETL: full
+SET DEFINE OFF;
+SET ECHO ON;
+SET FEEDBACK ON;
+SET SERVEROUTPUT ON;
+SET TIMING ON;
+WHENEVER SQLERROR CONTINUE;
+SPOOL data/output/logs/plan_ejecucion_dw_sesion_07.log
+-- Si las tablas base estan en otro esquema, descomenta y ajusta:
+-- ALTER SESSION SET CURRENT_SCHEMA=ESQUEMAORIGINAL;
+PROMPT ETL_PASO|13|scripts/sql/dw/02_dw_aggregates.sql
+EXEC ETL_PASO_INICIO(13, 'scripts/sql/dw/02_dw_aggregates.sql')
+@scripts/sql/dw/02_dw_aggregates.sql
+EXEC ETL_PASO_FIN(13)
+PROMPT ETL_PASO|15|scripts/sql/etl/reset_dw_watermark.sql
+EXEC ETL_PASO_INICIO(15, 'scripts/sql/etl/reset_dw_watermark.sql')
+@scripts/sql/etl/reset_dw_watermark.sql
+EXEC ETL_PASO_FIN(15)
+SPOOL OFF
+EXIT
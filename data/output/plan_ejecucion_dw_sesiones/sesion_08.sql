@@ -0,0 +1,17 @@
+-- Plan por sesiones (sesion_08) para construir OLTP enriquecido + DW
+-- Modo de ETL: full
+SET DEFINE OFF;
+SET ECHO ON;
+SET FEEDBACK ON;
+SET SERVEROUTPUT ON;
+SET TIMING ON;
+WHENEVER SQLERROR CONTINUE;
+SPOOL data/output/logs/plan_ejecucion_dw_sesion_08.log
+-- Si las tablas base estan en otro esquema, descomenta y ajusta:
+-- ALTER SESSION SET CURRENT_SCHEMA=ESQUEMAORIGINAL;
+PROMPT ETL_PASO|14|scripts/sql/dw/03_dw_fact_storage.sql
+EXEC ETL_PASO_INICIO(14, 'scripts/sql/dw/03_dw_fact_storage.sql')
+@scripts/sql/dw/03_dw_fact_storage.sql
+EXEC ETL_PASO_FIN(14)
+SPOOL OFF
+EXIT
@@ -0,0 +1,21 @@
+-- Plan por sesiones (sesion_09) para construir OLTP enriquecido + DW
+-- Modo de ETL: full
+SET DEFINE OFF;
+SET ECHO ON;
+SET FEEDBACK ON;
+SET SERVEROUTPUT ON;
+SET TIMING ON;
+WHENEVER SQLERROR CONTINUE;
+SPOOL data/output/logs/plan_ejecucion_dw_sesion_09.log
+-- Si las tablas base estan en otro esquema, descomenta y ajusta:
+-- ALTER SESSION SET CURRENT_SCHEMA=ESQUEMAORIGINAL;
+PROMPT ETL_PASO|16|scripts/sql/etl/load_dw_from_oltp.sql
+EXEC ETL_PASO_INICIO(16, 'scripts/sql/etl/load_dw_from_oltp.sql')
+@scripts/sql/etl/load_dw_from_oltp.sql
+EXEC ETL_PASO_FIN(16)
+PROMPT ETL_PASO|17|scripts/sql/etl/refresh_dw_aggregates.sql
+EXEC ETL_PASO_INICIO(17, 'scripts/sql/etl/refresh_dw_aggregates.sql')
+@scripts/sql/etl/refresh_dw_aggregates.sql
+EXEC ETL_PASO_FIN(17)
+SPOOL OFF
+EXIT
@@ -0,0 +1,36 @@
+-- Plan por sesiones (sesion_10) para construir OLTP enriquecido + DW
+-- Modo de ETL: full
+SET DEFINE OFF;
+SET ECHO ON;
+SET FEEDBACK ON;
+SET SERVEROUTPUT ON;
+SET TIMING ON;
+WHENEVER SQLERROR CONTINUE;
+SPOOL data/output/logs/plan_ejecucion_dw_sesion_10.log
+-- Si las tablas base estan en otro esquema, descomenta y ajusta:
+-- ALTER SESSION SET CURRENT_SCHEMA=ESQUEMAORIGINAL;
+PROMPT ETL_FIN
+EXEC ETL_RUN_FIN
+SET TIMING OFF;
+
+PROMPT ===== Verificacion rapida =====;
+PROMPT Conteo de ciudades en CIUDAD:;
+SELECT COUNT(*) AS TOTAL_CIUDADES FROM CIUDAD;
+PROMPT Ejemplo de 5 ciudades:
+SELECT CIUDADID, NOMBRE, PROVINCIA FROM CIUDAD WHERE ROWNUM <= 5;
+PROMPT Conteo en DW_DIM_UBICACION:
+SELECT COUNT(*) AS TOTAL_DIM_UBICACION FROM DW_DIM_UBICACION;
+PROMPT Top producto mas vendido (si hay datos):
+SELECT * FROM VW_MAS_VENDIDO WHERE ROWNUM <= 5;
+PROMPT Conteos jerarquía provincial:
+SELECT COUNT(*) AS TOTAL_PROVINCIAS FROM PROVINCIAS;
+SELECT COUNT(*) AS TOTAL_CANTONES FROM CANTONES;
+SELECT COUNT(*) AS TOTAL_PARROQUIAS FROM PARROQUIAS;
+PROMPT Ciudades enlazadas a canton/parroquia por metodo:
+SELECT METODO, COUNT(*) AS TOTAL FROM CIUDAD_UBICACION GROUP BY METODO ORDER BY METODO;
+PROMPT Marca de agua de la carga de hechos:
+SELECT Proceso, UltimoOrdenID, UltimaFechaOrden, Estado, OrdenesCargadas FROM ETL_CONTROL;
+PROMPT Pasos mas lentos de esta corrida (ETL_RUN_LOG):
+SELECT * FROM (SELECT Paso, Script, Objeto, ROUND(Segundos, 2) AS Segundos, Filas FROM ETL_RUN_LOG WHERE RunID = (SELECT MAX(RunID) FROM ETL_RUN_LOG) AND Paso > 0 ORDER BY Segundos DESC NULLS LAST) WHERE ROWNUM <= 10;
+SPOOL OFF
+EXIT
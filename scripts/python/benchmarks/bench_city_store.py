@@ -0,0 +1,114 @@
+"""
+Compara el catalogo de ciudades como lista de CityRow contra el almacen columnar (CityStore).
+
+Mide memoria (tracemalloc) y tiempo de apertura: parsear el CSV vs mapear el .bin.
+
+Uso (desde la raiz del repo):
+    python scripts/python/benchmarks/bench_city_store.py
+    python scripts/python/benchmarks/bench_city_store.py --csv data/output/ciudades/ciudades_ec.csv --scale 50
+
+--scale replica las filas N veces para simular catalogos mas grandes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, List, Optional, TypeVar
+
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from ciudades.city_store import CityStore
+from ciudades.download_ecuador_cities import CityRow, _root_dir
+
+T = TypeVar("T")
+
+
+def _read_csv(path: Path, scale: int) -> List[CityRow]:
+    rows: List[CityRow] = []
+    with path.open("r", newline="", encoding="utf-8") as fh:
+        reader = csv.reader(fh)
+        next(reader, None)
+        records = list(reader)
+    for copy in range(scale):
+        offset = copy * len(records)
+        for fields in records:
+            rows.append(
+                CityRow(
+                    int(fields[0]) + offset,
+                    fields[1],
+                    fields[2] or None,
+                    float(fields[3]) if fields[3] else None,
+                    float(fields[4]) if fields[4] else None,
+                    fields[5] or None,
+                    int(fields[6]) if len(fields) > 6 and fields[6] else None,
+                )
+            )
+    return rows
+
+
+def _measure(build: Callable[[], T]) -> tuple[T, float, int]:
+    """(resultado, segundos, bytes retenidos segun tracemalloc). El tiempo se mide sin trazar memoria."""
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    del result
+    tracemalloc.start()
+    result = build()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, retained
+
+
+def _parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark del catalogo columnar de ciudades.")
+    parser.add_argument(
+        "--csv", type=Path, default=_root_dir() / "data" / "output" / "ciudades" / "ciudades_ec.csv"
+    )
+    parser.add_argument("--scale", type=int, default=10, help="Veces que se replican las filas (default 10).")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    args = _parse_args(argv)
+    scale = max(1, args.scale)
+
+    with tempfile.TemporaryDirectory(prefix="bench_city_store_") as tmp:
+        csv_path = Path(tmp) / "ciudades.csv"
+        store_path = Path(tmp) / "ciudades.bin"
+        rows = _read_csv(args.csv, scale)
+        with csv_path.open("w", newline="", encoding="utf-8") as fh:
+            writer = csv.writer(fh)
+            writer.writerow(["ciudadid", "nombre", "provincia", "latitud", "longitud", "zona_horaria", "poblacion"])
+            writer.writerows(
+                [row.ciudadid, row.nombre, row.provincia, row.latitud, row.longitud, row.zona_horaria, row.poblacion]
+                for row in rows
+            )
+        CityStore.from_rows(rows).save(store_path)
+        del rows
+
+        objects, csv_seconds, objects_bytes = _measure(lambda: _read_csv(csv_path, 1))
+        columnar, _, columnar_bytes = _measure(lambda: CityStore.from_rows(objects))
+        mapped, mmap_seconds, mapped_bytes = _measure(lambda: CityStore.load(store_path))
+        with mapped:
+            if list(mapped) != objects:
+                raise SystemExit("El catalogo columnar no reproduce las mismas filas.")
+        total = len(objects)
+
+    print(f"Ciudades: {total} (x{scale})")
+    print(f"{'representacion':<22}{'bytes/ciudad':>14}{'total MB':>10}")
+    print(f"{'lista de CityRow':<22}{objects_bytes / total:>14.1f}{objects_bytes / 2**20:>10.2f}")
+    print(f"{'CityStore en memoria':<22}{columnar_bytes / total:>14.1f}{columnar_bytes / 2**20:>10.2f}")
+    print(f"{'CityStore mmap':<22}{mapped_bytes / total:>14.1f}{mapped_bytes / 2**20:>10.2f}")
+    print(f"Apertura: CSV {csv_seconds * 1000:.1f} ms | .bin con mmap {mmap_seconds * 1000:.2f} ms")
+    print(f"Columnas del .bin: {columnar.nbytes() / 2**20:.2f} MB")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
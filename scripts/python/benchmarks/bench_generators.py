@@ -0,0 +1,458 @@
+"""
+Benchmark de los generadores del catalogo de ciudades y de la jerarquia geografica.
+
+Genera entradas sinteticas (dump de GeoNames, CSV de jerarquia y dumps INSERT ... VALUES) a
+1x, 10x, 100x y 1000x el tamano de los datos incluidos en el repo y mide, por funcion y escala:
+filas procesadas, segundos por llamada (mejor de --repeat), filas/s y pico de memoria (tracemalloc,
+en una corrida aparte para no contaminar el tiempo). Cada muestra repite la funcion hasta sumar
+--min-seconds, asi las funciones rapidas no se miden con un solo tic del reloj.
+
+Cada muestra de la funcion va precedida de una muestra de un lazo de calibracion fijo (texto, dict y
+listas en Python puro) y se guarda la mediana de los cocientes filas/s de la funcion / iteraciones/s
+del lazo: una maquina mas lenta o cargada en ese momento baja ambos por igual, de modo que el
+cociente se puede comparar entre corridas y maquinas parecidas.
+
+Funciones medidas:
+ - ciudades/download_ecuador_cities.py: parse_geonames, deduplicate, write_csv, write_sql_inserts;
+ - jerarquia/build_jerarquia_csv.py: _extract_rows;
+ - jerarquia/generate_jerarquia_inserts.py: _load_csv, generate_jerarquia_sql.
+
+Con --save-baseline guarda los resultados en un JSON; en las corridas siguientes compara contra ese
+JSON y termina con codigo 1 si alguna funcion pierde mas de --threshold de throughput relativo o
+su pico de memoria crece mas de --memory-threshold. Antes de fallar vuelve a medir (hasta --retries
+veces) las funciones que parecen mas lentas y se queda con su mejor medicion: el ruido de una
+corrida no se repite, una regresion real si. Si cambia el interprete o la arquitectura, regenera
+el baseline.
+
+Uso (desde la raiz del repo):
+    python scripts/python/benchmarks/bench_generators.py
+    python scripts/python/benchmarks/bench_generators.py --scales 1 10 --save-baseline
+    python scripts/python/benchmarks/bench_generators.py --scales 100 --only parse_geonames deduplicate
+
+La escala 1000 escribe un dump de GeoNames de ~2 GB, parse_geonames retiene millones de filas y
+generate_jerarquia_sql procesa 1.6 millones de filas de jerarquia: usala en una maquina con espacio
+y RAM suficientes (varios GB).
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from ciudades.download_ecuador_cities import (
+    COUNTRY_CODE,
+    _iter_geonames_lines,
+    _root_dir,
+    deduplicate,
+    load_admin1_lookup,
+    parse_geonames,
+    write_csv,
+    write_sql_inserts,
+)
+from jerarquia.build_jerarquia_csv import _extract_rows
+from jerarquia.generate_jerarquia_inserts import _load_csv, generate_jerarquia_sql
+
+SCALES = (1, 10, 100, 1000)
+DEFAULT_SCALES = (1, 10)
+FUNCTIONS = (
+    "parse_geonames",
+    "deduplicate",
+    "write_csv",
+    "write_sql_inserts",
+    "_extract_rows",
+    "_load_csv",
+    "generate_jerarquia_sql",
+)
+DEFAULT_BASELINE = _root_dir() / "data" / "benchmarks" / "generators_baseline.json"
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_MEMORY_THRESHOLD = 0.25
+DEFAULT_MIN_SECONDS = 0.25
+DEFAULT_RETRIES = 2
+TIME_METRIC = "filas/s relativas"
+CALIBRATION_ITEMS = 20_000
+MIN_MEMORY_MB = 1.0
+INSERT_ROWS_PER_STATEMENT = 500
+
+_FEATURES = (("P", "PPL"), ("H", "STM"), ("T", "MT"), ("S", "SCH"), ("L", "AREA"), ("A", "ADM3"))
+_FEATURE_WEIGHTS = (53, 25, 12, 6, 2, 2)
+_PREFIXES = ("San", "Santa", "El", "La", "Los", "Puerto", "Nuevo", "Quebrada", "Loma", "Rio")
+_ROOTS = ("Jose", "Carmen", "Paz", "Rosa", "Rocafuerte", "Bolivar", "Esperanza", "Pedro", "Isidro", "Lucia")
+
+
+@dataclass
+class BenchResult:
+    funcion: str
+    escala: int
+    filas: int
+    segundos: float
+    pico_mb: float
+    relativo: float  # filas/s por cada iteracion/s del lazo de calibracion (mediana de las muestras)
+
+    @property
+    def key(self) -> str:
+        return f"{self.funcion}@{self.escala}"
+
+    @property
+    def filas_por_segundo(self) -> float:
+        return self.filas / max(self.segundos, 1e-9)
+
+
+@dataclass
+class Regression:
+    key: str
+    metrica: str
+    baseline: float
+    actual: float
+
+    def describe(self) -> str:
+        change = (self.actual - self.baseline) / self.baseline if self.baseline else 0.0
+        return f"{self.key}: {self.metrica} {self.baseline:,.4g} -> {self.actual:,.4g} ({change:+.0%})"
+
+
+def bundled_sizes(root: Path) -> Dict[str, int]:
+    """Tamanos de referencia (escala 1): lineas del EC.zip incluido y filas de los CSV de jerarquia."""
+    sizes = {"geonames": sum(1 for _ in _iter_geonames_lines(root / "data" / "raw" / "ciudades" / "EC.zip"))}
+    for level in ("provincias", "cantones", "parroquias"):
+        with (root / "data" / "raw" / "jerarquia" / f"{level}.csv").open("r", encoding="utf-8", newline="") as fh:
+            sizes[level] = max(sum(1 for _ in csv.DictReader(fh)), 1)
+    return sizes
+
+
+def _name(rng: random.Random, pool: int) -> str:
+    # El pool acotado repite nombres a proposito: deduplicate tiene trabajo real.
+    index = rng.randrange(pool)
+    return f"{_PREFIXES[index % len(_PREFIXES)]} {_ROOTS[(index // len(_PREFIXES)) % len(_ROOTS)]} {index}"
+
+
+def write_geonames(path: Path, lines: int, admin_codes: Sequence[str], seed: int = 7) -> None:
+    """Dump con el formato de GeoNames (19 columnas por tab); ~53% de lugares poblados, como EC.txt."""
+    rng = random.Random(seed)
+    pool = max(lines // 3, 1)
+    with path.open("w", encoding="utf-8", newline="\n") as fh:
+        for geonameid in range(1, lines + 1):
+            feature_class, feature_code = rng.choices(_FEATURES, _FEATURE_WEIGHTS)[0]
+            name = _name(rng, pool)
+            fields = [
+                str(geonameid),
+                name,
+                name,
+                "",
+                f"{rng.uniform(-5.0, 1.5):.5f}",
+                f"{rng.uniform(-81.0, -75.2):.5f}",
+                feature_class,
+                feature_code,
+                COUNTRY_CODE,
+                "",
+                rng.choice(admin_codes),
+                "",
+                "",
+                "",
+                str(rng.randrange(50000) if feature_class == "P" else 0),
+                "",
+                str(rng.randrange(4000)),
+                "America/Guayaquil",
+                "2020-01-01",
+            ]
+            fh.write("\t".join(fields))
+            fh.write("\n")
+
+
+def write_hierarchy(directory: Path, sizes: Dict[str, int], scale: int, seed: int = 7) -> Dict[str, int]:
+    """CSV de provincias/cantones/parroquias con codigos consistentes; devuelve filas por nivel."""
+    rng = random.Random(seed)
+    counts = {level: sizes[level] * scale for level in ("provincias", "cantones", "parroquias")}
+    width = len(str(counts["provincias"]))
+    provinces = [f"{index:0{width}d}" for index in range(1, counts["provincias"] + 1)]
+    cantons = [f"{provinces[index % len(provinces)]}{index:06d}" for index in range(counts["cantones"])]
+    directory.mkdir(parents=True, exist_ok=True)
+    with (directory / "provincias.csv").open("w", encoding="utf-8", newline="") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(["CODIGO", "NOMBRE"])
+        writer.writerows([code, f"PROVINCIA {code}"] for code in provinces)
+    with (directory / "cantones.csv").open("w", encoding="utf-8", newline="") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(["CODIGO", "PROVINCIA_CODIGO", "NOMBRE"])
+        writer.writerows([code, provinces[index % len(provinces)], f"CANTON {code}"] for index, code in enumerate(cantons))
+    with (directory / "parroquias.csv").open("w", encoding="utf-8", newline="") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(["CODIGO", "CANTON_CODIGO", "NOMBRE"])
+        for index in range(counts["parroquias"]):
+            writer.writerow([f"P{index:09d}", rng.choice(cantons), _name(rng, counts["parroquias"]).upper()])
+    return counts
+
+
+def write_values_dump(path: Path, rows: int, seed: int = 7) -> None:
+    """Dump latin-1 de parroquias con el formato de Datos-Geograficos-Ecuador (id, nombre, canton)."""
+    rng = random.Random(seed)
+    with path.open("w", encoding="latin-1", newline="\n") as fh:
+        for start in range(1, rows + 1, INSERT_ROWS_PER_STATEMENT):
+            stop = min(start + INSERT_ROWS_PER_STATEMENT, rows + 1)
+            values = ",\n".join(
+                f"({row_id}, '{_name(rng, rows).upper().replace('JOSE', 'JOS' + chr(201))}', {rng.randint(1, 221)})"
+                for row_id in range(start, stop)
+            )
+            fh.write(f"INSERT INTO PARROQUIA (ID, NOMBRE, CANTON_ID) VALUES\n{values};\n")
+
+
+def _calibration_work() -> int:
+    counts: Dict[str, int] = {}
+    for index in range(CALIBRATION_ITEMS):
+        text = f"{index % 97}|Fila {index}".lower()
+        counts[text[:4]] = counts.get(text[:4], 0) + len(text.split("|"))
+    return CALIBRATION_ITEMS
+
+
+def _sample(fn: Callable[[], int], min_seconds: float) -> tuple[int, float]:
+    """(filas, tiempo por llamada) de una muestra: llama a fn hasta sumar min_seconds."""
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        rows = fn()
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return rows, elapsed / calls
+
+
+def _measure(fn: Callable[[], int], repeat: int, min_seconds: float) -> tuple[int, float, float, float]:
+    """
+    (filas, mejor tiempo por llamada, pico de memoria en MB, mediana de los cocientes contra la
+    calibracion). Cada muestra de fn sigue a una del lazo de calibracion; el pico se mide en una
+    corrida aparte.
+    """
+    best = float("inf")
+    ratios: List[float] = []
+    rows = 0
+    for _ in range(max(1, repeat)):
+        items, calibration = _sample(_calibration_work, min_seconds)
+        rows, seconds = _sample(fn, min_seconds)
+        best = min(best, seconds)
+        ratios.append((rows / max(seconds, 1e-9)) / (items / calibration))
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return rows, best, peak / 2**20, statistics.median(ratios)
+
+
+def run_scale(
+    scale: int,
+    sizes: Dict[str, int],
+    functions: Sequence[str],
+    repeat: int,
+    workdir: Path,
+    min_seconds: float = DEFAULT_MIN_SECONDS,
+) -> List[BenchResult]:
+    """Prepara las entradas de una escala y mide cada funcion pedida."""
+    root = _root_dir()
+    admin_lookup = load_admin1_lookup(root / "data" / "raw" / "ciudades")
+    admin_codes = sorted(key.split(".", 1)[1] for key in admin_lookup if key.startswith(f"{COUNTRY_CODE}."))
+    geonames = workdir / "EC.txt"
+    jerarquia = workdir / "jerarquia"
+    dump = workdir / "parroquias.sql"
+    write_geonames(geonames, sizes["geonames"] * scale, admin_codes)
+    write_hierarchy(jerarquia, sizes, scale)
+    write_values_dump(dump, sizes["parroquias"] * scale)
+
+    rows = parse_geonames(geonames, COUNTRY_CODE, admin_lookup)
+    unique = deduplicate(rows)
+    for index, row in enumerate(unique, start=1):
+        row.ciudadid = index
+
+    def hierarchy_sql() -> int:
+        result = generate_jerarquia_sql(source=jerarquia, output=workdir / "insert_jerarquia.sql")
+        return sum(int(result.get(level) or 0) for level in ("provincias", "cantones", "parroquias"))
+
+    def write_and_count(writer: Callable[..., Path]) -> Callable[[], int]:
+        return lambda: (writer(unique, workdir / "salida.out"), len(unique))[1]
+
+    cases: Dict[str, Callable[[], int]] = {
+        "parse_geonames": lambda: len(parse_geonames(geonames, COUNTRY_CODE, admin_lookup)),
+        "deduplicate": lambda: len(deduplicate(rows)),
+        "write_csv": write_and_count(write_csv),
+        "write_sql_inserts": write_and_count(write_sql_inserts),
+        "_extract_rows": lambda: sum(1 for _ in _extract_rows(dump, 3)),
+        "_load_csv": lambda: len(_load_csv(jerarquia / "parroquias.csv", ("CODIGO", "CANTON_CODIGO", "NOMBRE"))),
+        "generate_jerarquia_sql": hierarchy_sql,
+    }
+    results: List[BenchResult] = []
+    for name in functions:
+        filas, segundos, pico, relativo = _measure(cases[name], repeat, min_seconds)
+        results.append(BenchResult(name, scale, filas, round(segundos, 6), round(pico, 2), round(relativo, 6)))
+    return results
+
+
+def load_baseline(path: Path) -> Dict[str, Dict[str, Any]]:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8")).get("resultados", {})
+
+
+def save_baseline(path: Path, results: Sequence[BenchResult]) -> Path:
+    """Fusiona los resultados con el baseline existente (las escalas no medidas se conservan)."""
+    merged = load_baseline(path)
+    for result in results:
+        merged[result.key] = {**asdict(result), "filas_por_segundo": round(result.filas_por_segundo, 1)}
+    payload = {
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "generado": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "resultados": dict(sorted(merged.items())),
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2, ensure_ascii=True) + "\n", encoding="utf-8")
+    return path
+
+
+def compare(
+    results: Sequence[BenchResult],
+    baseline: Dict[str, Dict[str, Any]],
+    threshold: float = DEFAULT_THRESHOLD,
+    memory_threshold: float = DEFAULT_MEMORY_THRESHOLD,
+) -> List[Regression]:
+    """
+    Regresiones respecto del baseline: caida de filas/s relativas a la calibracion o crecimiento del
+    pico de memoria. Entradas de un baseline sin calibracion solo se comparan en memoria.
+    """
+    regressions: List[Regression] = []
+    for result in results:
+        reference = baseline.get(result.key)
+        if reference is None:
+            continue
+        if reference.get("relativo"):
+            expected = float(reference["relativo"])
+            if result.relativo < expected * (1 - threshold):
+                regressions.append(Regression(result.key, TIME_METRIC, expected, result.relativo))
+        if reference["pico_mb"] >= MIN_MEMORY_MB:
+            expected = float(reference["pico_mb"])
+            if result.pico_mb > expected * (1 + memory_threshold):
+                regressions.append(Regression(result.key, "pico MB", expected, result.pico_mb))
+    return regressions
+
+
+def remeasure(
+    results: Sequence[BenchResult],
+    keys: Sequence[str],
+    sizes: Dict[str, int],
+    repeat: int,
+    min_seconds: float = DEFAULT_MIN_SECONDS,
+) -> List[BenchResult]:
+    """Vuelve a medir las funciones de keys; cada una conserva su medicion con mejor filas/s relativas."""
+    by_key = {result.key: result for result in results}
+    for scale in sorted({by_key[key].escala for key in keys}):
+        functions = [by_key[key].funcion for key in keys if by_key[key].escala == scale]
+        with tempfile.TemporaryDirectory(prefix=f"bench_generators_x{scale}_") as tmp:
+            for result in run_scale(scale, sizes, functions, repeat, Path(tmp), min_seconds):
+                if result.relativo > by_key[result.key].relativo:
+                    by_key[result.key] = result
+    return [by_key[result.key] for result in results]
+
+
+def _parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark de los generadores de ciudades y jerarquia.")
+    parser.add_argument(
+        "--scales",
+        type=int,
+        nargs="+",
+        choices=SCALES,
+        default=list(DEFAULT_SCALES),
+        help="Escalas respecto de los datos incluidos (default 1 10; 100 y 1000 son pesadas).",
+    )
+    parser.add_argument("--only", nargs="+", choices=FUNCTIONS, help="Mide solo estas funciones.")
+    parser.add_argument("--repeat", type=int, default=5, help="Muestras por funcion; se reporta la mejor.")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="JSON de referencia.")
+    parser.add_argument("--save-baseline", action="store_true", help="Guarda los resultados como baseline.")
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=DEFAULT_RETRIES,
+        help="Veces que se vuelve a medir una funcion mas lenta que el baseline antes de fallar "
+        f"(default {DEFAULT_RETRIES}).",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"Caida de filas/s relativas tolerada respecto del baseline (default {DEFAULT_THRESHOLD}).",
+    )
+    parser.add_argument(
+        "--memory-threshold",
+        type=float,
+        default=DEFAULT_MEMORY_THRESHOLD,
+        help=f"Crecimiento del pico de memoria tolerado (default {DEFAULT_MEMORY_THRESHOLD}).",
+    )
+    parser.add_argument(
+        "--min-seconds",
+        type=float,
+        default=DEFAULT_MIN_SECONDS,
+        help=f"Tiempo minimo medido por muestra; las funciones rapidas se repiten hasta sumarlo "
+        f"(default {DEFAULT_MIN_SECONDS}).",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    args = _parse_args(argv)
+    functions = args.only or list(FUNCTIONS)
+    sizes = bundled_sizes(_root_dir())
+    print(
+        f"Tamanos base: geonames={sizes['geonames']} lineas, provincias={sizes['provincias']}, "
+        f"cantones={sizes['cantones']}, parroquias={sizes['parroquias']}"
+    )
+
+    results: List[BenchResult] = []
+    for scale in sorted(set(args.scales)):
+        with tempfile.TemporaryDirectory(prefix=f"bench_generators_x{scale}_") as tmp:
+            results.extend(run_scale(scale, sizes, functions, args.repeat, Path(tmp), args.min_seconds))
+
+    baseline = load_baseline(args.baseline)
+    print(f"{'funcion':<24}{'escala':>7}{'filas':>11}{'segundos':>10}{'filas/s':>12}{'pico MB':>9}{'vs base':>9}")
+    for result in results:
+        reference = baseline.get(result.key)
+        change = ""
+        if reference and reference.get("relativo"):
+            change = f"{result.relativo / float(reference['relativo']):.2f}x"
+        print(
+            f"{result.funcion:<24}{result.escala:>7}{result.filas:>11}{result.segundos:>10.3f}"
+            f"{result.filas_por_segundo:>12.0f}{result.pico_mb:>9.1f}{change:>9}"
+        )
+
+    if args.save_baseline:
+        print(f"Baseline guardado en {save_baseline(args.baseline, results)}")
+        return
+    if not baseline:
+        print(f"Sin baseline en {args.baseline}; ejecuta con --save-baseline para crearlo.")
+        return
+    regressions = compare(results, baseline, args.threshold, args.memory_threshold)
+    for attempt in range(1, args.retries + 1):
+        slow = [regression.key for regression in regressions if regression.metrica == TIME_METRIC]
+        if not slow:
+            break
+        print(f"Re-midiendo ({attempt}/{args.retries}): {', '.join(slow)}")
+        results = remeasure(results, slow, sizes, args.repeat, args.min_seconds)
+        regressions = compare(results, baseline, args.threshold, args.memory_threshold)
+    if regressions:
+        for regression in regressions:
+            print(f"Regresion: {regression.describe()}")
+        raise SystemExit(1)
+    print("Sin regresiones respecto del baseline.")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
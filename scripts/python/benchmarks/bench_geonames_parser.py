@@ -0,0 +1,103 @@
+"""
+Compara el throughput de los parsers de GeoNames (text vs mmap) sobre el mismo archivo.
+
+Uso (desde la raiz del repo):
+    python scripts/python/benchmarks/bench_geonames_parser.py
+    python scripts/python/benchmarks/bench_geonames_parser.py --source data/raw/ciudades/EC.zip --scale 20
+
+--scale concatena el dump N veces en un temporal para simular archivos mas grandes.
+El benchmark verifica ademas que ambos parsers produzcan exactamente las mismas filas.
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from ciudades.download_ecuador_cities import (
+    COUNTRY_CODE,
+    PARSERS,
+    _root_dir,
+    extract_geonames_txt,
+    iter_geonames,
+    load_admin1_lookup,
+)
+
+
+def _prepare_source(source: Path, scale: int, workdir: Path) -> Path:
+    """Devuelve un .txt plano (extraido y/o replicado scale veces) para que ambos parsers lean lo mismo."""
+    if source.suffix.lower() == ".zip":
+        source = extract_geonames_txt(source, workdir)
+    if scale <= 1:
+        return source
+    target = workdir / f"{source.stem}_x{scale}.txt"
+    with target.open("wb") as dst:
+        for _ in range(scale):
+            with source.open("rb") as src:
+                shutil.copyfileobj(src, dst, 1024 * 1024)
+    return target
+
+
+def _run(parser: str, source: Path, code: Optional[str], admin_lookup: dict[str, str]) -> tuple[float, int]:
+    # Se consume en streaming, como el pipeline: retener las filas mediria al recolector de basura.
+    start = time.perf_counter()
+    total = sum(1 for _ in iter_geonames(source, code, admin_lookup, parser=parser))
+    return time.perf_counter() - start, total
+
+
+def _same_rows(source: Path, code: Optional[str], admin_lookup: dict[str, str]) -> bool:
+    pairs = itertools.zip_longest(
+        *(iter_geonames(source, code, admin_lookup, parser=name) for name in PARSERS)
+    )
+    return all(left == right for left, right in pairs)
+
+
+def _parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    root = _root_dir()
+    parser = argparse.ArgumentParser(description="Benchmark de los parsers de GeoNames (text vs mmap).")
+    parser.add_argument("--source", type=Path, default=root / "data" / "raw" / "ciudades" / "EC.zip")
+    parser.add_argument("--code", default=COUNTRY_CODE, help="Codigo de pais a filtrar (default EC).")
+    parser.add_argument("--scale", type=int, default=10, help="Veces que se replica el dump (default 10).")
+    parser.add_argument("--repeat", type=int, default=3, help="Repeticiones por parser; se reporta la mejor.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    args = _parse_args(argv)
+    admin_lookup = load_admin1_lookup(_root_dir() / "data" / "raw" / "ciudades")
+
+    with tempfile.TemporaryDirectory(prefix="bench_geonames_") as tmp:
+        source = _prepare_source(args.source, args.scale, Path(tmp))
+        size_mb = source.stat().st_size / (1024 * 1024)
+        print(f"Archivo: {source.name} ({size_mb:.1f} MB), pais={args.code}, repeticiones={args.repeat}")
+
+        results: dict[str, tuple[float, int]] = {}
+        for name in PARSERS:
+            runs = [_run(name, source, args.code, admin_lookup) for _ in range(max(1, args.repeat))]
+            results[name] = min(runs)
+        identical = _same_rows(source, args.code, admin_lookup)
+
+    baseline = results["text"][0]
+    print(f"{'parser':<8}{'filas':>10}{'segundos':>11}{'MB/s':>9}{'filas/s':>12}{'speedup':>9}")
+    for name, (elapsed, total) in results.items():
+        elapsed = max(elapsed, 1e-9)
+        print(
+            f"{name:<8}{total:>10}{elapsed:>11.3f}{size_mb / elapsed:>9.1f}"
+            f"{total / elapsed:>12.0f}{baseline / elapsed:>8.2f}x"
+        )
+    if not identical:
+        raise SystemExit("Los parsers produjeron filas distintas.")
+    print("Ambos parsers producen las mismas filas.")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
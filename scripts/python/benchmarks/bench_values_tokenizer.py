@@ -0,0 +1,130 @@
+"""
+Mide el tokenizer en streaming de dumps INSERT ... VALUES (comun/sql_values.py) sobre un
+dump sintetico del tamano pedido.
+
+Uso (desde la raiz del repo):
+    python scripts/python/benchmarks/bench_values_tokenizer.py --size-mb 300
+    python scripts/python/benchmarks/bench_values_tokenizer.py --size-mb 50 --legacy
+
+El dump tiene varias sentencias INSERT, nombres con "),", comillas escapadas ('') y valores
+con parentesis anidados; se verifica que el total de filas leidas sea el generado.
+--legacy ejecuta ademas el parser anterior (read_text + re.split), que carga todo el archivo
+y solo ve la primera sentencia.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import random
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Optional
+
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from comun.sql_values import DEFAULT_CHUNK_SIZE, iter_values_rows
+
+_NAMES = ("SAN JOSE", "EL CARMEN", "LA PAZ", "SANTA ROSA", "NUEVO ROCAFUERTE", "PUERTO BOLIVAR")
+_TRICKY = ("SAN JUAN), (BIS", "D''ANGELO", "LA (NUEVA) ESPERANZA", "O''HIGGINS), ''X")
+
+
+def write_synthetic_dump(path: Path, size_mb: int, rows_per_insert: int = 1000, seed: int = 7) -> int:
+    """Escribe un dump de ~size_mb MB y devuelve cuantas filas contiene."""
+    rng = random.Random(seed)
+    target = size_mb * 1024 * 1024
+    written = 0
+    total = 0
+    with path.open("w", encoding="latin-1", newline="\n") as fh:
+        while written < target:
+            lines: List[str] = []
+            for _ in range(rows_per_insert):
+                total += 1
+                if total % 50 == 0:
+                    name = rng.choice(_TRICKY)
+                else:
+                    name = f"{rng.choice(_NAMES)} {total}"
+                if total % 97 == 0:
+                    canton = f"TO_NUMBER('{rng.randint(1, 221)}')"
+                else:
+                    canton = str(rng.randint(1, 221))
+                lines.append(f"({total}, '{name}', {canton})")
+            statement = (
+                "-- bloque generado\n"
+                "INSERT INTO PARROQUIA (ID, NOMBRE, CANTON_ID) VALUES\n" + ",\n".join(lines) + ";\n"
+            )
+            fh.write(statement)
+            written += len(statement)
+    return total
+
+
+def _legacy_extract_rows(path: Path, expected_columns: int) -> int:
+    # Parser previo de build_jerarquia_csv, conservado solo como referencia de rendimiento.
+    text = path.read_text(encoding="latin-1")
+    idx = text.upper().find("VALUES")
+    body = text[idx + len("VALUES") :].strip().rstrip(";")
+    total = 0
+    for fragment in re.split(r"\),\s*", body):
+        fragment = fragment.strip().removesuffix(")").removeprefix("(")
+        if not fragment:
+            continue
+        try:
+            parsed = next(csv.reader([fragment], delimiter=",", quotechar="'", skipinitialspace=True))
+        except csv.Error:
+            continue
+        if len(parsed) == expected_columns:
+            total += 1
+    return total
+
+
+def _parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark del tokenizer de dumps SQL VALUES.")
+    parser.add_argument("--size-mb", type=int, default=300, help="Tamano del dump sintetico (default 300).")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Bytes por bloque leido.")
+    parser.add_argument("--legacy", action="store_true", help="Mide tambien el parser anterior.")
+    return parser.parse_args(argv)
+
+
+def _peak_rss_mb() -> Optional[float]:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    args = _parse_args(argv)
+    with tempfile.TemporaryDirectory(prefix="bench_values_") as tmp:
+        dump = Path(tmp) / "parroquias.sql"
+        expected = write_synthetic_dump(dump, args.size_mb)
+        size_mb = dump.stat().st_size / (1024 * 1024)
+        print(f"Dump sintetico: {size_mb:.0f} MB, {expected} filas")
+
+        rss_before = _peak_rss_mb()
+        start = time.perf_counter()
+        total = sum(1 for _ in iter_values_rows(dump, encoding="latin-1", chunk_size=args.chunk_size))
+        elapsed = time.perf_counter() - start
+        rss_after = _peak_rss_mb()
+        print(f"streaming: {total} filas en {elapsed:.2f} s ({size_mb / elapsed:.1f} MB/s, {total / elapsed:.0f} filas/s)")
+        if rss_before is not None and rss_after is not None:
+            print(f"  pico de memoria del proceso: {rss_after:.0f} MB (antes de leer: {rss_before:.0f} MB)")
+        if total != expected:
+            raise SystemExit(f"Se esperaban {expected} filas y se leyeron {total}.")
+
+        if args.legacy:
+            start = time.perf_counter()
+            legacy_total = _legacy_extract_rows(dump, 3)
+            elapsed = time.perf_counter() - start
+            print(f"legacy:    {legacy_total} filas en {elapsed:.2f} s (solo la primera sentencia INSERT)")
+            legacy_rss = _peak_rss_mb()
+            if legacy_rss is not None:
+                print(f"  pico de memoria del proceso: {legacy_rss:.0f} MB")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,477 @@
+"""
+Enlaza cada ciudad de CIUDAD con su canton y su parroquia (tablas CANTONES/PARROQUIAS).
+
+GeoNames publica un punto de referencia por canton (A.ADM2) y por parroquia (A.ADM3), con el
+codigo INEC del canton en admin2. Los cantones se enlazan a la jerarquia por ese codigo y las
+parroquias por nombre (normalize_key) dentro de su canton. Con esos puntos se arma un KD-tree
+y cada ciudad se resuelve con una consulta de vecinos mas cercanos (O(log n) por ciudad):
+ - se toma la parroquia cuyo punto de referencia esta mas cerca;
+ - entre las que quedan casi a la misma distancia (--tie-km) gana la de nombre igual al de la ciudad;
+ - si un canton a menos de 2 * --max-km se llama como la ciudad (cabecera cantonal), gana ese canton;
+ - si no hay parroquia a menos de --max-km se usa el canton mas cercano (parroquia NULL).
+No hay poligonos de limites: "contiene" se aproxima por el punto de referencia mas cercano.
+
+Produce en data/output/ciudades/:
+ - ciudad_ubicacion.csv
+ - insert_ciudad_ubicacion.sql (carga CIUDAD_UBICACION; load_dw_from_oltp.sql la une por CIUDADID)
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import heapq
+import math
+import sys
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Sequence
+
+if __package__ in (None, ""):
+    # Permite ejecutar el script directamente: python scripts/python/ciudades/city_linker.py
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from ciudades.download_ecuador_cities import COUNTRY_CODE, CityRow, _iter_geonames_lines, _root_dir
+from comun import file_memo
+from comun.name_keys import normalize_key
+from comun.sql_emitter import DEFAULT_BATCH_SIZE, DEFAULT_INSERT_MODE, INSERT_MODES, insert_statements
+from jerarquia.generate_jerarquia_inserts import Canton, Parroquia, Province, load_hierarchy
+
+LINK_CSV_NAME = "ciudad_ubicacion.csv"
+LINK_SQL_NAME = "insert_ciudad_ubicacion.sql"
+LINK_COLUMNS = ("CIUDADID", "CANTONID", "PARROQUIAID", "DISTANCIA_KM", "METODO")
+EARTH_RADIUS_KM = 6371.0088
+DEFAULT_MAX_KM = 25.0
+DEFAULT_TIE_KM = 2.0
+# Vecinos que se examinan por ciudad para el desempate por nombre.
+CANDIDATES = 5
+# Similitud minima (0-1) para aceptar dos nombres como el mismo lugar.
+NAME_SIMILARITY = 0.85
+# Se incrementa cuando cambia el formato de salida; invalida el manifiesto de build.
+GENERATOR_VERSION = "1"
+
+
+@dataclass
+class ReferencePoint:
+    nombre: str
+    latitud: float
+    longitud: float
+    cantonid: int
+    parroquiaid: Optional[int]  # None en los puntos de canton
+    provincia: str = ""  # clave normalizada (normalize_key) de la provincia del canton
+
+
+@dataclass
+class CityLink:
+    ciudadid: int
+    cantonid: Optional[int]
+    parroquiaid: Optional[int]
+    distancia_km: Optional[float]
+    metodo: str  # parroquia | parroquia_nombre | canton_nombre | canton | sin_coordenadas | sin_referencia
+
+
+def _key(name: Optional[str]) -> str:
+    return normalize_key(name) or ""
+
+
+def _same_name(left: str, right: str) -> bool:
+    if left == right:
+        return True
+    return SequenceMatcher(None, left, right).ratio() >= NAME_SIMILARITY
+
+
+def _unit_vector(lat: float, lon: float) -> tuple[float, float, float]:
+    # Puntos sobre la esfera unitaria: la distancia euclidiana (cuerda) ordena igual que la geodesica.
+    phi, lam = math.radians(lat), math.radians(lon)
+    cos_phi = math.cos(phi)
+    return (cos_phi * math.cos(lam), cos_phi * math.sin(lam), math.sin(phi))
+
+
+def _chord_to_km(squared_chord: float) -> float:
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(squared_chord) / 2))
+
+
+def _distance_km(point: tuple[float, float, float], reference: ReferencePoint) -> float:
+    other = _unit_vector(reference.latitud, reference.longitud)
+    return _chord_to_km(sum((a - b) ** 2 for a, b in zip(point, other)))
+
+
+class KDTree:
+    """KD-tree estatico en 3 dimensiones (particion por la mediana, eje alternado)."""
+
+    def __init__(self, points: Sequence[tuple[float, float, float]]) -> None:
+        self._points = list(points)
+        # Cada nodo: [indice del punto, eje, hijo izquierdo, hijo derecho]; -1 = sin hijo.
+        self._nodes: List[List[int]] = []
+        self._root = self._build(list(range(len(self._points))), 0)
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def _build(self, indices: List[int], depth: int) -> int:
+        if not indices:
+            return -1
+        axis = depth % 3
+        indices.sort(key=lambda idx: self._points[idx][axis])
+        mid = len(indices) // 2
+        node = len(self._nodes)
+        self._nodes.append([indices[mid], axis, -1, -1])
+        self._nodes[node][2] = self._build(indices[:mid], depth + 1)
+        self._nodes[node][3] = self._build(indices[mid + 1 :], depth + 1)
+        return node
+
+    def nearest(self, point: tuple[float, float, float], k: int = 1) -> List[tuple[float, int]]:
+        """Los k puntos mas cercanos como (distancia al cuadrado, indice), de menor a mayor."""
+        heap: List[tuple[float, int]] = []  # max-heap con distancias negadas
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node < 0:
+                continue
+            idx, axis, left, right = self._nodes[node]
+            candidate = self._points[idx]
+            dx, dy, dz = point[0] - candidate[0], point[1] - candidate[1], point[2] - candidate[2]
+            squared = dx * dx + dy * dy + dz * dz
+            if len(heap) < k:
+                heapq.heappush(heap, (-squared, idx))
+            elif squared < -heap[0][0]:
+                heapq.heapreplace(heap, (-squared, idx))
+            diff = point[axis] - candidate[axis]
+            near, far = (left, right) if diff < 0 else (right, left)
+            # El lado lejano solo se visita si el hiperplano queda dentro del radio actual.
+            if len(heap) < k or diff * diff < -heap[0][0]:
+                stack.append(far)
+            stack.append(near)
+        return sorted((-negated, idx) for negated, idx in heap)
+
+
+def iter_admin_points(source: Path, country_code: str = COUNTRY_CODE) -> Iterator[tuple[str, str, float, float, str]]:
+    """Produce (ADM2|ADM3, nombre, latitud, longitud, codigo admin2) de las divisiones del pais."""
+    for line in _iter_geonames_lines(source):
+        if "\tA\t" not in line:
+            continue
+        parts = line.rstrip("\n").split("\t")
+        if len(parts) < 19 or parts[6] != "A" or parts[7] not in ("ADM2", "ADM3") or parts[8] != country_code:
+            continue
+        try:
+            lat, lon = float(parts[4]), float(parts[5])
+        except ValueError:
+            continue
+        yield parts[7], parts[1].strip(), lat, lon, parts[11].strip()
+
+
+def _match_parroquia(name: str, candidates: List[tuple[str, Parroquia]]) -> Optional[Parroquia]:
+    folded = _key(name)
+    # GeoNames agrega aclaraciones entre parentesis: "Cacha (Cab. En Machangara)".
+    short = _key(name.split("(")[0])
+    best: Optional[Parroquia] = None
+    best_ratio = NAME_SIMILARITY
+    for key, parroquia in candidates:
+        if key in (folded, short):
+            return parroquia
+        ratio = max(SequenceMatcher(None, key, folded).ratio(), SequenceMatcher(None, key, short).ratio())
+        if ratio >= best_ratio:
+            best, best_ratio = parroquia, ratio
+    return best
+
+
+def build_reference_points(
+    source: Path,
+    provinces: Iterable[Province],
+    cantons: Iterable[Canton],
+    parroquias: Iterable[Parroquia],
+    country_code: str = COUNTRY_CODE,
+) -> tuple[List[ReferencePoint], List[ReferencePoint], dict[str, int]]:
+    """
+    Resuelve los puntos ADM2/ADM3 de GeoNames contra la jerarquia.
+    Devuelve (puntos de canton, puntos de parroquia, estadisticas de enlace).
+    """
+    province_keys = {province.provinciaid: _key(province.nombre) for province in provinces}
+    canton_by_code = {canton.codigo: canton for canton in cantons}
+    parishes_by_canton: dict[int, List[tuple[str, Parroquia]]] = {}
+    for parroquia in parroquias:
+        parishes_by_canton.setdefault(parroquia.cantonid, []).append((_key(parroquia.nombre), parroquia))
+
+    canton_points: List[ReferencePoint] = []
+    parish_points: List[ReferencePoint] = []
+    stats = {"adm2": 0, "adm3": 0, "cantones_enlazados": 0, "parroquias_enlazadas": 0}
+    # Los puntos de GeoNames no dependen de la jerarquia: se reutilizan mientras el dump no cambie.
+    points = file_memo.memoized(
+        "admin_points", [source], lambda: list(iter_admin_points(source, country_code)), country_code
+    )
+    for feature, name, lat, lon, admin2 in points:
+        stats[feature.lower()] += 1
+        canton = canton_by_code.get(admin2)
+        if canton is None:
+            continue
+        if feature == "ADM2":
+            stats["cantones_enlazados"] += 1
+            canton_points.append(
+                ReferencePoint(canton.nombre, lat, lon, canton.cantonid, None, province_keys.get(canton.provinciaid, ""))
+            )
+            continue
+        parroquia = _match_parroquia(name, parishes_by_canton.get(canton.cantonid, []))
+        if parroquia is not None:
+            stats["parroquias_enlazadas"] += 1
+            parish_points.append(ReferencePoint(parroquia.nombre, lat, lon, canton.cantonid, parroquia.parroquiaid))
+    return canton_points, parish_points, stats
+
+
+class CityLinker:
+    """Indice espacial sobre los puntos de referencia; link resuelve una ciudad."""
+
+    def __init__(
+        self,
+        canton_points: List[ReferencePoint],
+        parish_points: List[ReferencePoint],
+        max_km: float = DEFAULT_MAX_KM,
+        tie_km: float = DEFAULT_TIE_KM,
+    ) -> None:
+        self.canton_points = canton_points
+        self.parish_points = parish_points
+        self.max_km = max_km
+        self.tie_km = tie_km
+        self._canton_tree = KDTree([_unit_vector(p.latitud, p.longitud) for p in canton_points])
+        self._parish_tree = KDTree([_unit_vector(p.latitud, p.longitud) for p in parish_points])
+        self._parish_keys = [_key(p.nombre) for p in parish_points]
+        self._canton_keys = [_key(p.nombre) for p in canton_points]
+        self._parishes_by_canton: dict[int, List[ReferencePoint]] = {}
+        for parish in parish_points:
+            self._parishes_by_canton.setdefault(parish.cantonid, []).append(parish)
+
+    def _named_canton(
+        self, point: tuple[float, float, float], city_key: str, provincia: Optional[str]
+    ) -> Optional[ReferencePoint]:
+        """
+        Canton de la misma provincia, con su punto a menos de 2 * max_km, cuyo nombre coincide
+        con el de la ciudad. Sin provincia conocida no se aplica la regla.
+        """
+        province_key = _key(provincia or "")
+        if not any(ch.isalpha() for ch in province_key):
+            return None  # GeoNames deja el codigo admin1 ("00") cuando no hay nombre
+        for squared, idx in self._canton_tree.nearest(point, 2 * CANDIDATES) if len(self._canton_tree) else []:
+            if _chord_to_km(squared) > 2 * self.max_km:
+                break
+            canton = self.canton_points[idx]
+            # GeoNames agrega sufijos ("Tungurahua Province"): basta que contenga el nombre de la jerarquia.
+            if canton.provincia and canton.provincia in province_key and _same_name(city_key, self._canton_keys[idx]):
+                return canton
+        return None
+
+    def _nearest_in_canton(
+        self, point: tuple[float, float, float], cantonid: int
+    ) -> tuple[float, Optional[ReferencePoint]]:
+        best: tuple[float, Optional[ReferencePoint]] = (math.inf, None)
+        for parish in self._parishes_by_canton.get(cantonid, []):
+            km = _distance_km(point, parish)
+            if km < best[0]:
+                best = (km, parish)
+        return best
+
+    def link(self, row: CityRow) -> CityLink:
+        ciudadid = row.ciudadid or 0
+        if row.latitud is None or row.longitud is None:
+            return CityLink(ciudadid, None, None, None, "sin_coordenadas")
+        point = _unit_vector(row.latitud, row.longitud)
+
+        city_key = _key(row.nombre)
+        named_canton = self._named_canton(point, city_key, row.provincia)
+
+        if len(self._parish_tree):
+            neighbours = [
+                (_chord_to_km(squared), idx) for squared, idx in self._parish_tree.nearest(point, CANDIDATES)
+            ]
+            best_km, best_idx = neighbours[0]
+            if best_km <= self.max_km:
+                method = "parroquia"
+                for km, idx in neighbours:
+                    if km > best_km + self.tie_km:
+                        break
+                    if _same_name(city_key, self._parish_keys[idx]):
+                        best_km, best_idx, method = km, idx, "parroquia_nombre"
+                        break
+                parish = self.parish_points[best_idx]
+                if named_canton is None or named_canton.cantonid == parish.cantonid:
+                    return CityLink(ciudadid, parish.cantonid, parish.parroquiaid, round(best_km, 3), method)
+
+        if named_canton is not None:
+            # La ciudad se llama como un canton cercano (cabecera cantonal de un canton extenso):
+            # se prefiere ese canton y su parroquia mas cercana dentro de max_km.
+            km, parish = self._nearest_in_canton(point, named_canton.cantonid)
+            if parish is not None and km <= self.max_km:
+                return CityLink(ciudadid, named_canton.cantonid, parish.parroquiaid, round(km, 3), "canton_nombre")
+            return CityLink(
+                ciudadid, named_canton.cantonid, None, round(_distance_km(point, named_canton), 3), "canton_nombre"
+            )
+
+        if len(self._canton_tree):
+            squared, idx = self._canton_tree.nearest(point, 1)[0]
+            canton = self.canton_points[idx]
+            return CityLink(ciudadid, canton.cantonid, None, round(_chord_to_km(squared), 3), "canton")
+        return CityLink(ciudadid, None, None, None, "sin_referencia")
+
+
+def read_city_csv(path: Path) -> Iterator[CityRow]:
+    """Lee en streaming un ciudades_xx.csv generado por download_ecuador_cities."""
+    with path.open("r", newline="", encoding="utf-8") as fh:
+        reader = csv.reader(fh)
+        next(reader, None)  # encabezado
+        for fields in reader:
+            if len(fields) < 6:
+                continue
+            yield CityRow(
+                int(fields[0]),
+                fields[1],
+                fields[2] or None,
+                float(fields[3]) if fields[3] else None,
+                float(fields[4]) if fields[4] else None,
+                fields[5] or None,
+                int(fields[6]) if len(fields) > 6 and fields[6] else None,
+            )
+
+
+def _link_values(link: CityLink) -> tuple:
+    return (link.ciudadid, link.cantonid, link.parroquiaid, link.distancia_km, link.metodo)
+
+
+def write_link_csv(links: Iterable[CityLink], path: Path) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", newline="", encoding="utf-8") as fh:
+        writer = csv.writer(fh)
+        writer.writerow([column.lower() for column in LINK_COLUMNS])
+        writer.writerows(_link_values(link) for link in links)
+    return path
+
+
+def write_link_sql(
+    links: Iterable[CityLink],
+    path: Path,
+    mode: str = DEFAULT_INSERT_MODE,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as fh:
+        fh.write("-- Enlace ciudad -> canton/parroquia generado por city_linker.py\n")
+        fh.write("DELETE FROM CIUDAD_UBICACION;\n")
+        for statement in insert_statements(
+            "CIUDAD_UBICACION", LINK_COLUMNS, (_link_values(link) for link in links), mode=mode, batch_size=batch_size
+        ):
+            fh.write(statement)
+            fh.write("\n")
+        fh.write("COMMIT;\n")
+    return path
+
+
+def clear_links(
+    output_dir: Optional[Path] = None,
+    insert_mode: str = DEFAULT_INSERT_MODE,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> dict[str, object]:
+    """Escribe un enlace vacio: el SQL solo vacia CIUDAD_UBICACION (catalogos sin jerarquia)."""
+    output_dir = output_dir or _root_dir() / "data" / "output" / "ciudades"
+    csv_path = write_link_csv([], output_dir / LINK_CSV_NAME)
+    sql_path = write_link_sql([], output_dir / LINK_SQL_NAME, mode=insert_mode, batch_size=batch_size)
+    return {"status": "missing", "csv": csv_path, "sql": sql_path, "ciudades": 0, "metodos": {}}
+
+
+def generate_links(
+    cities_csv: Optional[Path] = None,
+    source: Optional[Path] = None,
+    jerarquia_source: Optional[Path] = None,
+    output_dir: Optional[Path] = None,
+    insert_mode: str = DEFAULT_INSERT_MODE,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_km: float = DEFAULT_MAX_KM,
+    tie_km: float = DEFAULT_TIE_KM,
+) -> dict[str, object]:
+    """
+    Calcula el enlace de todas las ciudades y escribe CSV + SQL.
+    Sin jerarquia o sin puntos de referencia el SQL solo vacia CIUDAD_UBICACION (status "missing"),
+    de modo que el plan siempre puede ejecutarse.
+    """
+    root = _root_dir()
+    default_dir = root / "data" / "output" / "ciudades"
+    output_dir = output_dir or default_dir
+    cities_csv = cities_csv or default_dir / f"ciudades_{COUNTRY_CODE.lower()}.csv"
+    raw_dir = root / "data" / "raw" / "ciudades"
+    if source is None:
+        txt = raw_dir / f"{COUNTRY_CODE}.txt"
+        source = txt if txt.exists() else raw_dir / f"{COUNTRY_CODE}.zip"
+    csv_path, sql_path = output_dir / LINK_CSV_NAME, output_dir / LINK_SQL_NAME
+
+    provinces, cantons, parroquias = load_hierarchy(jerarquia_source)
+    canton_points: List[ReferencePoint] = []
+    parish_points: List[ReferencePoint] = []
+    stats: dict[str, int] = {}
+    if cantons and source.exists():
+        canton_points, parish_points, stats = build_reference_points(source, provinces, cantons, parroquias)
+    if not (canton_points or parish_points) or not cities_csv.exists():
+        return clear_links(output_dir, insert_mode=insert_mode, batch_size=batch_size)
+
+    linker = CityLinker(canton_points, parish_points, max_km=max_km, tie_km=tie_km)
+    links = [linker.link(row) for row in read_city_csv(cities_csv)]
+    methods: dict[str, int] = {}
+    for link in links:
+        methods[link.metodo] = methods.get(link.metodo, 0) + 1
+    write_link_csv(links, csv_path)
+    write_link_sql(links, sql_path, mode=insert_mode, batch_size=batch_size)
+    return {
+        "status": "ok",
+        "csv": csv_path,
+        "sql": sql_path,
+        "ciudades": len(links),
+        "metodos": methods,
+        **stats,
+    }
+
+
+def _parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Enlaza CIUDAD con CANTONES/PARROQUIAS por cercania geografica.")
+    parser.add_argument("--cities", type=Path, help="CSV de ciudades (default data/output/ciudades/ciudades_ec.csv).")
+    parser.add_argument("--source", type=Path, help="EC.txt/EC.zip de GeoNames con los puntos ADM2/ADM3.")
+    parser.add_argument("--jerarquia-source", type=Path, help="Directorio con provincias/cantones/parroquias.csv.")
+    parser.add_argument("--output-dir", type=Path, help="Directorio de salida (default data/output/ciudades).")
+    parser.add_argument("--insert-mode", choices=INSERT_MODES, default=DEFAULT_INSERT_MODE)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument(
+        "--max-km",
+        type=float,
+        default=DEFAULT_MAX_KM,
+        help=f"Distancia maxima a una parroquia antes de recurrir al canton (default {DEFAULT_MAX_KM}).",
+    )
+    parser.add_argument(
+        "--tie-km",
+        type=float,
+        default=DEFAULT_TIE_KM,
+        help=f"Margen en km dentro del cual el nombre desempata entre parroquias (default {DEFAULT_TIE_KM}).",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    args = _parse_args(argv)
+    result = generate_links(
+        cities_csv=args.cities,
+        source=args.source,
+        jerarquia_source=args.jerarquia_source,
+        output_dir=args.output_dir,
+        insert_mode=args.insert_mode,
+        batch_size=args.batch_size,
+        max_km=args.max_km,
+        tie_km=args.tie_km,
+    )
+    if result["status"] != "ok":
+        print("No se encontraron jerarquia o puntos de referencia; CIUDAD_UBICACION quedara vacia.")
+    else:
+        metodos = ", ".join(f"{name}={count}" for name, count in sorted(result["metodos"].items()))
+        print(
+            f"Ciudades enlazadas: {result['ciudades']} ({metodos}). "
+            f"Puntos: cantones {result['cantones_enlazados']}/{result['adm2']}, "
+            f"parroquias {result['parroquias_enlazadas']}/{result['adm3']}."
+        )
+    print(f"CSV: {result['csv']}\nSQL: {result['sql']}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,241 @@
+"""
+Representacion columnar y compacta del catalogo CIUDAD, con un archivo binario de cache.
+
+En lugar de un objeto CityRow por ciudad se guardan columnas tipadas:
+ - ids: array('q'); latitudes/longitudes: array('d') (NaN = sin coordenada);
+ - poblaciones: array('q') (-1 = NULL);
+ - provincia/zona horaria: indices array('i') sobre tablas de textos internados (-1 = NULL);
+ - nombres: un buffer UTF-8 contiguo mas un array('q') de offsets (n + 1 elementos).
+
+El archivo (ciudades_xx.bin junto al CSV) guarda esas columnas tal cual, alineadas a 8 bytes
+y en little-endian. CityStore.load lo mapea en memoria: las columnas numericas son vistas
+sobre el mmap, sin copiar ni parsear, por lo que abrir el catalogo toma milisegundos.
+"""
+
+from __future__ import annotations
+
+import math
+import mmap
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Sequence
+
+from ciudades.download_ecuador_cities import CityRow
+
+STORE_SUFFIX = ".bin"
+_MAGIC = b"CIUDADC1"
+_FORMAT_VERSION = 2
+# magic, version, filas, bytes de nombres, bytes de provincias, bytes de zonas horarias, reservado.
+_HEADER = struct.Struct("<8sIIQQQQ")
+_TABLE_SEPARATOR = "\x00"
+_NULL_INDEX = -1
+_LITTLE_ENDIAN = sys.byteorder == "little"
+# Orden y tipo de las columnas en el archivo; name_offsets tiene una entrada mas que filas.
+_COLUMNS = (
+    ("ids", "q"),
+    ("latitudes", "d"),
+    ("longitudes", "d"),
+    ("poblaciones", "q"),
+    ("name_offsets", "q"),
+    ("provincia_idx", "i"),
+    ("zona_idx", "i"),
+)
+
+
+def city_store_path(csv_path: Path) -> Path:
+    """Ruta del archivo columnar que acompana a un ciudades_xx.csv."""
+    return csv_path.with_suffix(STORE_SUFFIX)
+
+
+def _padding(size: int) -> int:
+    return -size % 8
+
+
+class _Interner:
+    def __init__(self) -> None:
+        self.values: List[str] = []
+        self._index: dict[str, int] = {}
+
+    def add(self, value: Optional[str]) -> int:
+        if value is None:
+            return _NULL_INDEX
+        idx = self._index.get(value)
+        if idx is None:
+            idx = self._index[value] = len(self.values)
+            self.values.append(value)
+        return idx
+
+
+class CityStore:
+    """Catalogo de ciudades en columnas. Se itera como CityRow para reutilizar los writers existentes."""
+
+    def __init__(
+        self,
+        ids: Sequence[int],
+        latitudes: Sequence[float],
+        longitudes: Sequence[float],
+        poblaciones: Sequence[int],
+        provincia_idx: Sequence[int],
+        zona_idx: Sequence[int],
+        provincias: List[str],
+        zonas: List[str],
+        name_offsets: Sequence[int],
+        names: bytes | memoryview,
+        mapped: Optional[mmap.mmap] = None,
+    ) -> None:
+        self.ids = ids
+        self.latitudes = latitudes
+        self.longitudes = longitudes
+        self.poblaciones = poblaciones
+        self.provincia_idx = provincia_idx
+        self.zona_idx = zona_idx
+        self.provincias = provincias
+        self.zonas = zonas
+        self.name_offsets = name_offsets
+        self.names = names
+        self._mapped = mapped
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[CityRow]) -> "CityStore":
+        ids, latitudes, longitudes, poblaciones = array("q"), array("d"), array("d"), array("q")
+        provincia_idx, zona_idx = array("i"), array("i")
+        name_offsets = array("q", [0])
+        names = bytearray()
+        provincias, zonas = _Interner(), _Interner()
+        for row in rows:
+            ids.append(row.ciudadid or 0)
+            latitudes.append(math.nan if row.latitud is None else row.latitud)
+            longitudes.append(math.nan if row.longitud is None else row.longitud)
+            poblaciones.append(_NULL_INDEX if row.poblacion is None else row.poblacion)
+            provincia_idx.append(provincias.add(row.provincia))
+            zona_idx.append(zonas.add(row.zona_horaria))
+            names += row.nombre.encode("utf-8")
+            name_offsets.append(len(names))
+        return cls(
+            ids=ids,
+            latitudes=latitudes,
+            longitudes=longitudes,
+            poblaciones=poblaciones,
+            provincia_idx=provincia_idx,
+            zona_idx=zona_idx,
+            provincias=provincias.values,
+            zonas=zonas.values,
+            name_offsets=name_offsets,
+            names=bytes(names),
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def nombre(self, idx: int) -> str:
+        return bytes(self.names[self.name_offsets[idx] : self.name_offsets[idx + 1]]).decode("utf-8")
+
+    def row(self, idx: int) -> CityRow:
+        lat, lon = self.latitudes[idx], self.longitudes[idx]
+        provincia, zona = self.provincia_idx[idx], self.zona_idx[idx]
+        poblacion = self.poblaciones[idx]
+        return CityRow(
+            self.ids[idx],
+            self.nombre(idx),
+            None if provincia == _NULL_INDEX else self.provincias[provincia],
+            None if math.isnan(lat) else lat,
+            None if math.isnan(lon) else lon,
+            None if zona == _NULL_INDEX else self.zonas[zona],
+            None if poblacion == _NULL_INDEX else poblacion,
+        )
+
+    def __iter__(self) -> Iterator[CityRow]:
+        for idx in range(len(self)):
+            yield self.row(idx)
+
+    def nbytes(self) -> int:
+        """Bytes ocupados por las columnas (sin contar las tablas de textos internados)."""
+        columns = [getattr(self, name) for name, _ in _COLUMNS]
+        return sum(len(column) * column.itemsize for column in columns) + len(self.names)
+
+    def save(self, path: Path) -> Path:
+        provincias = _TABLE_SEPARATOR.join(self.provincias).encode("utf-8")
+        zonas = _TABLE_SEPARATOR.join(self.zonas).encode("utf-8")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("wb") as fh:
+            fh.write(
+                _HEADER.pack(_MAGIC, _FORMAT_VERSION, len(self), len(self.names), len(provincias), len(zonas), 0)
+            )
+            for name, typecode in _COLUMNS:
+                data = array(typecode, getattr(self, name))
+                if not _LITTLE_ENDIAN:
+                    data.byteswap()
+                raw = data.tobytes()
+                fh.write(raw)
+                fh.write(b"\x00" * _padding(len(raw)))
+            for blob in (bytes(self.names), provincias, zonas):
+                fh.write(blob)
+        return path
+
+    @classmethod
+    def load(cls, path: Path, use_mmap: bool = True) -> "CityStore":
+        """
+        Abre un archivo escrito con save. Con use_mmap las columnas son vistas sobre el archivo
+        mapeado (llamar a close al terminar); sin mmap se leen a memoria.
+        """
+        with path.open("rb") as fh:
+            if use_mmap and _LITTLE_ENDIAN:
+                buffer: bytes | mmap.mmap = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                buffer = fh.read()
+
+        view = memoryview(buffer)
+        magic, version, count, names_len, provincias_len, zonas_len, _ = _HEADER.unpack_from(view)
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            raise ValueError(f"{path} no es un catalogo columnar de ciudades compatible")
+
+        offset = _HEADER.size
+        columns: dict[str, Sequence] = {}
+        for name, typecode in _COLUMNS:
+            length = count + 1 if name == "name_offsets" else count
+            size = length * array(typecode).itemsize
+            chunk = view[offset : offset + size]
+            if _LITTLE_ENDIAN:
+                columns[name] = chunk.cast(typecode)
+            else:
+                data = array(typecode, bytes(chunk))
+                data.byteswap()
+                columns[name] = data
+            offset += size + _padding(size)
+
+        names = view[offset : offset + names_len]
+        offset += names_len
+        provincias = bytes(view[offset : offset + provincias_len]).decode("utf-8")
+        offset += provincias_len
+        zonas = bytes(view[offset : offset + zonas_len]).decode("utf-8")
+        view.release()
+        return cls(
+            **columns,
+            provincias=provincias.split(_TABLE_SEPARATOR) if provincias_len else [],
+            zonas=zonas.split(_TABLE_SEPARATOR) if zonas_len else [],
+            names=names,
+            mapped=buffer if isinstance(buffer, mmap.mmap) else None,
+        )
+
+    def close(self) -> None:
+        if self._mapped is not None:
+            # Las vistas deben liberarse antes de cerrar el mmap.
+            for name in [*(column for column, _ in _COLUMNS), "names"]:
+                value = getattr(self, name)
+                if isinstance(value, memoryview):
+                    value.release()
+            self._mapped.close()
+            self._mapped = None
+
+    def __enter__(self) -> "CityStore":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def write_city_store(rows: Iterable[CityRow], path: Path) -> Path:
+    """Construye el catalogo columnar desde rows y lo guarda en path."""
+    return CityStore.from_rows(rows).save(path)
@@ -1,8 +1,10 @@
 """
 Genera el catalogo de ciudades de Ecuador a partir del dump de GeoNames (EC.zip).
-Produce dos archivos en data/output/ciudades/:
+Produce en data/output/ciudades/:
  - ciudades_ec.csv
  - insert_ciudad.sql (INSERTs listos para Oracle)
+ - delta_ciudad.sql (solo con --delta: MERGE/DELETE contra el CSV de la corrida anterior)
+ - ciudades_ec.bin (solo con --store: catalogo columnar que se abre con mmap, ver city_store.py)
 
 El script busca primero un archivo local (data/raw/ciudades/EC.txt o EC.zip).
 Si no existe, descarga EC.zip y admin1CodesASCII.txt para enriquecer la provincia.
@@ -12,27 +14,93 @@ from __future__ import annotations
 
 import argparse
 import csv
+import hashlib
 import io
+import mmap
+import os
+import shutil
 import sys
-import urllib.request
+import tempfile
 import zipfile
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Iterable, Iterator, List, Optional
+
+if __package__ in (None, ""):
+    # Permite ejecutar el script directamente: python scripts/python/ciudades/download_ecuador_cities.py
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from comun import file_memo
+from comun.external_sort import DEFAULT_RUN_SIZE, external_sort
+from comun.name_keys import normalize_key
+from comun.sql_emitter import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_INSERT_MODE,
+    INSERT_MODES,
+    in_list_statements,
+    insert_statements,
+    merge_statements,
+)
+from comun.sequences import SequenceSpec, realign_block
+from comun.sqlloader import LoaderColumn, sqlldr_command, write_control_file, write_data_file
 
 COUNTRY_CODE = "EC"
 GEONAMES_ZIP_URL = "https://download.geonames.org/export/dump/{code}.zip"
 GEONAMES_ADMIN1_URL = "https://download.geonames.org/export/dump/admin1CodesASCII.txt"
+# NOMBRE_CLAVE/PROVINCIA_CLAVE: claves normalizadas (comun/name_keys.py) para joins indexados en el DW.
+SQL_COLUMNS = (
+    "CIUDADID",
+    "NOMBRE",
+    "PROVINCIA",
+    "LATITUD",
+    "LONGITUD",
+    "ZONA_HORARIA",
+    "NOMBRE_CLAVE",
+    "PROVINCIA_CLAVE",
+    "POBLACION",
+)
+LOADER_COLUMNS = (
+    LoaderColumn("CIUDADID", "INTEGER EXTERNAL"),
+    LoaderColumn("NOMBRE", "CHAR(150)"),
+    LoaderColumn("PROVINCIA", "CHAR(150)"),
+    LoaderColumn("LATITUD", "DECIMAL EXTERNAL"),
+    LoaderColumn("LONGITUD", "DECIMAL EXTERNAL"),
+    LoaderColumn("ZONA_HORARIA", "CHAR(50)"),
+    LoaderColumn("NOMBRE_CLAVE", "CHAR(150)"),
+    LoaderColumn("PROVINCIA_CLAVE", "CHAR(150)"),
+    LoaderColumn("POBLACION", "INTEGER EXTERNAL"),
+)
+SQLLDR_SCRIPT_NAME = "load_ciudad_sqlldr.sql"
+DELTA_SQL_NAME = "delta_ciudad.sql"
+# mmap: parser por bytes sobre el .txt mapeado en memoria; text: parser linea a linea original.
+PARSERS = ("mmap", "text")
+DEFAULT_PARSER = "mmap"
+# Clase de feature "P" entre tabs: ninguna linea sin esta secuencia puede ser un lugar poblado.
+_CLASS_P_MARKER = b"\tP\t"
+# Se incrementa cuando cambia el formato de salida; invalida el manifiesto de build.
+GENERATOR_VERSION = "4"
 
 
 @dataclass
 class CityRow:
+    # Sin __dict__ por instancia: el orden externo llega a mantener run_size filas en memoria.
+    __slots__ = ("ciudadid", "nombre", "provincia", "latitud", "longitud", "zona_horaria", "poblacion")
+
     ciudadid: Optional[int]
     nombre: str
     provincia: Optional[str]
     latitud: Optional[float]
     longitud: Optional[float]
     zona_horaria: Optional[str]
+    poblacion: Optional[int]  # columna population de GeoNames (0 = sin dato en la fuente)
+
+
+@dataclass
+class CitySnapshot:
+    """CSV de la corrida anterior indexado por nombre+provincia (huella de _dedupe_key)."""
+
+    rows: dict[int, tuple[str, ...]]  # huella -> valores tal como quedaron en el CSV
+    max_id: int
 
 
 def _root_dir() -> Path:
@@ -41,6 +109,8 @@ def _root_dir() -> Path:
 
 def download_file(url: str, dest: Path) -> Path:
     """Descarga un archivo binario y lo guarda en dest."""
+    import urllib.request  # solo hace falta sin archivos locales; acelera el arranque del CLI
+
     dest.parent.mkdir(parents=True, exist_ok=True)
     with urllib.request.urlopen(url) as resp, open(dest, "wb") as fh:
         fh.write(resp.read())
@@ -50,19 +120,23 @@ def download_file(url: str, dest: Path) -> Path:
 def load_admin1_lookup(raw_dir: Path) -> dict[str, str]:
     """
     Devuelve un diccionario code->nombre para provincias (admin1).
-    Usa cache local; si no existe descarga el archivo.
+    Usa cache local; si no existe descarga el archivo. El diccionario queda en memoria mientras el
+    archivo no cambie (comun/file_memo.py): no modificarlo.
     """
     path = raw_dir / "admin1CodesASCII.txt"
     if not path.exists():
         download_file(GEONAMES_ADMIN1_URL, path)
 
-    lookup: dict[str, str] = {}
-    with path.open("r", encoding="utf-8") as fh:
-        for line in fh:
-            parts = line.strip().split("\t")
-            if len(parts) >= 2:
-                lookup[parts[0]] = parts[1]
-    return lookup
+    def read() -> dict[str, str]:
+        lookup: dict[str, str] = {}
+        with path.open("r", encoding="utf-8") as fh:
+            for line in fh:
+                parts = line.strip().split("\t")
+                if len(parts) >= 2:
+                    lookup[parts[0]] = parts[1]
+        return lookup
+
+    return file_memo.memoized("admin1", [path], read)
 
 
 def _iter_geonames_lines_from_zip(path: Path) -> Iterable[str]:
@@ -90,68 +164,338 @@ def _iter_geonames_lines_from_txt(path: Path) -> Iterable[str]:
             yield line
 
 
-def parse_geonames(source: Path, country_code: str, admin_lookup: dict[str, str]) -> List[CityRow]:
+def _iter_geonames_lines(source: Path) -> Iterable[str]:
+    if source.suffix.lower() == ".zip":
+        return _iter_geonames_lines_from_zip(source)
+    return _iter_geonames_lines_from_txt(source)
+
+
+def _population(text: str | bytes) -> Optional[int]:
+    try:
+        return int(text)  # int() acepta bytes directamente
+    except ValueError:
+        return None
+
+
+def _city_from_fields(
+    parts: List[str], wanted: Optional[str], admin_lookup: dict[str, str]
+) -> Optional[CityRow]:
+    """Convierte una linea de GeoNames ya separada por tabs; None si no es un lugar poblado buscado."""
+    if len(parts) < 19:
+        return None
+
+    feature_class = parts[6]
+    if feature_class != "P":  # solo lugares poblados
+        return None
+
+    row_country = parts[8].strip()
+    if wanted is not None and row_country != wanted:
+        return None
+
+    province_code = parts[10].strip()
+    province_key = f"{wanted or row_country}.{province_code}" if province_code else ""
+    province_name = admin_lookup.get(province_key, province_code or None)
+
+    try:
+        lat = float(parts[4])
+        lon = float(parts[5])
+    except ValueError:
+        lat = lon = None
+
+    return CityRow(
+        ciudadid=None,
+        nombre=parts[1].strip(),
+        provincia=province_name,
+        latitud=lat,
+        longitud=lon,
+        zona_horaria=parts[17].strip() or None,
+        poblacion=_population(parts[14]),
+    )
+
+
+def extract_geonames_txt(zip_path: Path, dest_dir: Path) -> Path:
     """
-    Filtra filas de GeoNames (clase P) y devuelve CityRow.
-    GeoNames separa por tabs; la columna admin1 (parts[10]) contiene el codigo de provincia.
+    Extrae el .txt de un zip de GeoNames en dest_dir (el parser mmap necesita el archivo plano).
+    Si ya existe una extraccion mas nueva que el zip se reutiliza.
     """
-    if source.suffix.lower() == ".zip":
-        lines = _iter_geonames_lines_from_zip(source)
-    else:
-        lines = _iter_geonames_lines_from_txt(source)
+    target = dest_dir / f"{zip_path.stem}.txt"
+    if target.exists() and target.stat().st_mtime >= zip_path.stat().st_mtime:
+        return target
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(zip_path, "r") as zf:
+        names = zf.namelist()
+        member = next((n for n in names if n.lower().endswith(target.name.lower())), None)
+        if member is None:
+            member = next((n for n in names if n.lower().endswith(".txt")), None)
+        if member is None:
+            raise ValueError(f"No se encontro archivo .txt dentro de {zip_path}")
+        with zf.open(member) as src, target.open("wb") as dst:
+            shutil.copyfileobj(src, dst, 1024 * 1024)
+    return target
+
+
+def iter_geonames_mmap(
+    path: Path,
+    country_code: Optional[str],
+    admin_lookup: dict[str, str],
+    start: int = 0,
+    end: Optional[int] = None,
+) -> Iterator[tuple[int, str, CityRow]]:
+    """
+    Parser rapido de un GeoNames .txt mapeado en memoria. Produce (offset, pais, CityRow)
+    para las lineas de clase P cuyo primer byte cae en [start, end).
 
-    rows: List[CityRow] = []
-    for line in lines:
-        parts = line.strip().split("\t")
-        if len(parts) < 19:
+    Las lineas sin la secuencia tab-P-tab se saltan con mmap.find, sin decodificarlas ni
+    separarlas; la clase y el pais se comparan en bytes y solo se decodifican las columnas
+    usadas. Produce las mismas filas que _city_from_fields.
+    """
+    wanted = country_code.upper() if country_code else None
+    wanted_bytes = wanted.encode("ascii") if wanted else None
+    lookup = admin_lookup.get
+    with path.open("rb") as fh:
+        size = os.fstat(fh.fileno()).st_size
+        if size == 0:
+            return
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = size if end is None else min(end, size)
+            find, rfind = mm.find, mm.rfind
+            pos = start
+            while True:
+                hit = find(_CLASS_P_MARKER, pos)
+                if hit < 0:
+                    return
+                line_start = rfind(b"\n", 0, hit) + 1
+                if line_start >= end:
+                    return
+                line_end = find(b"\n", hit)
+                if line_end < 0:
+                    line_end = size
+                pos = line_end
+                if line_start < start:
+                    continue  # la linea empezo en el rango anterior
+
+                parts = mm[line_start:line_end].strip().split(b"\t")
+                # La secuencia puede aparecer en otra columna: se confirma la clase en parts[6].
+                if len(parts) < 19 or parts[6] != b"P":
+                    continue
+                country_raw = parts[8].strip()
+                if wanted_bytes is not None and country_raw != wanted_bytes:
+                    continue
+
+                row_country = country_raw.decode("utf-8")
+                province_code = parts[10].decode("utf-8").strip()
+                province_name = (
+                    lookup(f"{wanted or row_country}.{province_code}", province_code) if province_code else None
+                )
+                try:
+                    lat = float(parts[4])  # float() acepta bytes directamente
+                    lon = float(parts[5])
+                except ValueError:
+                    lat = lon = None
+                row = CityRow(
+                    None,
+                    parts[1].decode("utf-8").strip(),
+                    province_name,
+                    lat,
+                    lon,
+                    parts[17].decode("utf-8").strip() or None,
+                    _population(parts[14]),
+                )
+                yield line_start, row_country, row
+
+
+def iter_geonames(
+    source: Path,
+    country_code: Optional[str],
+    admin_lookup: dict[str, str],
+    parser: str = DEFAULT_PARSER,
+) -> Iterator[CityRow]:
+    """
+    Recorre GeoNames en streaming y produce un CityRow por lugar poblado (clase P).
+    GeoNames separa por tabs; la columna admin1 (parts[10]) contiene el codigo de provincia.
+    Con country_code se descartan filas de otros paises (necesario para allCountries.zip);
+    con None se conservan todos y la provincia se resuelve con el pais de cada fila.
+    parser="mmap" usa iter_geonames_mmap (un .zip se extrae a un directorio temporal);
+    parser="text" decodifica y separa cada linea. Ambos producen las mismas filas.
+    """
+    if parser not in PARSERS:
+        raise ValueError(f"Parser desconocido: {parser}. Usa uno de {', '.join(PARSERS)}")
+    wanted = country_code.upper() if country_code else None
+    if parser == "mmap":
+        with tempfile.TemporaryDirectory(prefix="geonames_") as tmp:
+            if source.suffix.lower() == ".zip":
+                source = extract_geonames_txt(source, Path(tmp))
+            for _, _, row in iter_geonames_mmap(source, wanted, admin_lookup):
+                yield row
+        return
+
+    for line in _iter_geonames_lines(source):
+        row = _city_from_fields(line.strip().split("\t"), wanted, admin_lookup)
+        if row is not None:
+            yield row
+
+
+def parse_geonames(
+    source: Path, country_code: str, admin_lookup: dict[str, str], parser: str = DEFAULT_PARSER
+) -> List[CityRow]:
+    """Version en memoria de iter_geonames (util para catalogos pequenos)."""
+    return list(iter_geonames(source, country_code, admin_lookup, parser=parser))
+
+
+def _dedupe_key(row: CityRow, country: str = "") -> int:
+    # Huella de 8 bytes en lugar de la tupla de textos: el set ocupa una fraccion de memoria.
+    text = f"{row.nombre.lower()}\x00{(row.provincia or '').lower()}"
+    if country:
+        text = f"{country}\x00{text}"
+    return int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def iter_unique(rows: Iterable[CityRow]) -> Iterator[CityRow]:
+    """
+    Elimina duplicados por nombre+provincia sobre la marcha, conservando la primera aparicion.
+    Solo guarda una huella de 64 bits por clave unica (colisiones despreciables para GeoNames).
+    """
+    seen: set[int] = set()
+    for row in rows:
+        key = _dedupe_key(row)
+        if key in seen:
             continue
+        seen.add(key)
+        yield row
 
-        feature_class = parts[6]
-        if feature_class != "P":  # solo lugares poblados
-            continue
 
-        province_code = parts[10].strip()
-        province_key = f"{country_code}.{province_code}" if province_code else ""
-        province_name = admin_lookup.get(province_key, province_code or None)
+def deduplicate(rows: Iterable[CityRow]) -> List[CityRow]:
+    """Elimina duplicados por nombre+provincia para evitar ciudades repetidas."""
+    return list(iter_unique(rows))
 
-        try:
-            lat = float(parts[4])
-            lon = float(parts[5])
-        except ValueError:
-            lat = lon = None
-
-        rows.append(
-            CityRow(
-                ciudadid=None,
-                nombre=parts[1].strip(),
-                provincia=province_name,
-                latitud=lat,
-                longitud=lon,
-                zona_horaria=parts[17].strip() or None,
-            )
+
+def _city_sort_key(row: CityRow) -> tuple[str, str]:
+    # Orden estable: provincia -> nombre.
+    return (row.provincia or "", row.nombre)
+
+
+def _parsed_catalog(
+    source: Path, code: str, raw_dir: Path, admin_lookup: dict[str, str], parser: str, run_size: int
+) -> Optional[tuple[tuple, ...]]:
+    """
+    Ciudades parseadas, deduplicadas y ordenadas como tuplas (sin ciudadid), o None si no caben en
+    una corrida de run_size filas (el catalogo se procesa entonces en streaming). El resultado queda
+    en memoria mientras no cambien el dump ni admin1 (comun/file_memo.py); la numeracion trabaja
+    sobre CityRow nuevos, asi que las tuplas compartidas no se modifican.
+    """
+
+    def read() -> Optional[tuple[tuple, ...]]:
+        rows: List[CityRow] = []
+        for row in iter_unique(iter_geonames(source, code, admin_lookup, parser=parser)):
+            if len(rows) >= run_size:
+                return None
+            rows.append(row)
+        rows.sort(key=_city_sort_key)
+        return tuple(
+            (row.nombre, row.provincia, row.latitud, row.longitud, row.zona_horaria, row.poblacion) for row in rows
         )
 
-    return rows
+    paths = [source, raw_dir / "admin1CodesASCII.txt"]
+    return file_memo.memoized("city_catalog", paths, read, (code.upper(), run_size))
 
 
-def deduplicate(rows: List[CityRow]) -> List[CityRow]:
-    """Elimina duplicados por nombre+provincia para evitar ciudades repetidas."""
-    seen = set()
-    unique: List[CityRow] = []
+def _numbered(rows: Iterable[CityRow]) -> Iterator[CityRow]:
+    for idx, row in enumerate(rows, start=1):
+        row.ciudadid = idx
+        yield row
+
+
+def _csv_values(row: CityRow) -> tuple[str, ...]:
+    # Misma representacion que escribe csv.writer; permite comparar contra el snapshot sin reconvertir.
+    return tuple(
+        "" if value is None else str(value)
+        for value in (
+            row.ciudadid,
+            row.nombre,
+            row.provincia,
+            row.latitud,
+            row.longitud,
+            row.zona_horaria,
+            row.poblacion,
+        )
+    )
+
+
+def load_snapshot(path: Path) -> Optional[CitySnapshot]:
+    """
+    Lee un ciudades_xx.csv generado antes; None si no existe. Si junto al CSV hay un
+    catalogo columnar (.bin) al menos igual de reciente, se lee ese en su lugar.
+    """
+    if not path.exists():
+        return None
+    from ciudades.city_store import CityStore, city_store_path
+
+    store_path = city_store_path(path)
+    if store_path.exists() and store_path.stat().st_mtime_ns >= path.stat().st_mtime_ns:
+        try:
+            with CityStore.load(store_path) as store:
+                return _snapshot_from_rows(store)
+        except ValueError:
+            pass  # catalogo de una version anterior del formato: se lee el CSV
+
+    rows: dict[int, tuple[str, ...]] = {}
+    max_id = 0
+    with path.open("r", newline="", encoding="utf-8") as fh:
+        reader = csv.reader(fh)
+        next(reader, None)  # encabezado
+        for fields in reader:
+            if len(fields) < 6:
+                continue
+            # Un CSV anterior a la columna poblacion queda con 6 valores: todas sus filas cuentan como modificadas.
+            values = tuple(fields[:7])
+            row = CityRow(int(values[0]), values[1], values[2] or None, None, None, None, None)
+            rows[_dedupe_key(row)] = values
+            max_id = max(max_id, row.ciudadid or 0)
+    return CitySnapshot(rows=rows, max_id=max_id)
+
+
+def _snapshot_from_rows(rows: Iterable[CityRow]) -> CitySnapshot:
+    values: dict[int, tuple[str, ...]] = {}
+    max_id = 0
     for row in rows:
-        key = (row.nombre.lower(), (row.provincia or "").lower())
-        if key in seen:
-            continue
-        seen.add(key)
-        unique.append(row)
-    return unique
+        values[_dedupe_key(row)] = _csv_values(row)
+        max_id = max(max_id, row.ciudadid or 0)
+    return CitySnapshot(rows=values, max_id=max_id)
 
 
-def write_csv(rows: List[CityRow], path: Path) -> Path:
+def _stable_numbered(rows: Iterable[CityRow], snapshot: CitySnapshot) -> Iterator[CityRow]:
+    """Conserva el ciudadid del snapshot; las ciudades nuevas reciben ids a partir del maximo anterior."""
+    next_id = snapshot.max_id
+    for row in rows:
+        previous = snapshot.rows.get(_dedupe_key(row))
+        if previous is not None:
+            row.ciudadid = int(previous[0])
+        else:
+            next_id += 1
+            row.ciudadid = next_id
+        yield row
+
+
+def _sql_values(row: CityRow) -> tuple:
+    """Valores de SQL_COLUMNS para una fila; las claves se derivan del nombre y la provincia."""
+    return (
+        row.ciudadid,
+        row.nombre,
+        row.provincia,
+        row.latitud,
+        row.longitud,
+        row.zona_horaria,
+        normalize_key(row.nombre),
+        normalize_key(row.provincia),
+        row.poblacion,
+    )
+
+
+def write_csv(rows: Iterable[CityRow], path: Path) -> Path:
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("w", newline="", encoding="utf-8") as fh:
         writer = csv.writer(fh)
-        writer.writerow(["ciudadid", "nombre", "provincia", "latitud", "longitud", "zona_horaria"])
+        writer.writerow(["ciudadid", "nombre", "provincia", "latitud", "longitud", "zona_horaria", "poblacion"])
         for row in rows:
             writer.writerow(
                 [
@@ -161,96 +505,314 @@ def write_csv(rows: List[CityRow], path: Path) -> Path:
                     row.latitud,
                     row.longitud,
                     row.zona_horaria,
+                    row.poblacion,
                 ]
             )
     return path
 
 
-def _sql_value(value: Optional[str | float]) -> str:
-    if value is None:
-        return "NULL"
-    if isinstance(value, str):
-        return "'" + value.replace("'", "''") + "'"
-    return str(value)
+def _sequence_block(total: int) -> str:
+    # Los scripts cargan CIUDADID explicito: SEQ_CIUDAD debe quedar por encima para TRG_CIUDAD_BI.
+    return realign_block([SequenceSpec("SEQ_CIUDAD", "CIUDAD", "CIUDADID", total)]) + "\n"
 
 
-def write_sql_inserts(rows: List[CityRow], path: Path) -> Path:
+def write_sql_inserts(
+    rows: Iterable[CityRow],
+    path: Path,
+    mode: str = DEFAULT_INSERT_MODE,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Path:
+    """
+    Escribe el script de carga de CIUDAD.
+    mode=row genera un INSERT por fila; insert_all/forall agrupan batch_size filas por sentencia.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
+    total = 0
+
+    def values() -> Iterator[tuple]:
+        nonlocal total
+        for row in rows:
+            total += 1
+            yield _sql_values(row)
+
     with path.open("w", encoding="utf-8") as fh:
         fh.write("-- Inserts generados automaticamente para la tabla CIUDAD\n")
         fh.write("DELETE FROM CIUDAD;\n")
-        for row in rows:
-            fh.write(
-                "INSERT INTO CIUDAD (CIUDADID, NOMBRE, PROVINCIA, LATITUD, LONGITUD, ZONA_HORARIA) "
-                f"VALUES ({row.ciudadid}, {_sql_value(row.nombre)}, {_sql_value(row.provincia)}, "
-                f"{_sql_value(row.latitud)}, {_sql_value(row.longitud)}, {_sql_value(row.zona_horaria)});\n"
-            )
+        for statement in insert_statements("CIUDAD", SQL_COLUMNS, values(), mode=mode, batch_size=batch_size):
+            fh.write(statement)
+            fh.write("\n")
         fh.write("COMMIT;\n")
+        fh.write(_sequence_block(total))
     return path
 
 
+def write_sql_delta(
+    rows: Iterable[CityRow],
+    snapshot: CitySnapshot,
+    path: Path,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> dict[str, int]:
+    """
+    Escribe solo los cambios respecto al snapshot: MERGE para ciudades nuevas o modificadas y
+    DELETE para las que ya no estan. rows debe venir numerado con _stable_numbered.
+    Los clientes que apuntan a una ciudad eliminada quedan con CIUDADID NULL para que
+    03_assign_random_city_to_clients.sql los reasigne.
+    """
+    stats = {"nuevas": 0, "modificadas": 0, "eliminadas": 0, "sin_cambios": 0}
+    seen: set[int] = set()
+
+    def changed() -> Iterator[tuple]:
+        for row in rows:
+            key = _dedupe_key(row)
+            seen.add(key)
+            previous = snapshot.rows.get(key)
+            if previous == _csv_values(row):
+                stats["sin_cambios"] += 1
+                continue
+            stats["nuevas" if previous is None else "modificadas"] += 1
+            yield _sql_values(row)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as fh:
+        fh.write("-- Cambios incrementales generados automaticamente para la tabla CIUDAD\n")
+        for statement in merge_statements("CIUDAD", SQL_COLUMNS, ("CIUDADID",), changed(), batch_size=batch_size):
+            fh.write(statement)
+            fh.write("\n")
+
+        removed = sorted(int(values[0]) for key, values in snapshot.rows.items() if key not in seen)
+        stats["eliminadas"] = len(removed)
+        for template in (
+            "UPDATE CLIENTES SET CIUDADID = NULL WHERE CIUDADID IN ({keys});",
+            "DELETE FROM CIUDAD WHERE CIUDADID IN ({keys});",
+        ):
+            for statement in in_list_statements(template, removed):
+                fh.write(statement)
+                fh.write("\n")
+        fh.write("COMMIT;\n")
+        fh.write(_sequence_block(len(seen)))
+    return stats
+
+
+def resolve_source(code: str, source: Optional[Path], raw_dir: Path) -> Path:
+    """Devuelve el dump de GeoNames a usar para code; prefiere archivos locales y si no descarga."""
+    if source is None:
+        # Preferir archivos locales para evitar descarga si ya existen.
+        candidate_txt = raw_dir / f"{code}.txt"
+        candidate_zip = raw_dir / f"{code}.zip"
+        if candidate_txt.exists():
+            return candidate_txt
+        if candidate_zip.exists():
+            return candidate_zip
+        url = GEONAMES_ZIP_URL.format(code=code)
+        return download_file(url, candidate_zip)
+
+    source = Path(source)
+    if not source.exists():
+        raise FileNotFoundError(f"No se encontro el archivo de ciudades: {source}")
+    return source
+
+
+def write_sqlldr_files(rows: Iterable[CityRow], loader_dir: Path) -> Path:
+    """
+    Escribe ciudad.ctl + ciudad.dat para una carga direct-path y el script SQL*Plus que la lanza.
+    Devuelve la ruta del script (reemplaza a insert_ciudad.sql en el plan).
+    """
+    root = _root_dir()
+    data_path = loader_dir / "ciudad.dat"
+    control_path = loader_dir / "ciudad.ctl"
+    total = write_data_file((_sql_values(row) for row in rows), data_path)
+    # REPLACE equivale al DELETE FROM CIUDAD del script de INSERTs.
+    write_control_file("CIUDAD", LOADER_COLUMNS, control_path, data_path, load_method="REPLACE", root=root)
+
+    script_path = loader_dir / SQLLDR_SCRIPT_NAME
+    with script_path.open("w", encoding="utf-8") as fh:
+        fh.write("-- Carga direct-path de CIUDAD con SQL*Loader (requiere SQLLDR_USERID=usuario/clave@tns)\n")
+        fh.write(sqlldr_command(control_path, root=root))
+        fh.write("\n")
+        fh.write(_sequence_block(total))
+    return script_path
+
+
 def generate_catalog(
     code: str = COUNTRY_CODE,
     source: Optional[Path] = None,
     csv_output: Optional[Path] = None,
     sql_output: Optional[Path] = None,
+    insert_mode: str = DEFAULT_INSERT_MODE,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    loader_dir: Optional[Path] = None,
+    run_size: int = DEFAULT_RUN_SIZE,
+    delta: bool = False,
+    delta_output: Optional[Path] = None,
+    parser: str = DEFAULT_PARSER,
+    store: bool = False,
 ) -> dict[str, str | int | Path]:
+    """
+    Genera el catalogo en streaming: parseo -> deduplicacion -> orden externo -> escritura.
+    La memoria queda acotada por run_size filas, sin importar el tamano del dump. Un catalogo que
+    cabe en una corrida se parsea una sola vez por proceso mientras el dump no cambie (_parsed_catalog).
+
+    Con delta=True el CSV existente actua como snapshot: los ciudadid se conservan y ademas
+    se escribe delta_ciudad.sql con solo las filas que cambiaron. El snapshot se lee
+    completo en memoria (una entrada por ciudad).
+
+    Con store=True tambien se escribe el catalogo columnar (.bin) junto al CSV.
+    """
     root = _root_dir()
     raw_dir = root / "data" / "raw" / "ciudades"
     raw_dir.mkdir(parents=True, exist_ok=True)
 
-    if source is None:
-        # Preferir archivos locales para evitar descarga si ya existen.
-        candidate_txt = raw_dir / f"{code}.txt"
-        candidate_zip = raw_dir / f"{code}.zip"
-        if candidate_txt.exists():
-            source = candidate_txt
-        elif candidate_zip.exists():
-            source = candidate_zip
-        else:
-            url = GEONAMES_ZIP_URL.format(code=code)
-            source = download_file(url, candidate_zip)
-    else:
-        source = Path(source)
-        if not source.exists():
-            raise FileNotFoundError(f"No se encontro el archivo de ciudades: {source}")
-
+    source = resolve_source(code, source, raw_dir)
     admin_lookup = load_admin1_lookup(raw_dir)
-    rows = parse_geonames(source, code, admin_lookup)
-    rows = deduplicate(rows)
-    # Orden estable: provincia -> nombre.
-    rows.sort(key=lambda r: (r.provincia or "", r.nombre))
-
-    for idx, row in enumerate(rows, start=1):
-        row.ciudadid = idx
-
     csv_path = csv_output or (root / "data" / "output" / "ciudades" / f"ciudades_{code.lower()}.csv")
     sql_path = sql_output or (root / "data" / "output" / "ciudades" / "insert_ciudad.sql")
+    # El snapshot se lee antes de sobrescribir el CSV.
+    snapshot = (load_snapshot(csv_path) or CitySnapshot(rows={}, max_id=0)) if delta else None
 
-    write_csv(rows, csv_path)
-    write_sql_inserts(rows, sql_path)
+    def numbered(rows: Iterable[CityRow]) -> Iterator[CityRow]:
+        return _numbered(rows) if snapshot is None else _stable_numbered(rows, snapshot)
 
-    return {"total_ciudades": len(rows), "csv": csv_path, "sql": sql_path, "source": source}
+    parsed = _parsed_catalog(source, code, raw_dir, admin_lookup, parser, run_size)
+    if parsed is not None:
+        unique_rows: Iterable[CityRow] = (CityRow(None, *values) for values in parsed)
+    else:
+        unique_rows = iter_unique(iter_geonames(source, code, admin_lookup, parser=parser))
+    with external_sort(unique_rows, key=_city_sort_key, run_size=run_size) as ordered:
+        # Cada salida vuelve a recorrer las corridas ordenadas; ciudadid se asigna igual en todas.
+        result: dict[str, str | int | Path] = {
+            "total_ciudades": len(ordered),
+            "csv": csv_path,
+            "sql": sql_path,
+            "source": source,
+        }
+        if snapshot is not None:
+            delta_path = delta_output or csv_path.with_name(DELTA_SQL_NAME)
+            stats = write_sql_delta(numbered(ordered), snapshot, delta_path, batch_size=batch_size)
+            result["delta"] = delta_path
+            result.update(stats)
+        write_csv(numbered(ordered), csv_path)
+        write_sql_inserts(numbered(ordered), sql_path, mode=insert_mode, batch_size=batch_size)
+        if loader_dir is not None:
+            result["sqlldr"] = write_sqlldr_files(numbered(ordered), loader_dir)
+        if store:
+            from ciudades.city_store import city_store_path, write_city_store
+
+            result["store"] = write_city_store(numbered(ordered), city_store_path(csv_path))
+    return result
 
 
 def _parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Genera catalogo de ciudades de Ecuador desde GeoNames.")
-    parser.add_argument("--code", default=COUNTRY_CODE, help="Codigo ISO del pais (default EC).")
+    parser.add_argument(
+        "--code",
+        nargs="+",
+        default=[COUNTRY_CODE],
+        help="Uno o varios codigos ISO de pais (default EC). Varios codigos se procesan en paralelo.",
+    )
+    parser.add_argument(
+        "--all",
+        dest="all_countries",
+        action="store_true",
+        help="Procesa allCountries.zip completo, repartido por rangos de bytes entre procesos.",
+    )
+    parser.add_argument("--workers", type=int, help="Procesos para --all o varios --code (default: CPUs).")
     parser.add_argument("--source", type=Path, help="Ruta a EC.txt/EC.zip local para evitar descarga.")
     parser.add_argument("--csv", type=Path, help="Ruta de salida para el CSV.")
     parser.add_argument("--sql", type=Path, help="Ruta de salida para los INSERTs SQL.")
+    parser.add_argument(
+        "--insert-mode",
+        choices=INSERT_MODES,
+        default=DEFAULT_INSERT_MODE,
+        help="row: un INSERT por fila; insert_all/forall: sentencias por lote (default row).",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Filas por sentencia en los modos por lote (default {DEFAULT_BATCH_SIZE}).",
+    )
+    parser.add_argument(
+        "--sqlldr-dir",
+        type=Path,
+        help="Directorio donde escribir ciudad.ctl/ciudad.dat para una carga direct-path con SQL*Loader.",
+    )
+    parser.add_argument(
+        "--sort-run-size",
+        type=int,
+        default=DEFAULT_RUN_SIZE,
+        help=f"Filas por corrida del orden externo; acota la memoria (default {DEFAULT_RUN_SIZE}).",
+    )
+    parser.add_argument(
+        "--delta",
+        action="store_true",
+        help="Conserva los ciudadid del CSV anterior y escribe delta_ciudad.sql solo con los cambios.",
+    )
+    parser.add_argument("--delta-sql", type=Path, help="Ruta de salida para el SQL incremental (con --delta).")
+    parser.add_argument(
+        "--parser",
+        choices=PARSERS,
+        default=DEFAULT_PARSER,
+        help="mmap: lectura por bytes mapeada en memoria; text: parser linea a linea (default mmap).",
+    )
+    parser.add_argument(
+        "--store",
+        action="store_true",
+        help="Escribe ademas ciudades_xx.bin: catalogo columnar compacto que se abre con mmap.",
+    )
     return parser.parse_args(argv)
 
 
 def main(argv: Optional[list[str]] = None) -> None:
     args = _parse_args(argv)
-    result = generate_catalog(code=args.code, source=args.source, csv_output=args.csv, sql_output=args.sql)
+    if args.all_countries or len(args.code) > 1:
+        if args.delta:
+            raise SystemExit("--delta solo se admite con un unico codigo de pais.")
+        from ciudades.parallel_catalog import generate_multi_catalog
+
+        result = generate_multi_catalog(
+            codes=args.code,
+            all_countries=args.all_countries,
+            source=args.source,
+            csv_output=args.csv,
+            sql_output=args.sql,
+            insert_mode=args.insert_mode,
+            batch_size=args.batch_size,
+            loader_dir=args.sqlldr_dir,
+            run_size=args.sort_run_size,
+            workers=args.workers,
+            parser=args.parser,
+            store=args.store,
+        )
+    else:
+        result = generate_catalog(
+            code=args.code[0],
+            source=args.source,
+            csv_output=args.csv,
+            sql_output=args.sql,
+            insert_mode=args.insert_mode,
+            batch_size=args.batch_size,
+            loader_dir=args.sqlldr_dir,
+            run_size=args.sort_run_size,
+            delta=args.delta,
+            delta_output=args.delta_sql,
+            parser=args.parser,
+            store=args.store,
+        )
     print(
         f"Ciudades procesadas: {result['total_ciudades']}\n"
         f"CSV: {result['csv']}\n"
         f"SQL: {result['sql']}\n"
         f"Fuente: {result['source']}"
     )
+    if "sqlldr" in result:
+        print(f"SQL*Loader: {result['sqlldr']}")
+    if "store" in result:
+        print(f"Catalogo columnar: {result['store']}")
+    if "delta" in result:
+        print(
+            f"Delta: {result['delta']} (nuevas={result['nuevas']}, modificadas={result['modificadas']},"
+            f" eliminadas={result['eliminadas']}, sin cambios={result['sin_cambios']})"
+        )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,248 @@
+"""
+Genera un unico catalogo CIUDAD para varios paises (o todo allCountries) en paralelo.
+
+Cada tarea (un pais, o un rango de bytes de allCountries.txt) corre en un proceso del
+ProcessPoolExecutor: parsea, deduplica y deja una corrida ordenada en disco. El proceso
+principal mezcla las corridas, elimina duplicados entre tareas y asigna ciudadid.
+
+El orden final es provincia -> nombre; los empates se resuelven por posicion en el origen
+(pais en orden alfabetico, luego numero de linea), asi que ciudadid no depende del numero
+de workers ni de como se partio el archivo.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from operator import itemgetter
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Sequence
+
+from ciudades.download_ecuador_cities import (
+    DEFAULT_PARSER,
+    CityRow,
+    GEONAMES_ZIP_URL,
+    _city_from_fields,
+    _dedupe_key,
+    _iter_geonames_lines,
+    _root_dir,
+    download_file,
+    extract_geonames_txt,
+    iter_geonames_mmap,
+    load_admin1_lookup,
+    resolve_source,
+    write_csv,
+    write_sql_inserts,
+    write_sqlldr_files,
+)
+from ciudades.city_store import city_store_path, write_city_store
+from comun.external_sort import DEFAULT_RUN_SIZE, external_sort, merge_run_files, write_run
+from comun.sql_emitter import DEFAULT_BATCH_SIZE, DEFAULT_INSERT_MODE
+
+ALL_COUNTRIES = "allCountries"
+# Tareas por worker al partir allCountries.txt: rangos mas chicos equilibran mejor la carga.
+CHUNKS_PER_WORKER = 4
+
+# Elemento de corrida: (provincia, nombre, tarea, posicion, huella, CityRow).
+# La posicion es el offset de la linea (parser mmap) o su numero (parser text); ambos siguen el orden del archivo.
+_MERGE_KEY = itemgetter(0, 1, 2, 3)
+
+_ADMIN_LOOKUP: dict[str, str] = {}
+
+
+@dataclass
+class CatalogTask:
+    index: int
+    source: Path
+    country_code: Optional[str]
+    start: Optional[int] = None
+    end: Optional[int] = None
+    parser: str = DEFAULT_PARSER
+
+
+def _init_worker(admin_lookup: dict[str, str]) -> None:
+    # El lookup admin1 se envia una sola vez por proceso, no en cada tarea.
+    global _ADMIN_LOOKUP
+    _ADMIN_LOOKUP = admin_lookup
+
+
+def _iter_range_lines(path: Path, start: int, end: int) -> Iterator[str]:
+    """Lineas cuyo primer byte cae en [start, end)."""
+    with path.open("rb") as fh:
+        if start > 0:
+            fh.seek(start - 1)
+            fh.readline()  # la linea que cruza start pertenece al rango anterior
+        while fh.tell() < end:
+            line = fh.readline()
+            if not line:
+                break
+            yield line.decode("utf-8")
+
+
+def _byte_ranges(path: Path, chunks: int) -> List[tuple[int, int]]:
+    size = path.stat().st_size
+    chunks = max(1, min(chunks, size or 1))
+    step = -(-size // chunks)
+    return [(start, min(start + step, size)) for start in range(0, size, step)] or [(0, 0)]
+
+
+def _task_cities(task: CatalogTask, workdir: Path, wanted: Optional[str]) -> Iterator[tuple[int, str, CityRow]]:
+    """(posicion, pais, CityRow) de cada lugar poblado de la tarea, en orden de archivo."""
+    if task.parser == "mmap":
+        source = task.source
+        if source.suffix.lower() == ".zip":
+            source = extract_geonames_txt(source, workdir / f"task_{task.index:05d}")
+        yield from iter_geonames_mmap(source, wanted, _ADMIN_LOOKUP, task.start or 0, task.end)
+        return
+
+    if task.start is None or task.end is None:
+        lines: Iterable[str] = _iter_geonames_lines(task.source)
+    else:
+        lines = _iter_range_lines(task.source, task.start, task.end)
+    for seq, line in enumerate(lines):
+        parts = line.strip().split("\t")
+        row = _city_from_fields(parts, wanted, _ADMIN_LOOKUP)
+        if row is not None:
+            yield seq, parts[8].strip(), row
+
+
+def _run_task(task: CatalogTask, workdir: Path, run_size: int) -> tuple[Path, int]:
+    wanted = task.country_code.upper() if task.country_code else None
+    # Un pais completo se deduplica aqui en orden de archivo (igual que generate_catalog).
+    # Un rango de bytes no: deduplicarlo localmente haria depender el resultado de los cortes.
+    dedupe_locally = task.start is None
+
+    def items() -> Iterator[tuple]:
+        seen: set[int] = set()
+        for seq, country, row in _task_cities(task, workdir, wanted):
+            key = _dedupe_key(row, country)
+            if dedupe_locally:
+                if key in seen:
+                    continue
+                seen.add(key)
+            yield (row.provincia or "", row.nombre, task.index, seq, key, row)
+
+    target = workdir / f"task_{task.index:05d}.pkl"
+    with external_sort(items(), key=_MERGE_KEY, run_size=run_size, tmp_dir=workdir) as ordered:
+        write_run(ordered, target)
+        return target, len(ordered)
+
+
+def _build_tasks(
+    codes: Sequence[str],
+    all_countries: bool,
+    source: Optional[Path],
+    raw_dir: Path,
+    workdir: Path,
+    workers: int,
+    parser: str = DEFAULT_PARSER,
+) -> List[CatalogTask]:
+    if all_countries:
+        if source is None:
+            source = raw_dir / f"{ALL_COUNTRIES}.zip"
+            if not source.exists() and not (raw_dir / f"{ALL_COUNTRIES}.txt").exists():
+                download_file(GEONAMES_ZIP_URL.format(code=ALL_COUNTRIES), source)
+            elif not source.exists():
+                source = raw_dir / f"{ALL_COUNTRIES}.txt"
+        source = Path(source)
+        if source.suffix.lower() == ".zip":
+            # Se extrae en el directorio de la corrida: un .txt en raw_dir lo tomaria resolve_source
+            # en las corridas siguientes aunque el zip se actualice.
+            source = extract_geonames_txt(source, workdir)
+        ranges = _byte_ranges(source, workers * CHUNKS_PER_WORKER)
+        return [
+            CatalogTask(index=idx, source=source, country_code=None, start=start, end=end, parser=parser)
+            for idx, (start, end) in enumerate(ranges)
+        ]
+
+    unique_codes = sorted({code.upper() for code in codes})
+    if not unique_codes:
+        raise ValueError("Indica al menos un codigo de pais o usa --all.")
+    if source is not None and len(unique_codes) > 1:
+        raise ValueError("--source solo se admite con un unico codigo de pais o con --all.")
+    return [
+        CatalogTask(index=idx, source=resolve_source(code, source, raw_dir), country_code=code, parser=parser)
+        for idx, code in enumerate(unique_codes)
+    ]
+
+
+def _unique_rows(ordered: Iterable[tuple]) -> Iterator[CityRow]:
+    # Duplicados entre tareas: se conserva el primero en orden de mezcla (provincia, nombre, posicion).
+    seen: set[int] = set()
+    for item in ordered:
+        if item[4] in seen:
+            continue
+        seen.add(item[4])
+        yield item[5]
+
+
+def generate_multi_catalog(
+    codes: Sequence[str] = (),
+    all_countries: bool = False,
+    source: Optional[Path] = None,
+    csv_output: Optional[Path] = None,
+    sql_output: Optional[Path] = None,
+    insert_mode: str = DEFAULT_INSERT_MODE,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    loader_dir: Optional[Path] = None,
+    run_size: int = DEFAULT_RUN_SIZE,
+    workers: Optional[int] = None,
+    parser: str = DEFAULT_PARSER,
+    store: bool = False,
+) -> dict[str, str | int | Path]:
+    """
+    Genera CIUDAD para la lista de codes (un proceso por pais) o para todo allCountries
+    (un proceso por rango de bytes) y escribe los mismos artefactos que generate_catalog.
+    """
+    root = _root_dir()
+    raw_dir = root / "data" / "raw" / "ciudades"
+    raw_dir.mkdir(parents=True, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+
+    workdir = Path(tempfile.mkdtemp(prefix="ciudades_parallel_"))
+    try:
+        tasks = _build_tasks(codes, all_countries, source, raw_dir, workdir, workers, parser)
+        admin_lookup = load_admin1_lookup(raw_dir)
+
+        label = "all" if all_countries else "_".join(t.country_code.lower() for t in tasks if t.country_code)
+        csv_path = csv_output or (root / "data" / "output" / "ciudades" / f"ciudades_{label}.csv")
+        sql_path = sql_output or (root / "data" / "output" / "ciudades" / "insert_ciudad.sql")
+
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(tasks)),
+            initializer=_init_worker,
+            initargs=(admin_lookup,),
+        ) as pool:
+            futures = [pool.submit(_run_task, task, workdir, run_size) for task in tasks]
+            results = [future.result() for future in futures]
+
+        run_paths = [path for path, _ in results]
+        candidates = sum(count for _, count in results)
+        stats = {"total": 0}
+
+        def numbered(ordered: Iterable[tuple]) -> Iterator[CityRow]:
+            for idx, row in enumerate(_unique_rows(ordered), start=1):
+                row.ciudadid = idx
+                stats["total"] = idx
+                yield row
+
+        with merge_run_files(run_paths, _MERGE_KEY, workdir, candidates) as ordered:
+            write_csv(numbered(ordered), csv_path)
+            write_sql_inserts(numbered(ordered), sql_path, mode=insert_mode, batch_size=batch_size)
+            result: dict[str, str | int | Path] = {
+                "total_ciudades": stats["total"],
+                "csv": csv_path,
+                "sql": sql_path,
+                "source": (source or tasks[0].source) if all_countries else ", ".join(str(t.source) for t in tasks),
+                "tareas": len(tasks),
+            }
+            if loader_dir is not None:
+                result["sqlldr"] = write_sqlldr_files(numbered(ordered), loader_dir)
+            if store:
+                result["store"] = write_city_store(numbered(ordered), city_store_path(csv_path))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return result
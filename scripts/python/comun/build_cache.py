@@ -0,0 +1,143 @@
+"""
+Manifiesto de build para omitir etapas del pipeline cuyas entradas no cambiaron.
+
+Por cada etapa se guardan: huella (tamano, mtime, sha256) de cada archivo de entrada,
+version del generador, parametros y huella de cada salida. Una etapa esta al dia si
+todo coincide y sus salidas siguen intactas en disco.
+
+Para que una ejecucion sin cambios sea inmediata, el sha256 solo se recalcula cuando
+cambia el tamano o el mtime de un archivo.
+
+Las etapas del pipeline corren en hilos (comun/dag.py): is_fresh, record y save toman un lock.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Any, Iterable, Mapping, Optional
+
+MANIFEST_VERSION = 1
+_HASH_CHUNK = 1024 * 1024
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as fh:
+        for chunk in iter(lambda: fh.read(_HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class BuildCache:
+    """Lee y escribe el manifiesto JSON; las rutas se guardan relativas a root."""
+
+    def __init__(self, manifest_path: Path, root: Path, force: bool = False) -> None:
+        self.manifest_path = manifest_path
+        self.root = root
+        self.force = force
+        self._stages: dict[str, dict[str, Any]] = {}
+        self._lock = threading.RLock()
+        if manifest_path.exists():
+            try:
+                data = json.loads(manifest_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                data = {}
+            if data.get("version") == MANIFEST_VERSION:
+                self._stages = data.get("stages", {})
+
+    def _key(self, path: Path) -> str:
+        resolved = Path(path).resolve()
+        try:
+            return resolved.relative_to(self.root.resolve()).as_posix()
+        except ValueError:
+            return resolved.as_posix()
+
+    def _path(self, key: str) -> Path:
+        path = Path(key)
+        return path if path.is_absolute() else self.root / path
+
+    def _fingerprint(self, path: Path, previous: Optional[Mapping[str, Any]] = None) -> Optional[dict[str, Any]]:
+        if not path.is_file():
+            return None
+        stat = path.stat()
+        if previous and previous.get("size") == stat.st_size and previous.get("mtime_ns") == stat.st_mtime_ns:
+            return dict(previous)
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": file_sha256(path)}
+
+    def _matches(self, recorded: Mapping[str, Mapping[str, Any]], current_keys: Optional[set[str]] = None) -> bool:
+        if current_keys is not None and set(recorded) != current_keys:
+            return False
+        for key, previous in recorded.items():
+            current = self._fingerprint(self._path(key), previous)
+            if current is None or current["sha256"] != previous.get("sha256"):
+                return False
+            if current != previous:
+                # Mismo contenido con otro mtime: se actualiza para volver al camino rapido.
+                recorded[key].update(current)  # type: ignore[union-attr]
+        return True
+
+    def is_fresh(
+        self,
+        stage: str,
+        inputs: Iterable[Path],
+        version: str,
+        params: Optional[Mapping[str, Any]] = None,
+    ) -> bool:
+        """True si stage ya se genero con las mismas entradas, version y parametros."""
+        if self.force:
+            return False
+        with self._lock:
+            record = self._stages.get(stage)
+            if not record:
+                return False
+            if record.get("version") != version or record.get("params") != _normalize(params or {}):
+                return False
+            input_keys = {self._key(path) for path in inputs}
+            return self._matches(record.get("inputs", {}), input_keys) and self._matches(record.get("outputs", {}))
+
+    def record(
+        self,
+        stage: str,
+        inputs: Iterable[Path],
+        outputs: Iterable[Path],
+        version: str,
+        params: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        """Registra el resultado de una etapa recien ejecutada."""
+        entry_inputs: dict[str, Any] = {}
+        for path in inputs:
+            fingerprint = self._fingerprint(Path(path))
+            if fingerprint is None:
+                # Sin la entrada en disco no hay forma de validar la etapa la proxima vez.
+                with self._lock:
+                    self._stages.pop(stage, None)
+                return
+            entry_inputs[self._key(path)] = fingerprint
+        entry_outputs = {
+            self._key(path): fingerprint
+            for path in outputs
+            if (fingerprint := self._fingerprint(Path(path))) is not None
+        }
+        with self._lock:
+            self._stages[stage] = {
+                "version": version,
+                "params": _normalize(params or {}),
+                "inputs": entry_inputs,
+                "outputs": entry_outputs,
+            }
+
+    def save(self) -> Path:
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            payload = {"version": MANIFEST_VERSION, "stages": self._stages}
+            text = json.dumps(payload, indent=2, sort_keys=True) + "\n"
+        self.manifest_path.write_text(text, encoding="utf-8")
+        return self.manifest_path
+
+
+def _normalize(params: Mapping[str, Any]) -> dict[str, Any]:
+    # Ida y vuelta por JSON para comparar igual que lo que se lee del manifiesto (tuplas -> listas, Path -> str).
+    return json.loads(json.dumps(dict(params), sort_keys=True, default=str))
@@ -0,0 +1,166 @@
+"""
+Grafo de dependencias entre tareas (etapas del pipeline, pasos o sesiones del plan SQL).
+
+Cada tarea declara por nombre las tareas que deben terminar antes. run_tasks lanza cada tarea en
+un pool de hilos apenas terminan sus dependencias, de modo que el tiempo total tiende al camino
+critico del grafo y no a la suma de las tareas. Si una tarea falla no se lanzan mas tareas; se
+espera a las que ya estaban en curso y se relanza el primer error.
+
+Los hilos sirven para coordinar: el trabajo pesado de cada tarea corre en otro proceso (generadores
+de Python) o en la base de datos (sesiones SQL), asi que el GIL no serializa el grafo.
+"""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+
+class CycleError(ValueError):
+    """El grafo tiene un ciclo o una dependencia hacia una tarea que no existe."""
+
+
+@dataclass(frozen=True)
+class Task:
+    name: str
+    deps: Tuple[str, ...] = ()
+    fn: Optional[Callable[[], Any]] = None
+
+
+@dataclass
+class TaskResult:
+    name: str
+    value: Any
+    inicio: float  # segundos desde el arranque de run_tasks
+    segundos: float
+
+
+def topological_order(tasks: Sequence[Task]) -> List[Task]:
+    """Orden estable: si la declaracion ya respeta las dependencias, se devuelve en ese mismo orden."""
+    by_name = {task.name: task for task in tasks}
+    if len(by_name) != len(tasks):
+        raise CycleError("Hay tareas con nombre repetido.")
+    for task in tasks:
+        missing = [dep for dep in task.deps if dep not in by_name]
+        if missing:
+            raise CycleError(f"{task.name} depende de tareas inexistentes: {', '.join(missing)}")
+
+    ordered: List[Task] = []
+    done: set[str] = set()
+    pending = list(tasks)
+    while pending:
+        ready = next((task for task in pending if all(dep in done for dep in task.deps)), None)
+        if ready is None:
+            raise CycleError(f"Ciclo entre: {', '.join(task.name for task in pending)}")
+        ordered.append(ready)
+        done.add(ready.name)
+        pending.remove(ready)
+    return ordered
+
+
+def waves(tasks: Sequence[Task]) -> List[List[Task]]:
+    """Niveles del grafo: cada tarea va en el primer nivel posterior a todas sus dependencias."""
+    level: Dict[str, int] = {}
+    result: List[List[Task]] = []
+    for task in topological_order(tasks):
+        level[task.name] = 1 + max((level[dep] for dep in task.deps), default=-1)
+        if level[task.name] == len(result):
+            result.append([])
+        result[level[task.name]].append(task)
+    return result
+
+
+def restrict(tasks: Sequence[Task], keep: Iterable[str]) -> List[Task]:
+    """
+    Subgrafo con las tareas de keep. Una dependencia que se descarta se reemplaza por sus propias
+    dependencias conservadas, para no perder el orden transitivo.
+    """
+    keep = set(keep)
+    by_name = {task.name: task for task in tasks}
+
+    def kept_deps(name: str, seen: set[str]) -> List[str]:
+        found: List[str] = []
+        for dep in by_name[name].deps:
+            if dep in seen:
+                continue
+            seen.add(dep)
+            found.extend([dep] if dep in keep else kept_deps(dep, seen))
+        return found
+
+    return [
+        Task(task.name, tuple(dict.fromkeys(kept_deps(task.name, set()))), task.fn)
+        for task in topological_order(tasks)
+        if task.name in keep
+    ]
+
+
+def chains(tasks: Sequence[Task]) -> List[List[Task]]:
+    """
+    Agrupa el grafo en cadenas lineales: una tarea sigue en la cadena de su unica dependencia si es
+    la unica tarea que depende de ella. Cada cadena puede correr en una sola sesion sin esperas.
+    """
+    dependents: Dict[str, int] = {task.name: 0 for task in tasks}
+    for task in tasks:
+        for dep in task.deps:
+            dependents[dep] += 1
+    chain_of: Dict[str, List[Task]] = {}
+    result: List[List[Task]] = []
+    for task in topological_order(tasks):
+        if len(task.deps) == 1 and dependents[task.deps[0]] == 1:
+            chain = chain_of[task.deps[0]]
+        else:
+            chain = []
+            result.append(chain)
+        chain.append(task)
+        chain_of[task.name] = chain
+    return result
+
+
+def critical_path(tasks: Sequence[Task], durations: Mapping[str, float]) -> Tuple[float, List[str]]:
+    """Duracion y tareas del camino mas largo segun durations (las tareas sin duracion cuentan 0)."""
+    best: Dict[str, Tuple[float, List[str]]] = {}
+    for task in topological_order(tasks):
+        before = max((best[dep] for dep in task.deps), key=lambda item: item[0], default=(0.0, []))
+        best[task.name] = (before[0] + durations.get(task.name, 0.0), [*before[1], task.name])
+    return max(best.values(), key=lambda item: item[0], default=(0.0, []))
+
+
+def run_tasks(tasks: Sequence[Task], workers: int = 4) -> Dict[str, TaskResult]:
+    """Ejecuta fn de cada tarea respetando dependencias, con hasta workers tareas a la vez."""
+    if workers < 1:
+        raise ValueError("workers debe ser positivo")
+    ordered = topological_order(tasks)
+    results: Dict[str, TaskResult] = {}
+    start = time.perf_counter()
+
+    def timed(task: Task) -> TaskResult:
+        began = time.perf_counter()
+        value = task.fn() if task.fn is not None else None
+        return TaskResult(task.name, value, round(began - start, 3), round(time.perf_counter() - began, 3))
+
+    pending = list(ordered)
+    running: Dict[Future, Task] = {}
+    error: Optional[BaseException] = None
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        while pending or running:
+            if error is None:
+                ready = [task for task in pending if all(dep in results for dep in task.deps)]
+                for task in ready[: max(workers - len(running), 0)]:
+                    running[pool.submit(timed, task)] = task
+                    pending.remove(task)
+            if not running:
+                break
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                running.pop(future)
+                try:
+                    result = future.result()
+                except BaseException as exc:  # se relanza tras esperar a las tareas en curso
+                    error = error or exc
+                    continue
+                results[result.name] = result
+    if error is not None:
+        raise error
+    return results
@@ -0,0 +1,167 @@
+"""
+Ordenamiento externo (merge sort) con memoria acotada.
+
+Los elementos se acumulan en corridas de run_size elementos; cada corrida se ordena en
+memoria y se vuelca a disco con pickle. La lectura mezcla las corridas con heapq.merge,
+por lo que solo se mantiene un elemento por corrida en memoria. El orden es estable:
+ante claves iguales se respeta el orden de llegada, igual que list.sort.
+"""
+
+from __future__ import annotations
+
+import heapq
+import pickle
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Generic, Iterable, Iterator, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_RUN_SIZE = 200_000
+# Maximo de corridas abiertas a la vez durante la mezcla; si hay mas se mezclan por niveles.
+DEFAULT_FAN_IN = 64
+
+
+def write_run(items: Iterable[Any], path: Path) -> None:
+    with path.open("wb") as fh:
+        pickler = pickle.Pickler(fh, protocol=pickle.HIGHEST_PROTOCOL)
+        for item in items:
+            pickler.dump(item)
+            # Sin memo: cada elemento es independiente y el memo crece con la corrida.
+            pickler.clear_memo()
+
+
+def read_run(path: Path) -> Iterator[Any]:
+    with path.open("rb") as fh:
+        # Un Unpickler reutilizado retiene memoria entre llamadas; pickle.load por elemento no.
+        while True:
+            try:
+                yield pickle.load(fh)
+            except EOFError:
+                return
+
+
+class SortedRuns(Generic[T]):
+    """
+    Resultado de external_sort. Se puede iterar varias veces (cada iteracion vuelve a
+    mezclar las corridas desde disco). Usar como context manager para borrar los temporales.
+    """
+
+    def __init__(
+        self,
+        key: Callable[[T], Any],
+        memory: Optional[List[T]],
+        runs: List[Path],
+        workdir: Optional[Path],
+        total: int,
+    ) -> None:
+        self._key = key
+        self._memory = memory
+        self._runs = runs
+        self._workdir = workdir
+        self._total = total
+
+    def __len__(self) -> int:
+        return self._total
+
+    def __iter__(self) -> Iterator[T]:
+        if self._memory is not None:
+            return iter(self._memory)
+        return heapq.merge(*(read_run(run) for run in self._runs), key=self._key)
+
+    def close(self) -> None:
+        if self._workdir is not None:
+            shutil.rmtree(self._workdir, ignore_errors=True)
+            self._workdir = None
+        self._runs = []
+
+    def __enter__(self) -> "SortedRuns[T]":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def external_sort(
+    items: Iterable[T],
+    key: Callable[[T], Any],
+    run_size: int = DEFAULT_RUN_SIZE,
+    tmp_dir: Optional[Path] = None,
+    fan_in: int = DEFAULT_FAN_IN,
+) -> SortedRuns[T]:
+    """
+    Ordena items por key usando como maximo run_size elementos en memoria.
+    Si todo cabe en una corrida no se toca el disco.
+    """
+    if run_size < 1:
+        raise ValueError("run_size debe ser mayor que cero")
+    if fan_in < 2:
+        raise ValueError("fan_in debe ser al menos 2")
+
+    workdir: Optional[Path] = None
+    runs: List[Path] = []
+    buffer: List[T] = []
+    total = 0
+
+    def spill() -> None:
+        nonlocal workdir
+        if workdir is None:
+            workdir = Path(tempfile.mkdtemp(prefix="external_sort_", dir=tmp_dir))
+        buffer.sort(key=key)
+        run_path = workdir / f"run_{len(runs):06d}.pkl"
+        write_run(buffer, run_path)
+        runs.append(run_path)
+        buffer.clear()
+
+    try:
+        for item in items:
+            buffer.append(item)
+            total += 1
+            if len(buffer) >= run_size:
+                spill()
+
+        if not runs:
+            buffer.sort(key=key)
+            return SortedRuns(key, buffer, [], None, total)
+        if buffer:
+            spill()
+
+        runs = _merge_levels(runs, key, workdir, fan_in)
+    except BaseException:
+        if workdir is not None:
+            shutil.rmtree(workdir, ignore_errors=True)
+        raise
+
+    return SortedRuns(key, None, runs, workdir, total)
+
+
+def _merge_levels(runs: List[Path], key: Callable[[Any], Any], workdir: Path, fan_in: int) -> List[Path]:
+    # Mezcla por niveles para no abrir mas de fan_in archivos a la vez.
+    level = 0
+    while len(runs) > fan_in:
+        merged: List[Path] = []
+        for start in range(0, len(runs), fan_in):
+            group = runs[start : start + fan_in]
+            target = workdir / f"merge_{level:02d}_{len(merged):06d}.pkl"
+            write_run(heapq.merge(*(read_run(run) for run in group), key=key), target)
+            for run in group:
+                run.unlink()
+            merged.append(target)
+        runs = merged
+        level += 1
+    return runs
+
+
+def merge_run_files(
+    runs: List[Path],
+    key: Callable[[T], Any],
+    workdir: Path,
+    total: int,
+    fan_in: int = DEFAULT_FAN_IN,
+) -> SortedRuns[T]:
+    """
+    Mezcla corridas ya ordenadas (p.ej. escritas por procesos distintos con write_run).
+    El orden de runs desempata claves iguales. workdir no se borra al cerrar el resultado.
+    """
+    return SortedRuns(key, None, _merge_levels(list(runs), key, workdir, fan_in), None, total)
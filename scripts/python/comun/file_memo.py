@@ -0,0 +1,52 @@
+"""
+Memo en proceso de valores derivados de archivos (lookups y catalogos parseados).
+
+Cada valor se guarda con la firma (tamano, mtime) de los archivos de los que sale y se recalcula
+solo cuando alguna firma cambia. En una corrida normal del pipeline cada archivo se lee una vez
+igual que antes; en el modo --watch de run_full_etl_pipeline.py el proceso sigue vivo entre
+regeneraciones y las etapas reutilizan lo ya parseado de los archivos que no cambiaron.
+
+Los valores se comparten entre llamadas: quien los recibe no debe modificarlos. Las etapas del
+pipeline corren en hilos (comun/dag.py), por eso el acceso toma un lock.
+"""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+_LOCK = threading.Lock()
+# (nombre, rutas, extra) -> (firmas de las rutas, valor)
+_MEMO: Dict[Tuple[Hashable, ...], Tuple[Tuple[Optional[Tuple[int, int]], ...], Any]] = {}
+
+
+def file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    """(tamano, mtime_ns) de path, o None si no existe."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def memoized(name: str, paths: Iterable[Path], compute: Callable[[], T], extra: Hashable = None) -> T:
+    """Valor de compute() para name/paths/extra; se recalcula si cambia algun archivo de paths."""
+    paths = tuple(Path(path).resolve() for path in paths)
+    key = (name, paths, extra)
+    stamps = tuple(file_stamp(path) for path in paths)
+    with _LOCK:
+        hit = _MEMO.get(key)
+    if hit is not None and hit[0] == stamps:
+        return hit[1]
+    value = compute()
+    with _LOCK:
+        _MEMO[key] = (stamps, value)
+    return value
+
+
+def clear() -> None:
+    with _LOCK:
+        _MEMO.clear()
@@ -0,0 +1,79 @@
+"""
+Claves normalizadas de nombres geograficos para joins por igualdad en Oracle.
+
+normalize_key repara mojibake (UTF-8 leido como latin-1, p.ej. "GirÃ³n"), quita tildes,
+pasa a mayusculas y reduce todo lo que no sea letra o digito a un espacio:
+    "GirÃ³n" -> "GIRON", "Morona-Santiago Province" -> "MORONA SANTIAGO PROVINCE"
+
+Los generadores guardan la clave en columnas NOMBRE_CLAVE/PROVINCIA_CLAVE (indexadas), de modo
+que la carga del DW compara columnas planas en lugar de UPPER(TRIM(...)) en cada fila.
+Las variantes que no coinciden tras normalizar (sufijos como "Province") se resuelven con la
+tabla NOMBRE_ALIAS, que derive_aliases calcula contra las claves canonicas de la jerarquia.
+FN_CLAVE_NOMBRE (dw/01_dw_star_schema_and_top_product_view.sql) replica la misma regla en
+Oracle para los nombres que nacen en la base (categorias), sin la reparacion de mojibake.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from difflib import SequenceMatcher
+from typing import Iterable, Optional
+
+# Prefijos y sufijos genericos que GeoNames u otras fuentes agregan al nombre de la division.
+_AFFIXES = re.compile(r"^(?:PROVINCIA DE(?:L)? |CANTON |PARROQUIA )|(?: PROVINCE| PROVINCIA| CANTON)$")
+_NON_ALNUM = re.compile(r"[^A-Z0-9]+")
+_MOJIBAKE_MARKERS = ("Ã", "Â")
+# Similitud minima para aceptar una variante como alias cuando las reglas exactas no bastan.
+ALIAS_SIMILARITY = 0.9
+
+
+def repair_mojibake(text: str) -> str:
+    """Deshace la doble codificacion UTF-8 -> latin-1; devuelve text intacto si no aplica."""
+    if not any(marker in text for marker in _MOJIBAKE_MARKERS):
+        return text
+    try:
+        return text.encode("latin-1").decode("utf-8")
+    except (UnicodeEncodeError, UnicodeDecodeError):
+        return text
+
+
+def normalize_key(text: Optional[str]) -> Optional[str]:
+    """Clave de comparacion de un nombre; None si no queda nada (igual que TRIM('') en Oracle)."""
+    if text is None:
+        return None
+    decomposed = unicodedata.normalize("NFKD", repair_mojibake(text))
+    ascii_text = decomposed.encode("ascii", "ignore").decode("ascii").upper()
+    key = _NON_ALNUM.sub(" ", ascii_text).strip()
+    return key or None
+
+
+def strip_affixes(key: str) -> str:
+    """Quita prefijos/sufijos de division administrativa de una clave ya normalizada."""
+    return _AFFIXES.sub("", key).strip()
+
+
+def derive_aliases(variants: Iterable[str], canonical_keys: Iterable[str]) -> dict[str, str]:
+    """
+    Relaciona nombres alternativos con las claves canonicas: alias_clave -> clave.
+    Solo se devuelven variantes cuya clave difiere de la canonica; las que no se resuelven
+    (ni por prefijos/sufijos ni por similitud) se omiten.
+    """
+    canonical = set(canonical_keys)
+    aliases: dict[str, str] = {}
+    for variant in variants:
+        key = normalize_key(variant)
+        if key is None or key in canonical or key in aliases:
+            continue
+        stripped = strip_affixes(key)
+        if stripped in canonical:
+            aliases[key] = stripped
+            continue
+        best, best_ratio = None, ALIAS_SIMILARITY
+        for candidate in canonical:
+            ratio = SequenceMatcher(None, stripped, candidate).ratio()
+            if ratio >= best_ratio:
+                best, best_ratio = candidate, ratio
+        if best is not None:
+            aliases[key] = best
+    return aliases
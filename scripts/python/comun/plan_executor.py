@@ -0,0 +1,503 @@
+"""
+Ejecuta el plan SQL*Plus (plan_ejecucion_dw.sql) sobre una conexion DB-API, sin sqlplus.
+
+Diferencias con SQL*Plus:
+ - se detiene en el primer error (WHENEVER SQLERROR se ignora) y hace ROLLBACK de lo pendiente;
+   la unica excepcion es el DDL sobre objetos que ya existen (tabla, indice, columna), que los
+   scripts del repo crean sin verificar para poder re-ejecutarse;
+ - los INSERT de una fila consecutivos sobre la misma tabla y columnas (insert_ciudad.sql,
+   insert_jerarquia.sql, ...) se agrupan y se envian con executemany en lotes de array_size:
+   un parse y un round-trip por lote en lugar de uno por fila;
+ - COMMIT/ROLLBACK usan connection.commit()/rollback(); PROMPT imprime; EXEC se ejecuta como
+   bloque PL/SQL; las consultas SELECT imprimen sus primeras filas; HOST no esta soportado
+   (usa --loader sql);
+ - SPOOL escribe lo impreso y, como SQL*Plus, el feedback "N rows ..." y con SET TIMING ON una
+   linea Elapsed por sentencia, de modo que comun/run_report.py lee el mismo formato.
+
+Destinos:
+ - oracle: python-oracledb (pip install oracledb); credenciales usuario/clave@tns en la variable
+   de entorno DW_USERID o en --userid.
+ - sqlite: base local para probar el plan sin Oracle. Se omiten (y se cuentan) los bloques
+   PL/SQL y las sentencias propias de Oracle (MERGE, secuencias, ROWNUM, DUAL, ...); el resto
+   (DDL de tablas, cargas de catalogos) se ejecuta igual que en Oracle. De los bloques PL/SQL
+   idempotentes se ejecuta solo el DDL literal: EXECUTE IMMEDIATE q'[CREATE TABLE ...]' como
+   CREATE TABLE IF NOT EXISTS y 'ALTER TABLE t ADD (columna tipo)' como ADD COLUMN.
+
+Uso (desde la raiz del repo):
+    python scripts/python/comun/plan_executor.py --target sqlite --sqlite-db /tmp/dw.sqlite
+    DW_USERID=usuario/clave@tns python scripts/python/comun/plan_executor.py --target oracle
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import sqlite3
+import sys
+import time
+from dataclasses import dataclass, field
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Sequence, TextIO
+
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from comun.sql_script import COMMAND, PLSQL, SQL, Statement, read_statements
+
+ROOT = Path(__file__).resolve().parents[3]
+DEFAULT_PLAN = ROOT / "data" / "output" / "plan_ejecucion_dw.sql"
+DEFAULT_SQLITE_DB = ROOT / "data" / "output" / "dw_local.sqlite"
+TARGETS = ("oracle", "sqlite")
+USERID_ENV = "DW_USERID"
+DEFAULT_ARRAY_SIZE = 1000
+# Con sesiones paralelas (comun/session_runner.py) cada conexion SQLite espera el lock de escritura.
+SQLITE_TIMEOUT = 60.0
+# Filas que se imprimen de cada SELECT del plan (consultas de verificacion).
+QUERY_PREVIEW_ROWS = 10
+# Feedback que SQL*Plus escribe tras cada DML ("N rows merged.").
+_FEEDBACK_VERBS = {"INSERT": "created", "UPDATE": "updated", "DELETE": "deleted", "MERGE": "merged"}
+
+_SINGLE_ROW_INSERT = re.compile(
+    r"INSERT\s+INTO\s+([\w$#.]+)\s*\(([^)]*)\)\s*VALUES\s*\((.*)\)\s*\Z",
+    re.I | re.S,
+)
+_LITERAL = re.compile(
+    r"\s*(?:'((?:[^']|'')*)'|(NULL)|([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?))\s*(,|\Z)",
+    re.I,
+)
+
+
+class PlanExecutionError(RuntimeError):
+    """Fallo de una sentencia del plan; el mensaje indica script y linea."""
+
+
+@dataclass
+class ExecutionReport:
+    scripts: int = 0
+    statements: int = 0
+    batches: int = 0
+    bound_rows: int = 0
+    skipped: int = 0
+    existing: int = 0
+    elapsed: float = 0.0
+    skipped_samples: List[str] = field(default_factory=list)
+
+
+class Dialect:
+    """Diferencias entre drivers: marcadores de bind, conversion de numeros y sentencias soportadas."""
+
+    name = ""
+
+    def placeholders(self, count: int) -> str:
+        raise NotImplementedError
+
+    def number(self, text: str) -> Any:
+        raise NotImplementedError
+
+    def expand(self, statement: Statement) -> List[Statement]:
+        """Sentencias que ejecutan statement en este destino (por defecto, la misma)."""
+        return [statement]
+
+    def skip_reason(self, statement: Statement) -> Optional[str]:
+        """Motivo para omitir la sentencia en este destino; None si se ejecuta."""
+        return None
+
+    def is_existing_object(self, exc: Exception) -> bool:
+        """True si exc indica que el objeto del DDL ya existia (re-ejecucion del plan)."""
+        return False
+
+    def after_plsql(self, cursor: Any) -> List[str]:
+        """Lineas de salida (DBMS_OUTPUT) que dejo el ultimo bloque PL/SQL."""
+        return []
+
+
+class OracleDialect(Dialect):
+    name = "oracle"
+
+    def __init__(self, server_output: bool = False) -> None:
+        self.server_output = server_output
+
+    def placeholders(self, count: int) -> str:
+        return ", ".join(f":{index}" for index in range(1, count + 1))
+
+    # ORA-00955 nombre en uso, ORA-01430 columna existente, ORA-01408 indice equivalente,
+    # ORA-02260/02261/02275 PK, UNIQUE o FK ya definidas.
+    _EXISTING_CODES = frozenset({955, 1408, 1430, 2260, 2261, 2275})
+
+    def is_existing_object(self, exc: Exception) -> bool:
+        match = re.search(r"ORA-(\d{5})", str(exc))
+        return match is not None and int(match.group(1)) in self._EXISTING_CODES
+
+    def number(self, text: str) -> Any:
+        # Decimal conserva el literal exacto (un float cambiaria -2.34686 por -2.3468599999...).
+        return Decimal(text)
+
+    def after_plsql(self, cursor: Any) -> List[str]:
+        if not self.server_output:
+            return []
+        line_var = cursor.var(str)
+        status_var = cursor.var(int)
+        lines: List[str] = []
+        while True:
+            cursor.callproc("DBMS_OUTPUT.GET_LINE", (line_var, status_var))
+            if status_var.getvalue() != 0:
+                return lines
+            lines.append(line_var.getvalue() or "")
+
+
+class SqliteDialect(Dialect):
+    name = "sqlite"
+
+    _ORACLE_ONLY = re.compile(
+        r"\A(?:MERGE|ALTER\s+(?:SESSION|SEQUENCE)|CREATE\s+(?:OR\s+REPLACE\s+|UNIQUE\s+)?(?:SEQUENCE|VIEW|FUNCTION|TRIGGER)\b)"
+        r"|\b(?:ROWNUM|DUAL|NEXTVAL|CURRVAL|SYSTIMESTAMP|SYSDATE|DBMS_\w+|FN_\w+)\b",
+        re.I,
+    )
+
+    _EMBEDDED_CREATE = re.compile(r"EXECUTE\s+IMMEDIATE\s+q'\[\s*CREATE\s+TABLE\s+(.*?)\]'", re.I | re.S)
+    _EMBEDDED_ADD_COLUMN = re.compile(r"EXECUTE\s+IMMEDIATE\s+'ALTER\s+TABLE\s+([\w$#]+)\s+ADD\s+\((\w+\s+[^',]+)\)'", re.I)
+
+    def placeholders(self, count: int) -> str:
+        return ", ".join("?" * count)
+
+    def expand(self, statement: Statement) -> List[Statement]:
+        if statement.kind != PLSQL:
+            return [statement]
+        ddl = [f"CREATE TABLE IF NOT EXISTS {body.strip()}" for body in self._EMBEDDED_CREATE.findall(statement.text)]
+        ddl += [f"ALTER TABLE {table} ADD COLUMN {column}" for table, column in self._EMBEDDED_ADD_COLUMN.findall(statement.text)]
+        if not ddl:
+            return [statement]
+        return [Statement(SQL, text, statement.line) for text in ddl]
+
+    def is_existing_object(self, exc: Exception) -> bool:
+        message = str(exc)
+        return "already exists" in message or "duplicate column" in message
+
+    def number(self, text: str) -> Any:
+        return float(text) if any(char in text for char in ".eE") else int(text)
+
+    def skip_reason(self, statement: Statement) -> Optional[str]:
+        if statement.kind == PLSQL:
+            return "bloque PL/SQL"
+        match = self._ORACLE_ONLY.search(statement.text)
+        if match:
+            return f"sintaxis Oracle ({match.group().split()[0].upper()})"
+        return None
+
+
+def _parse_literals(body: str, dialect: Dialect) -> Optional[tuple]:
+    """Valores de VALUES (...) si todos son literales (texto, numero o NULL); None si hay expresiones."""
+    values: List[Any] = []
+    pos, size = 0, len(body)
+    while True:
+        match = _LITERAL.match(body, pos)
+        if match is None:
+            return None
+        quoted, null, number, separator = match.groups()
+        if quoted is not None:
+            values.append(quoted.replace("''", "'"))
+        elif null is not None:
+            values.append(None)
+        else:
+            values.append(dialect.number(number))
+        pos = match.end()
+        if not separator:
+            return tuple(values) if pos == size else None
+
+
+class _InsertBatch:
+    """INSERTs de una fila pendientes para la misma tabla y columnas."""
+
+    def __init__(self, header: tuple, sql: str, statement: Statement, script: Path) -> None:
+        self.header = header
+        self.sql = sql
+        self.started = time.perf_counter()
+        self.rows: List[tuple] = []
+        self.first = statement
+        self.script = script
+
+
+class PlanExecutor:
+    """Recorre el plan (y los scripts que referencia con @) y los ejecuta en orden sobre connection."""
+
+    def __init__(
+        self,
+        connection: Any,
+        dialect: Dialect,
+        root: Path = ROOT,
+        array_size: int = DEFAULT_ARRAY_SIZE,
+        echo: Callable[[str], None] = print,
+    ) -> None:
+        if array_size < 1:
+            raise ValueError("array_size debe ser positivo")
+        self.connection = connection
+        self.dialect = dialect
+        self.root = root
+        self.array_size = array_size
+        self.echo = echo
+        self.report = ExecutionReport()
+        self._cursor = connection.cursor()
+        self._batch: Optional[_InsertBatch] = None
+        self._stopped = False
+        self._spool: Optional[TextIO] = None
+        self._timing = False
+
+    def run(self, plan_path: Path) -> ExecutionReport:
+        start = time.perf_counter()
+        try:
+            self.run_script(plan_path)
+            self._flush()
+            self.connection.commit()
+        except BaseException:
+            self._batch = None
+            self.connection.rollback()
+            raise
+        finally:
+            self.report.elapsed = time.perf_counter() - start
+            self._close_spool()
+        return self.report
+
+    def run_script(self, path: Path) -> None:
+        if not path.exists():
+            raise PlanExecutionError(f"No existe el script {path}")
+        self.report.scripts += 1
+        for statement in read_statements(path):
+            if self._stopped:
+                return
+            if statement.kind == COMMAND:
+                self._flush()
+                self._command(statement, path)
+            else:
+                self._execute(statement, path)
+
+    def _command(self, statement: Statement, script: Path) -> None:
+        keyword = statement.keyword
+        if keyword == "@@":
+            self.run_script(script.parent / statement.text[2:].strip())
+        elif keyword == "@" or keyword == "START":
+            target = statement.text[1:] if keyword == "@" else statement.text.split(None, 1)[1]
+            self.run_script(self.root / target.strip())
+        elif keyword in ("PROMPT", "PRO"):
+            parts = statement.text.split(None, 1)
+            self._emit(parts[1] if len(parts) > 1 else "")
+        elif keyword in ("EXEC", "EXECUTE"):
+            call = statement.text.split(None, 1)[1].rstrip().rstrip(";")
+            self._execute(Statement(PLSQL, f"BEGIN {call}; END;", statement.line), script)
+        elif keyword == "SPOOL":
+            self._close_spool()
+            target = statement.text.split(None, 1)[1].strip() if len(statement.text.split()) > 1 else "OFF"
+            if target.upper() != "OFF":
+                path = self.root / target.split()[0]
+                path.parent.mkdir(parents=True, exist_ok=True)
+                self._spool = path.open("w", encoding="utf-8")
+        elif keyword in ("EXIT", "QUIT"):
+            self._stopped = True
+        elif keyword == "HOST":
+            raise PlanExecutionError(
+                f"{self._where(script, statement)}: HOST no esta soportado por el ejecutor; genera el plan con --loader sql."
+            )
+        elif keyword == "SET":
+            timing = re.fullmatch(r"SET\s+TIMING\s+(ON|OFF)", statement.text, re.I)
+            if timing:
+                self._timing = timing.group(1).upper() == "ON"
+            elif isinstance(self.dialect, OracleDialect) and re.fullmatch(r"SET\s+SERVEROUTPUT\s+ON.*", statement.text, re.I):
+                self._cursor.callproc("DBMS_OUTPUT.ENABLE", (None,))
+                self.dialect.server_output = True
+        # WHENEVER, COLUMN, DEFINE y el resto de SET: sin efecto fuera de SQL*Plus.
+
+    def _execute(self, statement: Statement, script: Path) -> None:
+        for expanded in self.dialect.expand(statement):
+            self._execute_one(expanded, script)
+
+    def _execute_one(self, statement: Statement, script: Path) -> None:
+        reason = self.dialect.skip_reason(statement)
+        if reason is not None:
+            self._flush()
+            self.report.skipped += 1
+            if len(self.report.skipped_samples) < 5:
+                self.report.skipped_samples.append(f"{self._where(script, statement)} ({reason})")
+            return
+
+        keyword = statement.keyword
+        if statement.text.upper() in ("COMMIT", "ROLLBACK"):
+            self._flush()
+            (self.connection.commit if keyword == "COMMIT" else self.connection.rollback)()
+            self.report.statements += 1
+            return
+
+        if keyword == "INSERT" and statement.kind != PLSQL and self._queue_insert(statement, script):
+            return
+
+        self._flush()
+        started = time.perf_counter()
+        try:
+            self._cursor.execute(statement.text)
+        except Exception as exc:
+            if keyword in ("CREATE", "ALTER") and self.dialect.is_existing_object(exc):
+                self.report.existing += 1
+                return
+            raise PlanExecutionError(f"{self._where(script, statement)}: {exc}") from exc
+        self.report.statements += 1
+        if statement.kind == PLSQL:
+            for line in self.dialect.after_plsql(self._cursor):
+                self._emit(line)
+        elif keyword in ("SELECT", "WITH"):
+            self._print_rows()
+        elif keyword in _FEEDBACK_VERBS and self._cursor.rowcount >= 0:
+            self._spool_line(f"{self._cursor.rowcount} rows {_FEEDBACK_VERBS[keyword]}.")
+        self._spool_elapsed(started)
+
+    def _queue_insert(self, statement: Statement, script: Path) -> bool:
+        match = _SINGLE_ROW_INSERT.match(statement.text)
+        if match is None:
+            return False
+        table, column_text, body = match.groups()
+        columns = tuple(column.strip().upper() for column in column_text.split(","))
+        row = _parse_literals(body, self.dialect)
+        if row is None or len(row) != len(columns):
+            return False
+        header = (table.upper(), columns)
+        if self._batch is None or self._batch.header != header:
+            self._flush()
+            sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({self.dialect.placeholders(len(columns))})"
+            self._batch = _InsertBatch(header, sql, statement, script)
+        self._batch.rows.append(row)
+        if len(self._batch.rows) >= self.array_size:
+            self._flush()
+        return True
+
+    def _flush(self) -> None:
+        batch, self._batch = self._batch, None
+        if batch is None or not batch.rows:
+            return
+        try:
+            self._cursor.executemany(batch.sql, batch.rows)
+        except Exception as exc:
+            raise PlanExecutionError(
+                f"{self._where(batch.script, batch.first)}: lote de {len(batch.rows)} filas en {batch.header[0]}: {exc}"
+            ) from exc
+        self.report.batches += 1
+        self.report.bound_rows += len(batch.rows)
+        self.report.statements += 1
+        self._spool_line(f"{len(batch.rows)} rows created.")
+        self._spool_elapsed(batch.started)
+
+    def _print_rows(self) -> None:
+        if self._cursor.description is None:
+            return
+        names = [column[0] for column in self._cursor.description]
+        rows = self._cursor.fetchmany(QUERY_PREVIEW_ROWS)
+        self._emit(" | ".join(names))
+        for row in rows:
+            self._emit(" | ".join("" if value is None else str(value) for value in row))
+
+    def _emit(self, line: str) -> None:
+        self.echo(line)
+        self._spool_line(line)
+
+    def _spool_line(self, line: str) -> None:
+        if self._spool is not None:
+            self._spool.write(line + "\n")
+
+    def _spool_elapsed(self, started: float) -> None:
+        if not self._timing or self._spool is None:
+            return
+        elapsed = time.perf_counter() - started
+        minutes, seconds = divmod(elapsed, 60)
+        hours, minutes = divmod(int(minutes), 60)
+        self._spool.write(f"Elapsed: {hours:02d}:{minutes:02d}:{seconds:05.2f}\n")
+
+    def _close_spool(self) -> None:
+        if self._spool is not None:
+            self._spool.close()
+            self._spool = None
+
+    def _where(self, script: Path, statement: Statement) -> str:
+        try:
+            name = script.resolve().relative_to(self.root.resolve()).as_posix()
+        except ValueError:
+            name = str(script)
+        return f"{name}:{statement.line}"
+
+
+def connect(target: str, userid: Optional[str] = None, sqlite_db: Path = DEFAULT_SQLITE_DB) -> tuple[Any, Dialect]:
+    """Abre la conexion DB-API del destino; las credenciales Oracle usan el formato usuario/clave@tns."""
+    if target == "sqlite":
+        sqlite_db.parent.mkdir(parents=True, exist_ok=True)
+        return sqlite3.connect(sqlite_db, timeout=SQLITE_TIMEOUT), SqliteDialect()
+    if target != "oracle":
+        raise ValueError(f"Destino desconocido: {target}. Usa uno de {', '.join(TARGETS)}")
+
+    userid = userid or os.environ.get(USERID_ENV)
+    if not userid:
+        raise ValueError(f"Define {USERID_ENV}=usuario/clave@tns o pasa --userid para ejecutar sobre Oracle.")
+    user, _, rest = userid.partition("/")
+    password, _, dsn = rest.rpartition("@")
+    if not user or not password or not dsn:
+        raise ValueError("Credenciales invalidas: se espera usuario/clave@tns.")
+    try:
+        import oracledb
+    except ImportError as exc:
+        raise ValueError("El destino oracle requiere python-oracledb: pip install oracledb") from exc
+    return oracledb.connect(user=user, password=password, dsn=dsn), OracleDialect()
+
+
+def execute_plan(
+    plan_path: Path,
+    target: str,
+    userid: Optional[str] = None,
+    sqlite_db: Path = DEFAULT_SQLITE_DB,
+    array_size: int = DEFAULT_ARRAY_SIZE,
+    root: Path = ROOT,
+) -> ExecutionReport:
+    """Conecta, ejecuta el plan completo y cierra la conexion."""
+    connection, dialect = connect(target, userid=userid, sqlite_db=sqlite_db)
+    try:
+        return PlanExecutor(connection, dialect, root=root, array_size=array_size).run(plan_path)
+    finally:
+        connection.close()
+
+
+def describe_report(report: ExecutionReport) -> List[str]:
+    lines = [
+        f"Plan ejecutado en {report.elapsed:.1f} s: {report.scripts} scripts, {report.statements} sentencias, "
+        f"{report.bound_rows} filas en {report.batches} lotes executemany."
+    ]
+    if report.existing:
+        lines.append(f"DDL sobre objetos ya existentes (sin cambios): {report.existing}.")
+    if report.skipped:
+        lines.append(f"Omitidas por el destino: {report.skipped} (p.ej. {'; '.join(report.skipped_samples)}).")
+    return lines
+
+
+def _parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Ejecuta el plan del DW sobre una conexion DB-API.")
+    parser.add_argument("--plan", type=Path, default=DEFAULT_PLAN, help="Plan SQL*Plus a ejecutar.")
+    parser.add_argument("--target", choices=TARGETS, default="oracle", help="Destino de la ejecucion.")
+    parser.add_argument("--userid", help=f"usuario/clave@tns para Oracle (default: variable {USERID_ENV}).")
+    parser.add_argument("--sqlite-db", type=Path, default=DEFAULT_SQLITE_DB, help="Base SQLite local.")
+    parser.add_argument(
+        "--array-size",
+        type=int,
+        default=DEFAULT_ARRAY_SIZE,
+        help=f"Filas por lote executemany (default {DEFAULT_ARRAY_SIZE}).",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = _parse_args(argv)
+    try:
+        report = execute_plan(
+            args.plan, args.target, userid=args.userid, sqlite_db=args.sqlite_db, array_size=args.array_size
+        )
+    except (PlanExecutionError, ValueError) as exc:
+        raise SystemExit(f"Ejecucion detenida: {exc}") from exc
+    for line in describe_report(report):
+        print(line)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
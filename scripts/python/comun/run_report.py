@@ -0,0 +1,293 @@
+"""
+Reporte de tiempos por paso a partir del spool del plan (plan_ejecucion_dw.sql).
+
+build_plan_file marca cada paso con PROMPT ETL_PASO|n|script y activa SET TIMING ON; los MERGE
+de la carga del DW escriben ETL_FILAS|tabla|filas|segundos via DBMS_OUTPUT. Este modulo lee el
+spool (de SQL*Plus o el que escribe comun/plan_executor.py con el mismo formato) y produce:
+ - por paso: segundos (suma de las lineas Elapsed/Transcurrido), filas (mensajes de feedback
+   "N rows created/merged/updated" y lineas ETL_FILAS), filas por segundo y, aparte, filas
+   borradas ("N rows deleted": el DELETE previo a una recarga no cuenta como trabajo del paso);
+ - por objeto instrumentado (ETL_FILAS): filas y segundos de cada MERGE.
+
+Cada corrida se agrega a un historial JSON Lines; un paso u objeto se marca como regresion si
+tarda mas que la mediana de las ultimas corridas por encima del umbral relativo y del minimo
+absoluto (para no alertar por ruido en pasos de milisegundos).
+
+Uso (desde la raiz del repo):
+    python scripts/python/comun/run_report.py data/output/logs/plan_ejecucion_dw.log --threshold 0.25
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import re
+import statistics
+import sys
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+ROOT = Path(__file__).resolve().parents[3]
+LOG_DIR = ROOT / "data" / "output" / "logs"
+DEFAULT_SPOOL = LOG_DIR / "plan_ejecucion_dw.log"
+DEFAULT_HISTORY = LOG_DIR / "run_history.jsonl"
+STEP_MARKER = "ETL_PASO"
+END_MARKER = "ETL_FIN"
+ROWS_MARKER = "ETL_FILAS"
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_MIN_SECONDS = 1.0
+DEFAULT_WINDOW = 5
+
+_STEP = re.compile(rf"^{STEP_MARKER}\|(\d+)\|(.+?)\s*$")
+_END = re.compile(rf"^{END_MARKER}\s*$")
+_ROWS = re.compile(rf"^{ROWS_MARKER}\|([^|]+)\|(\d+)\|([\d.,]+)\s*$")
+_ELAPSED = re.compile(r"^(?:Elapsed|Transcurrido):\s*(\d+):(\d+):(\d+(?:[.,]\d+)?)\s*$", re.I)
+# Feedback de SQL*Plus en ingles o espanol; las filas seleccionadas no cuentan y las borradas van aparte.
+_FEEDBACK = re.compile(
+    r"^(\d+) (?:rows?|filas?) (?:created|inserted|merged|updated"
+    r"|cread[ao]s?|insertad[ao]s?|fusionad[ao]s?|actualizad[ao]s?)\.",
+    re.I,
+)
+_DELETED = re.compile(r"^(\d+) (?:rows?|filas?) (?:deleted|suprimid[ao]s?|eliminad[ao]s?|borrad[ao]s?)\.", re.I)
+
+
+@dataclass
+class ObjectTiming:
+    objeto: str
+    filas: int
+    segundos: float
+
+
+@dataclass
+class StepTiming:
+    paso: int
+    script: str
+    segundos: float = 0.0
+    filas: int = 0
+    borradas: int = 0
+    objetos: List[ObjectTiming] = field(default_factory=list)
+
+    @property
+    def filas_por_segundo(self) -> Optional[float]:
+        return self.filas / self.segundos if self.segundos > 0 else None
+
+
+@dataclass
+class Regression:
+    clave: str
+    segundos: float
+    referencia: float
+    corridas: int
+
+    @property
+    def variacion(self) -> Optional[float]:
+        return self.segundos / self.referencia - 1 if self.referencia > 0 else None
+
+
+def _seconds(hours: str, minutes: str, seconds: str) -> float:
+    return int(hours) * 3600 + int(minutes) * 60 + float(seconds.replace(",", "."))
+
+
+def parse_spool_lines(lines: Iterable[str]) -> List[StepTiming]:
+    """Pasos del spool en orden; lo que aparece antes del primer marcador o tras ETL_FIN se ignora."""
+    steps: List[StepTiming] = []
+    current: Optional[StepTiming] = None
+    for raw in lines:
+        line = raw.strip()
+        step = _STEP.match(line)
+        if step:
+            current = StepTiming(int(step.group(1)), step.group(2))
+            steps.append(current)
+            continue
+        if current is None:
+            continue
+        if _END.match(line):
+            current = None
+            continue
+        elapsed = _ELAPSED.match(line)
+        if elapsed:
+            current.segundos += _seconds(*elapsed.groups())
+            continue
+        rows = _ROWS.match(line)
+        if rows:
+            filas = int(rows.group(2))
+            current.objetos.append(ObjectTiming(rows.group(1), filas, float(rows.group(3).replace(",", "."))))
+            current.filas += filas
+            continue
+        feedback = _FEEDBACK.match(line)
+        if feedback:
+            current.filas += int(feedback.group(1))
+            continue
+        deleted = _DELETED.match(line)
+        if deleted:
+            current.borradas += int(deleted.group(1))
+    for step in steps:
+        step.segundos = round(step.segundos, 3)
+    return steps
+
+
+def parse_spool(path: Path) -> List[StepTiming]:
+    # El spool hereda la codificacion del cliente (NLS_LANG); los marcadores son ASCII.
+    with path.open("r", encoding="utf-8", errors="replace") as fh:
+        return parse_spool_lines(fh)
+
+
+def _durations(steps: Sequence[StepTiming]) -> Dict[str, float]:
+    """Duraciones por clave: el script para pasos y 'script:objeto' para MERGE instrumentados."""
+    durations: Dict[str, float] = {}
+    for step in steps:
+        # El numero de paso cambia entre planes full e incremental; el script no.
+        key = step.script
+        durations[key] = step.segundos
+        for item in step.objetos:
+            durations[f"{key}:{item.objeto}"] = durations.get(f"{key}:{item.objeto}", 0.0) + item.segundos
+    return durations
+
+
+def load_history(path: Path) -> List[Dict[str, float]]:
+    """Duraciones de las corridas previas (mas antigua primero)."""
+    if not path.exists():
+        return []
+    runs: List[Dict[str, float]] = []
+    with path.open("r", encoding="utf-8") as fh:
+        for line in fh:
+            if line.strip():
+                runs.append(json.loads(line)["duraciones"])
+    return runs
+
+
+def find_regressions(
+    steps: Sequence[StepTiming],
+    history: Sequence[Dict[str, float]],
+    threshold: float = DEFAULT_THRESHOLD,
+    min_seconds: float = DEFAULT_MIN_SECONDS,
+    window: int = DEFAULT_WINDOW,
+) -> List[Regression]:
+    """Compara cada paso/objeto con la mediana de sus ultimas `window` corridas."""
+    regressions: List[Regression] = []
+    for key, seconds in _durations(steps).items():
+        previous = [run[key] for run in history if key in run][-window:]
+        if not previous:
+            continue
+        reference = statistics.median(previous)
+        if seconds > reference * (1 + threshold) and seconds - reference >= min_seconds:
+            regressions.append(Regression(key, seconds, reference, len(previous)))
+    return regressions
+
+
+def append_history(path: Path, steps: Sequence[StepTiming], generated: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as fh:
+        fh.write(json.dumps({"generado": generated, "duraciones": _durations(steps)}, ensure_ascii=False) + "\n")
+
+
+def write_json(path: Path, steps: Sequence[StepTiming], regressions: Sequence[Regression], generated: str) -> None:
+    payload = {
+        "generado": generated,
+        "total_segundos": round(sum(step.segundos for step in steps), 3),
+        "pasos": [{**asdict(step), "filas_por_segundo": step.filas_por_segundo} for step in steps],
+        "regresiones": [{**asdict(item), "variacion": item.variacion} for item in regressions],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+
+def write_csv(path: Path, steps: Sequence[StepTiming]) -> None:
+    """Una fila por paso y una por objeto instrumentado (columna objeto vacia en los pasos)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8", newline="") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(["paso", "script", "objeto", "segundos", "filas", "borradas", "filas_por_segundo"])
+        for step in steps:
+            rate = "" if step.filas_por_segundo is None else f"{step.filas_por_segundo:.1f}"
+            writer.writerow([step.paso, step.script, "", step.segundos, step.filas, step.borradas, rate])
+            for item in step.objetos:
+                item_rate = f"{item.filas / item.segundos:.1f}" if item.segundos > 0 else ""
+                writer.writerow([step.paso, step.script, item.objeto, item.segundos, item.filas, "", item_rate])
+
+
+def build_report(
+    spool: Path,
+    history_path: Optional[Path] = DEFAULT_HISTORY,
+    threshold: float = DEFAULT_THRESHOLD,
+    min_seconds: float = DEFAULT_MIN_SECONDS,
+    window: int = DEFAULT_WINDOW,
+) -> tuple[List[StepTiming], List[Regression], Dict[str, Path]]:
+    """
+    Lee el spool, escribe <spool>_report.json/.csv, compara con el historial y agrega la corrida.
+    Con history_path=None no se compara ni se registra.
+    """
+    steps = parse_spool(spool)
+    if not steps:
+        raise ValueError(f"El spool {spool} no tiene marcadores {STEP_MARKER}; genera el plan con build_plan_file.")
+    generated = datetime.now().isoformat(timespec="seconds")
+    regressions: List[Regression] = []
+    if history_path is not None:
+        regressions = find_regressions(steps, load_history(history_path), threshold, min_seconds, window)
+    outputs = {
+        "json": spool.with_name(f"{spool.stem}_report.json"),
+        "csv": spool.with_name(f"{spool.stem}_report.csv"),
+    }
+    write_json(outputs["json"], steps, regressions, generated)
+    write_csv(outputs["csv"], steps)
+    if history_path is not None:
+        append_history(history_path, steps, generated)
+    return steps, regressions, outputs
+
+
+def describe(steps: Sequence[StepTiming], regressions: Sequence[Regression], top: int = 5) -> List[str]:
+    lines = [f"Total: {sum(step.segundos for step in steps):.2f} s en {len(steps)} pasos. Pasos mas lentos:"]
+    for step in sorted(steps, key=lambda item: item.segundos, reverse=True)[:top]:
+        rate = step.filas_por_segundo
+        throughput = f", {rate:.0f} filas/s" if rate else ""
+        deleted = f" ({step.borradas} borradas)" if step.borradas else ""
+        lines.append(f"  {step.paso:>2} {step.script}: {step.segundos:.2f} s, {step.filas} filas{throughput}{deleted}")
+    for item in regressions:
+        lines.append(
+            f"REGRESION {item.clave}: {item.segundos:.2f} s vs mediana {item.referencia:.2f} s "
+            f"({'nuevo' if item.variacion is None else format(item.variacion, '+.0%')}, {item.corridas} corridas previas)"
+        )
+    return lines
+
+
+def _parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Reporte de tiempos por paso a partir del spool del plan.")
+    parser.add_argument("spool", nargs="?", type=Path, default=DEFAULT_SPOOL, help="Spool del plan.")
+    parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY, help="Historial JSON Lines de corridas.")
+    parser.add_argument("--no-history", action="store_true", help="No comparar ni registrar la corrida.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"Aumento relativo sobre la mediana que cuenta como regresion (default {DEFAULT_THRESHOLD}).",
+    )
+    parser.add_argument(
+        "--min-seconds",
+        type=float,
+        default=DEFAULT_MIN_SECONDS,
+        help=f"Aumento absoluto minimo para marcar regresion (default {DEFAULT_MIN_SECONDS}).",
+    )
+    parser.add_argument("--window", type=int, default=DEFAULT_WINDOW, help="Corridas previas a comparar.")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Termina con codigo 1 si hay regresiones.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = _parse_args(argv)
+    history = None if args.no_history else args.history
+    try:
+        steps, regressions, outputs = build_report(args.spool, history, args.threshold, args.min_seconds, args.window)
+    except (OSError, ValueError) as exc:
+        raise SystemExit(str(exc)) from exc
+    for line in describe(steps, regressions):
+        print(line)
+    print(f"Reporte: {outputs['json']} / {outputs['csv']}")
+    if regressions and args.fail_on_regression:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,167 @@
+"""
+Manejo de secuencias Oracle para los generadores de carga y el DDL del DW.
+
+Los cargadores insertan ids explicitos (CIUDAD, PROVINCIAS, CANTONES, PARROQUIAS), asi que al
+terminar cada secuencia debe quedar por encima del MAX(id) de su tabla para que los triggers no
+repitan claves. realign_block lo hace en un numero fijo de pasos por secuencia, sin importar el
+MAX(id):
+ - increment: un NEXTVAL, ALTER SEQUENCE ... INCREMENT BY (MAX - actual), otro NEXTVAL y vuelta a
+   INCREMENT BY 1 (cualquier version de Oracle);
+ - restart: ALTER SEQUENCE ... RESTART START WITH MAX + 1 (Oracle 18c o superior).
+
+El bucle anterior pedia un NEXTVAL por id (O(MAX(id)) cambios de contexto).
+
+cache_size elige el CACHE segun el volumen que se espera cargar: una secuencia NOCACHE escribe
+en el diccionario en cada NEXTVAL, y en la tabla de hechos eso es un viaje por fila.
+
+Uso (desde la raiz del repo), para ajustar el CACHE de un DW ya creado a un volumen mayor:
+    python scripts/python/comun/sequences.py --expect SEQ_DW_FACT_VENTAS=20000000 SEQ_DW_DIM_UBICACION=500000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence
+
+REALIGN_MODES = ("increment", "restart")
+DEFAULT_REALIGN_MODE = "increment"
+# (filas esperadas hasta, CACHE). Por encima del ultimo escalon se usa MAX_CACHE.
+CACHE_STEPS = ((1_000, 20), (100_000, 100), (10_000_000, 1_000))
+MAX_CACHE = 10_000
+# ORA-02289: la secuencia no existe (p.ej. el DW aun no se creo).
+_MISSING_SEQUENCE = -2289
+
+
+@dataclass(frozen=True)
+class SequenceSpec:
+    name: str
+    table: str = ""
+    column: str = ""
+    expected_rows: int = 0
+
+    @property
+    def cache(self) -> int:
+        return cache_size(self.expected_rows)
+
+
+def cache_size(expected_rows: int) -> int:
+    """CACHE para una secuencia que entregara ~expected_rows valores por carga (minimo 20, el default de Oracle)."""
+    for limit, cache in CACHE_STEPS:
+        if expected_rows <= limit:
+            return cache
+    return MAX_CACHE
+
+
+def create_sequence(spec: SequenceSpec) -> str:
+    return f"CREATE SEQUENCE {spec.name} START WITH 1 INCREMENT BY 1 CACHE {spec.cache} NOCYCLE;"
+
+
+def _realign_procedure(mode: str) -> List[str]:
+    lines = [
+        "    PROCEDURE realinear(",
+        "        p_secuencia IN VARCHAR2, p_tabla IN VARCHAR2, p_columna IN VARCHAR2, p_cache IN PLS_INTEGER",
+        "    ) IS",
+        "        v_target  NUMBER;",
+        "        v_current NUMBER;",
+        "    BEGIN",
+        "        EXECUTE IMMEDIATE 'SELECT NVL(MAX(' || p_columna || '), 0) FROM ' || p_tabla INTO v_target;",
+    ]
+    if mode == "restart":
+        lines.append(
+            "        EXECUTE IMMEDIATE 'ALTER SEQUENCE ' || p_secuencia || ' RESTART START WITH ' || (v_target + 1);"
+        )
+    else:
+        lines.extend(
+            [
+                "        EXECUTE IMMEDIATE 'SELECT ' || p_secuencia || '.NEXTVAL FROM DUAL' INTO v_current;",
+                "        IF v_current < v_target THEN",
+                "            EXECUTE IMMEDIATE 'ALTER SEQUENCE ' || p_secuencia || ' INCREMENT BY ' || (v_target - v_current);",
+                "            EXECUTE IMMEDIATE 'SELECT ' || p_secuencia || '.NEXTVAL FROM DUAL' INTO v_current;",
+                "            EXECUTE IMMEDIATE 'ALTER SEQUENCE ' || p_secuencia || ' INCREMENT BY 1';",
+                "        END IF;",
+            ]
+        )
+    lines.extend(
+        [
+            "        EXECUTE IMMEDIATE 'ALTER SEQUENCE ' || p_secuencia || ' CACHE ' || p_cache;",
+            "    END;",
+        ]
+    )
+    return lines
+
+
+def realign_block(specs: Iterable[SequenceSpec], mode: str = DEFAULT_REALIGN_MODE) -> str:
+    """
+    Bloque PL/SQL que deja cada secuencia por encima del MAX(column) de su tabla y fija su CACHE.
+    Cada secuencia cuesta a lo sumo tres ALTER/NEXTVAL, sin importar cuantos ids se cargaron.
+    """
+    if mode not in REALIGN_MODES:
+        raise ValueError(f"Modo de realineacion desconocido: {mode}. Usa uno de {', '.join(REALIGN_MODES)}")
+    specs = list(specs)
+    incomplete = [spec.name for spec in specs if not spec.table or not spec.column]
+    if incomplete:
+        raise ValueError(f"Faltan tabla/columna para realinear: {', '.join(incomplete)}")
+    lines = ["DECLARE", *_realign_procedure(mode), "BEGIN"]
+    for spec in specs:
+        lines.append(f"    realinear('{spec.name}', '{spec.table}', '{spec.column}', {spec.cache});")
+    lines.extend(["END;", "/"])
+    return "\n".join(lines)
+
+
+def cache_block(specs: Iterable[SequenceSpec]) -> str:
+    """Bloque PL/SQL que ajusta el CACHE de cada secuencia; omite las que aun no existen."""
+    lines = ["BEGIN"]
+    for spec in specs:
+        lines.extend(
+            [
+                "    BEGIN",
+                f"        EXECUTE IMMEDIATE 'ALTER SEQUENCE {spec.name} CACHE {spec.cache}';",
+                "    EXCEPTION",
+                "        WHEN OTHERS THEN",
+                f"            IF SQLCODE != {_MISSING_SEQUENCE} THEN",
+                "                RAISE;",
+                "            END IF;",
+                "    END;",
+            ]
+        )
+    lines.extend(["END;", "/"])
+    return "\n".join(lines)
+
+
+def _parse_expect(text: str) -> SequenceSpec:
+    name, _, rows = text.partition("=")
+    if not name or not rows.isdigit():
+        raise argparse.ArgumentTypeError(f"Se esperaba SECUENCIA=FILAS: {text}")
+    return SequenceSpec(name.strip().upper(), expected_rows=int(rows))
+
+
+def _parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Emite el ajuste de CACHE de secuencias segun el volumen esperado.")
+    parser.add_argument(
+        "--expect",
+        type=_parse_expect,
+        nargs="+",
+        required=True,
+        metavar="SECUENCIA=FILAS",
+        help="Secuencias y filas esperadas por carga.",
+    )
+    parser.add_argument("--output", type=Path, help="Archivo .sql de salida (default: stdout).")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = _parse_args(argv)
+    block = cache_block(args.expect) + "\n"
+    if args.output is None:
+        sys.stdout.write(block)
+        return
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(block, encoding="utf-8")
+    print(f"Ajuste de secuencias: {args.output}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
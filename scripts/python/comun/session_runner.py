@@ -0,0 +1,220 @@
+"""
+Ejecuta el plan dividido por sesiones (build_session_plans en run_full_etl_pipeline.py).
+
+Lee sesiones.json y lanza cada script de sesion en su propia conexion apenas terminan las
+sesiones de las que depende (comun/dag.py), con hasta --sessions sesiones a la vez. Asi el plan
+tarda lo que su camino critico (p.ej. CIUDAD + CLIENTES + carga del DW) y no la suma de los pasos.
+
+Destinos:
+ - sqlplus: un proceso "sqlplus -S -L usuario/clave@tns @sesion_NN.sql" por sesion (credenciales
+   en la variable DW_USERID o --userid), desde la raiz del repo;
+ - oracle / sqlite: una conexion DB-API por sesion con comun/plan_executor.py (mismas reglas que
+   --execute: se detiene en el primer error).
+
+Al terminar une los spools de las sesiones, en orden de ejecucion, en el spool del plan
+secuencial, de modo que comun/run_report.py reporta los pasos igual que con el plan de una sesion.
+
+Uso (desde la raiz del repo):
+    DW_USERID=usuario/clave@tns python scripts/python/comun/session_runner.py --target sqlplus --sessions 4
+    python scripts/python/comun/session_runner.py --target sqlite --sqlite-db /tmp/dw.sqlite
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from comun import dag, plan_executor
+
+ROOT = Path(__file__).resolve().parents[3]
+DEFAULT_MANIFEST = ROOT / "data" / "output" / "plan_ejecucion_dw_sesiones" / "sesiones.json"
+TARGETS = ("sqlplus", *plan_executor.TARGETS)
+DEFAULT_SESSIONS = 4
+SQLPLUS = "sqlplus"
+_PRINT_LOCK = threading.Lock()
+
+
+class SessionError(RuntimeError):
+    """Una sesion fallo; las sesiones que dependian de ella no se lanzaron."""
+
+
+@dataclass
+class SessionTiming:
+    nombre: str
+    pasos: List[str]
+    inicio: float
+    segundos: float
+
+
+@dataclass
+class SessionRunReport:
+    sesiones: List[SessionTiming] = field(default_factory=list)
+    elapsed: float = 0.0
+    camino_critico: float = 0.0
+    camino: List[str] = field(default_factory=list)
+    spool: Optional[Path] = None
+
+    @property
+    def serial(self) -> float:
+        """Lo que habria tardado el mismo trabajo en una sola sesion."""
+        return sum(session.segundos for session in self.sesiones)
+
+
+def load_manifest(path: Path) -> Dict[str, Any]:
+    if not path.exists():
+        raise FileNotFoundError(f"No existe el manifiesto de sesiones {path}; genera el plan con run_full_etl_pipeline.py.")
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _run_sqlplus(script: Path, userid: str, root: Path) -> None:
+    try:
+        completed = subprocess.run(
+            [SQLPLUS, "-S", "-L", userid, f"@{script.relative_to(root).as_posix()}"],
+            cwd=root,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,  # la salida queda en el spool de la sesion
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+    except FileNotFoundError as exc:
+        raise SessionError(f"No se encontro {SQLPLUS} en el PATH.") from exc
+    if completed.returncode != 0:
+        raise SessionError(f"{script.name}: sqlplus termino con codigo {completed.returncode}: {completed.stderr.strip()}")
+
+
+def _run_executor(
+    script: Path, name: str, target: str, userid: Optional[str], sqlite_db: Path, array_size: int, root: Path
+) -> None:
+    def echo(line: str) -> None:
+        with _PRINT_LOCK:
+            print(f"[{name}] {line}")
+
+    connection, dialect = plan_executor.connect(target, userid=userid, sqlite_db=sqlite_db)
+    try:
+        plan_executor.PlanExecutor(connection, dialect, root=root, array_size=array_size, echo=echo).run(script)
+    except plan_executor.PlanExecutionError as exc:
+        raise SessionError(f"{name}: {exc}") from exc
+    finally:
+        connection.close()
+
+
+def merge_spools(manifest: Dict[str, Any], order: Sequence[str], root: Path = ROOT) -> Path:
+    """Concatena los spools de las sesiones (en el orden dado) en el spool del plan."""
+    spools = {session["nombre"]: root / session["spool"] for session in manifest["sesiones"]}
+    target = root / manifest["spool"]
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with target.open("w", encoding="utf-8") as out:
+        for name in order:
+            if spools[name].exists():
+                out.write(spools[name].read_text(encoding="utf-8"))
+    return target
+
+
+def run_sessions(
+    manifest_path: Path = DEFAULT_MANIFEST,
+    target: str = "sqlplus",
+    userid: Optional[str] = None,
+    sqlite_db: Path = plan_executor.DEFAULT_SQLITE_DB,
+    sessions: int = DEFAULT_SESSIONS,
+    array_size: int = plan_executor.DEFAULT_ARRAY_SIZE,
+    root: Path = ROOT,
+) -> SessionRunReport:
+    """Ejecuta las sesiones del manifiesto respetando sus dependencias y une sus spools."""
+    if target not in TARGETS:
+        raise ValueError(f"Destino desconocido: {target}. Usa uno de {', '.join(TARGETS)}")
+    manifest = load_manifest(manifest_path)
+    if target == "sqlplus":
+        userid = userid or os.environ.get(plan_executor.USERID_ENV)
+        if not userid:
+            raise ValueError(f"Define {plan_executor.USERID_ENV}=usuario/clave@tns o pasa --userid para usar sqlplus.")
+
+    def session_fn(script: Path, name: str):
+        if target == "sqlplus":
+            return lambda: _run_sqlplus(script, userid, root)
+        return lambda: _run_executor(script, name, target, userid, sqlite_db, array_size, root)
+
+    tasks = [
+        dag.Task(session["nombre"], tuple(session["depende_de"]), session_fn(root / session["script"], session["nombre"]))
+        for session in manifest["sesiones"]
+    ]
+    steps = {session["nombre"]: session["pasos"] for session in manifest["sesiones"]}
+    for session in manifest["sesiones"]:
+        (root / session["spool"]).unlink(missing_ok=True)
+    start = time.perf_counter()
+    try:
+        results = dag.run_tasks(tasks, workers=sessions)
+    finally:
+        # Tambien tras un error: el spool parcial sirve para diagnosticar.
+        spool = merge_spools(manifest, [task.name for task in dag.topological_order(tasks)], root)
+    report = SessionRunReport(elapsed=round(time.perf_counter() - start, 3), spool=spool)
+    for result in sorted(results.values(), key=lambda item: item.inicio):
+        report.sesiones.append(SessionTiming(result.name, steps[result.name], result.inicio, result.segundos))
+    durations = {result.name: result.segundos for result in results.values()}
+    report.camino_critico, report.camino = dag.critical_path(tasks, durations)
+    report.camino_critico = round(report.camino_critico, 3)
+    return report
+
+
+def describe_sessions(report: SessionRunReport) -> List[str]:
+    lines = [
+        f"Plan por sesiones en {report.elapsed:.1f} s (suma de sesiones {report.serial:.1f} s, "
+        f"camino critico {report.camino_critico:.1f} s: {' -> '.join(report.camino)})."
+    ]
+    for session in report.sesiones:
+        pasos = ", ".join(Path(step).name for step in session.pasos) or "apertura/cierre"
+        lines.append(f"  {session.nombre}: +{session.inicio:.1f} s, {session.segundos:.1f} s ({pasos})")
+    return lines
+
+
+def _parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Ejecuta el plan del DW en sesiones paralelas.")
+    parser.add_argument("--manifest", type=Path, default=DEFAULT_MANIFEST, help="sesiones.json del plan.")
+    parser.add_argument("--target", choices=TARGETS, default="sqlplus", help="Destino de la ejecucion.")
+    parser.add_argument("--userid", help=f"usuario/clave@tns (default: variable {plan_executor.USERID_ENV}).")
+    parser.add_argument("--sqlite-db", type=Path, default=plan_executor.DEFAULT_SQLITE_DB, help="Base SQLite local.")
+    parser.add_argument(
+        "--sessions",
+        type=int,
+        default=DEFAULT_SESSIONS,
+        help=f"Sesiones simultaneas como maximo (default {DEFAULT_SESSIONS}).",
+    )
+    parser.add_argument(
+        "--array-size",
+        type=int,
+        default=plan_executor.DEFAULT_ARRAY_SIZE,
+        help=f"Filas por lote executemany con oracle/sqlite (default {plan_executor.DEFAULT_ARRAY_SIZE}).",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = _parse_args(argv)
+    try:
+        report = run_sessions(
+            args.manifest,
+            args.target,
+            userid=args.userid,
+            sqlite_db=args.sqlite_db,
+            sessions=args.sessions,
+            array_size=args.array_size,
+        )
+    except (SessionError, ValueError, FileNotFoundError) as exc:
+        raise SystemExit(f"Ejecucion detenida: {exc}") from exc
+    for line in describe_sessions(report):
+        print(line)
+    print(f"Spool unificado: {report.spool}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
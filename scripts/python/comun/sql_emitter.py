@@ -0,0 +1,158 @@
+"""
+Emisor de sentencias INSERT para los catalogos generados (CIUDAD, PROVINCIAS, CANTONES, PARROQUIAS).
+
+Soporta tres modos de salida:
+ - row: un INSERT por fila (formato historico).
+ - insert_all: bloques INSERT ALL ... SELECT 1 FROM DUAL con batch_size filas cada uno.
+ - forall: bloques PL/SQL con colecciones por columna y un FORALL por lote.
+
+Los modos por lote reducen miles de sentencias a unas pocas, evitando un parse y un
+round-trip de SQL*Plus por cada fila.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Iterator, List, Optional, Sequence
+
+INSERT_MODES = ("row", "insert_all", "forall")
+DEFAULT_INSERT_MODE = "row"
+DEFAULT_BATCH_SIZE = 500
+# SQL*Plus limita el largo de cada linea; las colecciones se parten en lineas cortas.
+_MAX_LINE_WIDTH = 200
+
+
+def sql_literal(value: Optional[str | float | int]) -> str:
+    """Convierte un valor Python en literal SQL de Oracle."""
+    if value is None:
+        return "NULL"
+    if isinstance(value, str):
+        return "'" + value.replace("'", "''") + "'"
+    return str(value)
+
+
+def _chunks(rows: Iterable[Sequence[object]], size: int) -> Iterator[List[Sequence[object]]]:
+    batch: List[Sequence[object]] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _wrap_values(values: List[str], indent: str) -> List[str]:
+    lines: List[str] = []
+    current = ""
+    for value in values:
+        piece = value if not current else f"{current}, {value}"
+        if current and len(indent) + len(piece) > _MAX_LINE_WIDTH:
+            lines.append(f"{indent}{current},")
+            current = value
+        else:
+            current = piece
+    if current:
+        lines.append(f"{indent}{current}")
+    return lines
+
+
+def _insert_all_block(table: str, columns: Sequence[str], batch: List[Sequence[object]]) -> str:
+    column_list = ", ".join(columns)
+    lines = ["INSERT ALL"]
+    for row in batch:
+        values = ", ".join(sql_literal(value) for value in row)
+        lines.append(f"    INTO {table} ({column_list}) VALUES ({values})")
+    lines.append("SELECT 1 FROM DUAL;")
+    return "\n".join(lines)
+
+
+def _forall_block(table: str, columns: Sequence[str], batch: List[Sequence[object]]) -> str:
+    lines = ["DECLARE"]
+    for column in columns:
+        lines.append(f"    TYPE t_{column.lower()} IS TABLE OF {table}.{column}%TYPE;")
+    for idx, column in enumerate(columns):
+        name = column.lower()
+        lines.append(f"    l_{name} t_{name} := t_{name}(")
+        lines.extend(_wrap_values([sql_literal(row[idx]) for row in batch], " " * 8))
+        lines.append("    );")
+    first = f"l_{columns[0].lower()}"
+    binds = ", ".join(f"l_{column.lower()}(i)" for column in columns)
+    lines.append("BEGIN")
+    lines.append(f"    FORALL i IN 1 .. {first}.COUNT")
+    lines.append(f"        INSERT INTO {table} ({', '.join(columns)}) VALUES ({binds});")
+    lines.append("END;")
+    lines.append("/")
+    return "\n".join(lines)
+
+
+def insert_statements(
+    table: str,
+    columns: Sequence[str],
+    rows: Iterable[Sequence[object]],
+    mode: str = DEFAULT_INSERT_MODE,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[str]:
+    """
+    Genera las sentencias para insertar rows en table, una por elemento (sin salto final).
+    Cada fila debe traer los valores en el mismo orden que columns.
+    """
+    if mode not in INSERT_MODES:
+        raise ValueError(f"Modo de insercion desconocido: {mode}. Usa uno de {', '.join(INSERT_MODES)}")
+    if batch_size < 1:
+        raise ValueError("batch_size debe ser mayor que cero")
+
+    if mode == "row":
+        column_list = ", ".join(columns)
+        for row in rows:
+            values = ", ".join(sql_literal(value) for value in row)
+            yield f"INSERT INTO {table} ({column_list}) VALUES ({values});"
+        return
+
+    build_block = _insert_all_block if mode == "insert_all" else _forall_block
+    for batch in _chunks(rows, batch_size):
+        yield build_block(table, columns, batch)
+
+
+def merge_statements(
+    table: str,
+    columns: Sequence[str],
+    key_columns: Sequence[str],
+    rows: Iterable[Sequence[object]],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[str]:
+    """
+    Genera MERGE por lote (USING SELECT ... FROM DUAL UNION ALL ...): actualiza las filas
+    existentes segun key_columns e inserta las nuevas.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size debe ser mayor que cero")
+    update_columns = [column for column in columns if column not in key_columns]
+    on_clause = " AND ".join(f"t.{column} = s.{column}" for column in key_columns)
+    for batch in _chunks(rows, batch_size):
+        lines = [f"MERGE INTO {table} t", "USING ("]
+        for idx, row in enumerate(batch):
+            prefix = "    SELECT" if idx == 0 else "    UNION ALL SELECT"
+            values = ", ".join(f"{sql_literal(value)} {column}" for column, value in zip(columns, row))
+            lines.append(f"{prefix} {values} FROM DUAL")
+        lines.append(") s")
+        lines.append(f"ON ({on_clause})")
+        if update_columns:
+            lines.append(
+                "WHEN MATCHED THEN UPDATE SET " + ", ".join(f"t.{column} = s.{column}" for column in update_columns)
+            )
+        lines.append(
+            f"WHEN NOT MATCHED THEN INSERT ({', '.join(columns)}) "
+            f"VALUES ({', '.join(f's.{column}' for column in columns)});"
+        )
+        yield "\n".join(lines)
+
+
+def in_list_statements(template: str, keys: Iterable[object], batch_size: int = 1000) -> Iterator[str]:
+    """
+    Aplica template (con el marcador {keys}) a grupos de claves, p.ej.
+    "DELETE FROM CIUDAD WHERE CIUDADID IN ({keys});". Oracle admite hasta 1000 elementos por IN.
+    """
+    size = max(1, min(batch_size, 1000))
+    for batch in _chunks(([key] for key in keys), size):
+        lines = _wrap_values([sql_literal(item[0]) for item in batch], "    ")
+        yield template.format(keys="\n" + "\n".join(lines) + "\n")
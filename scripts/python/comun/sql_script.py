@@ -0,0 +1,202 @@
+"""
+Separa scripts SQL*Plus en sentencias ejecutables por un driver DB-API.
+
+Reglas (las mismas que aplica SQL*Plus a los scripts del repo):
+ - una sentencia SQL termina en ';' fuera de textos y comentarios, o en una linea con solo '/';
+ - un bloque PL/SQL (DECLARE, BEGIN, CREATE [OR REPLACE] FUNCTION/PROCEDURE/PACKAGE/TRIGGER/TYPE)
+   termina en una linea con solo '/'; los ';' internos no lo cortan;
+ - una linea '/' sin sentencia pendiente (re-ejecucion del buffer) se ignora;
+ - las lineas @archivo / @@archivo y los comandos de SQL*Plus (SET, PROMPT, HOST, ...) se
+   devuelven como comandos para que el ejecutor decida que hacer con ellos.
+
+El texto de las sentencias SQL se entrega sin el ';' final; el de los bloques PL/SQL conserva
+el 'END;' (los drivers lo exigen asi).
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional
+
+SQL, PLSQL, COMMAND = "sql", "plsql", "command"
+
+SQLPLUS_COMMANDS = frozenset(
+    {
+        "ACCEPT", "BREAK", "BTITLE", "CLEAR", "COL", "COLUMN", "COMPUTE", "DEFINE", "EXEC", "EXECUTE",
+        "EXIT", "HOST", "PAUSE", "PRO", "PROMPT", "QUIT", "REM", "REMARK", "SET", "SHOW", "SPOOL",
+        "START", "TTITLE", "UNDEFINE", "VAR", "VARIABLE", "WHENEVER",
+    }
+)  # fmt: skip
+
+_PLSQL_HEAD = re.compile(
+    r"(?:DECLARE|BEGIN)\b"
+    r"|CREATE\s+(?:OR\s+REPLACE\s+)?(?:(?:NON)?EDITIONABLE\s+)?(?:FUNCTION|PROCEDURE|PACKAGE|TRIGGER|TYPE)\b",
+    re.I,
+)
+_Q_CLOSERS = {"[": "]", "{": "}", "(": ")", "<": ">"}
+
+
+@dataclass(frozen=True)
+class Statement:
+    kind: str  # SQL, PLSQL o COMMAND
+    text: str
+    line: int  # linea (1-based) donde empieza en el script
+
+    @property
+    def keyword(self) -> str:
+        """Primera palabra en mayusculas (p.ej. INSERT, MERGE, PROMPT, @)."""
+        if self.text.startswith("@"):
+            return "@@" if self.text.startswith("@@") else "@"
+        head = self.text.split(None, 1)
+        return head[0].upper().rstrip(";") if head else ""
+
+
+class _Scanner:
+    """Sigue textos y comentarios entre lineas para encontrar el ';' que cierra una sentencia."""
+
+    def __init__(self) -> None:
+        self.quote: Optional[str] = None  # "'" o el cierre de un literal q'[...]'
+        self.block_comment = False
+
+    def find_terminator(self, line: str) -> int:
+        """Posicion del primer ';' fuera de textos/comentarios en line, o -1."""
+        pos, size = 0, len(line)
+        while pos < size:
+            if self.block_comment:
+                end = line.find("*/", pos)
+                if end < 0:
+                    return -1
+                self.block_comment = False
+                pos = end + 2
+                continue
+            if self.quote == "'":
+                end = line.find("'", pos)
+                if end < 0:
+                    return -1
+                if line.startswith("''", end):
+                    pos = end + 2
+                    continue
+                self.quote = None
+                pos = end + 1
+                continue
+            if self.quote is not None:
+                end = line.find(self.quote + "'", pos)
+                if end < 0:
+                    return -1
+                self.quote = None
+                pos = end + 2
+                continue
+
+            char = line[pos]
+            if char == ";":
+                return pos
+            if line.startswith("--", pos):
+                return -1
+            if line.startswith("/*", pos):
+                self.block_comment = True
+                pos += 2
+            elif char in "qQ" and line.startswith("'", pos + 1) and pos + 2 < size and _is_word_start(line, pos):
+                opener = line[pos + 2]
+                self.quote = _Q_CLOSERS.get(opener, opener)
+                pos += 3
+            elif char == "'":
+                self.quote = "'"
+                pos += 1
+            else:
+                pos += 1
+        return -1
+
+
+def _is_word_start(line: str, pos: int) -> bool:
+    return pos == 0 or not (line[pos - 1].isalnum() or line[pos - 1] in "_$#")
+
+
+def _command_word(line: str) -> str:
+    head = line.split(None, 1)
+    return head[0].upper().rstrip(";") if head else ""
+
+
+def split_statements(lines: Iterable[str]) -> Iterator[Statement]:
+    """Recorre las lineas de un script y produce sus sentencias, bloques y comandos en orden."""
+    buffer: List[str] = []
+    start = 0
+    plsql = False
+    scanner = _Scanner()
+    in_leading_comment = False
+
+    def flush(kind: str) -> Optional[Statement]:
+        text = "\n".join(buffer).strip()
+        buffer.clear()
+        return Statement(kind, text, start) if text else None
+
+    for number, raw in enumerate(lines, start=1):
+        fragment: Optional[str] = raw.rstrip("\r\n")
+        while fragment is not None:
+            line, fragment = fragment, None
+            stripped = line.strip()
+
+            if not buffer:
+                if in_leading_comment:
+                    in_leading_comment = "*/" not in stripped
+                    continue
+                if not stripped or stripped.startswith("--") or stripped == "/":
+                    continue
+                if stripped.startswith("/*"):
+                    in_leading_comment = "*/" not in stripped[2:]
+                    continue
+                if stripped.startswith("@"):
+                    yield Statement(COMMAND, stripped, number)
+                    continue
+                word = _command_word(stripped)
+                if word in SQLPLUS_COMMANDS:
+                    yield Statement(COMMAND, stripped if word in ("PRO", "PROMPT") else stripped.rstrip(";"), number)
+                    continue
+                start = number
+                plsql = bool(_PLSQL_HEAD.match(stripped))
+                scanner = _Scanner()
+
+            if plsql:
+                if stripped == "/":
+                    statement = flush(PLSQL)
+                    if statement:
+                        yield statement
+                else:
+                    buffer.append(line)
+                continue
+
+            if stripped == "/" and scanner.quote is None and not scanner.block_comment:
+                statement = flush(SQL)
+                if statement:
+                    yield statement
+                continue
+
+            end = scanner.find_terminator(line)
+            if end < 0:
+                buffer.append(line)
+                continue
+            if _PLSQL_HEAD.match("\n".join([*buffer, line]).lstrip()):
+                # CREATE OR REPLACE en una linea y FUNCTION en la siguiente: el ';' es interno.
+                plsql = True
+                buffer.append(line)
+                continue
+            buffer.append(line[:end])
+            statement = flush(SQL)
+            if statement:
+                yield statement
+            rest = line[end + 1 :]
+            if rest.strip():
+                # Varias sentencias en una misma linea.
+                fragment = rest
+
+    if buffer:
+        statement = flush(PLSQL if plsql else SQL)
+        if statement:
+            yield statement
+
+
+def read_statements(path: Path, encoding: str = "utf-8") -> Iterator[Statement]:
+    """Sentencias de un script en disco; se lee linea a linea (los INSERT de catalogos pesan MB)."""
+    with path.open("r", encoding=encoding, newline="") as fh:
+        yield from split_statements(fh)
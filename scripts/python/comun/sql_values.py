@@ -0,0 +1,184 @@
+"""
+Tokenizer en streaming para dumps SQL del tipo INSERT INTO t (...) VALUES (...), (...);
+
+Lee el archivo por bloques (memoria acotada por chunk_size, sin importar el tamano del dump)
+y recorre una maquina de estados: fuera de sentencia -> lista de tuplas (tras VALUES) -> tupla.
+Soporta:
+ - varias sentencias INSERT por archivo (y varias tuplas por sentencia);
+ - comillas escapadas ('') y cualquier caracter dentro de los textos, incluido "),";
+ - comentarios -- y /* */ fuera de los textos;
+ - parentesis anidados en los valores, p.ej. TO_DATE('2020-01-01', 'YYYY-MM-DD'), que se
+   devuelven como texto sin evaluar.
+
+Cada fila se produce como tupla: los textos entre comillas sin comillas, NULL como None y
+el resto (numeros, expresiones) como texto recortado.
+"""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+_OUTSIDE, _LIST, _TUPLE = range(3)
+
+_TOKEN = re.compile(
+    r"""
+      '(?:[^']|'')*'?         # texto; puede quedar abierto al final del bloque
+    | --[^\n]*                # comentario de linea
+    | /\*.*?(?:\*/|\Z)        # comentario de bloque
+    | [^\s'(),;]+             # palabra, numero o NULL
+    | [(),;]
+    | \s+
+    """,
+    re.X | re.S,
+)
+_CLOSED_STRING = re.compile(r"'(?:[^']|'')*'")
+# Camino rapido: una tupla completa sin parentesis anidados (con la coma y espacios previos)
+# se reconoce con una sola busqueda.
+_FLAT_TUPLE = re.compile(r"[\s,]*\(((?:'(?:[^']|'')*'|[^'()])*)\)")
+_FLAT_FIELD = re.compile(r"\s*(?:'((?:[^']|'')*)'\s*|([^',]*))(,|\Z)")
+
+
+def _bare_value(text: str) -> Optional[str]:
+    text = text.strip()
+    return None if text.upper() == "NULL" else text
+
+
+def _split_flat(body: str) -> Optional[tuple]:
+    """Separa el cuerpo de una tupla plana; None si no encaja (se usa la maquina de estados)."""
+    if "--" in body or "/*" in body:
+        return None
+    if not body.strip():
+        return ()
+    if "'" not in body:
+        return tuple(_bare_value(field) for field in body.split(","))
+    values: List[Optional[str]] = []
+    pos, size = 0, len(body)
+    while True:
+        match = _FLAT_FIELD.match(body, pos)
+        if match is None:
+            return None
+        quoted, bare, separator = match.groups()
+        values.append(quoted.replace("''", "'") if quoted is not None else _bare_value(bare))
+        pos = match.end()
+        if not separator:
+            return tuple(values) if pos == size else None
+
+
+class _TupleBuilder:
+    """Acumula los tokens de una tupla; los parentesis anidados quedan dentro del valor."""
+
+    def __init__(self) -> None:
+        self.values: List[Optional[str]] = []
+        self.parts: List[str] = []
+        self.significant = 0
+        self.depth = 1
+
+    def add(self, token: str) -> None:
+        self.parts.append(token)
+        if not token.isspace():
+            self.significant += 1
+
+    def end_field(self) -> None:
+        raw = "".join(self.parts).strip()
+        if self.significant == 1 and raw.startswith("'"):
+            self.values.append(raw[1:-1].replace("''", "'"))
+        else:
+            # Numeros, NULL o expresiones (p.ej. TO_DATE(...) o 'a' || 'b') quedan como texto crudo.
+            self.values.append(_bare_value(raw))
+        self.parts = []
+        self.significant = 0
+
+    def finish(self) -> tuple:
+        if self.values or self.significant:
+            self.end_field()
+        return tuple(self.values)
+
+
+def tokenize_values(chunks: Iterable[str]) -> Iterator[tuple]:
+    """Recorre el texto (entregado en bloques arbitrarios) y produce una tupla por fila de VALUES."""
+    chunk_iter = iter(chunks)
+    buf = ""
+    pos = 0
+    eof = False
+    state = _OUTSIDE
+    builder: Optional[_TupleBuilder] = None
+
+    while True:
+        if state == _LIST:
+            flat = _FLAT_TUPLE.match(buf, pos)
+            if flat is not None:
+                row = _split_flat(flat.group(1))
+                if row is not None:
+                    pos = flat.end()
+                    yield row
+                    continue
+
+        match = _TOKEN.match(buf, pos)
+        if match is None or (match.end() == len(buf) and not eof):
+            # Fin de bloque: el ultimo token puede seguir en el proximo bloque.
+            if eof:
+                break
+            chunk = next(chunk_iter, None)
+            if chunk is None:
+                eof = True
+            else:
+                buf = buf[pos:] + chunk
+                pos = 0
+            continue
+
+        token = match.group()
+        pos = match.end()
+        first = token[0]
+        if first.isspace() or token.startswith("--") or token.startswith("/*"):
+            if state == _TUPLE and first.isspace():
+                builder.add(token)  # type: ignore[union-attr]
+            continue
+        if first == "'" and not _CLOSED_STRING.fullmatch(token):
+            raise ValueError("Texto entre comillas sin cerrar al final del dump")
+
+        if state == _OUTSIDE:
+            if token.upper() == "VALUES":
+                state = _LIST
+        elif state == _LIST:
+            if token == "(":
+                builder = _TupleBuilder()
+                state = _TUPLE
+            elif token == ";":
+                state = _OUTSIDE
+            elif token != ",":
+                # Otra sentencia sin ';' previo.
+                state = _LIST if token.upper() == "VALUES" else _OUTSIDE
+        else:
+            assert builder is not None
+            if token == "(":
+                builder.depth += 1
+                builder.add(token)
+            elif token == ")":
+                if builder.depth == 1:
+                    yield builder.finish()
+                    builder = None
+                    state = _LIST
+                else:
+                    builder.depth -= 1
+                    builder.add(token)
+            elif token == "," and builder.depth == 1:
+                builder.end_field()
+            elif token == ";":
+                raise ValueError("Sentencia terminada dentro de una tupla de VALUES")
+            else:
+                builder.add(token)
+
+    if state == _TUPLE:
+        raise ValueError("El dump termina dentro de una tupla de VALUES")
+
+
+def iter_values_rows(
+    path: Path, encoding: str = "utf-8", chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[tuple]:
+    """Produce perezosamente las filas de todas las sentencias INSERT ... VALUES de path."""
+    with path.open("r", encoding=encoding, newline="") as fh:
+        yield from tokenize_values(iter(lambda: fh.read(chunk_size), ""))
@@ -0,0 +1,136 @@
+"""
+Genera archivos de SQL*Loader (.ctl + .dat delimitado) para cargas direct-path de catalogos.
+
+Los archivos son texto plano: se pueden revisar y validar sin base de datos con
+verify_loader_files. El script SQL*Plus resultante invoca sqlldr via HOST y toma las
+credenciales de la variable de entorno SQLLDR_USERID (usuario/clave@tns).
+"""
+
+from __future__ import annotations
+
+import csv
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, List, Optional, Sequence, TextIO
+
+LOAD_METHODS = ("APPEND", "REPLACE", "TRUNCATE", "INSERT")
+FIELD_DELIMITER = "|"
+FIELD_ENCLOSURE = '"'
+USERID_ENV = "SQLLDR_USERID"
+
+
+@dataclass
+class LoaderColumn:
+    nombre: str
+    tipo: str  # Clausula de tipo SQL*Loader, p.ej. "INTEGER EXTERNAL" o "CHAR(150)".
+
+
+def _relative_to_root(path: Path, root: Optional[Path]) -> str:
+    if root is not None:
+        try:
+            return path.resolve().relative_to(root.resolve()).as_posix()
+        except ValueError:
+            pass
+    return path.resolve().as_posix()
+
+
+def data_writer(fh: TextIO) -> Any:
+    """csv.writer con el formato de los .dat; util para escribir varios archivos en una sola pasada."""
+    return csv.writer(
+        fh,
+        delimiter=FIELD_DELIMITER,
+        quotechar=FIELD_ENCLOSURE,
+        quoting=csv.QUOTE_MINIMAL,
+        lineterminator="\n",
+    )
+
+
+def write_data_file(rows: Iterable[Sequence[object]], path: Path) -> int:
+    """Escribe filas delimitadas por '|' (textos entre comillas cuando hace falta). Devuelve el total."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    total = 0
+    with path.open("w", encoding="utf-8", newline="") as fh:
+        writer = data_writer(fh)
+        for row in rows:
+            writer.writerow(["" if value is None else value for value in row])
+            total += 1
+    return total
+
+
+def write_control_file(
+    table: str,
+    columns: Sequence[LoaderColumn],
+    control_path: Path,
+    data_path: Path,
+    load_method: str = "APPEND",
+    root: Optional[Path] = None,
+) -> Path:
+    """
+    Escribe el control file direct-path para table.
+    Las rutas se expresan relativas a root (la raiz del repo) para ejecutar sqlldr desde ahi.
+    """
+    if load_method not in LOAD_METHODS:
+        raise ValueError(f"Metodo de carga desconocido: {load_method}. Usa uno de {', '.join(LOAD_METHODS)}")
+
+    data_ref = _relative_to_root(data_path, root)
+    bad_ref = _relative_to_root(data_path.with_suffix(".bad"), root)
+    column_lines = ",\n".join(f"    {column.nombre} {column.tipo}" for column in columns)
+
+    control_path.parent.mkdir(parents=True, exist_ok=True)
+    with control_path.open("w", encoding="utf-8") as fh:
+        fh.write(f"-- Control file generado automaticamente para SQL*Loader ({table})\n")
+        fh.write("OPTIONS (DIRECT=TRUE, ERRORS=0)\n")
+        fh.write("LOAD DATA\n")
+        fh.write("CHARACTERSET AL32UTF8\n")
+        fh.write(f"INFILE '{data_ref}'\n")
+        fh.write(f"BADFILE '{bad_ref}'\n")
+        fh.write(f"{load_method}\n")
+        fh.write(f"INTO TABLE {table}\n")
+        fh.write("REENABLE DISABLED_CONSTRAINTS\n")
+        fh.write(f"FIELDS TERMINATED BY '{FIELD_DELIMITER}' OPTIONALLY ENCLOSED BY '{FIELD_ENCLOSURE}'\n")
+        fh.write("TRAILING NULLCOLS\n")
+        fh.write("(\n")
+        fh.write(column_lines)
+        fh.write("\n)\n")
+    return control_path
+
+
+def sqlldr_command(control_path: Path, root: Optional[Path] = None) -> str:
+    """Linea HOST de SQL*Plus que ejecuta la carga direct-path del control file."""
+    control_ref = _relative_to_root(control_path, root)
+    log_ref = _relative_to_root(control_path.with_suffix(".log"), root)
+    return f"HOST sqlldr userid=${USERID_ENV} control={control_ref} log={log_ref} direct=true"
+
+
+def _control_columns(text: str) -> List[str]:
+    match = re.search(r"TRAILING NULLCOLS\s*\((.*)\)\s*$", text, re.S)
+    if match is None:
+        raise ValueError("No se encontro la lista de columnas del control file")
+    return [line.strip().split()[0] for line in match.group(1).split(",\n") if line.strip()]
+
+
+def verify_loader_files(control_path: Path, root: Optional[Path] = None) -> int:
+    """
+    Valida offline que cada fila del archivo de datos tenga tantos campos como columnas
+    declara el control file. Devuelve el numero de filas; lanza ValueError si hay diferencias.
+    """
+    text = control_path.read_text(encoding="utf-8")
+    columns = _control_columns(text)
+    infile = re.search(r"^INFILE '([^']+)'", text, re.M)
+    if infile is None:
+        raise ValueError(f"No se encontro INFILE en {control_path}")
+    data_path = Path(infile.group(1))
+    if not data_path.is_absolute() and root is not None:
+        data_path = root / data_path
+
+    total = 0
+    with data_path.open("r", encoding="utf-8", newline="") as fh:
+        reader = csv.reader(fh, delimiter=FIELD_DELIMITER, quotechar=FIELD_ENCLOSURE)
+        for line_no, fields in enumerate(reader, start=1):
+            if len(fields) != len(columns):
+                raise ValueError(
+                    f"{data_path}:{line_no} tiene {len(fields)} campos; se esperaban {len(columns)} ({', '.join(columns)})"
+                )
+            total += 1
+    return total
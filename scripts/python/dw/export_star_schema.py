@@ -0,0 +1,406 @@
+"""
+Exporta el esquema estrella del DW (DW_FACT_VENTAS y las cuatro DW_DIM_*) a extractos para analitica
+fuera de Oracle (dw/olap.py o cualquier lector de Parquet/CSV).
+
+Lee por cursor en bloques de --chunk-size filas (fetchmany), sin cargar la tabla en memoria, desde
+Oracle o desde la base SQLite local de --execute sqlite. Escribe Parquet si pyarrow esta instalado y
+CSV .gz si no (--format lo fuerza):
+
+    <salida>/DW_DIM_TIEMPO.parquet                          una por dimension
+    <salida>/DW_FACT_VENTAS/anio=2024/mes=03/part.parquet   una particion por anio/mes de DW_DIM_TIEMPO
+    <salida>/manifest.json
+
+El manifiesto lista cada archivo con sus columnas y filas, y cada particion del hecho con su anio,
+mes y huella (filas y suma de un hash por fila sobre todas las columnas del hecho, de una sola
+consulta agrupada: ORA_HASH en Oracle, crc32 registrado como funcion en SQLite). Los
+consumidores podan particiones leyendo solo el manifiesto (select_partitions). Al re-exportar se
+reescriben solo los meses cuya huella cambio y se borran los que ya no tienen hechos; --full
+reescribe todo. Las dimensiones son chicas y se reescriben siempre. Cada archivo se escribe en un
+temporal y se renombra al terminar, de modo que un lector nunca ve un archivo a medias.
+
+Uso (desde la raiz del repo):
+    DW_USERID=usuario/clave@tns python scripts/python/dw/export_star_schema.py
+    python scripts/python/dw/export_star_schema.py --target sqlite --format csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import gzip
+import importlib.util
+import json
+import os
+import sys
+import time
+import zlib
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from comun import plan_executor
+
+ROOT = Path(__file__).resolve().parents[3]
+DEFAULT_OUTPUT_DIR = ROOT / "data" / "output" / "dw_extracts"
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 2
+FORMATS = ("auto", "parquet", "csv")
+SUFFIXES = {"parquet": ".parquet", "csv": ".csv.gz"}
+DEFAULT_CHUNK_SIZE = 10_000
+FACT_TABLE = "DW_FACT_VENTAS"
+TIME_TABLE = "DW_DIM_TIEMPO"
+
+
+@dataclass(frozen=True)
+class ExportTable:
+    name: str
+    columns: Tuple[Tuple[str, str], ...]  # (columna, tipo: int | float | text | date)
+
+    @property
+    def names(self) -> List[str]:
+        return [name for name, _ in self.columns]
+
+
+DIMENSIONS = (
+    ExportTable(
+        TIME_TABLE,
+        (("TiempoID", "int"), ("Fecha", "date"), ("Anio", "int"), ("Mes", "int"), ("Trimestre", "int"), ("DiaSemana", "text")),
+    ),
+    ExportTable("DW_DIM_CATEGORIA", (("CategoriaID", "int"), ("Nombre", "text"), ("NombreClave", "text"))),
+    ExportTable(
+        "DW_DIM_PRODUCTO",
+        (("ProductoID", "int"), ("CategoriaID", "int"), ("Descripcion", "text"), ("PrecioUnitario", "float")),
+    ),
+    ExportTable(
+        "DW_DIM_UBICACION",
+        (
+            ("UbicacionID", "int"),
+            ("ProvinciaID", "int"),
+            ("CantonID", "int"),
+            ("ParroquiaID", "int"),
+            ("CiudadID", "int"),
+            ("Provincia", "text"),
+            ("Canton", "text"),
+            ("Parroquia", "text"),
+            ("Ciudad", "text"),
+        ),
+    ),
+)
+FACT = ExportTable(
+    FACT_TABLE,
+    (
+        ("FactID", "int"),
+        ("ProductoID", "int"),
+        ("TiempoID", "int"),
+        ("UbicacionID", "int"),
+        ("PedidoID", "int"),
+        ("CategoriaID", "int"),
+        ("CantidadVendida", "float"),
+        ("MontoTotal", "float"),
+        ("Fecha", "date"),
+    ),
+)
+# Huella de cada mes: filas y suma (modulo 2^32) de un hash por fila sobre todas las columnas de FACT. Sumas
+# por columna no ven un hecho que cambia de dia dentro del mes si otro hace el cambio inverso; el hash por fila si.
+HASH_MODULUS = 2**32
+SQLITE_ROW_HASH = "HASH_FILA"
+
+
+@dataclass
+class ExportSummary:
+    formato: str
+    filas: Dict[str, int]
+    particiones_escritas: int = 0
+    particiones_sin_cambios: int = 0
+    particiones_borradas: int = 0
+    segundos: float = 0.0
+
+
+def resolve_format(requested: str) -> str:
+    """auto: parquet si pyarrow esta instalado, csv (gzip) si no."""
+    if requested not in FORMATS:
+        raise ValueError(f"Formato desconocido: {requested}. Usa uno de {', '.join(FORMATS)}")
+    if requested == "csv":
+        return "csv"
+    available = importlib.util.find_spec("pyarrow") is not None
+    if requested == "parquet" and not available:
+        raise ValueError("El formato parquet requiere pyarrow: pip install pyarrow")
+    return "parquet" if available else "csv"
+
+
+def partition_path(anio: int, mes: int, fmt: str) -> str:
+    """Ruta relativa (estilo hive) de la particion de un mes del hecho."""
+    return f"{FACT_TABLE}/anio={anio:04d}/mes={mes:02d}/part{SUFFIXES[fmt]}"
+
+
+def load_manifest(directory: Path) -> Optional[Dict[str, Any]]:
+    path = directory / MANIFEST_NAME
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def select_partitions(
+    manifest: Dict[str, Any],
+    desde: Optional[Tuple[int, int]] = None,
+    hasta: Optional[Tuple[int, int]] = None,
+) -> List[Dict[str, Any]]:
+    """Particiones del hecho con (anio, mes) dentro de [desde, hasta], sin abrir los archivos."""
+    selected = []
+    for partition in manifest["tablas"][FACT_TABLE]["particiones"]:
+        month = (partition["anio"], partition["mes"])
+        if (desde is None or month >= desde) and (hasta is None or month <= hasta):
+            selected.append(partition)
+    return selected
+
+
+def _convert(value: Any, kind: str) -> Any:
+    if value is None:
+        return None
+    if kind == "int":
+        return int(value)
+    if kind == "float":
+        return float(value)
+    if kind == "date":
+        if isinstance(value, datetime):
+            return value.date()
+        if isinstance(value, date):
+            return value
+        return date.fromisoformat(str(value)[:10])
+    return str(value)
+
+
+class _CsvWriter:
+    def __init__(self, path: Path, table: ExportTable) -> None:
+        self._fh = gzip.open(path, "wt", encoding="utf-8", newline="")
+        self._writer = csv.writer(self._fh)
+        self._writer.writerow(table.names)
+
+    def write(self, rows: List[Tuple[Any, ...]]) -> None:
+        self._writer.writerows(rows)
+
+    def close(self) -> None:
+        self._fh.close()
+
+
+class _ParquetWriter:
+    """Un row group por bloque leido: el archivo se escribe sin juntar la tabla en memoria."""
+
+    def __init__(self, path: Path, table: ExportTable) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        types = {"int": pa.int64(), "float": pa.float64(), "text": pa.string(), "date": pa.date32()}
+        self._pa = pa
+        self._schema = pa.schema([(name, types[kind]) for name, kind in table.columns])
+        self._writer = pq.ParquetWriter(path, self._schema, compression="snappy")
+
+    def write(self, rows: List[Tuple[Any, ...]]) -> None:
+        columns = list(zip(*rows))
+        arrays = [self._pa.array(values, type=field.type) for values, field in zip(columns, self._schema)]
+        self._writer.write_table(self._pa.Table.from_arrays(arrays, schema=self._schema))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+def _fetch(cursor: Any, sql: str, params: Sequence[Any], chunk_size: int) -> Iterator[List[Tuple[Any, ...]]]:
+    cursor.arraysize = chunk_size
+    cursor.execute(sql, tuple(params))
+    while True:
+        rows = cursor.fetchmany(chunk_size)
+        if not rows:
+            return
+        yield rows
+
+
+def _export(
+    cursor: Any,
+    sql: str,
+    params: Sequence[Any],
+    table: ExportTable,
+    path: Path,
+    fmt: str,
+    chunk_size: int,
+) -> int:
+    """Escribe el resultado de sql en path por bloques; devuelve las filas escritas."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(path.name + ".tmp")
+    writer = _ParquetWriter(partial, table) if fmt == "parquet" else _CsvWriter(partial, table)
+    kinds = [kind for _, kind in table.columns]
+    count = 0
+    try:
+        for chunk in _fetch(cursor, sql, params, chunk_size):
+            writer.write([tuple(_convert(value, kind) for value, kind in zip(row, kinds)) for row in chunk])
+            count += len(chunk)
+    except BaseException:
+        writer.close()
+        partial.unlink(missing_ok=True)
+        raise
+    writer.close()
+    os.replace(partial, path)
+    return count
+
+
+def _remove(directory: Path, relative: str) -> None:
+    """Borra un archivo exportado y los directorios de particion que queden vacios."""
+    path = directory / relative
+    path.unlink(missing_ok=True)
+    parent = path.parent
+    while parent != directory and parent.is_dir() and not any(parent.iterdir()):
+        parent.rmdir()
+        parent = parent.parent
+
+
+def _row_hash(*values: Any) -> int:
+    """Hash de una fila del hecho en SQLite (funcion SQLITE_ROW_HASH de la conexion)."""
+    return zlib.crc32("|".join("" if value is None else str(value) for value in values).encode("utf-8"))
+
+
+def _row_hash_sum(dialect: plan_executor.Dialect) -> str:
+    if dialect.name == "oracle":
+        text = " || '|' || ".join(
+            f"TO_CHAR(f.{name}, 'YYYY-MM-DD')" if kind == "date" else f"f.{name}" for name, kind in FACT.columns
+        )
+        return f"MOD(SUM(ORA_HASH({text})), {HASH_MODULUS})"
+    return f"SUM({SQLITE_ROW_HASH}({', '.join('f.' + name for name in FACT.names)})) % {HASH_MODULUS}"
+
+
+def month_fingerprints(cursor: Any, dialect: plan_executor.Dialect) -> Dict[Tuple[int, int], List[Any]]:
+    """(anio, mes) -> [filas, suma de hashes por fila], en una sola pasada por el hecho."""
+    cursor.execute(
+        f"SELECT t.Anio, t.Mes, COUNT(*), {_row_hash_sum(dialect)} FROM {FACT_TABLE} f "
+        f"JOIN {TIME_TABLE} t ON t.TiempoID = f.TiempoID "
+        "WHERE t.Anio IS NOT NULL AND t.Mes IS NOT NULL GROUP BY t.Anio, t.Mes ORDER BY t.Anio, t.Mes"
+    )
+    return {
+        (int(anio), int(mes)): [int(count), int(hashes)] for anio, mes, count, hashes in cursor.fetchall()
+    }
+
+
+def export_star_schema(
+    connection: Any,
+    dialect: plan_executor.Dialect,
+    output_dir: Path = DEFAULT_OUTPUT_DIR,
+    fmt: str = "auto",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    full: bool = False,
+) -> ExportSummary:
+    if chunk_size < 1:
+        raise ValueError("--chunk-size debe ser positivo")
+    fmt = resolve_format(fmt)
+    started = time.perf_counter()
+    output_dir.mkdir(parents=True, exist_ok=True)
+    previous = load_manifest(output_dir)
+    if previous is not None and (full or previous.get("version") != MANIFEST_VERSION or previous.get("formato") != fmt):
+        # Otro formato u otra version: se descartan los archivos anteriores y se exporta todo.
+        for info in previous.get("tablas", {}).values():
+            for partition in info.get("particiones", []):
+                _remove(output_dir, partition["archivo"])
+            if "archivo" in info:
+                _remove(output_dir, info["archivo"])
+        previous = None
+    known = {}
+    if previous is not None:
+        known = {(p["anio"], p["mes"]): p for p in previous["tablas"][FACT_TABLE]["particiones"]}
+
+    summary = ExportSummary(fmt, {})
+    tables: Dict[str, Any] = {}
+    if dialect.name == "sqlite":
+        connection.create_function(SQLITE_ROW_HASH, len(FACT.columns), _row_hash, deterministic=True)
+    cursor = connection.cursor()
+    try:
+        if dialect.name == "oracle":
+            # Huellas, meses y dimensiones de una misma foto de la base.
+            cursor.execute("SET TRANSACTION READ ONLY")
+        for table in DIMENSIONS:
+            relative = f"{table.name}{SUFFIXES[fmt]}"
+            sql = f"SELECT {', '.join(table.names)} FROM {table.name}"
+            rows = _export(cursor, sql, (), table, output_dir / relative, fmt, chunk_size)
+            tables[table.name] = {"archivo": relative, "columnas": table.names, "filas": rows}
+            summary.filas[table.name] = rows
+
+        month_sql = (
+            f"SELECT {', '.join('f.' + name for name in FACT.names)} FROM {FACT_TABLE} f "
+            f"JOIN {TIME_TABLE} t ON t.TiempoID = f.TiempoID "
+            "WHERE t.Anio = {0} AND t.Mes = {1}".format(*dialect.placeholders(2).split(", "))
+        )
+        partitions = []
+        for (anio, mes), fingerprint in month_fingerprints(cursor, dialect).items():
+            relative = partition_path(anio, mes, fmt)
+            entry = known.pop((anio, mes), None)
+            if entry is not None and entry["huella"] == fingerprint and (output_dir / relative).exists():
+                partitions.append(entry)
+                summary.particiones_sin_cambios += 1
+                continue
+            rows = _export(cursor, month_sql, (anio, mes), FACT, output_dir / relative, fmt, chunk_size)
+            partitions.append({"anio": anio, "mes": mes, "archivo": relative, "filas": rows, "huella": fingerprint})
+            summary.particiones_escritas += 1
+        for entry in known.values():
+            _remove(output_dir, entry["archivo"])
+            summary.particiones_borradas += 1
+    finally:
+        connection.rollback()
+        cursor.close()
+
+    summary.filas[FACT_TABLE] = sum(partition["filas"] for partition in partitions)
+    tables[FACT_TABLE] = {
+        "columnas": FACT.names,
+        "particionado": ["anio", "mes"],
+        "filas": summary.filas[FACT_TABLE],
+        "particiones": partitions,
+    }
+    payload = {
+        "version": MANIFEST_VERSION,
+        "formato": fmt,
+        "exportado": datetime.now().isoformat(timespec="seconds"),
+        "huella": ["filas", f"SUM(hash de fila) MOD {HASH_MODULUS}"],
+        "tablas": tables,
+    }
+    manifest = output_dir / MANIFEST_NAME
+    partial = manifest.with_name(manifest.name + ".tmp")
+    partial.write_text(json.dumps(payload, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    os.replace(partial, manifest)
+    summary.segundos = time.perf_counter() - started
+    return summary
+
+
+def _parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Exporta el esquema estrella del DW a Parquet/CSV particionado.")
+    parser.add_argument("--target", choices=plan_executor.TARGETS, default="oracle", help="Base de origen.")
+    parser.add_argument("--userid", help=f"usuario/clave@tns para Oracle (default: variable {plan_executor.USERID_ENV}).")
+    parser.add_argument("--sqlite-db", type=Path, default=plan_executor.DEFAULT_SQLITE_DB, help="Base SQLite local.")
+    parser.add_argument("--output-dir", type=Path, default=DEFAULT_OUTPUT_DIR, help="Directorio de extractos.")
+    parser.add_argument("--format", choices=FORMATS, default="auto", help="auto: parquet si hay pyarrow, si no csv.")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Filas por fetchmany.")
+    parser.add_argument("--full", action="store_true", help="Reescribe todas las particiones aunque no cambien.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = _parse_args(argv)
+    try:
+        if args.target == "sqlite" and not args.sqlite_db.exists():
+            raise ValueError(f"No existe la base SQLite {args.sqlite_db}")
+        connection, dialect = plan_executor.connect(args.target, args.userid, args.sqlite_db)
+        try:
+            summary = export_star_schema(connection, dialect, args.output_dir, args.format, args.chunk_size, args.full)
+        finally:
+            connection.close()
+    except ValueError as exc:
+        raise SystemExit(f"Exportacion detenida: {exc}") from exc
+    for table, rows in summary.filas.items():
+        print(f"{table}: {rows} filas")
+    print(
+        f"Formato {summary.formato}: {summary.particiones_escritas} particiones escritas, "
+        f"{summary.particiones_sin_cambios} sin cambios, {summary.particiones_borradas} borradas "
+        f"({summary.segundos:.1f} s) -> {args.output_dir / MANIFEST_NAME}"
+    )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,409 @@
+"""
+Genera la capa de agregados del DW: DDL (scripts/sql/dw/02_dw_aggregates.sql) y refresco
+incremental (scripts/sql/etl/refresh_dw_aggregates.sql).
+
+Cada agregado es una tabla mantenida por el ETL con SUM(CantidadVendida), SUM(MontoTotal) y el
+numero de lineas de hecho por combinacion de claves. Los granos se declaran en GRAINS como una
+tupla de claves de KEYS; agregar un grano es agregar una linea y volver a correr este script.
+
+Refresco: ETL_CONTROL lleva una marca de agua propia (Proceso DW_AGREGADOS). Cada corrida toma
+los hechos con PedidoID entre esa marca y la de DW_VENTAS (ordenes ya cargadas con exito), busca
+los grupos que tocan y los recalcula completos desde DW_FACT_VENTAS (DELETE + INSERT del grupo).
+Recalcular el grupo (y no sumar deltas) hace el refresco idempotente: repetir una ventana no
+duplica montos. Cuando la carga de hechos cambia las claves de un hecho existente (o lo quita de
+su particion), deja las claves anteriores en STG_DW_CLAVES_ANTERIORES; el refresco recalcula
+tambien esos grupos, y los que quedan sin hechos desaparecen. Del mismo modo, cuando la carga de
+DW_DIM_UBICACION cambia la provincia de una UbicacionID existente deja la fila anterior en
+STG_DW_UBICACION_ANTERIOR, y los granos con claves de la dimension recalculan los grupos de los
+hechos de esa ubicacion con la provincia anterior y con la nueva. reset_dw_watermark.sql reinicia
+ambas marcas y vacia las tablas AGG_*, de modo que --etl-mode full recalcula todo.
+
+VW_MAS_VENDIDO y VW_VENTAS_MES_PROVINCIA leen de los agregados: su costo depende del tamano del
+agregado y no del historial de hechos.
+
+Uso (desde la raiz del repo):
+    python scripts/python/dw/generate_dw_aggregates.py
+    python scripts/python/dw/generate_dw_aggregates.py --check   # falla si los .sql no estan al dia
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+ROOT = Path(__file__).resolve().parents[3]
+DDL_PATH = ROOT / "scripts" / "sql" / "dw" / "02_dw_aggregates.sql"
+REFRESH_PATH = ROOT / "scripts" / "sql" / "etl" / "refresh_dw_aggregates.sql"
+CONTROL_PROCESS = "DW_AGREGADOS"
+FACT_PROCESS = "DW_VENTAS"
+# reset_dw_watermark.sql vacia las tablas con este prefijo en la recarga completa.
+TABLE_PREFIX = "AGG_"
+# Claves que tenian los hechos antes de que la carga las cambiara (grupos a recalcular).
+PREVIOUS_KEYS_TABLE = "STG_DW_CLAVES_ANTERIORES"
+# Filas de DW_DIM_UBICACION antes de que la carga cambiara sus atributos (etl/load_dw_from_oltp.sql).
+# Guarda solo las columnas que usan las claves de KEYS sobre u.
+DIMENSION_CHANGES_TABLE = "STG_DW_UBICACION_ANTERIOR"
+DIMENSION_CHANGES_COLUMNS = {"Provincia": "VARCHAR2(150)"}
+
+
+@dataclass(frozen=True)
+class Key:
+    column: str
+    expr: str  # sobre f (DW_FACT_VENTAS), t (DW_DIM_TIEMPO) o u (DW_DIM_UBICACION)
+    sql_type: str = "NUMBER"
+
+
+@dataclass(frozen=True)
+class Measure:
+    column: str
+    expr: str
+
+
+@dataclass(frozen=True)
+class Grain:
+    table: str
+    keys: Tuple[str, ...]
+    descripcion: str
+
+
+KEYS: Dict[str, Key] = {
+    "dia": Key("TiempoID", "f.TiempoID"),
+    "anio": Key("Anio", "t.Anio"),
+    "mes": Key("Mes", "t.Mes"),
+    "categoria": Key("CategoriaID", "f.CategoriaID"),
+    "ciudad": Key("UbicacionID", "f.UbicacionID"),
+    "provincia": Key("Provincia", "NVL(u.Provincia, 'DESCONOCIDA')", "VARCHAR2(150)"),
+    "producto": Key("ProductoID", "f.ProductoID"),
+}
+MEASURES = (
+    Measure("CantidadVendida", "SUM(f.CantidadVendida)"),
+    Measure("MontoTotal", "SUM(f.MontoTotal)"),
+    Measure("Lineas", "COUNT(*)"),
+)
+GRAINS = (
+    Grain("AGG_VENTAS_DIA_PRODUCTO", ("dia", "categoria", "ciudad", "producto"), "dia x categoria x ciudad x producto"),
+    Grain("AGG_VENTAS_DIA_CIUDAD", ("dia", "categoria", "ciudad"), "dia x categoria x ciudad"),
+    Grain("AGG_VENTAS_MES_PROVINCIA", ("anio", "mes", "categoria", "provincia"), "mes x categoria x provincia"),
+)
+TOP_PRODUCT_GRAIN = "AGG_VENTAS_DIA_PRODUCTO"
+MONTH_PROVINCE_GRAIN = "AGG_VENTAS_MES_PROVINCIA"
+
+_FACT_FROM = (
+    "FROM DW_FACT_VENTAS f",
+    "JOIN DW_DIM_TIEMPO t ON t.TiempoID = f.TiempoID",
+    "LEFT JOIN DW_DIM_UBICACION u ON u.UbicacionID = f.UbicacionID",
+)
+_DIMENSION_COLUMN = re.compile(r"\bu\.(\w+)")
+
+
+def _grain(name: str) -> Grain:
+    return next(grain for grain in GRAINS if grain.table == name)
+
+
+def _keys(grain: Grain) -> List[Key]:
+    if not grain.table.startswith(TABLE_PREFIX):
+        raise ValueError(f"{grain.table}: las tablas de agregados deben empezar con {TABLE_PREFIX}")
+    unknown = [name for name in grain.keys if name not in KEYS]
+    if unknown:
+        raise ValueError(f"{grain.table}: claves desconocidas {', '.join(unknown)}. Usa {', '.join(KEYS)}")
+    keys = [KEYS[name] for name in grain.keys]
+    for key in keys:
+        missing = [column for column in _DIMENSION_COLUMN.findall(key.expr) if column not in DIMENSION_CHANGES_COLUMNS]
+        if missing:
+            raise ValueError(
+                f"{grain.table}: {key.column} usa {', '.join(missing)} de DW_DIM_UBICACION; "
+                "agregalas a DIMENSION_CHANGES_COLUMNS"
+            )
+    return keys
+
+
+def _indent(lines: Sequence[str], spaces: int) -> List[str]:
+    return [" " * spaces + line for line in lines]
+
+
+def grain_ddl(grain: Grain) -> List[str]:
+    keys = _keys(grain)
+    width = max(len(column) for column in [key.column for key in keys] + [m.column for m in MEASURES])
+    lines = [f"-- {grain.descripcion}", f"CREATE TABLE {grain.table} ("]
+    lines += [f"    {key.column:<{width}} {key.sql_type} NOT NULL," for key in keys]
+    lines += [f"    {measure.column:<{width}} NUMBER," for measure in MEASURES]
+    lines.append(f"    CONSTRAINT PK_{grain.table} PRIMARY KEY ({', '.join(key.column for key in keys)})")
+    lines += [");", ""]
+    return lines
+
+
+def _top_product_view() -> List[str]:
+    grain = _grain(TOP_PRODUCT_GRAIN)
+    return [
+        f"-- Producto mas vendido por fecha/categoria/provincia/ciudad, desde {grain.table}.",
+        "CREATE OR REPLACE VIEW VW_MAS_VENDIDO AS",
+        "SELECT",
+        "    inner_q.fecha,",
+        "    inner_q.anio,",
+        "    inner_q.mes,",
+        "    inner_q.categoria,",
+        "    inner_q.provincia,",
+        "    inner_q.ciudad,",
+        "    inner_q.producto,",
+        "    inner_q.total_vendido",
+        "FROM (",
+        "    SELECT",
+        "        t.Fecha      AS fecha,",
+        "        t.Anio       AS anio,",
+        "        t.Mes        AS mes,",
+        "        c.Nombre     AS categoria,",
+        "        u.Provincia  AS provincia,",
+        "        u.Ciudad     AS ciudad,",
+        "        p.Descripcion AS producto,",
+        "        SUM(a.CantidadVendida) AS total_vendido,",
+        "        ROW_NUMBER() OVER (",
+        "            PARTITION BY t.Fecha, c.Nombre, u.Provincia, u.Ciudad",
+        "            ORDER BY SUM(a.CantidadVendida) DESC",
+        "        ) AS rn",
+        f"    FROM {grain.table} a",
+        "    JOIN DW_DIM_TIEMPO t    ON a.TiempoID = t.TiempoID",
+        "    JOIN DW_DIM_PRODUCTO p  ON a.ProductoID = p.ProductoID",
+        "    JOIN DW_DIM_CATEGORIA c ON a.CategoriaID = c.CategoriaID",
+        "    JOIN DW_DIM_UBICACION u ON a.UbicacionID = u.UbicacionID",
+        "    GROUP BY t.Fecha, t.Anio, t.Mes, c.Nombre, u.Provincia, u.Ciudad, p.Descripcion",
+        ") inner_q",
+        "WHERE inner_q.rn = 1;",
+        "",
+    ]
+
+
+def _month_province_view() -> List[str]:
+    grain = _grain(MONTH_PROVINCE_GRAIN)
+    return [
+        f"-- Ventas mensuales por provincia y categoria (reportes), desde {grain.table}.",
+        "CREATE OR REPLACE VIEW VW_VENTAS_MES_PROVINCIA AS",
+        "SELECT a.Anio AS anio, a.Mes AS mes, a.Provincia AS provincia, c.Nombre AS categoria,",
+        "       a.CantidadVendida AS cantidad, a.MontoTotal AS monto, a.Lineas AS lineas",
+        f"FROM {grain.table} a",
+        "JOIN DW_DIM_CATEGORIA c ON a.CategoriaID = c.CategoriaID;",
+        "",
+    ]
+
+
+def build_ddl() -> str:
+    lines = [
+        "-- Generado por scripts/python/dw/generate_dw_aggregates.py; editar GRAINS y regenerar.",
+        "-- Agregados del DW mantenidos por etl/refresh_dw_aggregates.sql.",
+        "",
+    ]
+    for grain in GRAINS:
+        lines += grain_ddl(grain)
+    lines += [
+        "-- Claves anteriores de los hechos que la carga de hechos movio de grupo; el refresco recalcula",
+        "-- esos grupos y borra las filas consumidas.",
+        f"CREATE TABLE {PREVIOUS_KEYS_TABLE} (",
+        "    PedidoID    NUMBER NOT NULL,",
+        "    TiempoID    NUMBER,",
+        "    CategoriaID NUMBER,",
+        "    UbicacionID NUMBER,",
+        "    ProductoID  NUMBER",
+        ");",
+        "",
+        "-- Atributos anteriores de las ubicaciones que la carga de DW_DIM_UBICACION cambio; el refresco",
+        "-- recalcula los grupos de sus hechos y vacia la tabla.",
+        f"CREATE TABLE {DIMENSION_CHANGES_TABLE} (",
+        ",\n".join(
+            ["    UbicacionID NUMBER NOT NULL"]
+            + [f"    {column:<11} {sql_type}" for column, sql_type in DIMENSION_CHANGES_COLUMNS.items()]
+        ),
+        ");",
+        "",
+        "-- Marca de agua propia: hasta que PedidoID estan reflejados los hechos en los agregados.",
+        "MERGE INTO ETL_CONTROL c",
+        f"USING (SELECT '{CONTROL_PROCESS}' AS Proceso FROM DUAL) s",
+        "ON (c.Proceso = s.Proceso)",
+        "WHEN NOT MATCHED THEN",
+        "    INSERT (Proceso, UltimoOrdenID, Estado) VALUES (s.Proceso, 0, 'PENDIENTE');",
+        "",
+        "COMMIT;",
+        "",
+    ]
+    lines += _top_product_view()
+    lines += _month_province_view()
+    return "\n".join(lines)
+
+
+def _affected_groups(keys: Sequence[Key]) -> List[str]:
+    """
+    Grupos a recalcular: los de los hechos de la ventana y los que esos hechos dejaron. Si alguna
+    clave sale de la dimension, tambien los de los hechos de las ubicaciones cambiadas, con sus
+    atributos actuales y con los anteriores.
+    """
+    key_exprs = ", ".join(key.expr for key in keys)
+    window = f"JOIN ETL_CONTROL w ON w.Proceso = '{CONTROL_PROCESS}'"
+    previous_from = f"FROM {PREVIOUS_KEYS_TABLE} f"
+    previous_location = f"JOIN {DIMENSION_CHANGES_TABLE} u ON u.UbicacionID = f.UbicacionID"
+    lines = [
+        f"SELECT {key_exprs}",
+        *_FACT_FROM,
+        window,
+        "WHERE f.PedidoID > w.UltimoOrdenID",
+        "  AND f.PedidoID <= w.OrdenIDHasta",
+        "UNION",
+        f"SELECT {key_exprs}",
+        previous_from,
+        *_FACT_FROM[1:],
+        window,
+        "WHERE f.PedidoID <= w.OrdenIDHasta",
+    ]
+    if not any(_DIMENSION_COLUMN.search(key.expr) for key in keys):
+        return lines
+    return lines + [
+        "UNION",
+        f"SELECT {key_exprs}",
+        *_FACT_FROM,
+        f"WHERE f.UbicacionID IN (SELECT UbicacionID FROM {DIMENSION_CHANGES_TABLE})",
+        "UNION",
+        f"SELECT {key_exprs}",
+        *_FACT_FROM[:2],
+        previous_location,
+        "UNION",
+        f"SELECT {key_exprs}",
+        previous_from,
+        _FACT_FROM[1],
+        previous_location,
+        window,
+        "WHERE f.PedidoID <= w.OrdenIDHasta",
+    ]
+
+
+def grain_refresh(grain: Grain) -> List[str]:
+    keys = _keys(grain)
+    key_exprs = ", ".join(key.expr for key in keys)
+    affected = _affected_groups(keys)
+    select = [f"{key.expr}," for key in keys]
+    select += [f"{measure.expr}," for measure in MEASURES]
+    select[-1] = select[-1].rstrip(",")
+    columns = [key.column for key in keys] + [measure.column for measure in MEASURES]
+    return [
+        f"-- {grain.table}: {grain.descripcion}",
+        "DECLARE",
+        "    v_inicio TIMESTAMP := SYSTIMESTAMP;",
+        "BEGIN",
+        f"    DELETE FROM {grain.table} a",
+        f"    WHERE ({', '.join(f'a.{key.column}' for key in keys)}) IN (",
+        *_indent(affected, 8),
+        "    );",
+        f"    INSERT INTO {grain.table} ({', '.join(columns)})",
+        "    SELECT",
+        *_indent(select, 8),
+        *_indent(_FACT_FROM, 4),
+        f"    WHERE ({key_exprs}) IN (",
+        *_indent(affected, 8),
+        "    )",
+        f"    GROUP BY {key_exprs};",
+        f"    ETL_LOG_FILAS('{grain.table}', SQL%ROWCOUNT, v_inicio);",
+        "    COMMIT;",
+        "EXCEPTION",
+        "    WHEN OTHERS THEN",
+        "        ROLLBACK;",
+        f"        UPDATE ETL_CONTROL SET Estado = 'ERROR', Fin = SYSTIMESTAMP WHERE Proceso = '{CONTROL_PROCESS}';",
+        "        COMMIT;",
+        "        RAISE;",
+        "END;",
+        "/",
+        "",
+    ]
+
+
+def build_refresh() -> str:
+    lines = [
+        "-- Generado por scripts/python/dw/generate_dw_aggregates.py; editar GRAINS y regenerar.",
+        "-- Refresco incremental de los agregados del DW: recalcula los grupos tocados por los hechos",
+        f"-- con PedidoID entre la marca de {CONTROL_PROCESS} y la de {FACT_PROCESS} (ETL_CONTROL)",
+        f"-- y los grupos que esos hechos dejaron al cambiar de claves ({PREVIOUS_KEYS_TABLE}) o de",
+        f"-- provincia al cambiar su ubicacion en la dimension ({DIMENSION_CHANGES_TABLE}).",
+        "",
+        "-- Apertura: el tope es lo que la carga de hechos ya confirmo.",
+        "BEGIN",
+        "    UPDATE ETL_CONTROL",
+        f"    SET OrdenIDHasta = (SELECT UltimoOrdenID FROM ETL_CONTROL WHERE Proceso = '{FACT_PROCESS}'),",
+        "        Estado       = 'EN_CURSO',",
+        "        Inicio       = SYSTIMESTAMP,",
+        "        Fin          = NULL",
+        f"    WHERE Proceso = '{CONTROL_PROCESS}';",
+        "    COMMIT;",
+        "END;",
+        "/",
+        "",
+    ]
+    for grain in GRAINS:
+        lines += grain_refresh(grain)
+    lines += [
+        "-- Cierre: la marca avanza solo si ningun agregado fallo.",
+        "BEGIN",
+        f"    DELETE FROM {PREVIOUS_KEYS_TABLE}",
+        "    WHERE PedidoID <= (",
+        "        SELECT OrdenIDHasta",
+        "        FROM ETL_CONTROL",
+        f"        WHERE Proceso = '{CONTROL_PROCESS}'",
+        "          AND Estado = 'EN_CURSO'",
+        "    );",
+        f"    DELETE FROM {DIMENSION_CHANGES_TABLE}",
+        "    WHERE EXISTS (",
+        "        SELECT 1",
+        "        FROM ETL_CONTROL",
+        f"        WHERE Proceso = '{CONTROL_PROCESS}'",
+        "          AND Estado = 'EN_CURSO'",
+        "    );",
+        "    UPDATE ETL_CONTROL",
+        "    SET UltimoOrdenID = GREATEST(UltimoOrdenID, NVL(OrdenIDHasta, 0)),",
+        "        Estado        = 'OK',",
+        "        Fin           = SYSTIMESTAMP",
+        f"    WHERE Proceso = '{CONTROL_PROCESS}'",
+        "      AND Estado = 'EN_CURSO';",
+        "    COMMIT;",
+        "END;",
+        "/",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def generate_aggregates(ddl_path: Path = DDL_PATH, refresh_path: Path = REFRESH_PATH) -> Dict[str, Path]:
+    for path, text in ((ddl_path, build_ddl()), (refresh_path, build_refresh())):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+    return {"ddl": ddl_path, "refresh": refresh_path}
+
+
+def stale_outputs(ddl_path: Path = DDL_PATH, refresh_path: Path = REFRESH_PATH) -> List[Path]:
+    """Archivos cuyo contenido no coincide con lo que generarian GRAINS actuales."""
+    stale: List[Path] = []
+    for path, text in ((ddl_path, build_ddl()), (refresh_path, build_refresh())):
+        if not path.exists() or path.read_text(encoding="utf-8") != text:
+            stale.append(path)
+    return stale
+
+
+def _parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Genera el DDL y el refresco de los agregados del DW.")
+    parser.add_argument("--ddl", type=Path, default=DDL_PATH, help="Salida del DDL de agregados.")
+    parser.add_argument("--refresh", type=Path, default=REFRESH_PATH, help="Salida del script de refresco.")
+    parser.add_argument("--check", action="store_true", help="No escribe; termina con error si hay diferencias.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = _parse_args(argv)
+    if args.check:
+        stale = stale_outputs(args.ddl, args.refresh)
+        if stale:
+            raise SystemExit(f"Agregados desactualizados: {', '.join(str(path) for path in stale)}")
+        print("Agregados al dia.")
+        return
+    paths = generate_aggregates(args.ddl, args.refresh)
+    print(f"Agregados ({len(GRAINS)} granos): {paths['ddl']} | {paths['refresh']}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
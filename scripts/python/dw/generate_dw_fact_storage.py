@@ -0,0 +1,442 @@
+"""
+Genera el almacenamiento fisico de DW_FACT_VENTAS (scripts/sql/dw/03_dw_fact_storage.sql):
+columna Fecha, particionamiento e indices sobre las claves del hecho.
+
+Opciones:
+ - --partitioning none (default): tabla heap, como la crea dw/01.
+ - --partitioning mensual: particiona por RANGE (Fecha) con INTERVAL de un mes. Un DW existente
+   se convierte con ALTER TABLE ... MODIFY PARTITION BY ... ONLINE (Oracle 12.2 o superior). Los
+   reportes que filtran f.Fecha solo leen las particiones de su rango. La carga de hechos pasa a
+   intercambio de particiones: por cada mes de la ventana, DW_CARGAR_HECHOS_PARTICION llena
+   DW_FACT_VENTAS_INTERCAMBIO con los hechos del mes (conservados + ventana, INSERT APPEND) y la
+   cambia por la particion con EXCHANGE PARTITION, sin MERGE fila a fila sobre el hecho.
+ - --indexes btree (default): un indice compuesto sobre las claves del hecho (TiempoID primero,
+   para recalcular agregados por dia).
+ - --indexes bitmap: un indice bitmap por clave (LOCAL si la tabla esta particionada) para que el
+   optimizador use star transformation (ALTER SESSION SET STAR_TRANSFORMATION_ENABLED = TRUE).
+
+El script es idempotente: cada indice se crea si falta y se recrea si su tipo o su particionado no
+coinciden con las opciones; los de la otra opcion se eliminan. Volver a --partitioning none no
+des-particiona una tabla ya particionada (la carga sigue usando el intercambio).
+
+Uso (desde la raiz del repo):
+    python scripts/python/dw/generate_dw_fact_storage.py
+    python scripts/python/dw/generate_dw_fact_storage.py --partitioning mensual --indexes bitmap
+    python scripts/python/dw/generate_dw_fact_storage.py --check   # falla si el .sql no esta al dia
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+ROOT = Path(__file__).resolve().parents[3]
+DDL_PATH = ROOT / "scripts" / "sql" / "dw" / "03_dw_fact_storage.sql"
+PARTITIONINGS = ("none", "mensual")
+INDEX_KINDS = ("btree", "bitmap")
+DEFAULT_PARTITIONING = "none"
+DEFAULT_INDEXES = "btree"
+FACT_TABLE = "DW_FACT_VENTAS"
+EXCHANGE_TABLE = "DW_FACT_VENTAS_INTERCAMBIO"
+EXCHANGE_PROCEDURE = "DW_CARGAR_HECHOS_PARTICION"
+# EXCHANGE PARTITION exige en la tabla de intercambio la misma PK que el hecho (ORA-14130).
+EXCHANGE_PRIMARY_KEY = "PK_DW_FACT_VENTAS_INTERCAMBIO"
+FACT_KEY_COLUMN = "FactID"
+STAGING_TABLE = "STG_DW_VENTAS"
+# Creada por dw/02_dw_aggregates.sql (generate_dw_aggregates.PREVIOUS_KEYS_TABLE).
+PREVIOUS_KEYS_TABLE = "STG_DW_CLAVES_ANTERIORES"
+FACT_PROCESS = "DW_VENTAS"
+# Limite inferior de la primera particion; los meses posteriores se crean solos (INTERVAL).
+FIRST_PARTITION_BOUND = "2000-01-01"
+# Indices de versiones anteriores reemplazados por los de este script.
+OBSOLETE_INDEXES = ("IX_DW_FACT_VENTAS_TIEMPO",)
+FACT_COLUMNS = (
+    "FactID",
+    "ProductoID",
+    "TiempoID",
+    "UbicacionID",
+    "PedidoID",
+    "CategoriaID",
+    "CantidadVendida",
+    "MontoTotal",
+    "Fecha",
+)
+
+
+@dataclass(frozen=True)
+class FactIndex:
+    name: str
+    columns: Tuple[str, ...]
+    bitmap: bool = False
+
+    @property
+    def index_type(self) -> str:
+        """USER_INDEXES.INDEX_TYPE esperado."""
+        return "BITMAP" if self.bitmap else "NORMAL"
+
+    def ddl(self, table: str, name: str, local: bool) -> str:
+        kind = "BITMAP INDEX" if self.bitmap else "INDEX"
+        suffix = " LOCAL" if local else ""
+        return f"CREATE {kind} {name} ON {table} ({', '.join(self.columns)}){suffix}"
+
+
+FACT_INDEXES = {
+    "btree": (FactIndex("IX_DW_FACT_VENTAS_CLAVES", ("TiempoID", "ProductoID", "UbicacionID", "CategoriaID")),),
+    "bitmap": (
+        FactIndex("BX_DW_FACT_VENTAS_TIEMPO", ("TiempoID",), bitmap=True),
+        FactIndex("BX_DW_FACT_VENTAS_PRODUCTO", ("ProductoID",), bitmap=True),
+        FactIndex("BX_DW_FACT_VENTAS_UBICACION", ("UbicacionID",), bitmap=True),
+        FactIndex("BX_DW_FACT_VENTAS_CATEGORIA", ("CategoriaID",), bitmap=True),
+    ),
+}
+
+
+def _validate(partitioning: str, indexes: str) -> None:
+    if partitioning not in PARTITIONINGS:
+        raise ValueError(f"Particionamiento desconocido: {partitioning}. Usa uno de {', '.join(PARTITIONINGS)}")
+    if indexes not in INDEX_KINDS:
+        raise ValueError(f"Tipo de indice desconocido: {indexes}. Usa uno de {', '.join(INDEX_KINDS)}")
+
+
+def _indent(lines: Sequence[str], spaces: int) -> List[str]:
+    return [" " * spaces + line for line in lines]
+
+
+def _exchange_name(index: FactIndex) -> str:
+    return f"{index.name}_X"
+
+
+def _fecha_block() -> List[str]:
+    return [
+        "-- DW creado antes de la columna Fecha: se agrega y se completa desde DW_DIM_TIEMPO.",
+        "DECLARE",
+        "    v_exists NUMBER;",
+        "BEGIN",
+        "    SELECT COUNT(*) INTO v_exists",
+        "    FROM USER_TAB_COLUMNS",
+        f"    WHERE TABLE_NAME = '{FACT_TABLE}'",
+        "      AND COLUMN_NAME = 'FECHA';",
+        "    IF v_exists = 0 THEN",
+        f"        EXECUTE IMMEDIATE 'ALTER TABLE {FACT_TABLE} ADD (Fecha DATE)';",
+        f"        EXECUTE IMMEDIATE 'UPDATE {FACT_TABLE} f",
+        "            SET Fecha = (SELECT t.Fecha FROM DW_DIM_TIEMPO t WHERE t.TiempoID = f.TiempoID)';",
+        "        COMMIT;",
+        "    END IF;",
+        "END;",
+        "/",
+        "",
+    ]
+
+
+def _partition_block() -> List[str]:
+    return [
+        "-- Particionamiento mensual por Fecha (INTERVAL crea cada mes al primer hecho que llega).",
+        "-- Un DW heap existente se convierte en linea; requiere Oracle 12.2 o superior.",
+        "DECLARE",
+        "    v_count NUMBER;",
+        "BEGIN",
+        f"    SELECT COUNT(*) INTO v_count FROM USER_PART_TABLES WHERE TABLE_NAME = '{FACT_TABLE}';",
+        "    IF v_count = 0 THEN",
+        f"        EXECUTE IMMEDIATE 'ALTER TABLE {FACT_TABLE} MODIFY (Fecha NOT NULL)';",
+        f"        EXECUTE IMMEDIATE 'ALTER TABLE {FACT_TABLE} MODIFY PARTITION BY RANGE (Fecha)'",
+        "            || ' INTERVAL (NUMTOYMINTERVAL(1, ''MONTH''))'",
+        f"            || ' (PARTITION P_INICIAL VALUES LESS THAN (DATE ''{FIRST_PARTITION_BOUND}'')) ONLINE';",
+        "    END IF;",
+        "",
+        f"    -- {EXCHANGE_PROCEDURE} mueve de particion los hechos cuya orden cambio de mes.",
+        "    SELECT COUNT(*) INTO v_count",
+        "    FROM USER_TABLES",
+        f"    WHERE TABLE_NAME = '{FACT_TABLE}'",
+        "      AND ROW_MOVEMENT = 'DISABLED';",
+        "    IF v_count > 0 THEN",
+        f"        EXECUTE IMMEDIATE 'ALTER TABLE {FACT_TABLE} ENABLE ROW MOVEMENT';",
+        "    END IF;",
+        "",
+        "    -- Tabla de intercambio: misma estructura que el hecho, sin particiones.",
+        f"    SELECT COUNT(*) INTO v_count FROM USER_TABLES WHERE TABLE_NAME = '{EXCHANGE_TABLE}';",
+        "    IF v_count = 0 THEN",
+        f"        EXECUTE IMMEDIATE 'CREATE TABLE {EXCHANGE_TABLE} FOR EXCHANGE WITH TABLE {FACT_TABLE}';",
+        "    END IF;",
+        "END;",
+        "/",
+        "",
+    ]
+
+
+def _ensure(index: FactIndex, table: str, name: str, local: bool) -> List[str]:
+    partitioned = "YES" if local else "NO"
+    return [
+        f"asegurar('{name}', '{index.index_type}', '{partitioned}',",
+        f"         '{index.ddl(table, name, local)}');",
+    ]
+
+
+def _index_block(indexes: str) -> List[str]:
+    wanted = FACT_INDEXES[indexes]
+    others = [index for kind, group in FACT_INDEXES.items() if kind != indexes for index in group]
+    retired = [index.name for index in others] + [_exchange_name(index) for index in others]
+    retired += OBSOLETE_INDEXES
+    lines = [
+        "-- Indices sobre las claves del hecho: se crean si faltan y se recrean si cambio su tipo",
+        "-- (BITMAP/NORMAL) o su particionado (LOCAL).",
+        "DECLARE",
+        "    v_particionada VARCHAR2(3);",
+        "    v_count        NUMBER;",
+        "",
+        "    PROCEDURE retirar(p_nombre IN VARCHAR2) IS",
+        "        v_count NUMBER;",
+        "    BEGIN",
+        "        SELECT COUNT(*) INTO v_count FROM USER_INDEXES WHERE INDEX_NAME = p_nombre;",
+        "        IF v_count > 0 THEN",
+        "            EXECUTE IMMEDIATE 'DROP INDEX ' || p_nombre;",
+        "        END IF;",
+        "    END;",
+        "",
+        "    PROCEDURE asegurar(p_nombre IN VARCHAR2, p_tipo IN VARCHAR2, p_particionado IN VARCHAR2, p_ddl IN VARCHAR2) IS",
+        "        v_tipo         USER_INDEXES.INDEX_TYPE%TYPE;",
+        "        v_particionado USER_INDEXES.PARTITIONED%TYPE;",
+        "    BEGIN",
+        "        SELECT INDEX_TYPE, PARTITIONED INTO v_tipo, v_particionado",
+        "        FROM USER_INDEXES",
+        "        WHERE INDEX_NAME = p_nombre;",
+        "        IF v_tipo != p_tipo OR v_particionado != p_particionado THEN",
+        "            EXECUTE IMMEDIATE 'DROP INDEX ' || p_nombre;",
+        "            EXECUTE IMMEDIATE p_ddl;",
+        "        END IF;",
+        "    EXCEPTION",
+        "        WHEN NO_DATA_FOUND THEN",
+        "            EXECUTE IMMEDIATE p_ddl;",
+        "    END;",
+        "BEGIN",
+    ]
+    lines += [f"    retirar('{name}');" for name in retired]
+    lines += [
+        "",
+        "    SELECT CASE WHEN COUNT(*) > 0 THEN 'YES' ELSE 'NO' END INTO v_particionada",
+        f"    FROM USER_PART_TABLES WHERE TABLE_NAME = '{FACT_TABLE}';",
+        "    IF v_particionada = 'YES' THEN",
+    ]
+    for index in wanted:
+        lines += _indent(_ensure(index, FACT_TABLE, index.name, local=True), 8)
+    lines += [
+        f"        -- La PK del hecho ({FACT_KEY_COLUMN}) es un indice global: la tabla de intercambio necesita la misma",
+        "        -- restriccion o EXCHANGE PARTITION falla con ORA-14130.",
+        "        SELECT COUNT(*) INTO v_count",
+        "        FROM USER_CONSTRAINTS",
+        f"        WHERE TABLE_NAME = '{EXCHANGE_TABLE}'",
+        "          AND CONSTRAINT_TYPE = 'P';",
+        "        IF v_count = 0 THEN",
+        f"            EXECUTE IMMEDIATE 'ALTER TABLE {EXCHANGE_TABLE} ADD CONSTRAINT {EXCHANGE_PRIMARY_KEY}'",
+        f"                || ' PRIMARY KEY ({FACT_KEY_COLUMN})';",
+        "        END IF;",
+        "        -- INCLUDING INDEXES exige en la tabla de intercambio los mismos indices, sin particionar.",
+    ]
+    for index in wanted:
+        lines += _indent(_ensure(index, EXCHANGE_TABLE, _exchange_name(index), local=False), 8)
+    lines.append("    ELSE")
+    for index in wanted:
+        lines += _indent(_ensure(index, FACT_TABLE, index.name, local=False), 8)
+    lines += ["    END IF;", "END;", "/", ""]
+    return lines
+
+
+def _window_source(indent: int, by_month: bool = True) -> List[str]:
+    """Hechos (del mes m si by_month) desde STG_DW_VENTAS (llenada por load_dw_from_oltp.sql), con claves sustitutas."""
+    lines = [
+        "SELECT /*+ USE_HASH(t dp u) */",
+        "    s.ProductoID,",
+        "    s.PedidoID,",
+        "    t.TiempoID,",
+        "    NVL(u.UbicacionID, 0) AS UbicacionID,",
+        "    dp.CategoriaID,",
+        "    s.CantidadVendida,",
+        "    s.MontoTotal,",
+        "    s.Fecha",
+        f"FROM {STAGING_TABLE} s",
+        "JOIN DW_DIM_TIEMPO t ON t.Fecha = s.Fecha",
+        "JOIN DW_DIM_PRODUCTO dp ON dp.ProductoID = s.ProductoID",
+        "LEFT JOIN DW_DIM_UBICACION u ON u.CiudadID = s.CiudadID",
+    ]
+    if by_month:
+        lines += ["WHERE s.Fecha >= m.Mes", "  AND s.Fecha < ADD_MONTHS(m.Mes, 1)"]
+    return _indent(lines, indent)
+
+
+def _exchange_procedure() -> List[str]:
+    columns = ", ".join(FACT_COLUMNS)
+    width = len(FACT_COLUMNS) // 2
+    column_lines = [", ".join(FACT_COLUMNS[:width]) + ",", ", ".join(FACT_COLUMNS[width:])]
+    return [
+        f"-- Carga de hechos por intercambio de particiones; load_dw_from_oltp.sql la llama cuando {FACT_TABLE}",
+        f"-- esta particionada, despues de llenar {STAGING_TABLE}. Por cada mes de la ventana:",
+        f"--  1. {EXCHANGE_TABLE} recibe los hechos del mes fuera de la ventana y los de la ventana",
+        "--     (los ya cargados en una corrida fallida conservan su FactID);",
+        "--  2. EXCHANGE PARTITION cambia la tabla por la particion del mes (solo diccionario).",
+        "-- Las filas de la ventana se reemplazan completas: repetir la ventana no duplica hechos. Antes del",
+        "-- ciclo, los hechos de la ventana cuya orden cambio de mes se mueven a la particion nueva (conservan",
+        "-- FactID y el intercambio de ese mes los reemplaza), como hace el MERGE de la carga heap.",
+        f"CREATE OR REPLACE PROCEDURE {EXCHANGE_PROCEDURE} IS",
+        "    v_inicio TIMESTAMP := SYSTIMESTAMP;",
+        "    v_desde  NUMBER;",
+        "    v_hasta  NUMBER;",
+        "    v_mes    VARCHAR2(10);",
+        "    v_filas  NUMBER := 0;",
+        "BEGIN",
+        "    SELECT UltimoOrdenID, OrdenIDHasta INTO v_desde, v_hasta",
+        "    FROM ETL_CONTROL",
+        f"    WHERE Proceso = '{FACT_PROCESS}';",
+        "",
+        "    -- Claves que la carga va a cambiar: refresh_dw_aggregates.sql recalcula tambien los grupos que dejan.",
+        f"    INSERT INTO {PREVIOUS_KEYS_TABLE} (PedidoID, TiempoID, CategoriaID, UbicacionID, ProductoID)",
+        "    SELECT e.PedidoID, e.TiempoID, e.CategoriaID, e.UbicacionID, e.ProductoID",
+        "    FROM (",
+        *_window_source(8, by_month=False),
+        "    ) w",
+        f"    JOIN {FACT_TABLE} e",
+        "        ON e.PedidoID = w.PedidoID",
+        "       AND e.ProductoID = w.ProductoID",
+        "    WHERE e.PedidoID > v_desde",
+        "      AND e.PedidoID <= v_hasta",
+        "      AND (",
+        "          DECODE(e.TiempoID, w.TiempoID, 0, 1) = 1",
+        "          OR DECODE(e.UbicacionID, w.UbicacionID, 0, 1) = 1",
+        "          OR DECODE(e.CategoriaID, w.CategoriaID, 0, 1) = 1",
+        "      );",
+        "",
+        "    -- Solo se reconstruyen los meses de la ventana: un hecho que quedo en otro mes se mueve al suyo",
+        "    -- (ROW MOVEMENT) para que no quede duplicado en la particion anterior.",
+        f"    UPDATE {FACT_TABLE} f",
+        "    SET f.Fecha = (",
+        "        SELECT s.Fecha",
+        f"        FROM {STAGING_TABLE} s",
+        "        WHERE s.PedidoID = f.PedidoID",
+        "          AND s.ProductoID = f.ProductoID",
+        "    )",
+        "    WHERE f.PedidoID > v_desde",
+        "      AND f.PedidoID <= v_hasta",
+        "      AND EXISTS (",
+        "          SELECT 1",
+        f"          FROM {STAGING_TABLE} s",
+        "          WHERE s.PedidoID = f.PedidoID",
+        "            AND s.ProductoID = f.ProductoID",
+        "            AND TRUNC(s.Fecha, 'MM') != TRUNC(f.Fecha, 'MM')",
+        "      );",
+        "    COMMIT;",
+        "",
+        "    FOR m IN (",
+        "        SELECT DISTINCT TRUNC(Fecha, 'MM') AS Mes",
+        f"        FROM {STAGING_TABLE}",
+        "        ORDER BY Mes",
+        "    ) LOOP",
+        "        v_mes := TO_CHAR(m.Mes, 'YYYY-MM-DD');",
+        "        -- LOCK TABLE ... PARTITION FOR crea la particion del mes si aun no existe.",
+        f"        EXECUTE IMMEDIATE 'LOCK TABLE {FACT_TABLE} PARTITION FOR (DATE ''' || v_mes || ''') IN SHARE MODE';",
+        f"        EXECUTE IMMEDIATE 'TRUNCATE TABLE {EXCHANGE_TABLE}';",
+        "",
+        f"        INSERT /*+ APPEND */ INTO {EXCHANGE_TABLE} (",
+        *_indent(column_lines, 12),
+        "        )",
+        f"        SELECT {columns}",
+        f"        FROM {FACT_TABLE}",
+        "        WHERE Fecha >= m.Mes",
+        "          AND Fecha < ADD_MONTHS(m.Mes, 1)",
+        "          AND (PedidoID IS NULL OR PedidoID <= v_desde OR PedidoID > v_hasta);",
+        "        COMMIT;",
+        "",
+        f"        INSERT /*+ APPEND */ INTO {EXCHANGE_TABLE} (",
+        *_indent(column_lines, 12),
+        "        )",
+        "        SELECT NVL(s.FactID, SEQ_DW_FACT_VENTAS.NEXTVAL), s.ProductoID, s.TiempoID, s.UbicacionID, s.PedidoID,",
+        "               s.CategoriaID, s.CantidadVendida, s.MontoTotal, s.Fecha",
+        "        FROM (",
+        "            SELECT w.*, f.FactID",
+        "            FROM (",
+        *_window_source(16),
+        "            ) w",
+        f"            LEFT JOIN {FACT_TABLE} f",
+        "                ON f.PedidoID = w.PedidoID",
+        "               AND f.ProductoID = w.ProductoID",
+        "               AND f.Fecha >= m.Mes",
+        "               AND f.Fecha < ADD_MONTHS(m.Mes, 1)",
+        "        ) s;",
+        "        v_filas := v_filas + SQL%ROWCOUNT;",
+        "        COMMIT;",
+        "",
+        f"        EXECUTE IMMEDIATE 'ALTER TABLE {FACT_TABLE} EXCHANGE PARTITION FOR (DATE ''' || v_mes || ''')'",
+        f"            || ' WITH TABLE {EXCHANGE_TABLE} INCLUDING INDEXES WITHOUT VALIDATION UPDATE GLOBAL INDEXES';",
+        "    END LOOP;",
+        "",
+        "    -- Tras el ultimo intercambio la tabla guarda la particion anterior: se vacia.",
+        f"    EXECUTE IMMEDIATE 'TRUNCATE TABLE {EXCHANGE_TABLE}';",
+        f"    ETL_LOG_FILAS('{FACT_TABLE}', v_filas, v_inicio);",
+        "END;",
+        "/",
+        "",
+    ]
+
+
+def build_ddl(partitioning: str = DEFAULT_PARTITIONING, indexes: str = DEFAULT_INDEXES) -> str:
+    _validate(partitioning, indexes)
+    lines = [
+        "-- Generado por scripts/python/dw/generate_dw_fact_storage.py; no editar a mano.",
+        f"-- Almacenamiento de {FACT_TABLE}: --partitioning {partitioning} --indexes {indexes}.",
+        "",
+    ]
+    lines += _fecha_block()
+    if partitioning == "mensual":
+        lines += _partition_block()
+    lines += _index_block(indexes)
+    if partitioning == "mensual":
+        lines += _exchange_procedure()
+    return "\n".join(lines)
+
+
+def generate_storage(
+    path: Path = DDL_PATH, partitioning: str = DEFAULT_PARTITIONING, indexes: str = DEFAULT_INDEXES
+) -> Path:
+    text = build_ddl(partitioning, indexes)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def is_stale(path: Path = DDL_PATH, partitioning: str = DEFAULT_PARTITIONING, indexes: str = DEFAULT_INDEXES) -> bool:
+    """True si el archivo no coincide con lo que generarian estas opciones."""
+    return not path.exists() or path.read_text(encoding="utf-8") != build_ddl(partitioning, indexes)
+
+
+def _parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Genera el particionamiento y los indices de DW_FACT_VENTAS.")
+    parser.add_argument("--ddl", type=Path, default=DDL_PATH, help="Salida del DDL.")
+    parser.add_argument(
+        "--partitioning",
+        choices=PARTITIONINGS,
+        default=DEFAULT_PARTITIONING,
+        help="none: tabla heap; mensual: RANGE (Fecha) INTERVAL 1 mes y carga por EXCHANGE PARTITION.",
+    )
+    parser.add_argument(
+        "--indexes",
+        choices=INDEX_KINDS,
+        default=DEFAULT_INDEXES,
+        help="btree: indice compuesto de claves; bitmap: un bitmap por clave (star transformation).",
+    )
+    parser.add_argument("--check", action="store_true", help="No escribe; termina con error si hay diferencias.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = _parse_args(argv)
+    if args.check:
+        if is_stale(args.ddl, args.partitioning, args.indexes):
+            raise SystemExit(f"Almacenamiento del hecho desactualizado: {args.ddl}")
+        print("Almacenamiento del hecho al dia.")
+        return
+    path = generate_storage(args.ddl, args.partitioning, args.indexes)
+    print(f"Almacenamiento del hecho ({args.partitioning}, {args.indexes}): {path}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
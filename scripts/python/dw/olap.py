@@ -0,0 +1,482 @@
+"""
+Motor OLAP en proceso sobre extractos del DW: responde "producto mas vendido por
+fecha/categoria/provincia/ciudad" (VW_MAS_VENDIDO) y otros group-by/top-N sin ir a Oracle.
+
+Los extractos son los de dw/export_star_schema.py: Parquet o CSV .gz, con manifest.json y el hecho
+particionado por anio/mes (--desde/--hasta leen solo las particiones del rango, elegidas en el
+manifiesto). Sin manifiesto se aceptan archivos sueltos con encabezado, uno por tabla
+(<TABLA>.csv, .csv.gz o .parquet): DW_FACT_VENTAS, DW_DIM_TIEMPO, DW_DIM_CATEGORIA, DW_DIM_PRODUCTO
+y DW_DIM_UBICACION. Al cargarlos, cada atributo de ATTRIBUTES
+queda como un arreglo NumPy de codigos (int32) alineado con las filas del hecho, con su
+diccionario de valores ordenado; las medidas quedan como arreglos float64. Un group-by combina los
+codigos en una sola clave entera (base mixta), la agrupa con np.unique y suma con np.bincount; el
+top-N por grupo ordena esa agregacion con np.lexsort. Como en VW_MAS_VENDIDO, los hechos sin fila
+en una dimension usada por la consulta quedan fuera (JOIN).
+
+Las agregaciones se cachean por forma de consulta (atributos, medida y filtros): pedir el top 1 y
+luego el top 5 de la misma forma reutiliza la agregacion.
+
+Requiere numpy (pip install numpy); los extractos Parquet requieren ademas pyarrow.
+
+Uso (desde la raiz del repo):
+    python scripts/python/dw/olap.py --extracts data/output/dw_extracts
+    python scripts/python/dw/olap.py --by anio mes provincia --rank categoria --measure monto --top 3 \\
+        --where provincia=PICHINCHA --desde 2024-01 --hasta 2024-06
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import gzip
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from dw import export_star_schema
+
+DEFAULT_EXTRACTS_DIR = export_star_schema.DEFAULT_OUTPUT_DIR
+FACT_TABLE = export_star_schema.FACT_TABLE
+DEFAULT_CACHE_SIZE = 128
+# Consulta por defecto: la de VW_MAS_VENDIDO.
+DEFAULT_BY = ("fecha", "categoria", "provincia", "ciudad")
+DEFAULT_RANK = "producto"
+_MAX_COMBINED_KEY = 2**62
+
+
+@dataclass(frozen=True)
+class Attribute:
+    table: str
+    key: str  # columna de DW_FACT_VENTAS y clave primaria de la dimension
+    column: str
+    kind: str = "text"  # text | int | date
+
+
+ATTRIBUTES: Dict[str, Attribute] = {
+    "fecha": Attribute("DW_DIM_TIEMPO", "TiempoID", "Fecha", "date"),
+    "anio": Attribute("DW_DIM_TIEMPO", "TiempoID", "Anio", "int"),
+    "mes": Attribute("DW_DIM_TIEMPO", "TiempoID", "Mes", "int"),
+    "trimestre": Attribute("DW_DIM_TIEMPO", "TiempoID", "Trimestre", "int"),
+    "categoria": Attribute("DW_DIM_CATEGORIA", "CategoriaID", "Nombre"),
+    "producto": Attribute("DW_DIM_PRODUCTO", "ProductoID", "Descripcion"),
+    "provincia": Attribute("DW_DIM_UBICACION", "UbicacionID", "Provincia"),
+    "canton": Attribute("DW_DIM_UBICACION", "UbicacionID", "Canton"),
+    "parroquia": Attribute("DW_DIM_UBICACION", "UbicacionID", "Parroquia"),
+    "ciudad": Attribute("DW_DIM_UBICACION", "UbicacionID", "Ciudad"),
+}
+# Medida -> columna de DW_FACT_VENTAS (None: numero de lineas de hecho).
+MEASURES: Dict[str, Optional[str]] = {"cantidad": "CantidadVendida", "monto": "MontoTotal", "lineas": None}
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ValueError("El motor OLAP requiere numpy: pip install numpy")
+
+
+def extract_path(directory: Path, table: str) -> Path:
+    """<TABLA>.csv, <TABLA>.csv.gz o <TABLA>.parquet dentro de directory."""
+    for name in (f"{table}.csv", f"{table}.csv.gz", f"{table}.parquet"):
+        path = directory / name
+        if path.exists():
+            return path
+    raise FileNotFoundError(f"No se encontro el extracto de {table} en {directory}")
+
+
+def extract_paths(
+    directory: Path,
+    table: str,
+    desde: Optional[Tuple[int, int]] = None,
+    hasta: Optional[Tuple[int, int]] = None,
+) -> List[Path]:
+    """Archivos de una tabla: los del manifiesto (particiones del hecho en [desde, hasta]) o el suelto."""
+    manifest = export_star_schema.load_manifest(directory)
+    if manifest is None or table not in manifest["tablas"]:
+        if desde is not None or hasta is not None:
+            raise ValueError(f"--desde/--hasta requieren el manifiesto de dw/export_star_schema.py en {directory}")
+        return [extract_path(directory, table)]
+    if table == FACT_TABLE:
+        partitions = export_star_schema.select_partitions(manifest, desde, hasta)
+        return [directory / partition["archivo"] for partition in partitions]
+    return [directory / manifest["tablas"][table]["archivo"]]
+
+
+def _read_parquet(path: Path, columns: Sequence[str]) -> Dict[str, List[str]]:
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise ValueError("Los extractos Parquet requieren pyarrow: pip install pyarrow") from exc
+    names = {name.upper(): name for name in pq.read_schema(path).names}
+    missing = [name for name in columns if name.upper() not in names]
+    if missing:
+        raise ValueError(f"{path}: faltan columnas {', '.join(missing)}")
+    table = pq.read_table(path, columns=[names[name.upper()] for name in columns])
+    return {
+        name: ["" if value is None else str(value) for value in table.column(position).to_pylist()]
+        for position, name in enumerate(columns)
+    }
+
+
+def read_extract(path: Path, columns: Iterable[str]) -> Dict[str, List[str]]:
+    """Columnas pedidas de un extracto, como listas de texto (encabezado sin distinguir mayusculas)."""
+    if path.suffix == ".parquet":
+        return _read_parquet(path, list(dict.fromkeys(columns)))
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rt", encoding="utf-8", newline="") as fh:
+        reader = csv.reader(fh)
+        header = [name.strip().upper() for name in next(reader, [])]
+        wanted = list(dict.fromkeys(columns))
+        missing = [name for name in wanted if name.upper() not in header]
+        if missing:
+            raise ValueError(f"{path}: faltan columnas {', '.join(missing)}")
+        positions = [header.index(name.upper()) for name in wanted]
+        data: Dict[str, List[str]] = {name: [] for name in wanted}
+        lists = [data[name] for name in wanted]
+        for row in reader:
+            for values, position in zip(lists, positions):
+                values.append(row[position])
+    return data
+
+
+def read_extracts(paths: Sequence[Path], columns: Iterable[str]) -> Dict[str, List[str]]:
+    """read_extract de varios archivos (particiones) concatenados en orden."""
+    wanted = list(dict.fromkeys(columns))
+    data: Dict[str, List[str]] = {name: [] for name in wanted}
+    for path in paths:
+        for name, values in read_extract(path, wanted).items():
+            data[name].extend(values)
+    return data
+
+
+def _label(text: str, kind: str) -> Any:
+    text = text.strip()
+    if not text:
+        return None
+    if kind == "int":
+        return int(float(text))
+    if kind == "date":
+        return text[:10]
+    return text
+
+
+def _numbers(values: Sequence[str]) -> "np.ndarray":
+    return np.array([float(value) if value.strip() else np.nan for value in values], dtype=np.float64)
+
+
+def _ids(values: Sequence[str]) -> "np.ndarray":
+    return np.array([int(float(value)) for value in values], dtype=np.int64)
+
+
+def _join(dim_ids: "np.ndarray", fact_ids: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """
+    Join vectorizado por busqueda binaria: (orden de la dimension por id, fila de la dimension
+    ordenada para cada hecho, hechos con fila en la dimension).
+    """
+    order = np.argsort(dim_ids, kind="stable")
+    sorted_ids = dim_ids[order]
+    if not len(sorted_ids):
+        return order, np.zeros(len(fact_ids), dtype=np.int64), np.zeros(len(fact_ids), dtype=bool)
+    position = np.searchsorted(sorted_ids, fact_ids)
+    rows = np.minimum(position, len(sorted_ids) - 1)
+    return order, rows, sorted_ids[rows] == fact_ids
+
+
+def _sort_key(value: Any) -> Tuple[bool, Any]:
+    return (value is None, value if value is not None else 0)
+
+
+@dataclass
+class EncodedColumn:
+    """Atributo codificado por diccionario: values[codes[i]] es el valor de la fila i del hecho."""
+
+    values: List[Any]
+    codes: "np.ndarray"
+
+    def lookup(self, wanted: Iterable[Any]) -> "np.ndarray":
+        index = {value: code for code, value in enumerate(self.values)}
+        return np.array([index[value] for value in wanted if value in index], dtype=np.int32)
+
+
+@dataclass
+class Aggregate:
+    """Resultado de un group-by: una fila por combinacion de codigos presente en los hechos."""
+
+    by: Tuple[str, ...]
+    codes: "np.ndarray"  # (grupos, len(by))
+    totals: "np.ndarray"
+
+
+class SalesCube:
+    """Hecho de ventas en columnas NumPy con atributos de dimension codificados por diccionario."""
+
+    def __init__(
+        self,
+        columns: Mapping[str, EncodedColumn],
+        measures: Mapping[str, "np.ndarray"],
+        valid: Mapping[str, "np.ndarray"],
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ) -> None:
+        _require_numpy()
+        self.columns = dict(columns)
+        self.measures = dict(measures)
+        self.valid = dict(valid)  # tabla de dimension -> filas del hecho con fila en esa dimension
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[tuple, Aggregate]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def rows(self) -> int:
+        return len(next(iter(self.measures.values())))
+
+    @classmethod
+    def from_extracts(
+        cls,
+        directory: Path = DEFAULT_EXTRACTS_DIR,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        desde: Optional[Tuple[int, int]] = None,
+        hasta: Optional[Tuple[int, int]] = None,
+    ) -> "SalesCube":
+        """Carga los extractos; desde/hasta (anio, mes) podan las particiones del hecho por manifiesto."""
+        _require_numpy()
+        tables: Dict[str, List[Attribute]] = {}
+        for attribute in ATTRIBUTES.values():
+            tables.setdefault(attribute.table, []).append(attribute)
+        keys = sorted({attribute.key for attribute in ATTRIBUTES.values()})
+        fact_columns = keys + [column for column in MEASURES.values() if column]
+        fact = read_extracts(extract_paths(directory, FACT_TABLE, desde, hasta), fact_columns)
+
+        columns: Dict[str, EncodedColumn] = {}
+        valid: Dict[str, np.ndarray] = {}
+        for table, attributes in tables.items():
+            key = attributes[0].key
+            dimension = read_extracts(extract_paths(directory, table), [key] + [a.column for a in attributes])
+            order, rows, found = _join(_ids(dimension[key]), _ids(fact[key]))
+            valid[table] = found
+            for attribute_name, attribute in ATTRIBUTES.items():
+                if attribute.table != table:
+                    continue
+                labels = [_label(text, attribute.kind) for text in dimension[attribute.column]]
+                values = sorted(set(labels), key=_sort_key) or [None]
+                index = {value: code for code, value in enumerate(values)}
+                dim_codes = np.array([index[label] for label in labels], dtype=np.int32)[order]
+                codes = dim_codes[rows] if len(dim_codes) else np.zeros(len(rows), dtype=np.int32)
+                columns[attribute_name] = EncodedColumn(values, np.where(found, codes, 0).astype(np.int32))
+
+        measures = {name: _numbers(fact[column]) for name, column in MEASURES.items() if column}
+        measures["lineas"] = np.ones(len(fact[keys[0]]), dtype=np.float64)
+        return cls(columns, measures, valid, cache_size=cache_size)
+
+    def _check(self, names: Iterable[str]) -> None:
+        unknown = [name for name in names if name not in self.columns]
+        if unknown:
+            raise ValueError(f"Atributos desconocidos: {', '.join(unknown)}. Usa {', '.join(self.columns)}")
+
+    def _mask(self, attributes: Iterable[str], where: Mapping[str, Tuple[Any, ...]]) -> "np.ndarray":
+        mask = np.ones(self.rows, dtype=bool)
+        for table in sorted({ATTRIBUTES[name].table for name in attributes}):
+            mask &= self.valid[table]
+        for name, wanted in where.items():
+            column = self.columns[name]
+            mask &= np.isin(column.codes, column.lookup(wanted))
+        return mask
+
+    @staticmethod
+    def _normalize_where(where: Optional[Mapping[str, Any]]) -> Tuple[Tuple[str, Tuple[Any, ...]], ...]:
+        if not where:
+            return ()
+        shape = []
+        for name, value in where.items():
+            values = tuple(value) if isinstance(value, (list, tuple, set, frozenset)) else (value,)
+            kind = ATTRIBUTES[name].kind if name in ATTRIBUTES else "text"
+            labels = tuple(sorted({_label(str(item), kind) for item in values}, key=_sort_key))
+            shape.append((name, labels))
+        return tuple(sorted(shape))
+
+    def aggregate(
+        self,
+        by: Sequence[str],
+        measure: str = "cantidad",
+        where: Optional[Mapping[str, Any]] = None,
+    ) -> Aggregate:
+        """SUM(measure) GROUP BY by, con filtros de igualdad/IN en where; cacheado por forma de consulta."""
+        by = tuple(by)
+        if measure not in self.measures:
+            raise ValueError(f"Medida desconocida: {measure}. Usa {', '.join(self.measures)}")
+        filters = self._normalize_where(where)
+        self._check(list(by) + [name for name, _ in filters])
+        shape = (by, measure, filters)
+        cached = self._cache.get(shape)
+        if cached is not None:
+            self.hits += 1
+            self._cache.move_to_end(shape)
+            return cached
+        self.misses += 1
+
+        mask = self._mask(by + tuple(name for name, _ in filters), dict(filters))
+        weights = self.measures[measure][mask]
+        codes = [self.columns[name].codes[mask].astype(np.int64) for name in by]
+        cards = [len(self.columns[name].values) for name in by]
+        combined_cards = 1
+        for card in cards:
+            combined_cards *= card
+        if not by:
+            group_codes = np.zeros((1 if len(weights) else 0, 0), dtype=np.int64)
+            totals = np.array([np.nansum(weights)]) if len(weights) else np.zeros(0)
+        elif combined_cards < _MAX_COMBINED_KEY:
+            combined = np.zeros(len(weights), dtype=np.int64)
+            for column, card in zip(codes, cards):
+                combined = combined * card + column
+            keys, inverse = np.unique(combined, return_inverse=True)
+            totals = np.bincount(inverse, weights=np.nan_to_num(weights), minlength=len(keys))
+            group_codes = np.empty((len(keys), len(by)), dtype=np.int64)
+            for position in range(len(by) - 1, -1, -1):
+                group_codes[:, position] = keys % cards[position]
+                keys = keys // cards[position]
+        else:
+            group_codes, inverse = np.unique(np.stack(codes, axis=1), axis=0, return_inverse=True)
+            totals = np.bincount(inverse.ravel(), weights=np.nan_to_num(weights), minlength=len(group_codes))
+        result = Aggregate(by, group_codes, totals)
+
+        self._cache[shape] = result
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return result
+
+    def top(
+        self,
+        by: Sequence[str] = DEFAULT_BY,
+        rank: str = DEFAULT_RANK,
+        measure: str = "cantidad",
+        n: int = 1,
+        where: Optional[Mapping[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Los n valores de rank con mayor SUM(measure) en cada grupo de by (n=1 con los defaults es
+        VW_MAS_VENDIDO). Empates: gana el valor menor de rank, para que el resultado sea estable.
+        """
+        if n < 1:
+            raise ValueError("n debe ser positivo")
+        by = tuple(by)
+        aggregate = self.aggregate(by + (rank,), measure, where)
+        if not len(aggregate.totals):
+            return []
+        outer = np.zeros(len(aggregate.totals), dtype=np.int64)
+        if by:
+            # Grupo de cada fila de la agregacion (sin el atributo rankeado), en orden de codigos.
+            outer = np.unique(aggregate.codes[:, : len(by)], axis=0, return_inverse=True)[1].ravel()
+        order = np.lexsort((aggregate.codes[:, -1], -aggregate.totals, outer))
+        sorted_outer = outer[order]
+        starts = np.r_[True, sorted_outer[1:] != sorted_outer[:-1]]
+        first = np.maximum.accumulate(np.where(starts, np.arange(len(order)), 0))
+        keep = order[(np.arange(len(order)) - first) < n]
+        return self._rows(aggregate, keep, measure)
+
+    def group(
+        self,
+        by: Sequence[str],
+        measure: str = "cantidad",
+        where: Optional[Mapping[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """SUM(measure) por grupo de by, ordenado por los valores de by."""
+        aggregate = self.aggregate(by, measure, where)
+        keep = np.lexsort(aggregate.codes.T[::-1]) if len(aggregate.by) else np.arange(len(aggregate.totals))
+        return self._rows(aggregate, keep, measure)
+
+    def _rows(self, aggregate: Aggregate, keep: "np.ndarray", measure: str) -> List[Dict[str, Any]]:
+        rows: List[Dict[str, Any]] = []
+        for index in keep.tolist():
+            row = {
+                name: self.columns[name].values[int(aggregate.codes[index, position])]
+                for position, name in enumerate(aggregate.by)
+            }
+            total = float(aggregate.totals[index])
+            row[measure] = int(total) if measure == "lineas" else total
+            rows.append(row)
+        return rows
+
+    def cache_info(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._cache), "maxsize": self.cache_size}
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+
+
+def _format(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        return f"{value:.2f}"
+    return str(value)
+
+
+def _parse_where(text: str) -> Tuple[str, List[str]]:
+    name, _, values = text.partition("=")
+    if not name or not values:
+        raise argparse.ArgumentTypeError(f"Se esperaba ATRIBUTO=VALOR[,VALOR...]: {text}")
+    return name.strip().lower(), [value.strip() for value in values.split(",")]
+
+
+def _parse_month(text: str) -> Tuple[int, int]:
+    anio, _, mes = text.partition("-")
+    if not (anio.isdigit() and mes.isdigit() and 1 <= int(mes) <= 12):
+        raise argparse.ArgumentTypeError(f"Se esperaba AAAA-MM: {text}")
+    return int(anio), int(mes)
+
+
+def _parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Group-by/top-N en proceso sobre extractos del DW.")
+    parser.add_argument("--extracts", type=Path, default=DEFAULT_EXTRACTS_DIR, help="Directorio de extractos.")
+    parser.add_argument("--by", nargs="+", default=list(DEFAULT_BY), choices=list(ATTRIBUTES), help="Atributos de grupo.")
+    parser.add_argument(
+        "--rank",
+        choices=list(ATTRIBUTES),
+        default=DEFAULT_RANK,
+        help="Atributo a rankear dentro de cada grupo (con --top).",
+    )
+    parser.add_argument("--measure", choices=list(MEASURES), default="cantidad", help="Medida a sumar.")
+    parser.add_argument("--top", type=int, default=1, help="Valores de --rank por grupo; 0 = solo group-by.")
+    parser.add_argument(
+        "--where",
+        type=_parse_where,
+        action="append",
+        default=[],
+        metavar="ATRIBUTO=VALOR[,VALOR]",
+        help="Filtro de igualdad (o IN con comas); se puede repetir.",
+    )
+    parser.add_argument("--desde", type=_parse_month, metavar="AAAA-MM", help="Primer mes de hechos a cargar.")
+    parser.add_argument("--hasta", type=_parse_month, metavar="AAAA-MM", help="Ultimo mes de hechos a cargar.")
+    parser.add_argument("--limit", type=int, default=20, help="Filas a imprimir (0 = todas).")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = _parse_args(argv)
+    where = dict(args.where)
+    try:
+        cube = SalesCube.from_extracts(args.extracts, desde=args.desde, hasta=args.hasta)
+        if args.top > 0:
+            rows = cube.top(args.by, args.rank, args.measure, args.top, where)
+        else:
+            rows = cube.group(args.by, args.measure, where)
+    except (FileNotFoundError, ValueError) as exc:
+        raise SystemExit(f"Consulta detenida: {exc}") from exc
+    shown = rows if args.limit <= 0 else rows[: args.limit]
+    if shown:
+        print(" | ".join(shown[0]))
+    for row in shown:
+        print(" | ".join(_format(value) for value in row.values()))
+    print(f"{len(rows)} filas ({cube.rows} hechos).")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -3,40 +3,40 @@
 from __future__ import annotations
 
 import csv
-import re
+import sys
 from collections import defaultdict, OrderedDict
 from pathlib import Path
-from typing import List
+from typing import Iterator, List
+
+if __package__ in (None, ""):
+    # Permite ejecutar el script directamente: python scripts/python/jerarquia/build_jerarquia_csv.py
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from comun.sql_values import iter_values_rows
 
 ROOT = Path(__file__).resolve().parents[3]
 SQL_DIR = ROOT / "data" / "Datos-Geograficos-Ecuador"
 OUTPUT_DIR = ROOT / "data" / "raw" / "jerarquia"
-
-
-def _extract_rows(path: Path, expected_columns: int) -> List[List[str]]:
-    text = path.read_text(encoding="latin-1")
-    marker = "VALUES"
-    idx = text.upper().find(marker)
-    if idx == -1:
-        raise ValueError(f"No se encontro la clausula VALUES en {path}")
-    body = text[idx + len(marker) :].strip()
-    body = body.rstrip(";")
-    fragments = re.split(r"\),\s*", body)
-    rows: List[List[str]] = []
-    for fragment in fragments:
-        fragment = fragment.strip()
-        if fragment.endswith(")"):
-            fragment = fragment[:-1]
-        if fragment.startswith("("):
-            fragment = fragment[1:]
-        if not fragment:
-            continue
-        reader = csv.reader([fragment], delimiter=",", quotechar="'", skipinitialspace=True)
-        parsed = next(reader)
-        if len(parsed) != expected_columns:
+GENERATOR_VERSION = "2"
+
+
+def _extract_rows(path: Path, expected_columns: int) -> Iterator[tuple[str, ...]]:
+    """
+    Recorre en streaming todas las sentencias INSERT ... VALUES del dump y produce las filas
+    con expected_columns columnas. Las filas con otro numero de columnas se reportan al final.
+    """
+    found = False
+    skipped = 0
+    for row in iter_values_rows(path, encoding="latin-1"):
+        found = True
+        if len(row) != expected_columns:
+            skipped += 1
             continue
-        rows.append([value.strip() for value in parsed])
-    return rows
+        yield tuple("" if value is None else value.strip() for value in row)
+    if not found:
+        raise ValueError(f"No se encontro la clausula VALUES en {path}")
+    if skipped:
+        print(f"Aviso: {path.name}: {skipped} filas no tienen {expected_columns} columnas y se omitieron.")
 
 
 def build_geo_csv() -> None:
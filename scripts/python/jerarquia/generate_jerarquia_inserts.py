@@ -10,9 +10,17 @@ import csv
 import sys
 from dataclasses import dataclass
 from pathlib import Path
-from textwrap import dedent
 from typing import Iterable, List, Optional
 
+if __package__ in (None, ""):
+    # Permite ejecutar el script directamente: python scripts/python/jerarquia/generate_jerarquia_inserts.py
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from comun.name_keys import derive_aliases, normalize_key
+from comun.sequences import SequenceSpec, realign_block
+from comun.sql_emitter import DEFAULT_BATCH_SIZE, DEFAULT_INSERT_MODE, INSERT_MODES, insert_statements
+from comun.sqlloader import LoaderColumn, sqlldr_command, write_control_file, write_data_file
+
 ROOT = Path(__file__).resolve().parents[3]
 DEFAULT_SOURCE_DIR = ROOT / "data" / "raw" / "jerarquia"
 OUTPUT_DIR = ROOT / "data" / "output" / "jerarquia"
@@ -26,6 +34,12 @@ MANUAL_SQL_FILES = (
     "insert_cantones.sql",
     "insert_parroquias.sql",
 )
+SQLLDR_SCRIPT_NAME = "load_jerarquia_sqlldr.sql"
+# Nombres de provincia tal como los publica GeoNames (CIUDAD.PROVINCIA): fuente de NOMBRE_ALIAS.
+ADMIN1_FILE = ROOT / "data" / "raw" / "ciudades" / "admin1CodesASCII.txt"
+ALIAS_COUNTRY = "EC"
+ALIAS_COLUMNS = ("TIPO", "ALIAS_CLAVE", "CLAVE")
+GENERATOR_VERSION = "3"
 
 
 @dataclass
@@ -74,40 +88,37 @@ def _load_csv(path: Path, required_columns: Iterable[str]) -> List[dict[str, str
         return rows
 
 
-def _escape(value: str) -> str:
-    return "'" + value.replace("'", "''") + "'"
-
-
-def _generate_sequence_alignment_block() -> str:
-    return dedent(
-        """\
-        DECLARE
-            v_target  NUMBER;
-            v_current NUMBER;
-        BEGIN
-            SELECT NVL(MAX(PROVINCIAID), 0) INTO v_target FROM PROVINCIAS;
-            SELECT SEQ_PROVINCIA.NEXTVAL INTO v_current FROM DUAL;
-            WHILE v_current <= v_target LOOP
-                SELECT SEQ_PROVINCIA.NEXTVAL INTO v_current FROM DUAL;
-            END LOOP;
-
-            SELECT NVL(MAX(CANTONID), 0) INTO v_target FROM CANTONES;
-            SELECT SEQ_CANTON.NEXTVAL INTO v_current FROM DUAL;
-            WHILE v_current <= v_target LOOP
-                SELECT SEQ_CANTON.NEXTVAL INTO v_current FROM DUAL;
-            END LOOP;
-
-            SELECT NVL(MAX(PARROQUIAID), 0) INTO v_target FROM PARROQUIAS;
-            SELECT SEQ_PARROQUIA.NEXTVAL INTO v_current FROM DUAL;
-            WHILE v_current <= v_target LOOP
-                SELECT SEQ_PARROQUIA.NEXTVAL INTO v_current FROM DUAL;
-            END LOOP;
-        END;
-        /
-        """
+def _generate_sequence_alignment_block(provinces: int, cantons: int, parroquias: int) -> str:
+    """Realinea las secuencias de la jerarquia tras cargar ids explicitos (CACHE segun filas cargadas)."""
+    return realign_block(
+        (
+            SequenceSpec("SEQ_PROVINCIA", "PROVINCIAS", "PROVINCIAID", provinces),
+            SequenceSpec("SEQ_CANTON", "CANTONES", "CANTONID", cantons),
+            SequenceSpec("SEQ_PARROQUIA", "PARROQUIAS", "PARROQUIAID", parroquias),
+        )
     )
 
 
+def _admin1_names(path: Path, country: str) -> list[str]:
+    """Nombres (con y sin tildes) de las provincias de country en admin1CodesASCII.txt."""
+    if not path.exists():
+        return []
+    names: list[str] = []
+    with path.open("r", encoding="utf-8") as fh:
+        for line in fh:
+            parts = line.rstrip("\n").split("\t")
+            if len(parts) >= 3 and parts[0].startswith(f"{country}."):
+                names.extend(parts[1:3])
+    return names
+
+
+def alias_rows(provinces: Iterable[Province], admin1_path: Path = ADMIN1_FILE) -> list[tuple[str, str, str]]:
+    """Filas de NOMBRE_ALIAS: variantes de GeoNames que no coinciden con la clave canonica."""
+    canonical = [key for key in (normalize_key(province.nombre) for province in provinces) if key]
+    aliases = derive_aliases(_admin1_names(admin1_path, ALIAS_COUNTRY), canonical)
+    return [("PROVINCIA", alias, key) for alias, key in sorted(aliases.items())]
+
+
 def _collect_manual_sql() -> list[Path]:
     available: list[Path] = []
     for filename in MANUAL_SQL_FILES:
@@ -133,46 +144,209 @@ def _combine_manual_sql(paths: list[Path], output: Path) -> None:
                 fh.write("\n")
 
 
-def _build_sql_from_csv(provinces: list[Province], cantons: list[Canton], parroquias: list[Parroquia]) -> list[str]:
+def _build_sql_from_csv(
+    provinces: list[Province],
+    cantons: list[Canton],
+    parroquias: list[Parroquia],
+    mode: str = DEFAULT_INSERT_MODE,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> list[str]:
     lines: list[str] = [
         "-- Jerarquia generada automaticamente desde CSV",
+        "DELETE FROM NOMBRE_ALIAS;",
         "DELETE FROM PARROQUIAS;",
         "DELETE FROM CANTONES;",
         "DELETE FROM PROVINCIAS;",
         "COMMIT;",
     ]
 
-    for province in provinces:
-        lines.append(
-            "INSERT INTO PROVINCIAS (PROVINCIAID, CODIGO, NOMBRE) "
-            f"VALUES ({province.provinciaid}, {_escape(province.codigo)}, {_escape(province.nombre)});"
+    lines.extend(
+        insert_statements(
+            "PROVINCIAS",
+            ("PROVINCIAID", "CODIGO", "NOMBRE", "NOMBRE_CLAVE"),
+            ((p.provinciaid, p.codigo, p.nombre, normalize_key(p.nombre)) for p in provinces),
+            mode=mode,
+            batch_size=batch_size,
         )
+    )
 
     lines.append("")
 
-    for canton in cantons:
-        lines.append(
-            "INSERT INTO CANTONES (CANTONID, PROVINCIAID, CODIGO, NOMBRE) "
-            f"VALUES ({canton.cantonid}, {canton.provinciaid}, {_escape(canton.codigo)}, {_escape(canton.nombre)});"
+    lines.extend(
+        insert_statements(
+            "CANTONES",
+            ("CANTONID", "PROVINCIAID", "CODIGO", "NOMBRE", "NOMBRE_CLAVE"),
+            ((c.cantonid, c.provinciaid, c.codigo, c.nombre, normalize_key(c.nombre)) for c in cantons),
+            mode=mode,
+            batch_size=batch_size,
         )
+    )
 
     lines.append("")
 
-    for parish in parroquias:
-        lines.append(
-            "INSERT INTO PARROQUIAS (PARROQUIAID, CANTONID, CODIGO, NOMBRE) "
-            f"VALUES ({parish.parroquiaid}, {parish.cantonid}, {_escape(parish.codigo)}, {_escape(parish.nombre)});"
+    lines.extend(
+        insert_statements(
+            "PARROQUIAS",
+            ("PARROQUIAID", "CANTONID", "CODIGO", "NOMBRE", "NOMBRE_CLAVE"),
+            ((p.parroquiaid, p.cantonid, p.codigo, p.nombre, normalize_key(p.nombre)) for p in parroquias),
+            mode=mode,
+            batch_size=batch_size,
         )
+    )
+
+    lines.append("")
+    lines.extend(
+        insert_statements("NOMBRE_ALIAS", ALIAS_COLUMNS, alias_rows(provinces), mode=mode, batch_size=batch_size)
+    )
 
     lines.append("COMMIT;")
     lines.append("")
-    lines.append(_generate_sequence_alignment_block().strip())
+    lines.append(_generate_sequence_alignment_block(len(provinces), len(cantons), len(parroquias)))
     return lines
 
 
+def _write_sqlldr_files(
+    provinces: list[Province],
+    cantons: list[Canton],
+    parroquias: list[Parroquia],
+    loader_dir: Path,
+) -> Path:
+    """
+    Escribe un .ctl/.dat por tabla y el script SQL*Plus que vacia las tablas (hijas primero),
+    lanza las cargas direct-path en orden padre -> hija y realinea las secuencias.
+    """
+    tables = (
+        (
+            "PROVINCIAS",
+            (
+                LoaderColumn("PROVINCIAID", "INTEGER EXTERNAL"),
+                LoaderColumn("CODIGO", "CHAR(10)"),
+                LoaderColumn("NOMBRE", "CHAR(150)"),
+                LoaderColumn("NOMBRE_CLAVE", "CHAR(150)"),
+            ),
+            ((p.provinciaid, p.codigo, p.nombre, normalize_key(p.nombre)) for p in provinces),
+        ),
+        (
+            "CANTONES",
+            (
+                LoaderColumn("CANTONID", "INTEGER EXTERNAL"),
+                LoaderColumn("PROVINCIAID", "INTEGER EXTERNAL"),
+                LoaderColumn("CODIGO", "CHAR(10)"),
+                LoaderColumn("NOMBRE", "CHAR(150)"),
+                LoaderColumn("NOMBRE_CLAVE", "CHAR(150)"),
+            ),
+            ((c.cantonid, c.provinciaid, c.codigo, c.nombre, normalize_key(c.nombre)) for c in cantons),
+        ),
+        (
+            "PARROQUIAS",
+            (
+                LoaderColumn("PARROQUIAID", "INTEGER EXTERNAL"),
+                LoaderColumn("CANTONID", "INTEGER EXTERNAL"),
+                LoaderColumn("CODIGO", "CHAR(15)"),
+                LoaderColumn("NOMBRE", "CHAR(150)"),
+                LoaderColumn("NOMBRE_CLAVE", "CHAR(150)"),
+            ),
+            ((p.parroquiaid, p.cantonid, p.codigo, p.nombre, normalize_key(p.nombre)) for p in parroquias),
+        ),
+    )
+
+    host_lines: list[str] = []
+    for table, columns, rows in tables:
+        data_path = loader_dir / f"{table.lower()}.dat"
+        control_path = loader_dir / f"{table.lower()}.ctl"
+        write_data_file(rows, data_path)
+        write_control_file(table, columns, control_path, data_path, load_method="APPEND", root=ROOT)
+        host_lines.append(sqlldr_command(control_path, root=ROOT))
+
+    script_path = loader_dir / SQLLDR_SCRIPT_NAME
+    lines = [
+        "-- Carga direct-path de la jerarquia con SQL*Loader (requiere SQLLDR_USERID=usuario/clave@tns)",
+        "DELETE FROM NOMBRE_ALIAS;",
+        "DELETE FROM PARROQUIAS;",
+        "DELETE FROM CANTONES;",
+        "DELETE FROM PROVINCIAS;",
+        "COMMIT;",
+        *host_lines,
+        "",
+        # Pocas filas: los alias van como INSERTs normales tras las cargas direct-path.
+        *insert_statements("NOMBRE_ALIAS", ALIAS_COLUMNS, alias_rows(provinces)),
+        "COMMIT;",
+        "",
+        _generate_sequence_alignment_block(len(provinces), len(cantons), len(parroquias)),
+    ]
+    with script_path.open("w", encoding="utf-8") as fh:
+        fh.write("\n".join(lines))
+        fh.write("\n")
+    return script_path
+
+
+def _assign_ids(
+    provincias_rows: list[dict[str, str]],
+    cantones_rows: list[dict[str, str]],
+    parroquias_rows: list[dict[str, str]],
+) -> tuple[list[Province], list[Canton], list[Parroquia]]:
+    """Asigna ids secuenciales por orden de codigo; descarta filas incompletas o sin padre."""
+    provinces: list[Province] = []
+    province_map: dict[str, int] = {}
+    province_id = 1
+    for row in sorted(provincias_rows, key=lambda item: item["CODIGO"]):
+        codigo = row["CODIGO"]
+        nombre = row["NOMBRE"]
+        if not codigo or not nombre or codigo in province_map:
+            continue
+        province_map[codigo] = province_id
+        provinces.append(Province(provinciaid=province_id, codigo=codigo, nombre=nombre))
+        province_id += 1
+
+    cantons: list[Canton] = []
+    canton_map: dict[str, int] = {}
+    canton_id = 1
+    for row in sorted(cantones_rows, key=lambda item: item["CODIGO"]):
+        codigo = row["CODIGO"]
+        nombre = row["NOMBRE"]
+        provincia_codigo = row["PROVINCIA_CODIGO"]
+        province_id_ref = province_map.get(provincia_codigo)
+        if not codigo or not nombre or not province_id_ref:
+            continue
+        canton_map[codigo] = canton_id
+        cantons.append(Canton(cantonid=canton_id, provinciaid=province_id_ref, codigo=codigo, nombre=nombre))
+        canton_id += 1
+
+    parroquias: list[Parroquia] = []
+    parroquia_id = 1
+    for row in sorted(parroquias_rows, key=lambda item: item["CODIGO"]):
+        codigo = row["CODIGO"]
+        nombre = row["NOMBRE"]
+        canton_codigo = row["CANTON_CODIGO"]
+        canton_id_ref = canton_map.get(canton_codigo)
+        if not codigo or not nombre or not canton_id_ref:
+            continue
+        parroquias.append(Parroquia(parroquiaid=parroquia_id, cantonid=canton_id_ref, codigo=codigo, nombre=nombre))
+        parroquia_id += 1
+
+    return provinces, cantons, parroquias
+
+
+def load_hierarchy(source: Optional[Path] = None) -> tuple[list[Province], list[Canton], list[Parroquia]]:
+    """
+    Lee los CSV de jerarquia con los mismos ids que recibe insert_jerarquia.sql.
+    Devuelve listas vacias si falta alguno de los archivos.
+    """
+    source_dir = source or DEFAULT_SOURCE_DIR
+    provincias_rows = _load_csv(source_dir / "provincias.csv", ("CODIGO", "NOMBRE"))
+    cantones_rows = _load_csv(source_dir / "cantones.csv", ("CODIGO", "PROVINCIA_CODIGO", "NOMBRE"))
+    parroquias_rows = _load_csv(source_dir / "parroquias.csv", ("CODIGO", "CANTON_CODIGO", "NOMBRE"))
+    if not provincias_rows or not cantones_rows or not parroquias_rows:
+        return [], [], []
+    return _assign_ids(provincias_rows, cantones_rows, parroquias_rows)
+
+
 def generate_jerarquia_sql(
     source: Optional[Path] = None,
     output: Optional[Path] = None,
+    insert_mode: str = DEFAULT_INSERT_MODE,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    loader_dir: Optional[Path] = None,
 ) -> dict[str, Optional[Path] | str | int]:
     source_dir = source or DEFAULT_SOURCE_DIR
     if source is not None and not source_dir.exists():
@@ -215,51 +389,14 @@ def generate_jerarquia_sql(
             fh.write(f"-- Agrega provincias.csv, cantones.csv y parroquias.csv en {source_dir}\n")
         return {"status": "missing", "sql": output_path, "source": source_dir}
 
-    provinces: list[Province] = []
-    province_map: dict[str, int] = {}
-    province_id = 1
-    for row in sorted(provincias_rows, key=lambda item: item["CODIGO"]):
-        codigo = row["CODIGO"]
-        nombre = row["NOMBRE"]
-        if not codigo or not nombre or codigo in province_map:
-            continue
-        province_map[codigo] = province_id
-        provinces.append(Province(provinciaid=province_id, codigo=codigo, nombre=nombre))
-        province_id += 1
-
-    cantons: list[Canton] = []
-    canton_map: dict[str, int] = {}
-    canton_id = 1
-    for row in sorted(cantones_rows, key=lambda item: item["CODIGO"]):
-        codigo = row["CODIGO"]
-        nombre = row["NOMBRE"]
-        provincia_codigo = row["PROVINCIA_CODIGO"]
-        province_id_ref = province_map.get(provincia_codigo)
-        if not codigo or not nombre or not province_id_ref:
-            continue
-        canton_map[codigo] = canton_id
-        cantons.append(Canton(cantonid=canton_id, provinciaid=province_id_ref, codigo=codigo, nombre=nombre))
-        canton_id += 1
-
-    parroquias: list[Parroquia] = []
-    parroquia_id = 1
-    for row in sorted(parroquias_rows, key=lambda item: item["CODIGO"]):
-        codigo = row["CODIGO"]
-        nombre = row["NOMBRE"]
-        canton_codigo = row["CANTON_CODIGO"]
-        canton_id_ref = canton_map.get(canton_codigo)
-        if not codigo or not nombre or not canton_id_ref:
-            continue
-        parroquias.append(Parroquia(parroquiaid=parroquia_id, cantonid=canton_id_ref, codigo=codigo, nombre=nombre))
-        parroquia_id += 1
-
-    sql_lines = _build_sql_from_csv(provinces, cantons, parroquias)
+    provinces, cantons, parroquias = _assign_ids(provincias_rows, cantones_rows, parroquias_rows)
+    sql_lines = _build_sql_from_csv(provinces, cantons, parroquias, mode=insert_mode, batch_size=batch_size)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     with output_path.open("w", encoding="utf-8") as fh:
         fh.write("\n".join(sql_lines))
         fh.write("\n")
 
-    return {
+    result: dict[str, Optional[Path] | str | int] = {
         "status": "ok",
         "sql": output_path,
         "provincias": len(provinces),
@@ -267,6 +404,9 @@ def generate_jerarquia_sql(
         "parroquias": len(parroquias),
         "source": source_dir,
     }
+    if loader_dir is not None:
+        result["sqlldr"] = _write_sqlldr_files(provinces, cantons, parroquias, loader_dir)
+    return result
 
 
 def _parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
@@ -277,12 +417,35 @@ def _parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
         type=Path,
         help="Ruta de salida del SQL combinado (por defecto data/output/jerarquia/insert_jerarquia.sql).",
     )
+    parser.add_argument(
+        "--insert-mode",
+        choices=INSERT_MODES,
+        default=DEFAULT_INSERT_MODE,
+        help="row: un INSERT por fila; insert_all/forall: sentencias por lote (default row).",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Filas por sentencia en los modos por lote (default {DEFAULT_BATCH_SIZE}).",
+    )
+    parser.add_argument(
+        "--sqlldr-dir",
+        type=Path,
+        help="Directorio donde escribir los .ctl/.dat de SQL*Loader para la jerarquia.",
+    )
     return parser.parse_args(argv)
 
 
 def main(argv: Optional[list[str]] = None) -> None:
     args = _parse_args(argv)
-    result = generate_jerarquia_sql(source=args.source, output=args.output)
+    result = generate_jerarquia_sql(
+        source=args.source,
+        output=args.output,
+        insert_mode=args.insert_mode,
+        batch_size=args.batch_size,
+        loader_dir=args.sqlldr_dir,
+    )
     if result["status"] == "ok":
         provincias = result["provincias"] or "manual"
         cantones = result["cantones"] or "manual"
@@ -291,6 +454,8 @@ def main(argv: Optional[list[str]] = None) -> None:
             f"Jerarquia generada: provincias={provincias}, "
             f"cantones={cantones}, parroquias={parroquias}. SQL: {result['sql']}"
         )
+        if result.get("sqlldr"):
+            print(f"SQL*Loader: {result['sqlldr']}")
     else:
         print(
             "No se encontraron datos de jerarquia. "
@@ -0,0 +1,401 @@
+"""
+Genera datos OLTP sinteticos (CLIENTES, PRODUCTOS, ORDENES, DETALLE_ORDENES) para pruebas de carga.
+
+05_seed_transactional_data.sql trae 30 clientes y unas pocas ordenes: sirve para validar el
+plan, no para medir load_dw_from_oltp.sql ni VW_MAS_VENDIDO con volumen real. Este generador
+escribe archivos SQL*Loader (.ctl + .dat, ver comun/sqlloader.py) con un factor de escala:
+
+    escala 1   ->   1.000 clientes,   100 productos,    10.000 ordenes (~22.000 detalles)
+    escala 100 -> 100.000 clientes, 1.000 productos, 1.000.000 ordenes (~2,2 millones de detalles)
+
+Distribuciones:
+ - popularidad de productos Zipf (pocos productos concentran la mayoria de las lineas) y
+   actividad de clientes tambien sesgada (clientes frecuentes);
+ - fechas de orden estacionales: peso por mes (picos en mayo, noviembre y diciembre), por dia
+   de la semana y crecimiento anual; el ORDENID crece con la fecha, como en produccion, de modo
+   que la marca de agua de ETL_CONTROL avanza igual que con datos reales;
+ - ciudad del cliente ponderada por CIUDAD: por la columna poblacion del CSV de ciudades si
+   existe; si no, pesos Zipf sobre una permutacion de las ciudades (la ley de Zipf de tamanos
+   de ciudades).
+
+Todo sale de un unico random.Random(semilla) consumido en orden fijo y las filas se escriben a
+medida que se generan (la memoria no crece con la escala salvo por los pesos de clientes): con
+la misma semilla y escala los archivos son identicos byte a byte, asi sirven de entrada a benchmarks.
+
+load_sintetico_sqlldr.sql reemplaza el contenido de las cuatro tablas (DELETE + carga direct-path),
+reinicia la marca de agua del DW y ajusta el CACHE de sus secuencias al volumen generado.
+Ejecutarlo despues del plan (CLIENTES.CIUDADID y CIUDAD ya existen) y luego volver a correr la
+carga del DW.
+
+Uso (desde la raiz del repo):
+    python scripts/python/oltp/generate_synthetic_oltp.py --scale 10 --seed 7
+    sqlplus usuario/clave@tns @data/output/sintetico/load_sintetico_sqlldr.sql
+"""
+
+from __future__ import annotations
+
+import argparse
+import bisect
+import csv
+import itertools
+import json
+import random
+import sys
+from dataclasses import asdict, dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from comun.sequences import SequenceSpec, cache_block
+from comun.sqlloader import LoaderColumn, data_writer, sqlldr_command, write_control_file
+
+ROOT = Path(__file__).resolve().parents[3]
+DEFAULT_OUTPUT_DIR = ROOT / "data" / "output" / "sintetico"
+DEFAULT_CITIES_CSV = ROOT / "data" / "output" / "ciudades" / "ciudades_ec.csv"
+LOAD_SCRIPT_NAME = "load_sintetico_sqlldr.sql"
+MANIFEST_NAME = "sintetico.json"
+WATERMARK_RESET_SQL = "scripts/sql/etl/reset_dw_watermark.sql"
+GENERATOR_VERSION = "2"
+DEFAULT_SEED = 42
+DEFAULT_START = date(2023, 1, 1)
+DEFAULT_END = date(2024, 12, 31)
+
+CLIENTS_PER_SCALE = 1000
+ORDERS_PER_SCALE = 10000
+PRODUCTS_PER_SCALE = 100  # crece con la raiz de la escala: el catalogo no escala como las ventas
+MIN_PRODUCTS = 30
+PRODUCT_ZIPF = 1.1
+CLIENT_ZIPF = 0.6
+CITY_ZIPF = 1.0
+MAX_LINES = 12
+MAX_QUANTITY = 20
+ANNUAL_GROWTH = 0.15
+# Peso relativo por mes (enero..diciembre): dia de la madre en mayo, Black Friday y navidad.
+MONTH_WEIGHTS = (0.80, 0.85, 0.95, 0.95, 1.15, 1.00, 0.95, 1.00, 0.95, 1.00, 1.30, 1.60)
+# Lunes..domingo.
+WEEKDAY_WEIGHTS = (1.00, 1.00, 1.00, 1.05, 1.20, 1.10, 0.70)
+# Promociones de noviembre/diciembre: mas ordenes con descuento.
+DISCOUNTS = (0, 5, 10, 15, 20)
+DISCOUNT_WEIGHTS = (70, 15, 9, 4, 2)
+PROMO_DISCOUNT_WEIGHTS = (45, 25, 17, 9, 4)
+
+NOMBRES = (
+    "Sofia", "Mateo", "Valentina", "Sebastian", "Camila", "Daniel", "Isabella", "Alejandro", "Martina",
+    "Diego", "Mariana", "Andres", "Paula", "Rodrigo", "Luisa", "Nicolas", "Elena", "Ivan", "Victoria",
+    "David", "Natalia", "Jorge", "Laura", "Carlos", "Sara", "Pablo", "Andrea", "Martin", "Daniela", "Lucas",
+    "Gabriela", "Santiago", "Fernanda", "Esteban", "Carolina", "Joaquin", "Renata", "Emilio", "Ximena", "Tomas",
+)  # fmt: skip
+APELLIDOS = (
+    "Jimenez", "Torres", "Aguilar", "Rojas", "Andrade", "Cruz", "Vega", "Paredes", "Fernandez", "Medina",
+    "Castro", "Lozano", "Benitez", "Salazar", "Pena", "Herrera", "Cortes", "Morales", "Bravo", "Gil",
+    "Ortiz", "Cardenas", "Rivera", "Vaca", "Flores", "Mendoza", "Salas", "Duarte", "Reyes", "Zambrano",
+    "Guerrero", "Chavez", "Moreira", "Cedeno", "Villacis", "Espinoza", "Macias", "Ponce", "Suarez", "Naranjo",
+)  # fmt: skip
+DOMINIOS = ("correo.com", "mail.ec", "empresa.com.ec", "web.ec")
+# Categoria -> (sustantivos, precio tipico); los precios siguen una lognormal alrededor del tipico.
+CATEGORIAS = {
+    "Electronica": (("Laptop", "Monitor", "Smartphone", "Tablet", "Audifonos", "Parlante", "Camara"), 450.0),
+    "Perifericos": (("Teclado", "Mouse", "Webcam", "Hub USB", "Impresora", "Microfono"), 70.0),
+    "Mobiliario": (("Silla", "Escritorio", "Estante", "Archivador", "Lampara"), 220.0),
+    "Hogar": (("Licuadora", "Cafetera", "Aspiradora", "Ventilador", "Juego de Ollas", "Microondas"), 90.0),
+    "Oficina": (("Agenda", "Calculadora", "Pizarra", "Organizador", "Trituradora"), 35.0),
+    "Deporte": (("Bicicleta", "Mancuernas", "Colchoneta", "Balon", "Raqueta"), 60.0),
+    "Jardin": (("Manguera", "Podadora", "Macetero", "Set de Herramientas"), 45.0),
+    "Salud": (("Tensiometro", "Termometro", "Balanza", "Oximetro"), 40.0),
+    "Viaje": (("Maleta", "Mochila", "Almohada de Viaje", "Organizador de Viaje"), 80.0),
+}
+CATEGORY_WEIGHTS = (30, 12, 10, 18, 9, 8, 5, 4, 4)
+MODELOS = ("Basico", "Plus", "Pro", "Max", "Lite", "Eco", "Compacto", "Premium")
+
+CLIENTES_COLUMNS = (
+    LoaderColumn("CLIENTEID", "INTEGER EXTERNAL"),
+    LoaderColumn("NOMBRE", "CHAR(100)"),
+    LoaderColumn("APELLIDO", "CHAR(100)"),
+    LoaderColumn("EMAIL", "CHAR(150)"),
+    LoaderColumn("TELEFONO", "CHAR(30)"),
+    LoaderColumn("CIUDADID", "INTEGER EXTERNAL"),
+)
+PRODUCTOS_COLUMNS = (
+    LoaderColumn("PRODUCTOID", "INTEGER EXTERNAL"),
+    LoaderColumn("DESCRIPCION", "CHAR(255)"),
+    LoaderColumn("PRECIOUNIT", "DECIMAL EXTERNAL"),
+    LoaderColumn("CATEGORIA", "CHAR(100)"),
+)
+ORDENES_COLUMNS = (
+    LoaderColumn("ORDENID", "INTEGER EXTERNAL"),
+    LoaderColumn("CLIENTEID", "INTEGER EXTERNAL"),
+    LoaderColumn("EMPLEADOID", "INTEGER EXTERNAL"),
+    LoaderColumn("FECHAORDEN", 'DATE "YYYY-MM-DD"'),
+    LoaderColumn("DESCUENTO", "DECIMAL EXTERNAL"),
+)
+DETALLE_COLUMNS = (
+    LoaderColumn("DETALLEID", "INTEGER EXTERNAL"),
+    LoaderColumn("ORDENID", "INTEGER EXTERNAL"),
+    LoaderColumn("PRODUCTOID", "INTEGER EXTERNAL"),
+    LoaderColumn("CANTIDAD", "INTEGER EXTERNAL"),
+    LoaderColumn("PRECIOUNIT", "DECIMAL EXTERNAL"),
+)
+# Orden de carga (padres primero); el DELETE previo va en orden inverso.
+TABLES = (
+    ("CLIENTES", "clientes", CLIENTES_COLUMNS),
+    ("PRODUCTOS", "productos", PRODUCTOS_COLUMNS),
+    ("ORDENES", "ordenes", ORDENES_COLUMNS),
+    ("DETALLE_ORDENES", "detalle_ordenes", DETALLE_COLUMNS),
+)
+
+
+@dataclass(frozen=True)
+class SyntheticConfig:
+    scale: float = 1.0
+    seed: int = DEFAULT_SEED
+    start: date = DEFAULT_START
+    end: date = DEFAULT_END
+
+    @property
+    def clientes(self) -> int:
+        return max(1, round(CLIENTS_PER_SCALE * self.scale))
+
+    @property
+    def productos(self) -> int:
+        return max(MIN_PRODUCTS, round(PRODUCTS_PER_SCALE * self.scale**0.5))
+
+    @property
+    def ordenes(self) -> int:
+        return max(1, round(ORDERS_PER_SCALE * self.scale))
+
+    @property
+    def empleados(self) -> int:
+        return max(5, round(10 * self.scale**0.5))
+
+
+def zipf_cum_weights(count: int, exponent: float) -> List[float]:
+    """Pesos acumulados 1/rango^exponent para los rangos 1..count (para random.choices/bisect)."""
+    return list(itertools.accumulate(1.0 / rank**exponent for rank in range(1, count + 1)))
+
+
+def _pick(rng: random.Random, cum_weights: Sequence[float]) -> int:
+    """Indice elegido con los pesos acumulados (equivale a rng.choices sin crear listas)."""
+    return bisect.bisect(cum_weights, rng.random() * cum_weights[-1])
+
+
+def daily_order_counts(config: SyntheticConfig) -> Iterator[Tuple[date, int]]:
+    """
+    Reparte config.ordenes entre los dias del rango segun mes, dia de la semana y crecimiento.
+    Redondeo por mayor residuo: el total es exacto y no depende del generador aleatorio.
+    """
+    if config.end < config.start:
+        raise ValueError("La fecha final es anterior a la inicial.")
+    days = [config.start + timedelta(days=offset) for offset in range((config.end - config.start).days + 1)]
+    weights = [
+        MONTH_WEIGHTS[day.month - 1]
+        * WEEKDAY_WEIGHTS[day.weekday()]
+        * (1 + ANNUAL_GROWTH) ** (index / 365.25)
+        for index, day in enumerate(days)
+    ]
+    total_weight = sum(weights)
+    exact = [config.ordenes * weight / total_weight for weight in weights]
+    counts = [int(value) for value in exact]
+    remaining = config.ordenes - sum(counts)
+    for index in sorted(range(len(days)), key=lambda i: (counts[i] - exact[i], i))[:remaining]:
+        counts[index] += 1
+    return zip(days, counts)
+
+
+def _city_weights(cities_csv: Optional[Path], rng: random.Random) -> Tuple[List[Optional[int]], List[float]]:
+    """(ciudadid, pesos acumulados). Sin CSV de ciudades los clientes quedan sin CIUDADID (03 los asigna)."""
+    if cities_csv is None or not cities_csv.exists():
+        return [None], [1.0]
+    with cities_csv.open("r", encoding="utf-8", newline="") as fh:
+        reader = csv.DictReader(fh)
+        rows = [(int(row["ciudadid"]), row.get("poblacion") or "") for row in reader]
+    if not rows:
+        return [None], [1.0]
+    ids = [city_id for city_id, _ in rows]
+    if any(population for _, population in rows):
+        # +1 para que las localidades sin poblacion registrada no queden fuera.
+        return ids, list(itertools.accumulate(float(population or 0) + 1 for _, population in rows))
+    rng.shuffle(ids)
+    return ids, zipf_cum_weights(len(ids), CITY_ZIPF)
+
+
+def iter_productos(config: SyntheticConfig, rng: random.Random) -> Iterator[Tuple[int, str, float, str]]:
+    names = list(CATEGORIAS)
+    category_cum = list(itertools.accumulate(CATEGORY_WEIGHTS))
+    for producto_id in range(1, config.productos + 1):
+        categoria = names[_pick(rng, category_cum)]
+        nouns, typical = CATEGORIAS[categoria]
+        descripcion = f"{rng.choice(nouns)} {rng.choice(MODELOS)} {rng.randint(100, 999)}"
+        precio = round(min(max(rng.lognormvariate(0.0, 0.5) * typical, 1.0), 99_999_999.0), 2)
+        yield producto_id, descripcion, precio, categoria
+
+
+def iter_clientes(
+    config: SyntheticConfig, rng: random.Random, city_ids: Sequence[Optional[int]], city_cum: Sequence[float]
+) -> Iterator[Tuple[int, str, str, str, str, Optional[int]]]:
+    for cliente_id in range(1, config.clientes + 1):
+        nombre, apellido = rng.choice(NOMBRES), rng.choice(APELLIDOS)
+        email = f"{nombre}.{apellido}{cliente_id}@{rng.choice(DOMINIOS)}".lower()
+        telefono = f"09{rng.randrange(10**8):08d}"
+        yield cliente_id, nombre, apellido, email, telefono, city_ids[_pick(rng, city_cum)]
+
+
+def iter_ordenes(
+    config: SyntheticConfig, rng: random.Random, prices: Sequence[float]
+) -> Iterator[Tuple[Tuple[object, ...], List[Tuple[object, ...]]]]:
+    """(fila de ORDENES, filas de DETALLE_ORDENES) en orden de fecha; ORDENID y DETALLEID consecutivos."""
+    # Rango de popularidad aleatorio pero fijo por semilla: el producto 1 no es siempre el mas vendido.
+    product_ids = list(range(1, len(prices) + 1))
+    rng.shuffle(product_ids)
+    product_cum = zipf_cum_weights(len(product_ids), PRODUCT_ZIPF)
+    client_ids = list(range(1, config.clientes + 1))
+    rng.shuffle(client_ids)
+    client_cum = zipf_cum_weights(len(client_ids), CLIENT_ZIPF)
+    discount_cum = list(itertools.accumulate(DISCOUNT_WEIGHTS))
+    promo_cum = list(itertools.accumulate(PROMO_DISCOUNT_WEIGHTS))
+
+    orden_id = detalle_id = 0
+    for day, count in daily_order_counts(config):
+        fecha = day.isoformat()
+        discounts = promo_cum if day.month in (11, 12) else discount_cum
+        for _ in range(count):
+            orden_id += 1
+            orden = (
+                orden_id,
+                client_ids[_pick(rng, client_cum)],
+                rng.randint(1, config.empleados),
+                fecha,
+                DISCOUNTS[_pick(rng, discounts)],
+            )
+            # Lineas y cantidades con cola geometrica: la mayoria de ordenes son chicas.
+            lines = min(1 + int(rng.expovariate(0.6)), MAX_LINES, len(product_ids))
+            chosen: dict[int, None] = {}
+            while len(chosen) < lines:
+                chosen[product_ids[_pick(rng, product_cum)]] = None
+            detalles = []
+            for producto_id in chosen:
+                detalle_id += 1
+                cantidad = min(1 + int(rng.expovariate(0.5)), MAX_QUANTITY)
+                detalles.append((detalle_id, orden_id, producto_id, cantidad, prices[producto_id - 1]))
+            yield orden, detalles
+
+
+def _dw_sequences(config: SyntheticConfig, counts: dict[str, int]) -> List[SequenceSpec]:
+    """Secuencias del DW con las filas que recibiran al cargar estos datos."""
+    return [
+        SequenceSpec("SEQ_DW_DIM_TIEMPO", expected_rows=(config.end - config.start).days + 1),
+        SequenceSpec("SEQ_DW_DIM_PRODUCTO", expected_rows=counts["productos"]),
+        SequenceSpec("SEQ_DW_DIM_UBICACION", expected_rows=counts["clientes"]),
+        SequenceSpec("SEQ_DW_FACT_VENTAS", expected_rows=counts["detalle_ordenes"]),
+    ]
+
+
+def generate_synthetic(
+    config: SyntheticConfig = SyntheticConfig(),
+    output_dir: Path = DEFAULT_OUTPUT_DIR,
+    cities_csv: Optional[Path] = DEFAULT_CITIES_CSV,
+) -> dict[str, object]:
+    """Escribe los .dat/.ctl de las cuatro tablas, el script de carga y el manifiesto sintetico.json."""
+    if config.scale <= 0:
+        raise ValueError("La escala debe ser positiva.")
+    rng = random.Random(config.seed)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    data = {name: output_dir / f"{name}.dat" for _, name, _ in TABLES}
+    counts = dict.fromkeys(data, 0)
+
+    city_ids, city_cum = _city_weights(cities_csv, rng)
+    prices: List[float] = []
+    with data["productos"].open("w", encoding="utf-8", newline="") as fh:
+        writer = data_writer(fh)
+        for row in iter_productos(config, rng):
+            writer.writerow(row)
+            prices.append(row[2])
+    counts["productos"] = len(prices)
+
+    with data["clientes"].open("w", encoding="utf-8", newline="") as fh:
+        writer = data_writer(fh)
+        for row in iter_clientes(config, rng, city_ids, city_cum):
+            writer.writerow(["" if value is None else value for value in row])
+            counts["clientes"] += 1
+
+    with data["ordenes"].open("w", encoding="utf-8", newline="") as orders_fh, data["detalle_ordenes"].open(
+        "w", encoding="utf-8", newline=""
+    ) as details_fh:
+        orders_writer, details_writer = data_writer(orders_fh), data_writer(details_fh)
+        for orden, detalles in iter_ordenes(config, rng, prices):
+            orders_writer.writerow(orden)
+            details_writer.writerows(detalles)
+            counts["ordenes"] += 1
+            counts["detalle_ordenes"] += len(detalles)
+
+    controls = {
+        name: write_control_file(table, columns, output_dir / f"{name}.ctl", data[name], "APPEND", root=ROOT)
+        for table, name, columns in TABLES
+    }
+    script = output_dir / LOAD_SCRIPT_NAME
+    with script.open("w", encoding="utf-8") as fh:
+        fh.write(
+            f"-- Carga de datos sinteticos (escala {config.scale:g}, semilla {config.seed}) generada por "
+            "generate_synthetic_oltp.py\n"
+        )
+        fh.write("-- Reemplaza CLIENTES/PRODUCTOS/ORDENES/DETALLE_ORDENES; requiere SQLLDR_USERID=usuario/clave@tns.\n")
+        for table, _, _ in reversed(TABLES):
+            fh.write(f"DELETE FROM {table};\n")
+        fh.write("COMMIT;\n")
+        for _, name, _ in TABLES:
+            fh.write(sqlldr_command(controls[name], root=ROOT) + "\n")
+        fh.write("-- Las ordenes cambiaron: la proxima carga del DW debe ser completa.\n")
+        fh.write(f"@{WATERMARK_RESET_SQL}\n")
+        fh.write("-- CACHE de las secuencias del DW para el volumen generado (comun/sequences.py).\n")
+        fh.write(cache_block(_dw_sequences(config, counts)) + "\n")
+
+    manifest = output_dir / MANIFEST_NAME
+    payload = {
+        "version": GENERATOR_VERSION,
+        "config": {**asdict(config), "start": config.start.isoformat(), "end": config.end.isoformat()},
+        "ciudades": None if city_ids == [None] else len(city_ids),
+        "filas": counts,
+    }
+    manifest.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    return {"script": script, "manifest": manifest, "dir": output_dir, **counts}
+
+
+def _parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Genera datos OLTP sinteticos reproducibles para pruebas de carga.")
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help=f"Factor de escala: {CLIENTS_PER_SCALE} clientes y {ORDERS_PER_SCALE} ordenes por unidad (default 1).",
+    )
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help=f"Semilla (default {DEFAULT_SEED}).")
+    parser.add_argument("--start", type=date.fromisoformat, default=DEFAULT_START, help="Primera fecha de orden.")
+    parser.add_argument("--end", type=date.fromisoformat, default=DEFAULT_END, help="Ultima fecha de orden.")
+    parser.add_argument("--output-dir", type=Path, default=DEFAULT_OUTPUT_DIR, help="Directorio de salida.")
+    parser.add_argument(
+        "--cities",
+        type=Path,
+        default=DEFAULT_CITIES_CSV,
+        help="CSV de CIUDAD para ponderar la ciudad de cada cliente (default ciudades_ec.csv).",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    args = _parse_args(argv)
+    config = SyntheticConfig(scale=args.scale, seed=args.seed, start=args.start, end=args.end)
+    try:
+        result = generate_synthetic(config, output_dir=args.output_dir, cities_csv=args.cities)
+    except ValueError as exc:
+        raise SystemExit(str(exc)) from exc
+    print(
+        f"Clientes: {result['clientes']}, productos: {result['productos']}, "
+        f"ordenes: {result['ordenes']}, detalles: {result['detalle_ordenes']}"
+    )
+    print(f"Carga: {result['script']}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -3,71 +3,382 @@ Pipeline que prepara todos los artefactos para el DW:
 - Genera el catalogo de ciudades (CSV + INSERTs) usando GeoNames.
 - Crea un plan SQL (@file) que encadena los scripts OLTP + DW + ETL.
 
-No se conecta a la BD. Ejecuta el plan resultante en SQL*Plus/SQLcl desde la raiz del repo:
+Por defecto no se conecta a la BD: ejecuta el plan resultante en SQL*Plus/SQLcl desde la raiz del repo:
     sqlplus usuario/clave@tns @data/output/plan_ejecucion_dw.sql
+Con --execute oracle|sqlite el plan se ejecuta aqui mismo via DB-API (comun/plan_executor.py):
+se detiene en el primer error y carga los catalogos con executemany.
+
+Las etapas de Python (ciudades, jerarquia, enlace) se ejecutan segun sus dependencias en hasta
+--jobs procesos. El plan se escribe tambien dividido por sesiones (build_session_plans) para que
+comun/session_runner.py ejecute en paralelo los pasos independientes (--sessions N con --execute).
+
+Con --watch el proceso queda vivo tras generar todo y sondea data/raw/ciudades y data/raw/jerarquia
+(y las fuentes de --source/--jerarquia-source) cada --watch-interval segundos. Cuando un archivo
+cambia vuelve a correr las etapas; el manifiesto de build (comun/build_cache.py) omite las que no
+dependen del archivo, y el plan se reescribe si alguna etapa corrio. En este modo las etapas corren
+en el mismo proceso, de modo que los modulos, el lookup admin1 y los puntos de GeoNames ya parseados
+(comun/file_memo.py) siguen en memoria entre regeneraciones.
+
+Los modulos que solo usan algunas corridas o etapas (pool de procesos, grafo de etapas, enlace
+ciudad -> canton/parroquia, catalogo multi-pais, ejecutor DB-API y por sesiones, reporte de
+tiempos, descarga de GeoNames) se importan al usarse, para que el CLI (y --help) arranque rapido.
 """
 
 from __future__ import annotations
 
 import argparse
+import json
+import os
 import sys
+import time
 from pathlib import Path
-from typing import List
+from typing import TYPE_CHECKING, Callable, List, TextIO, TypeVar
 
+from comun import file_memo
+from comun.build_cache import BuildCache
+from comun.sql_emitter import DEFAULT_BATCH_SIZE, DEFAULT_INSERT_MODE, INSERT_MODES
+from jerarquia import build_jerarquia_csv, generate_jerarquia_inserts
 from jerarquia.build_jerarquia_csv import build_geo_csv
+from ciudades import download_ecuador_cities
 from ciudades.download_ecuador_cities import COUNTRY_CODE, generate_catalog
 from jerarquia.generate_jerarquia_inserts import generate_jerarquia_sql
 
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+    from comun import dag
+
+T = TypeVar("T")
+
 ROOT = Path(__file__).resolve().parents[2]
+PY_DIR = Path(__file__).resolve().parent
+BUILD_MANIFEST = ROOT / "data" / "output" / "build_manifest.json"
+CITY_RAW_DIR = ROOT / "data" / "raw" / "ciudades"
+# Codigo de los generadores: si cambia, la etapa se vuelve a ejecutar aunque los datos no cambien.
+CITY_GENERATOR_FILES = (
+    PY_DIR / "ciudades" / "download_ecuador_cities.py",
+    PY_DIR / "ciudades" / "parallel_catalog.py",
+    PY_DIR / "ciudades" / "city_store.py",
+    PY_DIR / "comun" / "external_sort.py",
+    PY_DIR / "comun" / "name_keys.py",
+    PY_DIR / "comun" / "sql_emitter.py",
+    PY_DIR / "comun" / "sqlloader.py",
+)
+JERARQUIA_CSV_GENERATOR_FILES = (PY_DIR / "jerarquia" / "build_jerarquia_csv.py",)
+JERARQUIA_SQL_GENERATOR_FILES = (
+    PY_DIR / "jerarquia" / "generate_jerarquia_inserts.py",
+    PY_DIR / "comun" / "name_keys.py",
+    PY_DIR / "comun" / "sql_emitter.py",
+    PY_DIR / "comun" / "sqlloader.py",
+)
 CITY_INSERT_SQL = ROOT / "data" / "output" / "ciudades" / "insert_ciudad.sql"
+CITY_DELTA_SQL = CITY_INSERT_SQL.with_name(download_ecuador_cities.DELTA_SQL_NAME)
 JERARQUIA_SQL = ROOT / "data" / "output" / "jerarquia" / "insert_jerarquia.sql"
+# city_linker.LINK_SQL_NAME; el enlazador se importa recien en su etapa.
+CITY_LINK_SQL = CITY_INSERT_SQL.with_name("insert_ciudad_ubicacion.sql")
+CITY_LINK_GENERATOR_FILES = (
+    PY_DIR / "ciudades" / "city_linker.py",
+    PY_DIR / "ciudades" / "download_ecuador_cities.py",
+    PY_DIR / "jerarquia" / "generate_jerarquia_inserts.py",
+    PY_DIR / "comun" / "name_keys.py",
+    PY_DIR / "comun" / "sql_emitter.py",
+)
+SQLLDR_DIR = ROOT / "data" / "output" / "sqlldr"
+CITY_SQLLDR_SQL = SQLLDR_DIR / "load_ciudad_sqlldr.sql"
+JERARQUIA_SQLLDR_SQL = SQLLDR_DIR / "load_jerarquia_sqlldr.sql"
+LOADERS = ("sql", "sqlldr")
+# Pasos del plan que cambian cuando los catalogos se cargan con SQL*Loader direct-path.
+SQLLDR_SUBSTITUTIONS = {
+    str(CITY_INSERT_SQL.relative_to(ROOT)): str(CITY_SQLLDR_SQL.relative_to(ROOT)),
+    str(JERARQUIA_SQL.relative_to(ROOT)): str(JERARQUIA_SQLLDR_SQL.relative_to(ROOT)),
+}
+
+BASE_TABLES_SQL = "scripts/sql/oltp/00_create_base_tables.sql"
+REQUIRE_BASE_SQL = "scripts/sql/oltp/00_require_base_tables.sql"
+SEED_SQL = "scripts/sql/oltp/05_seed_transactional_data.sql"
+CIUDAD_TABLE_SQL = "scripts/sql/oltp/01_create_ciudad_table.sql"
+CLIENTES_CIUDAD_SQL = "scripts/sql/oltp/02_add_ciudad_to_clientes.sql"
+JERARQUIA_TABLES_SQL = "scripts/sql/oltp/04_create_province_canton_parish_tables.sql"
+CIUDAD_UBICACION_TABLE_SQL = "scripts/sql/oltp/06_create_ciudad_ubicacion_table.sql"
+ASSIGN_CITY_SQL = "scripts/sql/oltp/03_assign_random_city_to_clients.sql"
+DW_SCHEMA_SQL = "scripts/sql/dw/01_dw_star_schema_and_top_product_view.sql"
+DW_AGGREGATES_SQL = "scripts/sql/dw/02_dw_aggregates.sql"
+# Generado por dw/generate_dw_fact_storage.py (particionamiento e indices del hecho).
+DW_FACT_STORAGE_SQL = "scripts/sql/dw/03_dw_fact_storage.sql"
+DW_LOAD_SQL = "scripts/sql/etl/load_dw_from_oltp.sql"
+# Generados por dw/generate_dw_aggregates.py (granos declarados en GRAINS).
+DW_REFRESH_SQL = "scripts/sql/etl/refresh_dw_aggregates.sql"
+# Cada paso del plan con los pasos que deben terminar antes; el orden de declaracion es el del plan
+# secuencial. CIUDAD, la jerarquia, CIUDAD_UBICACION y el esquema DW no dependen entre si, por eso
+# el plan por sesiones (build_session_plans) los ejecuta en sesiones paralelas.
+# 02 agrega la FK CLIENTES -> CIUDAD: espera a la semilla y a la carga de CIUDAD para no chocar
+# con sus transacciones abiertas (ORA-00054).
+SQL_DEPENDENCIES: dict[str, tuple[str, ...]] = {
+    BASE_TABLES_SQL: (),
+    REQUIRE_BASE_SQL: (BASE_TABLES_SQL,),
+    SEED_SQL: (REQUIRE_BASE_SQL,),
+    CIUDAD_TABLE_SQL: (),
+    str(CITY_INSERT_SQL.relative_to(ROOT)): (CIUDAD_TABLE_SQL,),
+    CLIENTES_CIUDAD_SQL: (SEED_SQL, str(CITY_INSERT_SQL.relative_to(ROOT))),
+    ASSIGN_CITY_SQL: (CLIENTES_CIUDAD_SQL,),
+    JERARQUIA_TABLES_SQL: (),
+    str(JERARQUIA_SQL.relative_to(ROOT)): (JERARQUIA_TABLES_SQL,),
+    CIUDAD_UBICACION_TABLE_SQL: (),
+    str(CITY_LINK_SQL.relative_to(ROOT)): (CIUDAD_UBICACION_TABLE_SQL,),
+    DW_SCHEMA_SQL: (),
+    DW_AGGREGATES_SQL: (DW_SCHEMA_SQL,),
+    # Particiona e indexa DW_FACT_VENTAS: debe terminar antes de la carga de hechos.
+    DW_FACT_STORAGE_SQL: (DW_SCHEMA_SQL,),
+    DW_LOAD_SQL: (
+        ASSIGN_CITY_SQL,
+        str(JERARQUIA_SQL.relative_to(ROOT)),
+        str(CITY_LINK_SQL.relative_to(ROOT)),
+        DW_AGGREGATES_SQL,
+        DW_FACT_STORAGE_SQL,
+    ),
+    DW_REFRESH_SQL: (DW_LOAD_SQL,),
+}
+SQL_SEQUENCE = list(SQL_DEPENDENCIES)
+DW_WATERMARK_RESET_SQL = "scripts/sql/etl/reset_dw_watermark.sql"
+# Bitacora ETL_RUN_LOG y procedimientos ETL_PASO_*; se crea antes del primer paso del plan.
+ETL_RUN_LOG_SQL = "scripts/sql/etl/00_create_etl_run_log.sql"
+ETL_MODES = ("full", "incremental")
+# Destinos de comun/plan_executor.py (TARGETS): el ejecutor (y sqlite3) se importa solo con --execute.
+EXECUTE_TARGETS = ("oracle", "sqlite")
+DEFAULT_JOBS = min(4, os.cpu_count() or 1)
+DEFAULT_WATCH_INTERVAL = 2.0
+# En modo incremental el plan solo asegura el esquema DW, carga las ordenes nuevas (marca de agua en
+# ETL_CONTROL) y refresca los agregados que tocan.
+INCREMENTAL_STEPS = (DW_SCHEMA_SQL, DW_AGGREGATES_SQL, DW_FACT_STORAGE_SQL, DW_LOAD_SQL, DW_REFRESH_SQL)
+
+
+def plan_spool_path(plan_path: Path) -> Path:
+    """Spool que escribe el plan al ejecutarse (lo lee comun/run_report.py)."""
+    from comun import run_report
+
+    return run_report.LOG_DIR / f"{plan_path.stem}.log"
+
+
+def session_plan_dir(plan_path: Path) -> Path:
+    """Directorio con los scripts por sesion y su manifiesto (build_session_plans)."""
+    return plan_path.with_name(f"{plan_path.stem}_sesiones")
+
+
+def plan_steps(
+    sql_paths: List[str],
+    loader: str = "sql",
+    city_delta: bool = False,
+    etl_mode: str = "full",
+) -> List[dag.Task]:
+    """
+    Pasos del plan en orden secuencial, con el script ya sustituido segun loader/city_delta y sus
+    dependencias (SQL_DEPENDENCIES). Un script que no esta en SQL_DEPENDENCIES depende del anterior.
+    Con etl_mode="full" la marca de agua se reinicia antes de la carga del DW (recarga completa);
+    con "incremental" solo quedan el esquema DW, la carga de las ordenes nuevas y el refresco de agregados.
+    """
+    if loader not in LOADERS:
+        raise ValueError(f"Loader desconocido: {loader}. Usa uno de {', '.join(LOADERS)}")
+    if etl_mode not in ETL_MODES:
+        raise ValueError(f"Modo de ETL desconocido: {etl_mode}. Usa uno de {', '.join(ETL_MODES)}")
+    deps = dict(SQL_DEPENDENCIES)
+    if etl_mode == "incremental":
+        sql_paths = [script for script in sql_paths if script in INCREMENTAL_STEPS]
+    elif DW_LOAD_SQL in sql_paths:
+        position = sql_paths.index(DW_LOAD_SQL)
+        sql_paths = [*sql_paths[:position], DW_WATERMARK_RESET_SQL, *sql_paths[position:]]
+        deps[DW_WATERMARK_RESET_SQL] = (DW_AGGREGATES_SQL,)
+        deps[DW_LOAD_SQL] = tuple(
+            DW_WATERMARK_RESET_SQL if dep == DW_AGGREGATES_SQL else dep for dep in deps[DW_LOAD_SQL]
+        )
+    for previous, script in zip([None, *sql_paths], sql_paths):
+        deps.setdefault(script, (previous,) if previous else ())
+    from comun import dag
+
+    kept = {task.name: task for task in dag.restrict([dag.Task(name, after) for name, after in deps.items()], sql_paths)}
+
+    substitutions: dict[str, str] = {}
+    if loader == "sqlldr":
+        substitutions.update(SQLLDR_SUBSTITUTIONS)
+    if city_delta:
+        substitutions[str(CITY_INSERT_SQL.relative_to(ROOT))] = str(CITY_DELTA_SQL.relative_to(ROOT))
+    return [
+        dag.Task(
+            Path(substitutions.get(script, script)).as_posix(),
+            tuple(Path(substitutions.get(dep, dep)).as_posix() for dep in kept[script].deps),
+        )
+        for script in sql_paths
+    ]
+
+
+def _write_header(fh: TextIO, title: str, etl_mode: str, spool_path: Path, loader: str) -> None:
+    fh.write(f"-- {title}\n")
+    fh.write(f"-- Modo de ETL: {etl_mode}\n")
+    fh.write("SET DEFINE OFF;\n")
+    fh.write("SET ECHO ON;\n")
+    fh.write("SET FEEDBACK ON;\n")
+    fh.write("SET SERVEROUTPUT ON;\n")
+    fh.write("SET TIMING ON;\n")
+    fh.write("WHENEVER SQLERROR CONTINUE;\n")
+    fh.write(f"SPOOL {spool_path.relative_to(ROOT).as_posix()}\n")
+    fh.write("-- Si las tablas base estan en otro esquema, descomenta y ajusta:\n")
+    fh.write("-- ALTER SESSION SET CURRENT_SCHEMA=ESQUEMAORIGINAL;\n")
+    if loader == "sqlldr":
+        fh.write("-- Las cargas SQL*Loader leen las credenciales de la variable de entorno SQLLDR_USERID.\n")
 
-SQL_SEQUENCE = [
-    # Garantiza que las tablas base se creen y luego se validen antes de continuar.
-    "scripts/sql/oltp/00_create_base_tables.sql",
-    "scripts/sql/oltp/00_require_base_tables.sql",
-    "scripts/sql/oltp/05_seed_transactional_data.sql",
-    "scripts/sql/oltp/01_create_ciudad_table.sql",
-    str(CITY_INSERT_SQL.relative_to(ROOT)),
-    "scripts/sql/oltp/02_add_ciudad_to_clientes.sql",
-    "scripts/sql/oltp/03_assign_random_city_to_clients.sql",
-    "scripts/sql/oltp/04_create_province_canton_parish_tables.sql",
-    str(JERARQUIA_SQL.relative_to(ROOT)),
-    "scripts/sql/dw/01_dw_star_schema_and_top_product_view.sql",
-    "scripts/sql/etl/load_dw_from_oltp.sql",
-]
-
-
-def build_plan_file(output_path: Path, sql_paths: List[str]) -> Path:
-    """Genera el archivo @plan con los scripts SQL en orden."""
+
+def _write_run_start(fh: TextIO, etl_mode: str) -> None:
+    fh.write(f"@{ETL_RUN_LOG_SQL}\n")
+    fh.write(f"EXEC ETL_RUN_INICIO('{etl_mode}')\n")
+
+
+def _write_step(fh: TextIO, number: int, script: str) -> None:
+    from comun import run_report
+
+    fh.write(f"PROMPT {run_report.STEP_MARKER}|{number}|{script}\n")
+    fh.write(f"EXEC ETL_PASO_INICIO({number}, '{script}')\n")
+    fh.write(f"@{script}\n")
+    fh.write(f"EXEC ETL_PASO_FIN({number})\n")
+
+
+def _write_run_end(fh: TextIO) -> None:
+    from comun import run_report
+
+    fh.write(f"PROMPT {run_report.END_MARKER}\n")
+    fh.write("EXEC ETL_RUN_FIN\n")
+    fh.write("SET TIMING OFF;\n")
+    fh.write("\nPROMPT ===== Verificacion rapida =====;\n")
+    fh.write("PROMPT Conteo de ciudades en CIUDAD:;\n")
+    fh.write("SELECT COUNT(*) AS TOTAL_CIUDADES FROM CIUDAD;\n")
+    fh.write("PROMPT Ejemplo de 5 ciudades:\n")
+    fh.write("SELECT CIUDADID, NOMBRE, PROVINCIA FROM CIUDAD WHERE ROWNUM <= 5;\n")
+    fh.write("PROMPT Conteo en DW_DIM_UBICACION:\n")
+    fh.write("SELECT COUNT(*) AS TOTAL_DIM_UBICACION FROM DW_DIM_UBICACION;\n")
+    fh.write("PROMPT Top producto mas vendido (si hay datos):\n")
+    fh.write("SELECT * FROM VW_MAS_VENDIDO WHERE ROWNUM <= 5;\n")
+    fh.write("PROMPT Conteos jerarquía provincial:\n")
+    fh.write("SELECT COUNT(*) AS TOTAL_PROVINCIAS FROM PROVINCIAS;\n")
+    fh.write("SELECT COUNT(*) AS TOTAL_CANTONES FROM CANTONES;\n")
+    fh.write("SELECT COUNT(*) AS TOTAL_PARROQUIAS FROM PARROQUIAS;\n")
+    fh.write("PROMPT Ciudades enlazadas a canton/parroquia por metodo:\n")
+    fh.write("SELECT METODO, COUNT(*) AS TOTAL FROM CIUDAD_UBICACION GROUP BY METODO ORDER BY METODO;\n")
+    fh.write("PROMPT Marca de agua de la carga de hechos:\n")
+    fh.write("SELECT Proceso, UltimoOrdenID, UltimaFechaOrden, Estado, OrdenesCargadas FROM ETL_CONTROL;\n")
+    fh.write("PROMPT Pasos mas lentos de esta corrida (ETL_RUN_LOG):\n")
+    fh.write(
+        "SELECT * FROM (SELECT Paso, Script, Objeto, ROUND(Segundos, 2) AS Segundos, Filas FROM ETL_RUN_LOG "
+        "WHERE RunID = (SELECT MAX(RunID) FROM ETL_RUN_LOG) AND Paso > 0 ORDER BY Segundos DESC NULLS LAST) "
+        "WHERE ROWNUM <= 10;\n"
+    )
+
+
+def build_plan_file(
+    output_path: Path,
+    sql_paths: List[str],
+    loader: str = "sql",
+    city_delta: bool = False,
+    etl_mode: str = "full",
+    spool_path: Path | None = None,
+) -> Path:
+    """
+    Genera el archivo @plan con los scripts SQL en orden.
+    Con loader="sqlldr" los INSERTs de catalogos se reemplazan por las cargas direct-path.
+    Con city_delta=True CIUDAD se actualiza con delta_ciudad.sql en lugar de recargarse completa.
+    Con etl_mode="full" la marca de agua se reinicia antes de la carga del DW (recarga completa);
+    con "incremental" el plan solo contiene el esquema DW y la carga de las ordenes nuevas.
+    Cada paso queda entre marcadores ETL_PASO (spool con SET TIMING ON, ver comun/run_report.py)
+    y llamadas ETL_PASO_INICIO/ETL_PASO_FIN que registran inicio, fin y filas en ETL_RUN_LOG.
+    El spool va a data/output/logs/<plan>.log salvo que se indique spool_path (dentro del repo).
+    """
+    steps = plan_steps(sql_paths, loader=loader, city_delta=city_delta, etl_mode=etl_mode)
+    spool_path = spool_path or plan_spool_path(output_path)
+    spool_path.parent.mkdir(parents=True, exist_ok=True)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     with output_path.open("w", encoding="utf-8") as fh:
-        fh.write("-- Plan de ejecucion para construir OLTP enriquecido + DW\n")
-        fh.write("SET DEFINE OFF;\n")
-        fh.write("SET ECHO ON;\n")
-        fh.write("SET FEEDBACK ON;\n")
-        fh.write("SET SERVEROUTPUT ON;\n")
-        fh.write("WHENEVER SQLERROR CONTINUE;\n")
-        fh.write("-- Si las tablas base estan en otro esquema, descomenta y ajusta:\n")
-        fh.write("-- ALTER SESSION SET CURRENT_SCHEMA=ESQUEMAORIGINAL;\n")
-        for script in sql_paths:
-            fh.write(f"@{Path(script).as_posix()}\n")
-        fh.write("\nPROMPT ===== Verificacion rapida =====;\n")
-        fh.write("PROMPT Conteo de ciudades en CIUDAD:;\n")
-        fh.write("SELECT COUNT(*) AS TOTAL_CIUDADES FROM CIUDAD;\n")
-        fh.write("PROMPT Ejemplo de 5 ciudades:\n")
-        fh.write("SELECT CIUDADID, NOMBRE, PROVINCIA FROM CIUDAD WHERE ROWNUM <= 5;\n")
-        fh.write("PROMPT Conteo en DW_DIM_UBICACION:\n")
-        fh.write("SELECT COUNT(*) AS TOTAL_DIM_UBICACION FROM DW_DIM_UBICACION;\n")
-        fh.write("PROMPT Top producto mas vendido (si hay datos):\n")
-        fh.write("SELECT * FROM VW_MAS_VENDIDO WHERE ROWNUM <= 5;\n")
-        fh.write("PROMPT Conteos jerarquía provincial:\n")
-        fh.write("SELECT COUNT(*) AS TOTAL_PROVINCIAS FROM PROVINCIAS;\n")
-        fh.write("SELECT COUNT(*) AS TOTAL_CANTONES FROM CANTONES;\n")
-        fh.write("SELECT COUNT(*) AS TOTAL_PARROQUIAS FROM PARROQUIAS;\n")
+        _write_header(fh, "Plan de ejecucion para construir OLTP enriquecido + DW", etl_mode, spool_path, loader)
+        _write_run_start(fh, etl_mode)
+        for number, step in enumerate(steps, start=1):
+            _write_step(fh, number, step.name)
+        _write_run_end(fh)
+        fh.write("SPOOL OFF\n")
     return output_path
 
 
+def build_session_plans(
+    output_path: Path,
+    sql_paths: List[str],
+    loader: str = "sql",
+    city_delta: bool = False,
+    etl_mode: str = "full",
+) -> Path:
+    """
+    Divide el plan en scripts por sesion dentro de session_plan_dir(output_path) y escribe su
+    manifiesto sesiones.json (lo lee comun/session_runner.py).
+
+    Los pasos se agrupan en cadenas sin bifurcaciones (comun/dag.py): cada cadena es una sesion
+    que depende de las sesiones de las que dependen sus pasos, asi CIUDAD, la jerarquia y el
+    esquema DW se cargan en paralelo. sesion_00 abre la corrida en ETL_RUN_LOG y la ultima sesion
+    la cierra y ejecuta la verificacion. Los pasos conservan el numero del plan secuencial y cada
+    sesion escribe su propio spool; el runner los une en el spool del plan para run_report.
+    """
+    from comun import dag
+
+    steps = plan_steps(sql_paths, loader=loader, city_delta=city_delta, etl_mode=etl_mode)
+    numbers = {step.name: number for number, step in enumerate(steps, start=1)}
+    groups = dag.chains(steps)
+    session_of = {step.name: f"sesion_{index:02d}" for index, chain in enumerate(groups, start=1) for step in chain}
+    first, last = "sesion_00", f"sesion_{len(groups) + 1:02d}"
+
+    session_dir = session_plan_dir(output_path)
+    session_dir.mkdir(parents=True, exist_ok=True)
+    for stale in session_dir.glob("sesion_*.sql"):
+        stale.unlink()
+    plan_spool = plan_spool_path(output_path)
+    plan_spool.parent.mkdir(parents=True, exist_ok=True)
+
+    sessions: list[dict[str, object]] = []
+
+    def write_session(name: str, deps: list[str], chain: list[dag.Task]) -> None:
+        script = session_dir / f"{name}.sql"
+        spool = plan_spool.with_name(f"{output_path.stem}_{name}.log")
+        with script.open("w", encoding="utf-8") as fh:
+            _write_header(fh, f"Plan por sesiones ({name}) para construir OLTP enriquecido + DW", etl_mode, spool, loader)
+            if name == first:
+                _write_run_start(fh, etl_mode)
+            for step in chain:
+                _write_step(fh, numbers[step.name], step.name)
+            if name == last:
+                _write_run_end(fh)
+            fh.write("SPOOL OFF\n")
+            fh.write("EXIT\n")
+        sessions.append(
+            {
+                "nombre": name,
+                "script": script.relative_to(ROOT).as_posix(),
+                "spool": spool.relative_to(ROOT).as_posix(),
+                "depende_de": deps,
+                "pasos": [step.name for step in chain],
+            }
+        )
+
+    chain_deps = {session_of[chain[0].name]: sorted({session_of[dep] for dep in chain[0].deps}) for chain in groups}
+    write_session(first, [], [])
+    for chain in groups:
+        write_session(session_of[chain[0].name], chain_deps[session_of[chain[0].name]] or [first], chain)
+    # El cierre espera a las sesiones de las que no depende ninguna otra (el resto ya termino antes).
+    referenced = {dep for deps in chain_deps.values() for dep in deps}
+    write_session(last, [name for name in chain_deps if name not in referenced] or [first], [])
+
+    manifest = session_dir / "sesiones.json"
+    payload = {
+        "plan": output_path.relative_to(ROOT).as_posix(),
+        "modo": etl_mode,
+        "spool": plan_spool.relative_to(ROOT).as_posix(),
+        "sesiones": sessions,
+    }
+    manifest.write_text(json.dumps(payload, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    return manifest
+
+
 def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Prepara la ejecucion completa del DW (ciudades + SQL).")
     parser.add_argument("--skip-cities", action="store_true", help="No generar el catalogo de ciudades.")
@@ -82,30 +393,378 @@ def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         action="store_true",
         help="Omitir la regeneracion de los CSV jerarquicos (usa los archivos existentes).",
     )
-    parser.add_argument("--code", default=COUNTRY_CODE, help="Codigo ISO de pais, default EC.")
+    parser.add_argument(
+        "--code",
+        nargs="+",
+        default=[COUNTRY_CODE],
+        help="Uno o varios codigos ISO de pais, default EC. Varios codigos se generan en paralelo.",
+    )
+    parser.add_argument(
+        "--all-countries",
+        action="store_true",
+        help="Genera CIUDAD desde allCountries.zip repartiendo el trabajo entre procesos.",
+    )
+    parser.add_argument("--workers", type=int, help="Procesos para la generacion multi-pais (default: CPUs).")
+    parser.add_argument(
+        "--insert-mode",
+        choices=INSERT_MODES,
+        default=DEFAULT_INSERT_MODE,
+        help="Formato de los INSERT de catalogos: row, insert_all o forall (default row).",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Filas por sentencia en los modos por lote (default {DEFAULT_BATCH_SIZE}).",
+    )
+    parser.add_argument(
+        "--loader",
+        choices=LOADERS,
+        default="sql",
+        help="sql: @insert_*.sql en el plan; sqlldr: cargas direct-path con SQL*Loader (default sql).",
+    )
+    parser.add_argument(
+        "--city-store",
+        action="store_true",
+        help="Escribe tambien el catalogo columnar ciudades_xx.bin (se abre con mmap en milisegundos).",
+    )
+    parser.add_argument(
+        "--delta",
+        action="store_true",
+        help="Conserva los ciudadid del CSV anterior y carga CIUDAD con delta_ciudad.sql (solo cambios).",
+    )
+    parser.add_argument(
+        "--link-max-km",
+        type=float,
+        help="Distancia maxima ciudad -> parroquia antes de enlazar solo el canton "
+        "(default: DEFAULT_MAX_KM de ciudades/city_linker.py).",
+    )
+    parser.add_argument(
+        "--etl-mode",
+        choices=ETL_MODES,
+        default="full",
+        help="full: plan completo y recarga de todas las ordenes (default). "
+        "incremental: solo carga al DW las ordenes posteriores a la marca de agua de ETL_CONTROL.",
+    )
+    parser.add_argument(
+        "--execute",
+        choices=EXECUTE_TARGETS,
+        help="Ejecuta el plan generado via DB-API (oracle: credenciales en "
+        "DW_USERID=usuario/clave@tns; sqlite: base local de prueba).",
+    )
+    parser.add_argument(
+        "--sqlite-db",
+        type=Path,
+        help="Base SQLite usada con --execute sqlite (default data/output/dw_local.sqlite).",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        help="Etapas de Python simultaneas (ciudades, jerarquia, enlace) en procesos separados; "
+        f"1 las ejecuta en secuencia (default {DEFAULT_JOBS}).",
+    )
+    parser.add_argument(
+        "--sessions",
+        type=int,
+        default=1,
+        help="Con --execute: sesiones de BD simultaneas. Con mas de 1 se ejecutan los scripts por sesion "
+        "(comun/session_runner.py) en lugar del plan secuencial (default 1).",
+    )
     parser.add_argument("--plan-output", type=Path, default=ROOT / "data" / "output" / "plan_ejecucion_dw.sql")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenera todas las etapas aunque el manifiesto de build indique que no cambiaron.",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Tras generar, sigue sondeando data/raw/ciudades y data/raw/jerarquia y regenera solo las "
+        "etapas afectadas cuando cambia un archivo (Ctrl+C para salir).",
+    )
+    parser.add_argument(
+        "--watch-interval",
+        type=float,
+        default=DEFAULT_WATCH_INTERVAL,
+        help=f"Segundos entre sondeos con --watch (default {DEFAULT_WATCH_INTERVAL:g}).",
+    )
     return parser.parse_args(argv)
 
 
-def main(argv: list[str] | None = None) -> None:
-    args = _parse_args(argv)
+def _city_inputs(args: argparse.Namespace) -> list[Path]:
+    """Archivos de los que depende el catalogo de ciudades (los que existan localmente)."""
+    if args.source is not None:
+        sources = [Path(args.source)]
+    else:
+        from ciudades.parallel_catalog import ALL_COUNTRIES
+
+        names = [ALL_COUNTRIES] if args.all_countries else [code.upper() for code in args.code]
+        sources = []
+        for name in names:
+            txt, zipped = CITY_RAW_DIR / f"{name}.txt", CITY_RAW_DIR / f"{name}.zip"
+            # Un dump ausente se fuerza como entrada faltante: la etapa no puede estar al dia.
+            sources.append(txt if txt.exists() or not zipped.exists() else zipped)
+    return [*sources, CITY_RAW_DIR / "admin1CodesASCII.txt", *CITY_GENERATOR_FILES]
+
+
+def _call(pool: ProcessPoolExecutor | None, fn: Callable[..., T], **kwargs: object) -> T:
+    """Ejecuta fn en el pool de procesos de las etapas (o aqui mismo sin pool) y espera el resultado."""
+    if pool is None:
+        return fn(**kwargs)
+    return pool.submit(fn, **kwargs).result()
+
+
+def _run_city_stage(
+    args: argparse.Namespace, loader_dir: Path | None, cache: BuildCache, pool: ProcessPoolExecutor | None = None
+) -> dict[str, object] | None:
+    params = {
+        "code": args.code,
+        "all_countries": args.all_countries,
+        "insert_mode": args.insert_mode,
+        "batch_size": args.batch_size,
+        "loader": args.loader,
+        "delta": args.delta,
+        "city_store": args.city_store,
+    }
+    version = download_ecuador_cities.GENERATOR_VERSION
+    if cache.is_fresh("ciudades", _city_inputs(args), version, params):
+        print("Catalogo de ciudades sin cambios; se omite la regeneracion.")
+        return None
+
+    if args.all_countries or len(args.code) > 1:
+        from ciudades.parallel_catalog import generate_multi_catalog
+
+        # Ya reparte los paises en su propio pool de procesos: se llama desde el hilo de la etapa.
+        result = generate_multi_catalog(
+            codes=args.code,
+            all_countries=args.all_countries,
+            source=args.source,
+            insert_mode=args.insert_mode,
+            batch_size=args.batch_size,
+            loader_dir=loader_dir,
+            workers=args.workers,
+            store=args.city_store,
+        )
+    else:
+        result = _call(
+            pool,
+            generate_catalog,
+            code=args.code[0],
+            source=args.source,
+            insert_mode=args.insert_mode,
+            batch_size=args.batch_size,
+            loader_dir=loader_dir,
+            delta=args.delta,
+            store=args.city_store,
+        )
+
+    outputs = [Path(result["csv"]), Path(result["sql"])]
+    if args.delta:
+        outputs.append(Path(result["delta"]))
+    if args.city_store:
+        outputs.append(Path(result["store"]))
+    if loader_dir is not None:
+        outputs += [CITY_SQLLDR_SQL, loader_dir / "ciudad.ctl", loader_dir / "ciudad.dat"]
+    cache.record("ciudades", _city_inputs(args), outputs, version, params)
+    return result
+
+
+def _run_jerarquia_csv_stage(cache: BuildCache, pool: ProcessPoolExecutor | None = None) -> bool:
+    inputs = [
+        *(build_jerarquia_csv.SQL_DIR / f"{name}.sql" for name in ("provincias", "cantones", "parroquias")),
+        *JERARQUIA_CSV_GENERATOR_FILES,
+    ]
+    version = build_jerarquia_csv.GENERATOR_VERSION
+    if cache.is_fresh("jerarquia_csv", inputs, version):
+        print("CSV de jerarquia sin cambios; se omite la regeneracion.")
+        return False
+    _call(pool, build_geo_csv)
+    outputs = [build_jerarquia_csv.OUTPUT_DIR / f"{name}.csv" for name in ("provincias", "cantones", "parroquias")]
+    cache.record("jerarquia_csv", inputs, outputs, version)
+    return True
+
+
+def _run_jerarquia_sql_stage(
+    args: argparse.Namespace, loader_dir: Path | None, cache: BuildCache, pool: ProcessPoolExecutor | None = None
+) -> dict[str, object] | None:
+    source_dir = args.jerarquia_source or generate_jerarquia_inserts.DEFAULT_SOURCE_DIR
+    manual_sql = [
+        directory / filename
+        for filename in generate_jerarquia_inserts.MANUAL_SQL_FILES
+        for directory in generate_jerarquia_inserts.MANUAL_SQL_DIRS
+        if (directory / filename).exists()
+    ]
+    inputs = [
+        *(Path(source_dir) / f"{name}.csv" for name in ("provincias", "cantones", "parroquias")),
+        *manual_sql,
+        generate_jerarquia_inserts.ADMIN1_FILE,
+        *JERARQUIA_SQL_GENERATOR_FILES,
+    ]
+    params = {"insert_mode": args.insert_mode, "batch_size": args.batch_size, "loader": args.loader}
+    version = generate_jerarquia_inserts.GENERATOR_VERSION
+    if cache.is_fresh("jerarquia_sql", inputs, version, params):
+        print("SQL de jerarquia sin cambios; se omite la regeneracion.")
+        return None
+
+    result = _call(
+        pool,
+        generate_jerarquia_sql,
+        source=args.jerarquia_source,
+        insert_mode=args.insert_mode,
+        batch_size=args.batch_size,
+        loader_dir=loader_dir,
+    )
+    if result["status"] == "ok":
+        outputs = [Path(result["sql"])]
+        if result.get("sqlldr"):
+            outputs.append(Path(result["sqlldr"]))
+            outputs += [
+                loader_dir / f"{name}.{ext}"
+                for name in ("provincias", "cantones", "parroquias")
+                for ext in ("ctl", "dat")
+            ]
+        cache.record("jerarquia_sql", inputs, outputs, version, params)
+    return result
+
+
+def _run_link_stage(
+    args: argparse.Namespace, cache: BuildCache, pool: ProcessPoolExecutor | None = None
+) -> dict[str, object] | None:
+    """Enlaza CIUDAD con cantones/parroquias; solo aplica al catalogo de Ecuador."""
+    from ciudades import city_linker
 
-    city_result = None
-    if not args.skip_cities:
-        city_result = generate_catalog(code=args.code, source=args.source)
-    elif not CITY_INSERT_SQL.exists():
+    max_km = city_linker.DEFAULT_MAX_KM if args.link_max_km is None else args.link_max_km
+    jerarquia_dir = Path(args.jerarquia_source or generate_jerarquia_inserts.DEFAULT_SOURCE_DIR)
+    cities_csv = CITY_INSERT_SQL.with_name(f"ciudades_{COUNTRY_CODE.lower()}.csv")
+    applies = not args.all_countries and [code.upper() for code in args.code] == [COUNTRY_CODE]
+    inputs = [
+        *(_city_inputs(args)[:1] if applies else []),
+        cities_csv,
+        *(jerarquia_dir / f"{name}.csv" for name in ("provincias", "cantones", "parroquias")),
+        *CITY_LINK_GENERATOR_FILES,
+    ]
+    params = {
+        "applies": applies,
+        "insert_mode": args.insert_mode,
+        "batch_size": args.batch_size,
+        "max_km": max_km,
+    }
+    version = city_linker.GENERATOR_VERSION
+    if cache.is_fresh("ciudad_ubicacion", inputs, version, params):
+        print("Enlace ciudad -> canton/parroquia sin cambios; se omite la regeneracion.")
+        return None
+
+    if applies:
+        result = _call(
+            pool,
+            city_linker.generate_links,
+            cities_csv=cities_csv,
+            source=_city_inputs(args)[0],
+            jerarquia_source=args.jerarquia_source,
+            insert_mode=args.insert_mode,
+            batch_size=args.batch_size,
+            max_km=max_km,
+        )
+    else:
+        result = _call(
+            pool,
+            city_linker.clear_links,
+            output_dir=CITY_INSERT_SQL.parent,
+            insert_mode=args.insert_mode,
+            batch_size=args.batch_size,
+        )
+    cache.record("ciudad_ubicacion", inputs, [Path(result["csv"]), Path(result["sql"])], version, params)
+    return result
+
+
+def _check_city_outputs(args: argparse.Namespace, loader_dir: Path | None) -> None:
+    if args.delta and not CITY_DELTA_SQL.exists():
         raise FileNotFoundError(
-            f"No se encontro el archivo de insert de ciudades en {CITY_INSERT_SQL}. "
-            "Ejecuta sin --skip-cities o genera el archivo manualmente."
+            f"No se encontro el SQL incremental de ciudades en {CITY_DELTA_SQL}. "
+            "Ejecuta sin --skip-cities para generarlo."
+        )
+    if loader_dir is not None and not CITY_SQLLDR_SQL.exists():
+        raise FileNotFoundError(
+            f"No se encontro la carga SQL*Loader de ciudades en {CITY_SQLLDR_SQL}. "
+            "Ejecuta sin --skip-cities para generarla."
         )
 
-    if not args.skip_jerarquia_csv:
-        build_geo_csv()
 
-    jerarquia_result = generate_jerarquia_sql(args.jerarquia_source)
-    plan_file = build_plan_file(args.plan_output, SQL_SEQUENCE)
+def _check_jerarquia_outputs(loader_dir: Path | None) -> None:
+    if loader_dir is not None and not JERARQUIA_SQLLDR_SQL.exists():
+        raise FileNotFoundError(
+            f"No se encontro la carga SQL*Loader de la jerarquia en {JERARQUIA_SQLLDR_SQL}. "
+            "La carga direct-path requiere provincias.csv/cantones.csv/parroquias.csv."
+        )
 
-    print("Plan generado correctamente.")
+
+def _stage_tasks(
+    args: argparse.Namespace, loader_dir: Path | None, cache: BuildCache, pool: ProcessPoolExecutor | None
+) -> list[dag.Task]:
+    """
+    Etapas de Python y sus dependencias. Ciudades y jerarquia son independientes; el enlace
+    ciudad -> canton/parroquia lee el CSV de ciudades y los CSV de la jerarquia.
+    """
+    from comun import dag
+
+    def cities() -> dict[str, object] | None:
+        result = None if args.skip_cities else _run_city_stage(args, loader_dir, cache, pool)
+        _check_city_outputs(args, loader_dir)
+        return result
+
+    def jerarquia_csv() -> bool:
+        return False if args.skip_jerarquia_csv else _run_jerarquia_csv_stage(cache, pool)
+
+    def jerarquia_sql() -> dict[str, object] | None:
+        result = _run_jerarquia_sql_stage(args, loader_dir, cache, pool)
+        _check_jerarquia_outputs(loader_dir)
+        return result
+
+    return [
+        dag.Task("ciudades", (), cities),
+        dag.Task("jerarquia_csv", (), jerarquia_csv),
+        dag.Task("jerarquia_sql", ("jerarquia_csv",), jerarquia_sql),
+        dag.Task("ciudad_ubicacion", ("ciudades", "jerarquia_csv"), lambda: _run_link_stage(args, cache, pool)),
+    ]
+
+
+def _run_stages(
+    args: argparse.Namespace, loader_dir: Path | None, cache: BuildCache, pool: ProcessPoolExecutor | None
+) -> tuple[list[dag.Task], dict[str, dag.TaskResult]]:
+    """Ejecuta las etapas de Python segun sus dependencias y guarda el manifiesto de build."""
+    from comun import dag
+
+    stage_tasks = _stage_tasks(args, loader_dir, cache, pool)
+    try:
+        stages = dag.run_tasks(stage_tasks, workers=args.jobs)
+    finally:
+        cache.save()
+    return stage_tasks, stages
+
+
+def _write_plans(args: argparse.Namespace) -> tuple[Path, Path]:
+    plan_file = build_plan_file(
+        args.plan_output, SQL_SEQUENCE, loader=args.loader, city_delta=args.delta, etl_mode=args.etl_mode
+    )
+    session_manifest = build_session_plans(
+        args.plan_output, SQL_SEQUENCE, loader=args.loader, city_delta=args.delta, etl_mode=args.etl_mode
+    )
+    return plan_file, session_manifest
+
+
+def _describe_stages(args: argparse.Namespace, stage_tasks: list[dag.Task], stages: dict[str, dag.TaskResult]) -> None:
+    city_result = stages["ciudades"].value
+    jerarquia_result = stages["jerarquia_sql"].value
+    link_result = stages["ciudad_ubicacion"].value
+    from comun import dag
+
+    critical, path = dag.critical_path(stage_tasks, {name: result.segundos for name, result in stages.items()})
+    print(
+        f"Etapas de Python ({args.jobs} en paralelo): "
+        + ", ".join(f"{name}={result.segundos:.1f}s" for name, result in stages.items())
+        + f"; camino critico {critical:.1f}s ({' -> '.join(path)})"
+    )
     if city_result:
         print(
             f"Ciudades generadas: {city_result['total_ciudades']} "
@@ -129,8 +788,163 @@ def main(argv: list[str] | None = None) -> None:
                 "No se encontraron CSV de jerarquía. "
                 f"Se dejó el archivo {jerarquia_result['sql']} con instrucciones."
             )
+    if link_result:
+        if link_result["status"] == "ok":
+            metodos = ", ".join(f"{name}={count}" for name, count in sorted(link_result["metodos"].items()))
+            print(f"Ciudades enlazadas a canton/parroquia: {link_result['ciudades']} ({metodos})")
+        else:
+            print("Sin enlace ciudad -> canton/parroquia (requiere catalogo EC y jerarquia); CIUDAD_UBICACION quedara vacia.")
+
+
+def _watch_paths(args: argparse.Namespace) -> list[Path]:
+    """Directorios (y archivos sueltos) que sondea --watch: las entradas crudas de las etapas."""
+    paths = [CITY_RAW_DIR, Path(args.jerarquia_source or generate_jerarquia_inserts.DEFAULT_SOURCE_DIR)]
+    if args.source is not None:
+        paths.append(Path(args.source))
+    if not args.skip_jerarquia_csv:
+        paths.append(build_jerarquia_csv.SQL_DIR)
+    return paths
+
+
+def _snapshot(paths: list[Path]) -> dict[Path, tuple[int, int]]:
+    """(tamano, mtime_ns) de cada archivo bajo paths; sondear solo hace stat, no lee contenidos."""
+    stamps: dict[Path, tuple[int, int]] = {}
+    for path in paths:
+        files = sorted(child for child in path.rglob("*") if child.is_file()) if path.is_dir() else [path]
+        for file in files:
+            stamp = file_memo.file_stamp(file)
+            if stamp is not None:
+                stamps[file] = stamp
+    return stamps
+
+
+def _display(path: Path) -> str:
+    try:
+        return path.resolve().relative_to(ROOT).as_posix()
+    except ValueError:
+        return str(path)
+
+
+def watch(args: argparse.Namespace, loader_dir: Path | None, cache: BuildCache) -> None:
+    """
+    Sondea _watch_paths y, cuando cambian, vuelve a correr las etapas en este proceso; el manifiesto
+    de build decide cuales estan afectadas. Un archivo que se sigue copiando cambia entre sondeos:
+    se espera a que dos sondeos seguidos coincidan antes de regenerar.
+    """
+    paths = _watch_paths(args)
+    cache.force = False
+    seen = _snapshot(paths)
+    print(
+        f"Observando {', '.join(_display(path) for path in paths)} cada {args.watch_interval:g} s "
+        "(Ctrl+C para salir)."
+    )
+    while True:
+        time.sleep(args.watch_interval)
+        current = _snapshot(paths)
+        if current == seen:
+            continue
+        while True:
+            time.sleep(args.watch_interval)
+            settled = _snapshot(paths)
+            if settled == current:
+                break
+            current = settled
+        changed = sorted(path for path in current.keys() | seen.keys() if current.get(path) != seen.get(path))
+        print(f"Cambios: {', '.join(_display(path) for path in changed)}")
+        try:
+            stage_tasks, stages = _run_stages(args, loader_dir, cache, None)
+        except (FileNotFoundError, ValueError, OSError) as exc:
+            print(f"Regeneracion fallida: {exc}")
+        else:
+            ran = [name for name, result in stages.items() if result.value]
+            if ran:
+                plan_file, _ = _write_plans(args)
+                _describe_stages(args, stage_tasks, stages)
+                print(f"Regeneradas: {', '.join(ran)}. Plan SQL: {plan_file}")
+            else:
+                print("Ninguna etapa depende de los archivos modificados.")
+        # Incluye lo que escribieron las etapas (p.ej. los CSV de data/raw/jerarquia): no vuelve a disparar.
+        seen = _snapshot(paths)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = _parse_args(argv)
+    if args.delta and (args.all_countries or len(args.code) > 1):
+        raise SystemExit("--delta solo se admite con un unico codigo de pais.")
+    if args.delta and args.loader == "sqlldr":
+        raise SystemExit("--delta y --loader sqlldr son excluyentes: SQL*Loader recarga CIUDAD completa.")
+    if args.etl_mode == "incremental" and (args.delta or args.loader == "sqlldr"):
+        raise SystemExit("--delta y --loader sqlldr no aplican con --etl-mode incremental: el plan no recarga catalogos.")
+    if args.execute and args.loader == "sqlldr":
+        raise SystemExit("--execute no admite --loader sqlldr: el ejecutor carga los catalogos con executemany.")
+    if args.jobs < 1 or args.sessions < 1:
+        raise SystemExit("--jobs y --sessions deben ser positivos.")
+    if args.watch and args.execute:
+        raise SystemExit("--watch no admite --execute: el modo watch solo regenera los artefactos y el plan.")
+    if args.watch_interval <= 0:
+        raise SystemExit("--watch-interval debe ser positivo.")
+    loader_dir = SQLLDR_DIR if args.loader == "sqlldr" else None
+    cache = BuildCache(BUILD_MANIFEST, ROOT, force=args.force)
+    if args.skip_cities and not CITY_INSERT_SQL.exists():
+        raise FileNotFoundError(
+            f"No se encontro el archivo de insert de ciudades en {CITY_INSERT_SQL}. "
+            "Ejecuta sin --skip-cities o genera el archivo manualmente."
+        )
+
+    if args.watch:
+        # En proceso: los modulos y lo ya parseado (comun/file_memo.py) quedan en memoria para --watch.
+        pool = None
+    elif args.jobs > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        pool = ProcessPoolExecutor(max_workers=args.jobs)
+    else:
+        pool = None
+    try:
+        stage_tasks, stages = _run_stages(args, loader_dir, cache, pool)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    plan_file, session_manifest = _write_plans(args)
+
+    print("Plan generado correctamente.")
+    _describe_stages(args, stage_tasks, stages)
+    if args.etl_mode == "incremental":
+        print("Plan incremental: solo se cargan al DW las ordenes posteriores a la marca de agua de ETL_CONTROL.")
     print(f"Plan SQL: {plan_file}")
-    print("Ejecutar desde la raiz del repo: sqlplus usuario/clave@tns @data/output/plan_ejecucion_dw.sql")
+    print(f"Plan por sesiones: {session_manifest.parent}")
+    if not args.execute:
+        print("Ejecutar desde la raiz del repo: sqlplus usuario/clave@tns @data/output/plan_ejecucion_dw.sql")
+        print(
+            "o en sesiones paralelas: DW_USERID=usuario/clave@tns "
+            "python scripts/python/comun/session_runner.py --target sqlplus"
+        )
+        if args.watch:
+            try:
+                watch(args, loader_dir, cache)
+            except KeyboardInterrupt:
+                print("Modo watch detenido.")
+        return
+    from comun import plan_executor, run_report, session_runner
+
+    sqlite_db = args.sqlite_db or plan_executor.DEFAULT_SQLITE_DB
+    try:
+        if args.sessions > 1:
+            session_report = session_runner.run_sessions(
+                session_manifest, args.execute, sqlite_db=sqlite_db, sessions=args.sessions, root=ROOT
+            )
+            for line in session_runner.describe_sessions(session_report):
+                print(line)
+        else:
+            report = plan_executor.execute_plan(plan_file, args.execute, sqlite_db=sqlite_db, root=ROOT)
+            for line in plan_executor.describe_report(report):
+                print(line)
+    except (plan_executor.PlanExecutionError, session_runner.SessionError, ValueError) as exc:
+        raise SystemExit(f"Ejecucion detenida: {exc}") from exc
+    steps, regressions, outputs = run_report.build_report(plan_spool_path(plan_file))
+    for line in run_report.describe(steps, regressions):
+        print(line)
+    print(f"Reporte de tiempos: {outputs['json']}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,6 @@
+"""
+Pruebas de los modulos de scripts/python (unittest de la libreria estandar, sin dependencias extra).
+
+Uso (desde la raiz del repo):
+    python -m unittest discover -s scripts/python/tests -t scripts/python
+"""
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import unittest
+from pathlib import Path
+
+from dw import olap
+
+# Extractos sueltos (sin manifiesto). El hecho 9 apunta a una UbicacionID sin fila en la dimension y
+# el 10 a una TiempoID sin fila: solo quedan fuera de las consultas que usan esa dimension.
+FIXTURES = Path(__file__).resolve().parent / "fixtures" / "olap"
+
+
+@unittest.skipIf(olap.np is None, "requiere numpy")
+class SalesCubeTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.cube = olap.SalesCube.from_extracts(FIXTURES)
+
+    def test_loads_every_fact_row(self) -> None:
+        self.assertEqual(self.cube.rows, 10)
+
+    def test_top_n_per_group(self) -> None:
+        rows = self.cube.top(by=("provincia",), rank="producto", n=2)
+        self.assertEqual(
+            rows,
+            [
+                {"provincia": "GUAYAS", "producto": "Lampara", "cantidad": 50.0},
+                {"provincia": "GUAYAS", "producto": "Silla", "cantidad": 6.0},
+                {"provincia": "PICHINCHA", "producto": "Laptop", "cantidad": 5.0},
+                # Mouse y Silla suman 4 en PICHINCHA: el empate lo gana el valor menor.
+                {"provincia": "PICHINCHA", "producto": "Mouse", "cantidad": 4.0},
+            ],
+        )
+
+    def test_top_product_view_shape(self) -> None:
+        # Grupos en el orden de sus atributos: fecha, categoria, provincia, ciudad.
+        rows = self.cube.top(where={"fecha": "2024-02-10"})
+        self.assertEqual(
+            [(row["categoria"], row["ciudad"], row["producto"], row["cantidad"]) for row in rows],
+            [
+                ("ELECTRONICA", "Guayaquil", "Laptop", 1.0),
+                ("ELECTRONICA", "Cayambe", "Laptop", 2.0),
+                ("HOGAR", "Guayaquil", "Silla", 6.0),
+                ("HOGAR", "Quito", "Lampara", 1.0),
+            ],
+        )
+
+    def test_group_by_excludes_orphans_of_used_dimensions(self) -> None:
+        self.assertEqual(
+            self.cube.group(("anio", "mes")),
+            [{"anio": 2024, "mes": 1, "cantidad": 113.0}, {"anio": 2024, "mes": 2, "cantidad": 10.0}],
+        )
+        self.assertEqual(
+            self.cube.group(("anio", "mes"), where={"provincia": "PICHINCHA"}),
+            [{"anio": 2024, "mes": 1, "cantidad": 11.0}, {"anio": 2024, "mes": 2, "cantidad": 3.0}],
+        )
+        self.assertEqual(
+            self.cube.group(("categoria",), measure="monto"),
+            [{"categoria": "ELECTRONICA", "monto": 106120.0}, {"categoria": "HOGAR", "monto": 2530.0}],
+        )
+        self.assertEqual(self.cube.group(("provincia",), measure="lineas")[0], {"provincia": "GUAYAS", "lineas": 4})
+
+    def test_aggregation_cached_by_query_shape(self) -> None:
+        self.cube.top(by=("provincia",), n=1)
+        self.cube.top(by=("provincia",), n=3)
+        self.assertEqual((self.cube.hits, self.cube.misses), (1, 1))
+
+        # Mismos filtros en otro orden o como lista: misma forma.
+        self.cube.group(("anio",), where={"provincia": ["PICHINCHA", "GUAYAS"]})
+        self.cube.group(("anio",), where={"provincia": ("GUAYAS", "PICHINCHA")})
+        self.assertEqual((self.cube.hits, self.cube.misses), (2, 2))
+
+        self.cube.group(("anio",), measure="monto")
+        self.assertEqual(self.cube.cache_info()["misses"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
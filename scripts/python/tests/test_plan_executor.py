@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from comun.plan_executor import PlanExecutionError, PlanExecutor, SqliteDialect
+
+CATALOG = """\
+BEGIN
+  EXECUTE IMMEDIATE q'[CREATE TABLE CIUDAD (CIUDADID NUMBER, NOMBRE VARCHAR2(100), LATITUD NUMBER)]';
+EXCEPTION WHEN OTHERS THEN NULL;
+END;
+/
+DELETE FROM CIUDAD;
+INSERT INTO CIUDAD (CIUDADID, NOMBRE, LATITUD) VALUES (1, 'Quito', -0.22);
+INSERT INTO CIUDAD (CIUDADID, NOMBRE, LATITUD) VALUES (2, 'Puerto; Ayora', -0.74);
+INSERT INTO CIUDAD (CIUDADID, NOMBRE, LATITUD) VALUES (3, 'O''Higgins', NULL);
+INSERT INTO CIUDAD (CIUDADID, NOMBRE, LATITUD) VALUES (4, 'Loja', -3.99);
+INSERT INTO CIUDAD (CIUDADID, NOMBRE, LATITUD) VALUES (5, 'Tena', -0.99);
+MERGE INTO CIUDAD c USING DUAL ON (1 = 0) WHEN NOT MATCHED THEN INSERT (CIUDADID) VALUES (6);
+COMMIT;
+"""
+
+
+class PlanExecutorSqliteTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        (self.root / "sql").mkdir()
+        (self.root / "sql" / "catalogo.sql").write_text(CATALOG, encoding="utf-8")
+        self.connection = sqlite3.connect(":memory:")
+        self.output: list[str] = []
+
+    def tearDown(self) -> None:
+        self.connection.close()
+        self._tmp.cleanup()
+
+    def _run(self, plan: str, array_size: int = 2):
+        plan_path = self.root / "plan.sql"
+        plan_path.write_text(plan, encoding="utf-8")
+        executor = PlanExecutor(
+            self.connection, SqliteDialect(), root=self.root, array_size=array_size, echo=self.output.append
+        )
+        return executor.run(plan_path)
+
+    def _rows(self) -> list[tuple]:
+        return self.connection.execute("SELECT CIUDADID, NOMBRE, LATITUD FROM CIUDAD ORDER BY CIUDADID").fetchall()
+
+    def test_runs_plan_with_batched_inserts(self) -> None:
+        report = self._run("PROMPT Catalogos\n@sql/catalogo.sql\nSELECT COUNT(*) AS TOTAL FROM CIUDAD;\n")
+
+        self.assertEqual(
+            self._rows(),
+            [(1, "Quito", -0.22), (2, "Puerto; Ayora", -0.74), (3, "O'Higgins", None), (4, "Loja", -3.99), (5, "Tena", -0.99)],
+        )
+        # 5 INSERTs de una fila en lotes de 2: tres executemany.
+        self.assertEqual((report.batches, report.bound_rows), (3, 5))
+        self.assertEqual(report.skipped, 1)  # MERGE
+        self.assertEqual(report.scripts, 2)
+        self.assertEqual(self.output, ["Catalogos", "TOTAL", "5"])
+
+    def test_rerun_tolerates_existing_objects(self) -> None:
+        plan = "@sql/catalogo.sql\nCREATE TABLE T_EXTRA (ID INTEGER);\n"
+        self._run(plan)
+        report = self._run(plan)
+        self.assertEqual(report.existing, 1)
+        self.assertEqual(len(self._rows()), 5)
+
+    def test_stops_on_first_error_and_rolls_back(self) -> None:
+        plan = (
+            "@sql/catalogo.sql\n"
+            "DELETE FROM CIUDAD WHERE CIUDADID = 1;\n"
+            "INSERT INTO CIUDAD (CIUDADID, NOMBRE) VALUES (9, 'Ibarra');\n"
+            "UPDATE NO_EXISTE SET A = 1;\n"
+            "PROMPT no llega\n"
+        )
+        with self.assertRaises(PlanExecutionError) as caught:
+            self._run(plan)
+
+        self.assertIn("plan.sql:4", str(caught.exception))
+        self.assertNotIn("no llega", self.output)
+        # Lo confirmado por el COMMIT del catalogo queda; lo posterior se deshace.
+        self.assertEqual([row[0] for row in self._rows()], [1, 2, 3, 4, 5])
+
+    def test_failed_batch_reports_first_statement(self) -> None:
+        plan = (
+            "CREATE TABLE T (ID INTEGER PRIMARY KEY);\n"
+            "INSERT INTO T (ID) VALUES (1);\n"
+            "INSERT INTO T (ID) VALUES (1);\n"
+        )
+        with self.assertRaises(PlanExecutionError) as caught:
+            self._run(plan, array_size=10)
+        self.assertIn("plan.sql:2: lote de 2 filas en T", str(caught.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()
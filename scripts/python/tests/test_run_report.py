@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import unittest
+
+from comun.run_report import parse_spool_lines
+
+SPOOL = """\
+fuera de paso: 5 rows created.
+ETL_PASO|1|data/output/ciudades/insert_ciudad.sql
+9827 rows deleted.
+Elapsed: 00:00:00.40
+9827 rows created.
+Elapsed: 00:00:01.10
+ETL_PASO|2|scripts/sql/etl/load_dw_from_oltp.sql
+ETL_FILAS|DW_DIM_UBICACION|12|0.250
+3 filas suprimidas.
+120 filas fusionadas.
+Transcurrido: 00:00:02,50
+ETL_FIN
+7 rows updated.
+"""
+
+
+class ParseSpoolTest(unittest.TestCase):
+    def test_deleted_rows_are_reported_apart(self) -> None:
+        first, second = parse_spool_lines(SPOOL.splitlines())
+
+        self.assertEqual((first.paso, first.filas, first.borradas, first.segundos), (1, 9827, 9827, 1.5))
+        self.assertAlmostEqual(first.filas_por_segundo, 9827 / 1.5)
+        # ETL_FILAS y el feedback en espanol suman; lo que sigue a ETL_FIN no.
+        self.assertEqual((second.filas, second.borradas, second.segundos), (132, 3, 2.5))
+        self.assertEqual([(item.objeto, item.filas) for item in second.objetos], [("DW_DIM_UBICACION", 12)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import unittest
+
+from comun.sql_script import COMMAND, PLSQL, SQL, split_statements
+
+
+def _split(script: str) -> list[tuple[str, str]]:
+    return [(statement.kind, statement.text) for statement in split_statements(script.splitlines(keepends=True))]
+
+
+class SplitStatementsTest(unittest.TestCase):
+    def test_sql_terminates_on_semicolon_or_slash(self) -> None:
+        script = "SELECT 1 FROM DUAL;\nUPDATE T\n   SET A = 1\n/\n"
+        self.assertEqual(_split(script), [(SQL, "SELECT 1 FROM DUAL"), (SQL, "UPDATE T\n   SET A = 1")])
+
+    def test_several_statements_on_one_line(self) -> None:
+        self.assertEqual(_split("DELETE FROM A; DELETE FROM B;\n"), [(SQL, "DELETE FROM A"), (SQL, "DELETE FROM B")])
+
+    def test_semicolon_inside_quotes_and_comments(self) -> None:
+        script = (
+            "INSERT INTO T (A, B) VALUES ('x;y', 'it''s; here'); -- fin;\n"
+            "INSERT INTO T (A) VALUES (/* a;b */ 'z');\n"
+        )
+        self.assertEqual(
+            _split(script),
+            [
+                (SQL, "INSERT INTO T (A, B) VALUES ('x;y', 'it''s; here')"),
+                (SQL, "INSERT INTO T (A) VALUES (/* a;b */ 'z')"),
+            ],
+        )
+
+    def test_q_quote_literal_spanning_lines(self) -> None:
+        script = "INSERT INTO T (A) VALUES (q'[uno;\ndos]' || q'{'}');\nCOMMIT;\n"
+        self.assertEqual(
+            _split(script),
+            [(SQL, "INSERT INTO T (A) VALUES (q'[uno;\ndos]' || q'{'}')"), (SQL, "COMMIT")],
+        )
+
+    def test_plsql_block_ends_on_slash(self) -> None:
+        script = (
+            "BEGIN\n"
+            "  EXECUTE IMMEDIATE q'[CREATE TABLE X (ID NUMBER)]';\n"
+            "EXCEPTION WHEN OTHERS THEN NULL;\n"
+            "END;\n"
+            "/\n"
+            "/\n"
+            "CREATE OR REPLACE\n"
+            "FUNCTION F RETURN NUMBER IS BEGIN RETURN 1; END;\n"
+            "/\n"
+        )
+        statements = _split(script)
+        self.assertEqual([kind for kind, _ in statements], [PLSQL, PLSQL])
+        self.assertTrue(statements[0][1].startswith("BEGIN") and statements[0][1].endswith("END;"))
+        self.assertTrue(statements[1][1].endswith("RETURN 1; END;"))
+
+    def test_commands_and_line_numbers(self) -> None:
+        script = "SET TIMING ON\n/* cabecera\n   ; */\nPROMPT Cargando; datos\n@scripts/sql/a.sql\n\nSELECT 1\nFROM T;\n"
+        statements = list(split_statements(script.splitlines(keepends=True)))
+        self.assertEqual(
+            [(s.kind, s.keyword, s.line) for s in statements],
+            [(COMMAND, "SET", 1), (COMMAND, "PROMPT", 4), (COMMAND, "@", 5), (SQL, "SELECT", 7)],
+        )
+        self.assertEqual(statements[1].text, "PROMPT Cargando; datos")
+
+
+if __name__ == "__main__":
+    unittest.main()
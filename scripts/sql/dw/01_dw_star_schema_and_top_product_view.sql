@@ -2,6 +2,8 @@
 -- Dimensiones: Tiempo, Categoria, Producto, Ubicacion.
 -- Hecho: Fact_Ventas con medidas CantidadVendida y MontoTotal.
 -- La dimension ubicacion desagrega provincia y ciudad (con posibles enlaces a cantones/parroquias).
+-- VW_MAS_VENDIDO lee de los agregados: se define en dw/02_dw_aggregates.sql.
+-- Particionamiento e indices de claves del hecho: dw/03_dw_fact_storage.sql.
 
 CREATE TABLE DW_DIM_TIEMPO (
     TiempoID  NUMBER PRIMARY KEY,
@@ -14,7 +16,8 @@ CREATE TABLE DW_DIM_TIEMPO (
 
 CREATE TABLE DW_DIM_CATEGORIA (
     CategoriaID NUMBER PRIMARY KEY,
-    Nombre      VARCHAR2(100) NOT NULL
+    Nombre      VARCHAR2(100) NOT NULL,
+    NombreClave VARCHAR2(100)
 );
 
 CREATE TABLE DW_DIM_PRODUCTO (
@@ -46,47 +49,97 @@ CREATE TABLE DW_FACT_VENTAS (
     CategoriaID    NUMBER NOT NULL,
     CantidadVendida NUMBER,
     MontoTotal     NUMBER,
+    Fecha          DATE,
     FOREIGN KEY (ProductoID)  REFERENCES DW_DIM_PRODUCTO(ProductoID),
     FOREIGN KEY (TiempoID)    REFERENCES DW_DIM_TIEMPO(TiempoID),
     FOREIGN KEY (UbicacionID) REFERENCES DW_DIM_UBICACION(UbicacionID),
     FOREIGN KEY (CategoriaID) REFERENCES DW_DIM_CATEGORIA(CategoriaID)
 );
 
-CREATE SEQUENCE SEQ_DW_DIM_TIEMPO     START WITH 1 INCREMENT BY 1 NOCACHE NOCYCLE;
-CREATE SEQUENCE SEQ_DW_DIM_CATEGORIA  START WITH 1 INCREMENT BY 1 NOCACHE NOCYCLE;
-CREATE SEQUENCE SEQ_DW_DIM_PRODUCTO   START WITH 1 INCREMENT BY 1 NOCACHE NOCYCLE;
-CREATE SEQUENCE SEQ_DW_DIM_UBICACION  START WITH 1 INCREMENT BY 1 NOCACHE NOCYCLE;
-CREATE SEQUENCE SEQ_DW_FACT_VENTAS    START WITH 1 INCREMENT BY 1 NOCACHE NOCYCLE;
-
-CREATE OR REPLACE VIEW VW_MAS_VENDIDO AS
-SELECT
-    inner_q.fecha,
-    inner_q.anio,
-    inner_q.mes,
-    inner_q.categoria,
-    inner_q.provincia,
-    inner_q.ciudad,
-    inner_q.producto,
-    inner_q.total_vendido
-FROM (
-    SELECT
-        t.Fecha      AS fecha,
-        t.Anio       AS anio,
-        t.Mes        AS mes,
-        c.Nombre     AS categoria,
-        u.Provincia  AS provincia,
-        u.Ciudad     AS ciudad,
-        p.Descripcion AS producto,
-        SUM(f.CantidadVendida) AS total_vendido,
-        ROW_NUMBER() OVER (
-            PARTITION BY t.Fecha, c.Nombre, u.Provincia, u.Ciudad
-            ORDER BY SUM(f.CantidadVendida) DESC
-        ) AS rn
-    FROM DW_FACT_VENTAS f
-    JOIN DW_DIM_TIEMPO t    ON f.TiempoID = t.TiempoID
-    JOIN DW_DIM_PRODUCTO p  ON f.ProductoID = p.ProductoID
-    JOIN DW_DIM_CATEGORIA c ON f.CategoriaID = c.CategoriaID
-    JOIN DW_DIM_UBICACION u ON f.UbicacionID = u.UbicacionID
-    GROUP BY t.Fecha, t.Anio, t.Mes, c.Nombre, u.Provincia, u.Ciudad, p.Descripcion
-) inner_q
-WHERE inner_q.rn = 1;
+-- Staging de la carga de hechos: lineas de la ventana de ETL_CONTROL agregadas al grano del hecho
+-- (pedido x producto). load_dw_from_oltp.sql la vacia y la llena con INSERT APPEND en cada corrida.
+CREATE TABLE STG_DW_VENTAS (
+    PedidoID        NUMBER NOT NULL,
+    ProductoID      NUMBER NOT NULL,
+    Fecha           DATE NOT NULL,
+    CiudadID        NUMBER,
+    CantidadVendida NUMBER,
+    MontoTotal      NUMBER
+);
+
+-- Se recarga entera en cada corrida: sin redo.
+BEGIN
+    EXECUTE IMMEDIATE 'ALTER TABLE STG_DW_VENTAS NOLOGGING';
+END;
+/
+
+-- Marca de agua de la carga de hechos: hasta que ORDENID/FECHAORDEN llego la ultima carga correcta.
+-- ORDENID_HASTA fija el tope de la corrida en curso para que las ordenes que entren durante la carga
+-- queden para la siguiente.
+CREATE TABLE ETL_CONTROL (
+    Proceso          VARCHAR2(30) PRIMARY KEY,
+    UltimoOrdenID    NUMBER DEFAULT 0 NOT NULL,
+    UltimaFechaOrden DATE,
+    OrdenIDHasta     NUMBER,
+    Estado           VARCHAR2(20) DEFAULT 'PENDIENTE' NOT NULL,
+    Inicio           TIMESTAMP,
+    Fin              TIMESTAMP,
+    OrdenesCargadas  NUMBER
+);
+
+MERGE INTO ETL_CONTROL c
+USING (SELECT 'DW_VENTAS' AS Proceso FROM DUAL) s
+ON (c.Proceso = s.Proceso)
+WHEN NOT MATCHED THEN
+    INSERT (Proceso, UltimoOrdenID, Estado) VALUES (s.Proceso, 0, 'PENDIENTE');
+
+COMMIT;
+
+-- La verificacion de cierre de la carga incremental busca hechos por pedido.
+CREATE INDEX IX_DW_FACT_VENTAS_PEDIDO ON DW_FACT_VENTAS (PedidoID);
+
+-- CACHE segun el volumen por carga (cache_size en scripts/python/comun/sequences.py): los hechos
+-- piden un NEXTVAL por fila y con NOCACHE cada uno era una escritura en el diccionario.
+-- Para volumenes mayores: python scripts/python/comun/sequences.py --expect SEQ_DW_FACT_VENTAS=<filas>
+CREATE SEQUENCE SEQ_DW_DIM_TIEMPO     START WITH 1 INCREMENT BY 1 CACHE 20 NOCYCLE;
+CREATE SEQUENCE SEQ_DW_DIM_CATEGORIA  START WITH 1 INCREMENT BY 1 CACHE 20 NOCYCLE;
+CREATE SEQUENCE SEQ_DW_DIM_PRODUCTO   START WITH 1 INCREMENT BY 1 CACHE 20 NOCYCLE;
+CREATE SEQUENCE SEQ_DW_DIM_UBICACION  START WITH 1 INCREMENT BY 1 CACHE 100 NOCYCLE;
+CREATE SEQUENCE SEQ_DW_FACT_VENTAS    START WITH 1 INCREMENT BY 1 CACHE 1000 NOCYCLE;
+
+-- DW creado con las secuencias NOCACHE.
+ALTER SEQUENCE SEQ_DW_DIM_TIEMPO    CACHE 20;
+ALTER SEQUENCE SEQ_DW_DIM_CATEGORIA CACHE 20;
+ALTER SEQUENCE SEQ_DW_DIM_PRODUCTO  CACHE 20;
+ALTER SEQUENCE SEQ_DW_DIM_UBICACION CACHE 100;
+ALTER SEQUENCE SEQ_DW_FACT_VENTAS   CACHE 1000;
+
+-- Clave normalizada de un nombre: misma regla que normalize_key (scripts/python/comun/name_keys.py)
+-- salvo la reparacion de mojibake, innecesaria para textos que nacen en la base (categorias).
+CREATE OR REPLACE FUNCTION FN_CLAVE_NOMBRE(p_nombre IN VARCHAR2) RETURN VARCHAR2 DETERMINISTIC IS
+BEGIN
+    RETURN TRIM(REGEXP_REPLACE(
+        UPPER(TRANSLATE(p_nombre, 'áéíóúüñçÁÉÍÓÚÜÑÇàèìòùÀÈÌÒÙ', 'aeiouuncAEIOUUNCaeiouAEIOU')),
+        '[^A-Z0-9]+',
+        ' '
+    ));
+END;
+/
+
+-- DW creado antes de NombreClave: se agrega la columna y se completa para las filas existentes.
+DECLARE
+    v_exists NUMBER;
+BEGIN
+    SELECT COUNT(*) INTO v_exists
+    FROM USER_TAB_COLUMNS
+    WHERE TABLE_NAME = 'DW_DIM_CATEGORIA'
+      AND COLUMN_NAME = 'NOMBRECLAVE';
+    IF v_exists = 0 THEN
+        EXECUTE IMMEDIATE 'ALTER TABLE DW_DIM_CATEGORIA ADD (NombreClave VARCHAR2(100))';
+        EXECUTE IMMEDIATE 'UPDATE DW_DIM_CATEGORIA SET NombreClave = FN_CLAVE_NOMBRE(Nombre)';
+        COMMIT;
+    END IF;
+END;
+/
+
+CREATE UNIQUE INDEX UX_DW_DIM_CATEGORIA_CLAVE ON DW_DIM_CATEGORIA (NombreClave);
@@ -0,0 +1,104 @@
+-- Generado por scripts/python/dw/generate_dw_aggregates.py; editar GRAINS y regenerar.
+-- Agregados del DW mantenidos por etl/refresh_dw_aggregates.sql.
+
+-- dia x categoria x ciudad x producto
+CREATE TABLE AGG_VENTAS_DIA_PRODUCTO (
+    TiempoID        NUMBER NOT NULL,
+    CategoriaID     NUMBER NOT NULL,
+    UbicacionID     NUMBER NOT NULL,
+    ProductoID      NUMBER NOT NULL,
+    CantidadVendida NUMBER,
+    MontoTotal      NUMBER,
+    Lineas          NUMBER,
+    CONSTRAINT PK_AGG_VENTAS_DIA_PRODUCTO PRIMARY KEY (TiempoID, CategoriaID, UbicacionID, ProductoID)
+);
+
+-- dia x categoria x ciudad
+CREATE TABLE AGG_VENTAS_DIA_CIUDAD (
+    TiempoID        NUMBER NOT NULL,
+    CategoriaID     NUMBER NOT NULL,
+    UbicacionID     NUMBER NOT NULL,
+    CantidadVendida NUMBER,
+    MontoTotal      NUMBER,
+    Lineas          NUMBER,
+    CONSTRAINT PK_AGG_VENTAS_DIA_CIUDAD PRIMARY KEY (TiempoID, CategoriaID, UbicacionID)
+);
+
+-- mes x categoria x provincia
+CREATE TABLE AGG_VENTAS_MES_PROVINCIA (
+    Anio            NUMBER NOT NULL,
+    Mes             NUMBER NOT NULL,
+    CategoriaID     NUMBER NOT NULL,
+    Provincia       VARCHAR2(150) NOT NULL,
+    CantidadVendida NUMBER,
+    MontoTotal      NUMBER,
+    Lineas          NUMBER,
+    CONSTRAINT PK_AGG_VENTAS_MES_PROVINCIA PRIMARY KEY (Anio, Mes, CategoriaID, Provincia)
+);
+
+-- Claves anteriores de los hechos que la carga de hechos movio de grupo; el refresco recalcula
+-- esos grupos y borra las filas consumidas.
+CREATE TABLE STG_DW_CLAVES_ANTERIORES (
+    PedidoID    NUMBER NOT NULL,
+    TiempoID    NUMBER,
+    CategoriaID NUMBER,
+    UbicacionID NUMBER,
+    ProductoID  NUMBER
+);
+
+-- Atributos anteriores de las ubicaciones que la carga de DW_DIM_UBICACION cambio; el refresco
+-- recalcula los grupos de sus hechos y vacia la tabla.
+CREATE TABLE STG_DW_UBICACION_ANTERIOR (
+    UbicacionID NUMBER NOT NULL,
+    Provincia   VARCHAR2(150)
+);
+
+-- Marca de agua propia: hasta que PedidoID estan reflejados los hechos en los agregados.
+MERGE INTO ETL_CONTROL c
+USING (SELECT 'DW_AGREGADOS' AS Proceso FROM DUAL) s
+ON (c.Proceso = s.Proceso)
+WHEN NOT MATCHED THEN
+    INSERT (Proceso, UltimoOrdenID, Estado) VALUES (s.Proceso, 0, 'PENDIENTE');
+
+COMMIT;
+
+-- Producto mas vendido por fecha/categoria/provincia/ciudad, desde AGG_VENTAS_DIA_PRODUCTO.
+CREATE OR REPLACE VIEW VW_MAS_VENDIDO AS
+SELECT
+    inner_q.fecha,
+    inner_q.anio,
+    inner_q.mes,
+    inner_q.categoria,
+    inner_q.provincia,
+    inner_q.ciudad,
+    inner_q.producto,
+    inner_q.total_vendido
+FROM (
+    SELECT
+        t.Fecha      AS fecha,
+        t.Anio       AS anio,
+        t.Mes        AS mes,
+        c.Nombre     AS categoria,
+        u.Provincia  AS provincia,
+        u.Ciudad     AS ciudad,
+        p.Descripcion AS producto,
+        SUM(a.CantidadVendida) AS total_vendido,
+        ROW_NUMBER() OVER (
+            PARTITION BY t.Fecha, c.Nombre, u.Provincia, u.Ciudad
+            ORDER BY SUM(a.CantidadVendida) DESC
+        ) AS rn
+    FROM AGG_VENTAS_DIA_PRODUCTO a
+    JOIN DW_DIM_TIEMPO t    ON a.TiempoID = t.TiempoID
+    JOIN DW_DIM_PRODUCTO p  ON a.ProductoID = p.ProductoID
+    JOIN DW_DIM_CATEGORIA c ON a.CategoriaID = c.CategoriaID
+    JOIN DW_DIM_UBICACION u ON a.UbicacionID = u.UbicacionID
+    GROUP BY t.Fecha, t.Anio, t.Mes, c.Nombre, u.Provincia, u.Ciudad, p.Descripcion
+) inner_q
+WHERE inner_q.rn = 1;
+
+-- Ventas mensuales por provincia y categoria (reportes), desde AGG_VENTAS_MES_PROVINCIA.
+CREATE OR REPLACE VIEW VW_VENTAS_MES_PROVINCIA AS
+SELECT a.Anio AS anio, a.Mes AS mes, a.Provincia AS provincia, c.Nombre AS categoria,
+       a.CantidadVendida AS cantidad, a.MontoTotal AS monto, a.Lineas AS lineas
+FROM AGG_VENTAS_MES_PROVINCIA a
+JOIN DW_DIM_CATEGORIA c ON a.CategoriaID = c.CategoriaID;
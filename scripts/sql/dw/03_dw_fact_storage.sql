@@ -0,0 +1,85 @@
+-- Generado por scripts/python/dw/generate_dw_fact_storage.py; no editar a mano.
+-- Almacenamiento de DW_FACT_VENTAS: --partitioning none --indexes btree.
+
+-- DW creado antes de la columna Fecha: se agrega y se completa desde DW_DIM_TIEMPO.
+DECLARE
+    v_exists NUMBER;
+BEGIN
+    SELECT COUNT(*) INTO v_exists
+    FROM USER_TAB_COLUMNS
+    WHERE TABLE_NAME = 'DW_FACT_VENTAS'
+      AND COLUMN_NAME = 'FECHA';
+    IF v_exists = 0 THEN
+        EXECUTE IMMEDIATE 'ALTER TABLE DW_FACT_VENTAS ADD (Fecha DATE)';
+        EXECUTE IMMEDIATE 'UPDATE DW_FACT_VENTAS f
+            SET Fecha = (SELECT t.Fecha FROM DW_DIM_TIEMPO t WHERE t.TiempoID = f.TiempoID)';
+        COMMIT;
+    END IF;
+END;
+/
+
+-- Indices sobre las claves del hecho: se crean si faltan y se recrean si cambio su tipo
+-- (BITMAP/NORMAL) o su particionado (LOCAL).
+DECLARE
+    v_particionada VARCHAR2(3);
+    v_count        NUMBER;
+
+    PROCEDURE retirar(p_nombre IN VARCHAR2) IS
+        v_count NUMBER;
+    BEGIN
+        SELECT COUNT(*) INTO v_count FROM USER_INDEXES WHERE INDEX_NAME = p_nombre;
+        IF v_count > 0 THEN
+            EXECUTE IMMEDIATE 'DROP INDEX ' || p_nombre;
+        END IF;
+    END;
+
+    PROCEDURE asegurar(p_nombre IN VARCHAR2, p_tipo IN VARCHAR2, p_particionado IN VARCHAR2, p_ddl IN VARCHAR2) IS
+        v_tipo         USER_INDEXES.INDEX_TYPE%TYPE;
+        v_particionado USER_INDEXES.PARTITIONED%TYPE;
+    BEGIN
+        SELECT INDEX_TYPE, PARTITIONED INTO v_tipo, v_particionado
+        FROM USER_INDEXES
+        WHERE INDEX_NAME = p_nombre;
+        IF v_tipo != p_tipo OR v_particionado != p_particionado THEN
+            EXECUTE IMMEDIATE 'DROP INDEX ' || p_nombre;
+            EXECUTE IMMEDIATE p_ddl;
+        END IF;
+    EXCEPTION
+        WHEN NO_DATA_FOUND THEN
+            EXECUTE IMMEDIATE p_ddl;
+    END;
+BEGIN
+    retirar('BX_DW_FACT_VENTAS_TIEMPO');
+    retirar('BX_DW_FACT_VENTAS_PRODUCTO');
+    retirar('BX_DW_FACT_VENTAS_UBICACION');
+    retirar('BX_DW_FACT_VENTAS_CATEGORIA');
+    retirar('BX_DW_FACT_VENTAS_TIEMPO_X');
+    retirar('BX_DW_FACT_VENTAS_PRODUCTO_X');
+    retirar('BX_DW_FACT_VENTAS_UBICACION_X');
+    retirar('BX_DW_FACT_VENTAS_CATEGORIA_X');
+    retirar('IX_DW_FACT_VENTAS_TIEMPO');
+
+    SELECT CASE WHEN COUNT(*) > 0 THEN 'YES' ELSE 'NO' END INTO v_particionada
+    FROM USER_PART_TABLES WHERE TABLE_NAME = 'DW_FACT_VENTAS';
+    IF v_particionada = 'YES' THEN
+        asegurar('IX_DW_FACT_VENTAS_CLAVES', 'NORMAL', 'YES',
+                 'CREATE INDEX IX_DW_FACT_VENTAS_CLAVES ON DW_FACT_VENTAS (TiempoID, ProductoID, UbicacionID, CategoriaID) LOCAL');
+        -- La PK del hecho (FactID) es un indice global: la tabla de intercambio necesita la misma
+        -- restriccion o EXCHANGE PARTITION falla con ORA-14130.
+        SELECT COUNT(*) INTO v_count
+        FROM USER_CONSTRAINTS
+        WHERE TABLE_NAME = 'DW_FACT_VENTAS_INTERCAMBIO'
+          AND CONSTRAINT_TYPE = 'P';
+        IF v_count = 0 THEN
+            EXECUTE IMMEDIATE 'ALTER TABLE DW_FACT_VENTAS_INTERCAMBIO ADD CONSTRAINT PK_DW_FACT_VENTAS_INTERCAMBIO'
+                || ' PRIMARY KEY (FactID)';
+        END IF;
+        -- INCLUDING INDEXES exige en la tabla de intercambio los mismos indices, sin particionar.
+        asegurar('IX_DW_FACT_VENTAS_CLAVES_X', 'NORMAL', 'NO',
+                 'CREATE INDEX IX_DW_FACT_VENTAS_CLAVES_X ON DW_FACT_VENTAS_INTERCAMBIO (TiempoID, ProductoID, UbicacionID, CategoriaID)');
+    ELSE
+        asegurar('IX_DW_FACT_VENTAS_CLAVES', 'NORMAL', 'NO',
+                 'CREATE INDEX IX_DW_FACT_VENTAS_CLAVES ON DW_FACT_VENTAS (TiempoID, ProductoID, UbicacionID, CategoriaID)');
+    END IF;
+END;
+/
@@ -0,0 +1,103 @@
+-- Bitacora de ejecucion del plan: una fila por paso (script del plan) y una por cada MERGE
+-- instrumentado dentro de un paso (Objeto = tabla destino).
+-- build_plan_file (run_full_etl_pipeline.py) envuelve cada paso con ETL_PASO_INICIO/ETL_PASO_FIN;
+-- load_dw_from_oltp.sql registra las filas de cada MERGE con ETL_LOG_FILAS.
+-- Con --sessions varias sesiones abren pasos a la vez: cada una recuerda el suyo en ETL_SESION
+-- (estado de paquete, propio de la sesion) y ETL_LOG_FILAS lo usa para no anotar en el paso de otra.
+-- Cada procedimiento escribe ademas una linea ETL_* en DBMS_OUTPUT que comun/run_report.py lee del spool.
+
+CREATE TABLE ETL_RUN_LOG (
+    LogID    NUMBER PRIMARY KEY,
+    RunID    NUMBER NOT NULL,
+    Paso     NUMBER NOT NULL,
+    Script   VARCHAR2(200),
+    Objeto   VARCHAR2(60),
+    Inicio   TIMESTAMP NOT NULL,
+    Fin      TIMESTAMP,
+    Segundos NUMBER,
+    Filas    NUMBER
+);
+
+CREATE INDEX IX_ETL_RUN_LOG_RUN ON ETL_RUN_LOG (RunID, Paso);
+
+CREATE SEQUENCE SEQ_ETL_RUN     START WITH 1 INCREMENT BY 1 NOCACHE NOCYCLE;
+CREATE SEQUENCE SEQ_ETL_RUN_LOG START WITH 1 INCREMENT BY 1 NOCACHE NOCYCLE;
+
+-- Segundos entre dos TIMESTAMP.
+CREATE OR REPLACE FUNCTION FN_ETL_SEGUNDOS(p_inicio IN TIMESTAMP, p_fin IN TIMESTAMP) RETURN NUMBER DETERMINISTIC IS
+    v_intervalo INTERVAL DAY(9) TO SECOND(6) := p_fin - p_inicio;
+BEGIN
+    RETURN EXTRACT(DAY FROM v_intervalo) * 86400
+         + EXTRACT(HOUR FROM v_intervalo) * 3600
+         + EXTRACT(MINUTE FROM v_intervalo) * 60
+         + EXTRACT(SECOND FROM v_intervalo);
+END;
+/
+
+-- Abre una corrida nueva (paso 0); los demas procedimientos usan la ultima corrida abierta.
+CREATE OR REPLACE PROCEDURE ETL_RUN_INICIO(p_modo IN VARCHAR2) IS
+    v_run NUMBER := SEQ_ETL_RUN.NEXTVAL;
+BEGIN
+    INSERT INTO ETL_RUN_LOG (LogID, RunID, Paso, Script, Inicio)
+    VALUES (SEQ_ETL_RUN_LOG.NEXTVAL, v_run, 0, 'plan:' || p_modo, SYSTIMESTAMP);
+    COMMIT;
+    DBMS_OUTPUT.PUT_LINE('ETL_RUN|' || v_run || '|' || p_modo);
+END;
+/
+
+-- Paso abierto por la sesion actual (LogID de su fila en ETL_RUN_LOG); NULL fuera de un paso.
+CREATE OR REPLACE PACKAGE ETL_SESION AS
+    g_paso_log NUMBER;
+END ETL_SESION;
+/
+
+CREATE OR REPLACE PROCEDURE ETL_PASO_INICIO(p_paso IN NUMBER, p_script IN VARCHAR2) IS
+    v_log NUMBER := SEQ_ETL_RUN_LOG.NEXTVAL;
+BEGIN
+    INSERT INTO ETL_RUN_LOG (LogID, RunID, Paso, Script, Inicio)
+    SELECT v_log, MAX(RunID), p_paso, p_script, SYSTIMESTAMP FROM ETL_RUN_LOG;
+    COMMIT;
+    ETL_SESION.g_paso_log := v_log;
+END;
+/
+
+-- Filas y duracion de un MERGE/INSERT dentro del paso en curso de esta sesion (fuera de un paso solo
+-- escribe la linea de DBMS_OUTPUT).
+CREATE OR REPLACE PROCEDURE ETL_LOG_FILAS(p_objeto IN VARCHAR2, p_filas IN NUMBER, p_inicio IN TIMESTAMP) IS
+    v_fin      TIMESTAMP := SYSTIMESTAMP;
+    v_segundos NUMBER := FN_ETL_SEGUNDOS(p_inicio, v_fin);
+BEGIN
+    INSERT INTO ETL_RUN_LOG (LogID, RunID, Paso, Script, Objeto, Inicio, Fin, Segundos, Filas)
+    SELECT SEQ_ETL_RUN_LOG.NEXTVAL, l.RunID, l.Paso, l.Script, p_objeto, p_inicio, v_fin, v_segundos, p_filas
+    FROM ETL_RUN_LOG l
+    WHERE l.LogID = ETL_SESION.g_paso_log;
+    DBMS_OUTPUT.PUT_LINE('ETL_FILAS|' || p_objeto || '|' || p_filas || '|' || TO_CHAR(v_segundos, 'FM999999990.000'));
+END;
+/
+
+-- Cierra el paso: duracion y suma de las filas registradas con ETL_LOG_FILAS.
+CREATE OR REPLACE PROCEDURE ETL_PASO_FIN(p_paso IN NUMBER) IS
+BEGIN
+    UPDATE ETL_RUN_LOG l
+    SET Fin      = SYSTIMESTAMP,
+        Segundos = FN_ETL_SEGUNDOS(l.Inicio, SYSTIMESTAMP),
+        Filas    = (SELECT SUM(d.Filas) FROM ETL_RUN_LOG d
+                    WHERE d.RunID = l.RunID AND d.Paso = l.Paso AND d.Objeto IS NOT NULL)
+    WHERE l.RunID = (SELECT MAX(RunID) FROM ETL_RUN_LOG)
+      AND l.Paso = p_paso
+      AND l.Objeto IS NULL;
+    COMMIT;
+    ETL_SESION.g_paso_log := NULL;
+END;
+/
+
+CREATE OR REPLACE PROCEDURE ETL_RUN_FIN IS
+BEGIN
+    UPDATE ETL_RUN_LOG
+    SET Fin      = SYSTIMESTAMP,
+        Segundos = FN_ETL_SEGUNDOS(Inicio, SYSTIMESTAMP)
+    WHERE RunID = (SELECT MAX(RunID) FROM ETL_RUN_LOG)
+      AND Paso = 0;
+    COMMIT;
+END;
+/
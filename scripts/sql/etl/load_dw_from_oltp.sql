@@ -1,6 +1,14 @@
 -- Carga dimensional y de hechos desde el esquema transaccional hacia el DW.
 -- Supone que los objetos de DW ya fueron creados (ver dw/01_dw_star_schema_and_top_product_view.sql).
 -- Incluye fila "DESCONOCIDA" para casos sin ciudad asignada.
+-- Tiempo y hechos solo procesan las ordenes posteriores a la marca de agua de ETL_CONTROL
+-- (ORDENID > UltimoOrdenID); etl/reset_dw_watermark.sql la vuelve a 0 para una recarga completa.
+-- Las dimensiones de catalogo (categoria, producto, ubicacion) se sincronizan completas: su costo
+-- depende del tamano del catalogo, no del historial de ventas.
+-- Las lineas de la ventana se leen del OLTP una sola vez, hacia STG_DW_VENTAS (INSERT APPEND); tiempo
+-- y hechos salen de esa tabla. Las claves sustitutas se resuelven con hash joins contra las
+-- dimensiones, los hechos nuevos entran por direct-path y solo se actualizan las filas que cambiaron.
+-- Cada paso registra sus filas y duracion en ETL_RUN_LOG (ETL_LOG_FILAS, etl/00_create_etl_run_log.sql).
 
 -- Fila para ubicacion desconocida.
 DECLARE
@@ -15,130 +23,351 @@ BEGIN
 END;
 /
 
--- Dimension Tiempo.
-MERGE INTO DW_DIM_TIEMPO d
-USING (
-    SELECT DISTINCT
-        FECHAORDEN AS Fecha,
-        EXTRACT(YEAR FROM FECHAORDEN) AS Anio,
-        EXTRACT(MONTH FROM FECHAORDEN) AS Mes,
-        CEIL(EXTRACT(MONTH FROM FECHAORDEN) / 3) AS Trimestre,
-        TO_CHAR(FECHAORDEN, 'Day') AS DiaSemana
-    FROM ORDENES
-) s
-ON (d.Fecha = s.Fecha)
-WHEN NOT MATCHED THEN
-    INSERT (TiempoID, Fecha, Anio, Mes, Trimestre, DiaSemana)
-    VALUES (SEQ_DW_DIM_TIEMPO.NEXTVAL, s.Fecha, s.Anio, s.Mes, s.Trimestre, s.DiaSemana);
-
-COMMIT;
+-- Apertura: fija el tope de la ventana (ordenes que lleguen durante la carga quedan para la proxima).
+BEGIN
+    UPDATE ETL_CONTROL
+    SET OrdenIDHasta    = (SELECT NVL(MAX(ORDENID), 0) FROM ORDENES),
+        Estado          = 'EN_CURSO',
+        Inicio          = SYSTIMESTAMP,
+        Fin             = NULL,
+        OrdenesCargadas = NULL
+    WHERE Proceso = 'DW_VENTAS';
+    COMMIT;
+END;
+/
+
+-- Extraccion: lineas de las ordenes de la ventana (con fecha) agregadas por pedido y producto.
+DECLARE
+    v_inicio TIMESTAMP := SYSTIMESTAMP;
+BEGIN
+    EXECUTE IMMEDIATE 'TRUNCATE TABLE STG_DW_VENTAS';
+    INSERT /*+ APPEND */ INTO STG_DW_VENTAS (PedidoID, ProductoID, Fecha, CiudadID, CantidadVendida, MontoTotal)
+    SELECT
+        o.ORDENID,
+        d.PRODUCTOID,
+        o.FECHAORDEN,
+        cli.CIUDADID,
+        SUM(d.CANTIDAD),
+        SUM(d.CANTIDAD * d.PRECIOUNIT * (1 - NVL(o.DESCUENTO, 0) / 100))
+    FROM ORDENES o
+    JOIN ETL_CONTROL w ON w.Proceso = 'DW_VENTAS'
+    JOIN DETALLE_ORDENES d ON d.ORDENID = o.ORDENID
+    LEFT JOIN CLIENTES cli ON cli.CLIENTEID = o.CLIENTEID
+    WHERE o.ORDENID > w.UltimoOrdenID
+      AND o.ORDENID <= w.OrdenIDHasta
+      AND o.FECHAORDEN IS NOT NULL
+    GROUP BY o.ORDENID, d.PRODUCTOID, o.FECHAORDEN, cli.CIUDADID;
+    ETL_LOG_FILAS('STG_DW_VENTAS', SQL%ROWCOUNT, v_inicio);
+    COMMIT;
+END;
+/
+
+-- Dimension Tiempo (solo fechas de las ordenes de la ventana).
+DECLARE
+    v_inicio TIMESTAMP := SYSTIMESTAMP;
+BEGIN
+    MERGE INTO DW_DIM_TIEMPO d
+    USING (
+        SELECT DISTINCT
+            s.Fecha,
+            EXTRACT(YEAR FROM s.Fecha) AS Anio,
+            EXTRACT(MONTH FROM s.Fecha) AS Mes,
+            CEIL(EXTRACT(MONTH FROM s.Fecha) / 3) AS Trimestre,
+            TO_CHAR(s.Fecha, 'Day') AS DiaSemana
+        FROM STG_DW_VENTAS s
+    ) s
+    ON (d.Fecha = s.Fecha)
+    WHEN NOT MATCHED THEN
+        INSERT (TiempoID, Fecha, Anio, Mes, Trimestre, DiaSemana)
+        VALUES (SEQ_DW_DIM_TIEMPO.NEXTVAL, s.Fecha, s.Anio, s.Mes, s.Trimestre, s.DiaSemana);
+    ETL_LOG_FILAS('DW_DIM_TIEMPO', SQL%ROWCOUNT, v_inicio);
+    COMMIT;
+END;
+/
 
 -- Dimension Categoria (derivada de PRODUCTOS.CATEGORIA).
-MERGE INTO DW_DIM_CATEGORIA c
-USING (
-    SELECT DISTINCT NVL(TRIM(CATEGORIA), 'SIN CATEGORIA') AS Nombre
-    FROM PRODUCTOS
-) s
-ON (UPPER(c.Nombre) = UPPER(s.Nombre))
-WHEN NOT MATCHED THEN
-    INSERT (CategoriaID, Nombre)
-    VALUES (SEQ_DW_DIM_CATEGORIA.NEXTVAL, s.Nombre);
-
-COMMIT;
+-- La clave se calcula una vez por categoria distinta; el ON compara contra el indice de NombreClave.
+DECLARE
+    v_inicio TIMESTAMP := SYSTIMESTAMP;
+BEGIN
+    MERGE INTO DW_DIM_CATEGORIA c
+    USING (
+        SELECT NombreClave, MIN(Nombre) AS Nombre
+        FROM (
+            SELECT NVL(TRIM(CATEGORIA), 'SIN CATEGORIA') AS Nombre,
+                   FN_CLAVE_NOMBRE(NVL(TRIM(CATEGORIA), 'SIN CATEGORIA')) AS NombreClave
+            FROM PRODUCTOS
+        )
+        GROUP BY NombreClave
+    ) s
+    ON (c.NombreClave = s.NombreClave)
+    WHEN NOT MATCHED THEN
+        INSERT (CategoriaID, Nombre, NombreClave)
+        VALUES (SEQ_DW_DIM_CATEGORIA.NEXTVAL, s.Nombre, s.NombreClave);
+    ETL_LOG_FILAS('DW_DIM_CATEGORIA', SQL%ROWCOUNT, v_inicio);
+    COMMIT;
+END;
+/
 
 -- Dimension Producto (usa el mismo ProductoID del OLTP).
-MERGE INTO DW_DIM_PRODUCTO dp
-USING (
-    SELECT p.PRODUCTOID,
-           p.DESCRIPCION,
-           p.PRECIOUNIT,
-           NVL(TRIM(p.CATEGORIA), 'SIN CATEGORIA') AS CATEGORIA
-    FROM PRODUCTOS p
-) s
-ON (dp.ProductoID = s.PRODUCTOID)
-WHEN NOT MATCHED THEN
-    INSERT (ProductoID, CategoriaID, Descripcion, PrecioUnitario)
-    VALUES (
-        s.PRODUCTOID,
-        (SELECT CategoriaID FROM DW_DIM_CATEGORIA WHERE UPPER(Nombre) = UPPER(s.CATEGORIA)),
-        s.DESCRIPCION,
-        s.PRECIOUNIT
-    )
-WHEN MATCHED THEN UPDATE
-    SET dp.Descripcion   = s.DESCRIPCION,
-        dp.PrecioUnitario = s.PRECIOUNIT,
-        dp.CategoriaID   = (SELECT CategoriaID FROM DW_DIM_CATEGORIA WHERE UPPER(Nombre) = UPPER(s.CATEGORIA));
-
-COMMIT;
+DECLARE
+    v_inicio TIMESTAMP := SYSTIMESTAMP;
+BEGIN
+    MERGE INTO DW_DIM_PRODUCTO dp
+    USING (
+        SELECT p.PRODUCTOID,
+               p.DESCRIPCION,
+               p.PRECIOUNIT,
+               c.CategoriaID
+        FROM PRODUCTOS p
+        JOIN DW_DIM_CATEGORIA c ON c.NombreClave = FN_CLAVE_NOMBRE(NVL(TRIM(p.CATEGORIA), 'SIN CATEGORIA'))
+    ) s
+    ON (dp.ProductoID = s.PRODUCTOID)
+    WHEN NOT MATCHED THEN
+        INSERT (ProductoID, CategoriaID, Descripcion, PrecioUnitario)
+        VALUES (
+            s.PRODUCTOID,
+            s.CategoriaID,
+            s.DESCRIPCION,
+            s.PRECIOUNIT
+        )
+    WHEN MATCHED THEN UPDATE
+        SET dp.Descripcion   = s.DESCRIPCION,
+            dp.PrecioUnitario = s.PRECIOUNIT,
+            dp.CategoriaID   = s.CategoriaID
+        -- Solo productos que cambiaron (DECODE compara NULL = NULL como iguales).
+        WHERE DECODE(dp.Descripcion, s.DESCRIPCION, 0, 1) = 1
+           OR DECODE(dp.PrecioUnitario, s.PRECIOUNIT, 0, 1) = 1
+           OR DECODE(dp.CategoriaID, s.CategoriaID, 0, 1) = 1;
+    ETL_LOG_FILAS('DW_DIM_PRODUCTO', SQL%ROWCOUNT, v_inicio);
+    COMMIT;
+END;
+/
 
 -- Dimension Ubicacion (provincia + ciudad, con enlaces a jerarquia si existe).
-MERGE INTO DW_DIM_UBICACION u
-USING (
-    SELECT DISTINCT
-        c.CIUDADID,
-        c.NOMBRE AS Ciudad,
-        TRIM(c.PROVINCIA) AS Provincia,
-        p.PROVINCIAID,
-        NULL AS CANTONID,
-        NULL AS PARROQUIAID
-    FROM CIUDAD c
-    LEFT JOIN PROVINCIAS p ON UPPER(p.NOMBRE) = UPPER(TRIM(c.PROVINCIA))
-) s
-ON (u.CiudadID = s.CIUDADID)
-WHEN NOT MATCHED THEN
-    INSERT (UbicacionID, ProvinciaID, CantonID, ParroquiaID, CiudadID, Provincia, Canton, Parroquia, Ciudad)
-    VALUES (
-        SEQ_DW_DIM_UBICACION.NEXTVAL,
-        s.PROVINCIAID,
-        s.CANTONID,
-        s.PARROQUIAID,
-        s.CIUDADID,
-        s.Provincia,
-        NULL,
-        NULL,
-        s.Ciudad
+-- Canton y parroquia salen de CIUDAD_UBICACION (enlace espacial precalculado por city_linker.py).
+-- La provincia se une por PROVINCIA_CLAVE (precalculada), traducida por NOMBRE_ALIAS si es una variante.
+DECLARE
+    v_inicio TIMESTAMP := SYSTIMESTAMP;
+BEGIN
+    -- Provincias que el MERGE va a cambiar: refresh_dw_aggregates.sql recalcula los grupos de los hechos de
+    -- esas ubicaciones con la provincia anterior y con la nueva (la marca de agua no los alcanza).
+    INSERT INTO STG_DW_UBICACION_ANTERIOR (UbicacionID, Provincia)
+    SELECT u.UbicacionID, u.Provincia
+    FROM DW_DIM_UBICACION u
+    JOIN CIUDAD c ON c.CIUDADID = u.CiudadID
+    WHERE DECODE(u.Provincia, TRIM(c.PROVINCIA), 0, 1) = 1;
+
+    MERGE INTO DW_DIM_UBICACION u
+    USING (
+        SELECT DISTINCT
+            c.CIUDADID,
+            c.NOMBRE AS Ciudad,
+            TRIM(c.PROVINCIA) AS Provincia,
+            NVL(p.PROVINCIAID, ca.PROVINCIAID) AS PROVINCIAID,
+            cu.CANTONID,
+            cu.PARROQUIAID,
+            ca.NOMBRE AS Canton,
+            pa.NOMBRE AS Parroquia
+        FROM CIUDAD c
+        LEFT JOIN NOMBRE_ALIAS a ON a.TIPO = 'PROVINCIA' AND a.ALIAS_CLAVE = c.PROVINCIA_CLAVE
+        LEFT JOIN PROVINCIAS p ON p.NOMBRE_CLAVE = NVL(a.CLAVE, c.PROVINCIA_CLAVE)
+        LEFT JOIN CIUDAD_UBICACION cu ON cu.CIUDADID = c.CIUDADID
+        LEFT JOIN CANTONES ca ON ca.CANTONID = cu.CANTONID
+        LEFT JOIN PARROQUIAS pa ON pa.PARROQUIAID = cu.PARROQUIAID
+    ) s
+    ON (u.CiudadID = s.CIUDADID)
+    WHEN NOT MATCHED THEN
+        INSERT (UbicacionID, ProvinciaID, CantonID, ParroquiaID, CiudadID, Provincia, Canton, Parroquia, Ciudad)
+        VALUES (
+            SEQ_DW_DIM_UBICACION.NEXTVAL,
+            s.PROVINCIAID,
+            s.CANTONID,
+            s.PARROQUIAID,
+            s.CIUDADID,
+            s.Provincia,
+            s.Canton,
+            s.Parroquia,
+            s.Ciudad
+        )
+    WHEN MATCHED THEN UPDATE
+        SET u.ProvinciaID = s.PROVINCIAID,
+            u.CantonID    = s.CANTONID,
+            u.ParroquiaID = s.PARROQUIAID,
+            u.Provincia   = s.Provincia,
+            u.Canton      = s.Canton,
+            u.Parroquia   = s.Parroquia,
+            u.Ciudad      = s.Ciudad
+        WHERE DECODE(u.ProvinciaID, s.PROVINCIAID, 0, 1) = 1
+           OR DECODE(u.CantonID, s.CANTONID, 0, 1) = 1
+           OR DECODE(u.ParroquiaID, s.PARROQUIAID, 0, 1) = 1
+           OR DECODE(u.Provincia, s.Provincia, 0, 1) = 1
+           OR DECODE(u.Canton, s.Canton, 0, 1) = 1
+           OR DECODE(u.Parroquia, s.Parroquia, 0, 1) = 1
+           OR DECODE(u.Ciudad, s.Ciudad, 0, 1) = 1;
+    ETL_LOG_FILAS('DW_DIM_UBICACION', SQL%ROWCOUNT, v_inicio);
+    COMMIT;
+END;
+/
+
+-- Hecho de ventas: claves sustitutas de STG_DW_VENTAS resueltas con hash joins contra las dimensiones.
+-- Un hecho es un (PedidoID, ProductoID): los existentes se actualizan solo si algo cambio y los nuevos
+-- entran con INSERT APPEND (direct-path). La busqueda de hechos existentes se limita a la ventana.
+-- Con DW_FACT_VENTAS particionada (dw/03_dw_fact_storage.sql, --partitioning mensual) la carga es por
+-- intercambio de particiones en DW_CARGAR_HECHOS_PARTICION.
+DECLARE
+    v_inicio       TIMESTAMP := SYSTIMESTAMP;
+    v_particionada NUMBER;
+    v_desde        NUMBER;
+    v_hasta        NUMBER;
+    v_filas        NUMBER;
+BEGIN
+    SELECT COUNT(*) INTO v_particionada FROM USER_PART_TABLES WHERE TABLE_NAME = 'DW_FACT_VENTAS';
+    IF v_particionada > 0 THEN
+        EXECUTE IMMEDIATE 'BEGIN DW_CARGAR_HECHOS_PARTICION; END;';
+        RETURN;
+    END IF;
+
+    SELECT UltimoOrdenID, OrdenIDHasta INTO v_desde, v_hasta
+    FROM ETL_CONTROL
+    WHERE Proceso = 'DW_VENTAS';
+
+    -- Claves que el MERGE va a cambiar: refresh_dw_aggregates.sql recalcula tambien los grupos que dejan.
+    INSERT INTO STG_DW_CLAVES_ANTERIORES (PedidoID, TiempoID, CategoriaID, UbicacionID, ProductoID)
+    SELECT /*+ USE_HASH(t dp u e) */
+        e.PedidoID, e.TiempoID, e.CategoriaID, e.UbicacionID, e.ProductoID
+    FROM STG_DW_VENTAS s
+    JOIN DW_DIM_TIEMPO t ON t.Fecha = s.Fecha
+    JOIN DW_DIM_PRODUCTO dp ON dp.ProductoID = s.ProductoID
+    LEFT JOIN DW_DIM_UBICACION u ON u.CiudadID = s.CiudadID
+    JOIN DW_FACT_VENTAS e
+        ON e.PedidoID = s.PedidoID
+       AND e.ProductoID = s.ProductoID
+    WHERE e.PedidoID > v_desde
+      AND e.PedidoID <= v_hasta
+      AND (
+          DECODE(e.TiempoID, t.TiempoID, 0, 1) = 1
+          OR DECODE(e.UbicacionID, NVL(u.UbicacionID, 0), 0, 1) = 1
+          OR DECODE(e.CategoriaID, dp.CategoriaID, 0, 1) = 1
+      );
+
+    MERGE INTO DW_FACT_VENTAS f
+    USING (
+        SELECT /*+ USE_HASH(t dp u e) */
+            e.FactID,
+            t.TiempoID,
+            NVL(u.UbicacionID, 0) AS UbicacionID,
+            dp.CategoriaID,
+            s.CantidadVendida,
+            s.MontoTotal,
+            s.Fecha
+        FROM STG_DW_VENTAS s
+        JOIN DW_DIM_TIEMPO t ON t.Fecha = s.Fecha
+        JOIN DW_DIM_PRODUCTO dp ON dp.ProductoID = s.ProductoID
+        LEFT JOIN DW_DIM_UBICACION u ON u.CiudadID = s.CiudadID
+        JOIN DW_FACT_VENTAS e
+            ON e.PedidoID = s.PedidoID
+           AND e.ProductoID = s.ProductoID
+        WHERE e.PedidoID > v_desde
+          AND e.PedidoID <= v_hasta
+          AND (
+              DECODE(e.TiempoID, t.TiempoID, 0, 1) = 1
+              OR DECODE(e.UbicacionID, NVL(u.UbicacionID, 0), 0, 1) = 1
+              OR DECODE(e.CategoriaID, dp.CategoriaID, 0, 1) = 1
+              OR DECODE(e.CantidadVendida, s.CantidadVendida, 0, 1) = 1
+              OR DECODE(e.MontoTotal, s.MontoTotal, 0, 1) = 1
+              OR DECODE(e.Fecha, s.Fecha, 0, 1) = 1
+          )
+    ) c
+    ON (f.FactID = c.FactID)
+    WHEN MATCHED THEN UPDATE
+        SET f.TiempoID        = c.TiempoID,
+            f.UbicacionID     = c.UbicacionID,
+            f.CategoriaID     = c.CategoriaID,
+            f.CantidadVendida = c.CantidadVendida,
+            f.MontoTotal      = c.MontoTotal,
+            f.Fecha           = c.Fecha;
+    v_filas := SQL%ROWCOUNT;
+    -- Direct-path: la tabla no se puede volver a tocar en la misma transaccion (ORA-12838).
+    COMMIT;
+
+    INSERT /*+ APPEND */ INTO DW_FACT_VENTAS (
+        FactID, ProductoID, TiempoID, UbicacionID, PedidoID, CategoriaID, CantidadVendida, MontoTotal, Fecha
     )
-WHEN MATCHED THEN UPDATE
-    SET u.ProvinciaID = s.PROVINCIAID,
-        u.CantonID    = s.CANTONID,
-        u.ParroquiaID = s.PARROQUIAID,
-        u.Provincia   = s.Provincia,
-        u.Ciudad      = s.Ciudad;
-
-COMMIT;
-
--- Hecho de ventas: agrega ubicacion y categoria al hecho de pedidos.
-MERGE INTO DW_FACT_VENTAS f
-USING (
-    SELECT
-        d.PRODUCTOID,
-        o.ORDENID AS PedidoID,
-        t.TiempoID,
-        NVL(u.UbicacionID, 0) AS UbicacionID,
-        (SELECT CategoriaID FROM DW_DIM_CATEGORIA WHERE UPPER(Nombre) = UPPER(NVL(p.CATEGORIA, 'SIN CATEGORIA'))) AS CategoriaID,
-        SUM(d.CANTIDAD) AS CantidadVendida,
-        SUM(d.CANTIDAD * d.PRECIOUNIT * (1 - NVL(o.DESCUENTO, 0) / 100)) AS MontoTotal
-    FROM DETALLE_ORDENES d
-    JOIN ORDENES o ON d.ORDENID = o.ORDENID
-    JOIN PRODUCTOS p ON p.PRODUCTOID = d.PRODUCTOID
-    JOIN DW_DIM_TIEMPO t ON t.Fecha = o.FECHAORDEN
-    LEFT JOIN CLIENTES cli ON cli.CLIENTEID = o.CLIENTEID
-    LEFT JOIN CIUDAD c ON c.CIUDADID = cli.CIUDADID
-    LEFT JOIN DW_DIM_UBICACION u ON u.CiudadID = c.CIUDADID
-    GROUP BY d.PRODUCTOID, o.ORDENID, t.TiempoID, NVL(u.UbicacionID, 0), NVL(p.CATEGORIA, 'SIN CATEGORIA')
-) s
-ON (
-    f.ProductoID  = s.PRODUCTOID
-    AND f.PedidoID   = s.PedidoID
-    AND f.TiempoID   = s.TiempoID
-    AND f.UbicacionID = s.UbicacionID
-)
-WHEN NOT MATCHED THEN
-    INSERT (FactID, ProductoID, TiempoID, UbicacionID, PedidoID, CategoriaID, CantidadVendida, MontoTotal)
-    VALUES (SEQ_DW_FACT_VENTAS.NEXTVAL, s.PRODUCTOID, s.TiempoID, s.UbicacionID, s.PedidoID, s.CategoriaID, s.CantidadVendida, s.MontoTotal)
-WHEN MATCHED THEN UPDATE
-    SET f.CantidadVendida = s.CantidadVendida,
-        f.MontoTotal      = s.MontoTotal,
-        f.CategoriaID     = s.CategoriaID;
-
-COMMIT;
+    SELECT SEQ_DW_FACT_VENTAS.NEXTVAL, n.ProductoID, n.TiempoID, n.UbicacionID, n.PedidoID, n.CategoriaID,
+           n.CantidadVendida, n.MontoTotal, n.Fecha
+    FROM (
+        SELECT /*+ USE_HASH(t dp u e) */
+            s.ProductoID,
+            t.TiempoID,
+            NVL(u.UbicacionID, 0) AS UbicacionID,
+            s.PedidoID,
+            dp.CategoriaID,
+            s.CantidadVendida,
+            s.MontoTotal,
+            s.Fecha
+        FROM STG_DW_VENTAS s
+        JOIN DW_DIM_TIEMPO t ON t.Fecha = s.Fecha
+        JOIN DW_DIM_PRODUCTO dp ON dp.ProductoID = s.ProductoID
+        LEFT JOIN DW_DIM_UBICACION u ON u.CiudadID = s.CiudadID
+        LEFT JOIN (
+            SELECT PedidoID, ProductoID
+            FROM DW_FACT_VENTAS
+            WHERE PedidoID > v_desde
+              AND PedidoID <= v_hasta
+        ) e
+            ON e.PedidoID = s.PedidoID
+           AND e.ProductoID = s.ProductoID
+        WHERE e.PedidoID IS NULL
+    ) n;
+    ETL_LOG_FILAS('DW_FACT_VENTAS', v_filas + SQL%ROWCOUNT, v_inicio);
+    COMMIT;
+END;
+/
+
+-- Cierre: la marca de agua solo avanza si todas las ordenes de la ventana con fecha y detalle tienen hechos.
+-- Con WHENEVER SQLERROR CONTINUE este bloque corre aunque un MERGE anterior falle; en ese caso
+-- la corrida queda en ERROR y la siguiente vuelve a procesar la misma ventana (la carga es idempotente).
+DECLARE
+    v_desde     NUMBER;
+    v_hasta     NUMBER;
+    v_faltantes NUMBER;
+    v_ordenes   NUMBER;
+    v_fecha     DATE;
+BEGIN
+    SELECT UltimoOrdenID, OrdenIDHasta INTO v_desde, v_hasta
+    FROM ETL_CONTROL
+    WHERE Proceso = 'DW_VENTAS'
+    FOR UPDATE;
+
+    SELECT COUNT(*), MAX(o.FECHAORDEN),
+           COUNT(CASE WHEN NOT EXISTS (SELECT 1 FROM DW_FACT_VENTAS f WHERE f.PedidoID = o.ORDENID) THEN 1 END)
+    INTO v_ordenes, v_fecha, v_faltantes
+    FROM ORDENES o
+    WHERE o.ORDENID > v_desde
+      AND o.ORDENID <= v_hasta
+      AND o.FECHAORDEN IS NOT NULL
+      AND EXISTS (SELECT 1 FROM DETALLE_ORDENES d WHERE d.ORDENID = o.ORDENID);
+
+    IF v_faltantes = 0 THEN
+        UPDATE ETL_CONTROL
+        SET UltimoOrdenID    = GREATEST(v_desde, v_hasta),
+            UltimaFechaOrden = CASE
+                                   WHEN v_fecha IS NULL OR UltimaFechaOrden > v_fecha THEN UltimaFechaOrden
+                                   ELSE v_fecha
+                               END,
+            Estado           = 'OK',
+            Fin              = SYSTIMESTAMP,
+            OrdenesCargadas  = v_ordenes
+        WHERE Proceso = 'DW_VENTAS';
+    ELSE
+        UPDATE ETL_CONTROL
+        SET Estado          = 'ERROR',
+            Fin             = SYSTIMESTAMP,
+            OrdenesCargadas = v_ordenes - v_faltantes
+        WHERE Proceso = 'DW_VENTAS';
+        DBMS_OUTPUT.PUT_LINE(v_faltantes || ' ordenes de la ventana sin hechos; la marca de agua no avanza.');
+    END IF;
+    COMMIT;
+END;
+/
@@ -0,0 +1,261 @@
+-- Generado por scripts/python/dw/generate_dw_aggregates.py; editar GRAINS y regenerar.
+-- Refresco incremental de los agregados del DW: recalcula los grupos tocados por los hechos
+-- con PedidoID entre la marca de DW_AGREGADOS y la de DW_VENTAS (ETL_CONTROL)
+-- y los grupos que esos hechos dejaron al cambiar de claves (STG_DW_CLAVES_ANTERIORES) o de
+-- provincia al cambiar su ubicacion en la dimension (STG_DW_UBICACION_ANTERIOR).
+
+-- Apertura: el tope es lo que la carga de hechos ya confirmo.
+BEGIN
+    UPDATE ETL_CONTROL
+    SET OrdenIDHasta = (SELECT UltimoOrdenID FROM ETL_CONTROL WHERE Proceso = 'DW_VENTAS'),
+        Estado       = 'EN_CURSO',
+        Inicio       = SYSTIMESTAMP,
+        Fin          = NULL
+    WHERE Proceso = 'DW_AGREGADOS';
+    COMMIT;
+END;
+/
+
+-- AGG_VENTAS_DIA_PRODUCTO: dia x categoria x ciudad x producto
+DECLARE
+    v_inicio TIMESTAMP := SYSTIMESTAMP;
+BEGIN
+    DELETE FROM AGG_VENTAS_DIA_PRODUCTO a
+    WHERE (a.TiempoID, a.CategoriaID, a.UbicacionID, a.ProductoID) IN (
+        SELECT f.TiempoID, f.CategoriaID, f.UbicacionID, f.ProductoID
+        FROM DW_FACT_VENTAS f
+        JOIN DW_DIM_TIEMPO t ON t.TiempoID = f.TiempoID
+        LEFT JOIN DW_DIM_UBICACION u ON u.UbicacionID = f.UbicacionID
+        JOIN ETL_CONTROL w ON w.Proceso = 'DW_AGREGADOS'
+        WHERE f.PedidoID > w.UltimoOrdenID
+          AND f.PedidoID <= w.OrdenIDHasta
+        UNION
+        SELECT f.TiempoID, f.CategoriaID, f.UbicacionID, f.ProductoID
+        FROM STG_DW_CLAVES_ANTERIORES f
+        JOIN DW_DIM_TIEMPO t ON t.TiempoID = f.TiempoID
+        LEFT JOIN DW_DIM_UBICACION u ON u.UbicacionID = f.UbicacionID
+        JOIN ETL_CONTROL w ON w.Proceso = 'DW_AGREGADOS'
+        WHERE f.PedidoID <= w.OrdenIDHasta
+    );
+    INSERT INTO AGG_VENTAS_DIA_PRODUCTO (TiempoID, CategoriaID, UbicacionID, ProductoID, CantidadVendida, MontoTotal, Lineas)
+    SELECT
+        f.TiempoID,
+        f.CategoriaID,
+        f.UbicacionID,
+        f.ProductoID,
+        SUM(f.CantidadVendida),
+        SUM(f.MontoTotal),
+        COUNT(*)
+    FROM DW_FACT_VENTAS f
+    JOIN DW_DIM_TIEMPO t ON t.TiempoID = f.TiempoID
+    LEFT JOIN DW_DIM_UBICACION u ON u.UbicacionID = f.UbicacionID
+    WHERE (f.TiempoID, f.CategoriaID, f.UbicacionID, f.ProductoID) IN (
+        SELECT f.TiempoID, f.CategoriaID, f.UbicacionID, f.ProductoID
+        FROM DW_FACT_VENTAS f
+        JOIN DW_DIM_TIEMPO t ON t.TiempoID = f.TiempoID
+        LEFT JOIN DW_DIM_UBICACION u ON u.UbicacionID = f.UbicacionID
+        JOIN ETL_CONTROL w ON w.Proceso = 'DW_AGREGADOS'
+        WHERE f.PedidoID > w.UltimoOrdenID
+          AND f.PedidoID <= w.OrdenIDHasta
+        UNION
+        SELECT f.TiempoID, f.CategoriaID, f.UbicacionID, f.ProductoID
+        FROM STG_DW_CLAVES_ANTERIORES f
+        JOIN DW_DIM_TIEMPO t ON t.TiempoID = f.TiempoID
+        LEFT JOIN DW_DIM_UBICACION u ON u.UbicacionID = f.UbicacionID
+        JOIN ETL_CONTROL w ON w.Proceso = 'DW_AGREGADOS'
+        WHERE f.PedidoID <= w.OrdenIDHasta
+    )
+    GROUP BY f.TiempoID, f.CategoriaID, f.UbicacionID, f.ProductoID;
+    ETL_LOG_FILAS('AGG_VENTAS_DIA_PRODUCTO', SQL%ROWCOUNT, v_inicio);
+    COMMIT;
+EXCEPTION
+    WHEN OTHERS THEN
+        ROLLBACK;
+        UPDATE ETL_CONTROL SET Estado = 'ERROR', Fin = SYSTIMESTAMP WHERE Proceso = 'DW_AGREGADOS';
+        COMMIT;
+        RAISE;
+END;
+/
+
+-- AGG_VENTAS_DIA_CIUDAD: dia x categoria x ciudad
+DECLARE
+    v_inicio TIMESTAMP := SYSTIMESTAMP;
+BEGIN
+    DELETE FROM AGG_VENTAS_DIA_CIUDAD a
+    WHERE (a.TiempoID, a.CategoriaID, a.UbicacionID) IN (
+        SELECT f.TiempoID, f.CategoriaID, f.UbicacionID
+        FROM DW_FACT_VENTAS f
+        JOIN DW_DIM_TIEMPO t ON t.TiempoID = f.TiempoID
+        LEFT JOIN DW_DIM_UBICACION u ON u.UbicacionID = f.UbicacionID
+        JOIN ETL_CONTROL w ON w.Proceso = 'DW_AGREGADOS'
+        WHERE f.PedidoID > w.UltimoOrdenID
+          AND f.PedidoID <= w.OrdenIDHasta
+        UNION
+        SELECT f.TiempoID, f.CategoriaID, f.UbicacionID
+        FROM STG_DW_CLAVES_ANTERIORES f
+        JOIN DW_DIM_TIEMPO t ON t.TiempoID = f.TiempoID
+        LEFT JOIN DW_DIM_UBICACION u ON u.UbicacionID = f.UbicacionID
+        JOIN ETL_CONTROL w ON w.Proceso = 'DW_AGREGADOS'
+        WHERE f.PedidoID <= w.OrdenIDHasta
+    );
+    INSERT INTO AGG_VENTAS_DIA_CIUDAD (TiempoID, CategoriaID, UbicacionID, CantidadVendida, MontoTotal, Lineas)
+    SELECT
+        f.TiempoID,
+        f.CategoriaID,
+        f.UbicacionID,
+        SUM(f.CantidadVendida),
+        SUM(f.MontoTotal),
+        COUNT(*)
+    FROM DW_FACT_VENTAS f
+    JOIN DW_DIM_TIEMPO t ON t.TiempoID = f.TiempoID
+    LEFT JOIN DW_DIM_UBICACION u ON u.UbicacionID = f.UbicacionID
+    WHERE (f.TiempoID, f.CategoriaID, f.UbicacionID) IN (
+        SELECT f.TiempoID, f.CategoriaID, f.UbicacionID
+        FROM DW_FACT_VENTAS f
+        JOIN DW_DIM_TIEMPO t ON t.TiempoID = f.TiempoID
+        LEFT JOIN DW_DIM_UBICACION u ON u.UbicacionID = f.UbicacionID
+        JOIN ETL_CONTROL w ON w.Proceso = 'DW_AGREGADOS'
+        WHERE f.PedidoID > w.UltimoOrdenID
+          AND f.PedidoID <= w.OrdenIDHasta
+        UNION
+        SELECT f.TiempoID, f.CategoriaID, f.UbicacionID
+        FROM STG_DW_CLAVES_ANTERIORES f
+        JOIN DW_DIM_TIEMPO t ON t.TiempoID = f.TiempoID
+        LEFT JOIN DW_DIM_UBICACION u ON u.UbicacionID = f.UbicacionID
+        JOIN ETL_CONTROL w ON w.Proceso = 'DW_AGREGADOS'
+        WHERE f.PedidoID <= w.OrdenIDHasta
+    )
+    GROUP BY f.TiempoID, f.CategoriaID, f.UbicacionID;
+    ETL_LOG_FILAS('AGG_VENTAS_DIA_CIUDAD', SQL%ROWCOUNT, v_inicio);
+    COMMIT;
+EXCEPTION
+    WHEN OTHERS THEN
+        ROLLBACK;
+        UPDATE ETL_CONTROL SET Estado = 'ERROR', Fin = SYSTIMESTAMP WHERE Proceso = 'DW_AGREGADOS';
+        COMMIT;
+        RAISE;
+END;
+/
+
+-- AGG_VENTAS_MES_PROVINCIA: mes x categoria x provincia
+DECLARE
+    v_inicio TIMESTAMP := SYSTIMESTAMP;
+BEGIN
+    DELETE FROM AGG_VENTAS_MES_PROVINCIA a
+    WHERE (a.Anio, a.Mes, a.CategoriaID, a.Provincia) IN (
+        SELECT t.Anio, t.Mes, f.CategoriaID, NVL(u.Provincia, 'DESCONOCIDA')
+        FROM DW_FACT_VENTAS f
+        JOIN DW_DIM_TIEMPO t ON t.TiempoID = f.TiempoID
+        LEFT JOIN DW_DIM_UBICACION u ON u.UbicacionID = f.UbicacionID
+        JOIN ETL_CONTROL w ON w.Proceso = 'DW_AGREGADOS'
+        WHERE f.PedidoID > w.UltimoOrdenID
+          AND f.PedidoID <= w.OrdenIDHasta
+        UNION
+        SELECT t.Anio, t.Mes, f.CategoriaID, NVL(u.Provincia, 'DESCONOCIDA')
+        FROM STG_DW_CLAVES_ANTERIORES f
+        JOIN DW_DIM_TIEMPO t ON t.TiempoID = f.TiempoID
+        LEFT JOIN DW_DIM_UBICACION u ON u.UbicacionID = f.UbicacionID
+        JOIN ETL_CONTROL w ON w.Proceso = 'DW_AGREGADOS'
+        WHERE f.PedidoID <= w.OrdenIDHasta
+        UNION
+        SELECT t.Anio, t.Mes, f.CategoriaID, NVL(u.Provincia, 'DESCONOCIDA')
+        FROM DW_FACT_VENTAS f
+        JOIN DW_DIM_TIEMPO t ON t.TiempoID = f.TiempoID
+        LEFT JOIN DW_DIM_UBICACION u ON u.UbicacionID = f.UbicacionID
+        WHERE f.UbicacionID IN (SELECT UbicacionID FROM STG_DW_UBICACION_ANTERIOR)
+        UNION
+        SELECT t.Anio, t.Mes, f.CategoriaID, NVL(u.Provincia, 'DESCONOCIDA')
+        FROM DW_FACT_VENTAS f
+        JOIN DW_DIM_TIEMPO t ON t.TiempoID = f.TiempoID
+        JOIN STG_DW_UBICACION_ANTERIOR u ON u.UbicacionID = f.UbicacionID
+        UNION
+        SELECT t.Anio, t.Mes, f.CategoriaID, NVL(u.Provincia, 'DESCONOCIDA')
+        FROM STG_DW_CLAVES_ANTERIORES f
+        JOIN DW_DIM_TIEMPO t ON t.TiempoID = f.TiempoID
+        JOIN STG_DW_UBICACION_ANTERIOR u ON u.UbicacionID = f.UbicacionID
+        JOIN ETL_CONTROL w ON w.Proceso = 'DW_AGREGADOS'
+        WHERE f.PedidoID <= w.OrdenIDHasta
+    );
+    INSERT INTO AGG_VENTAS_MES_PROVINCIA (Anio, Mes, CategoriaID, Provincia, CantidadVendida, MontoTotal, Lineas)
+    SELECT
+        t.Anio,
+        t.Mes,
+        f.CategoriaID,
+        NVL(u.Provincia, 'DESCONOCIDA'),
+        SUM(f.CantidadVendida),
+        SUM(f.MontoTotal),
+        COUNT(*)
+    FROM DW_FACT_VENTAS f
+    JOIN DW_DIM_TIEMPO t ON t.TiempoID = f.TiempoID
+    LEFT JOIN DW_DIM_UBICACION u ON u.UbicacionID = f.UbicacionID
+    WHERE (t.Anio, t.Mes, f.CategoriaID, NVL(u.Provincia, 'DESCONOCIDA')) IN (
+        SELECT t.Anio, t.Mes, f.CategoriaID, NVL(u.Provincia, 'DESCONOCIDA')
+        FROM DW_FACT_VENTAS f
+        JOIN DW_DIM_TIEMPO t ON t.TiempoID = f.TiempoID
+        LEFT JOIN DW_DIM_UBICACION u ON u.UbicacionID = f.UbicacionID
+        JOIN ETL_CONTROL w ON w.Proceso = 'DW_AGREGADOS'
+        WHERE f.PedidoID > w.UltimoOrdenID
+          AND f.PedidoID <= w.OrdenIDHasta
+        UNION
+        SELECT t.Anio, t.Mes, f.CategoriaID, NVL(u.Provincia, 'DESCONOCIDA')
+        FROM STG_DW_CLAVES_ANTERIORES f
+        JOIN DW_DIM_TIEMPO t ON t.TiempoID = f.TiempoID
+        LEFT JOIN DW_DIM_UBICACION u ON u.UbicacionID = f.UbicacionID
+        JOIN ETL_CONTROL w ON w.Proceso = 'DW_AGREGADOS'
+        WHERE f.PedidoID <= w.OrdenIDHasta
+        UNION
+        SELECT t.Anio, t.Mes, f.CategoriaID, NVL(u.Provincia, 'DESCONOCIDA')
+        FROM DW_FACT_VENTAS f
+        JOIN DW_DIM_TIEMPO t ON t.TiempoID = f.TiempoID
+        LEFT JOIN DW_DIM_UBICACION u ON u.UbicacionID = f.UbicacionID
+        WHERE f.UbicacionID IN (SELECT UbicacionID FROM STG_DW_UBICACION_ANTERIOR)
+        UNION
+        SELECT t.Anio, t.Mes, f.CategoriaID, NVL(u.Provincia, 'DESCONOCIDA')
+        FROM DW_FACT_VENTAS f
+        JOIN DW_DIM_TIEMPO t ON t.TiempoID = f.TiempoID
+        JOIN STG_DW_UBICACION_ANTERIOR u ON u.UbicacionID = f.UbicacionID
+        UNION
+        SELECT t.Anio, t.Mes, f.CategoriaID, NVL(u.Provincia, 'DESCONOCIDA')
+        FROM STG_DW_CLAVES_ANTERIORES f
+        JOIN DW_DIM_TIEMPO t ON t.TiempoID = f.TiempoID
+        JOIN STG_DW_UBICACION_ANTERIOR u ON u.UbicacionID = f.UbicacionID
+        JOIN ETL_CONTROL w ON w.Proceso = 'DW_AGREGADOS'
+        WHERE f.PedidoID <= w.OrdenIDHasta
+    )
+    GROUP BY t.Anio, t.Mes, f.CategoriaID, NVL(u.Provincia, 'DESCONOCIDA');
+    ETL_LOG_FILAS('AGG_VENTAS_MES_PROVINCIA', SQL%ROWCOUNT, v_inicio);
+    COMMIT;
+EXCEPTION
+    WHEN OTHERS THEN
+        ROLLBACK;
+        UPDATE ETL_CONTROL SET Estado = 'ERROR', Fin = SYSTIMESTAMP WHERE Proceso = 'DW_AGREGADOS';
+        COMMIT;
+        RAISE;
+END;
+/
+
+-- Cierre: la marca avanza solo si ningun agregado fallo.
+BEGIN
+    DELETE FROM STG_DW_CLAVES_ANTERIORES
+    WHERE PedidoID <= (
+        SELECT OrdenIDHasta
+        FROM ETL_CONTROL
+        WHERE Proceso = 'DW_AGREGADOS'
+          AND Estado = 'EN_CURSO'
+    );
+    DELETE FROM STG_DW_UBICACION_ANTERIOR
+    WHERE EXISTS (
+        SELECT 1
+        FROM ETL_CONTROL
+        WHERE Proceso = 'DW_AGREGADOS'
+          AND Estado = 'EN_CURSO'
+    );
+    UPDATE ETL_CONTROL
+    SET UltimoOrdenID = GREATEST(UltimoOrdenID, NVL(OrdenIDHasta, 0)),
+        Estado        = 'OK',
+        Fin           = SYSTIMESTAMP
+    WHERE Proceso = 'DW_AGREGADOS'
+      AND Estado = 'EN_CURSO';
+    COMMIT;
+END;
+/
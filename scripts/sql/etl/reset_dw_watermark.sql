@@ -0,0 +1,26 @@
+-- Reinicia las marcas de agua de ETL_CONTROL para que load_dw_from_oltp.sql vuelva a procesar
+-- todas las ordenes y refresh_dw_aggregates.sql recalcule todos los agregados (recarga completa).
+-- El plan lo incluye con --etl-mode full, el default.
+
+UPDATE ETL_CONTROL
+SET UltimoOrdenID    = 0,
+    UltimaFechaOrden = NULL,
+    OrdenIDHasta     = NULL,
+    Estado           = 'REINICIADO'
+WHERE Proceso IN ('DW_VENTAS', 'DW_AGREGADOS');
+
+COMMIT;
+
+-- Los agregados se reconstruyen desde cero: un grupo que ya no tiene hechos no debe quedar en las
+-- vistas. Las tablas AGG_* las genera dw/generate_dw_aggregates.py.
+BEGIN
+    FOR r IN (
+        SELECT TABLE_NAME
+        FROM USER_TABLES
+        WHERE TABLE_NAME LIKE 'AGG\_%' ESCAPE '\'
+           OR TABLE_NAME IN ('STG_DW_CLAVES_ANTERIORES', 'STG_DW_UBICACION_ANTERIOR')
+    ) LOOP
+        EXECUTE IMMEDIATE 'TRUNCATE TABLE ' || r.TABLE_NAME;
+    END LOOP;
+END;
+/
@@ -76,3 +76,6 @@ END;
 /
 
 
+
+-- La carga incremental del DW recorre DETALLE_ORDENES por rango de ORDENID (ver etl/load_dw_from_oltp.sql).
+CREATE INDEX IX_DETALLE_ORDENES_ORDEN ON DETALLE_ORDENES (ORDENID);
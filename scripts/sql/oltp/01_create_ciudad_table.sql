@@ -1,6 +1,8 @@
 -- Crea tabla CIUDAD y objetos de soporte. Pensada para Oracle.
 -- Ejecutar con privilegios sobre el esquema transaccional (donde viven CLIENTES).
 -- Estructura simple para almacenar nombre/provincia y coordenadas de referencia.
+-- NOMBRE_CLAVE/PROVINCIA_CLAVE las llena el generador (normalize_key) para joins indexados.
+-- POBLACION viene de GeoNames; 03_assign_random_city_to_clients.sql la usa como peso.
 
 CREATE TABLE CIUDAD (
     CIUDADID     NUMBER(10)    PRIMARY KEY,
@@ -8,13 +10,40 @@ CREATE TABLE CIUDAD (
     PROVINCIA    VARCHAR2(150),
     LATITUD      NUMBER(9,6),
     LONGITUD     NUMBER(9,6),
-    ZONA_HORARIA VARCHAR2(50)
+    ZONA_HORARIA VARCHAR2(50),
+    NOMBRE_CLAVE    VARCHAR2(150),
+    PROVINCIA_CLAVE VARCHAR2(150),
+    POBLACION       NUMBER(12)
 );
 
+-- Esquemas creados antes de las columnas de clave o de POBLACION: se agregan si faltan.
+DECLARE
+    PROCEDURE add_column(p_column IN VARCHAR2, p_definition IN VARCHAR2) IS
+        v_exists NUMBER;
+    BEGIN
+        SELECT COUNT(*) INTO v_exists
+        FROM USER_TAB_COLUMNS
+        WHERE TABLE_NAME = 'CIUDAD'
+          AND COLUMN_NAME = p_column;
+        IF v_exists = 0 THEN
+            EXECUTE IMMEDIATE 'ALTER TABLE CIUDAD ADD (' || p_column || ' ' || p_definition || ')';
+        END IF;
+    END;
+BEGIN
+    add_column('NOMBRE_CLAVE', 'VARCHAR2(150)');
+    add_column('PROVINCIA_CLAVE', 'VARCHAR2(150)');
+    add_column('POBLACION', 'NUMBER(12)');
+END;
+/
+
+CREATE INDEX IX_CIUDAD_PROVINCIA_CLAVE ON CIUDAD (PROVINCIA_CLAVE);
+CREATE INDEX IX_CIUDAD_NOMBRE_CLAVE ON CIUDAD (NOMBRE_CLAVE);
+
+-- insert_ciudad.sql realinea la secuencia tras cargar CIUDADID explicitos (comun/sequences.py).
 CREATE SEQUENCE SEQ_CIUDAD
     START WITH 1
     INCREMENT BY 1
-    NOCACHE
+    CACHE 20
     NOCYCLE;
 
 CREATE OR REPLACE TRIGGER TRG_CIUDAD_BI
@@ -1,23 +1,53 @@
--- Asigna una ciudad aleatoria a cada cliente que no tenga CIUDADID.
--- Usa una lista en memoria para minimizar lecturas repetitivas sobre CIUDAD.
+-- Asigna una ciudad aleatoria, ponderada por poblacion, a cada cliente que no tenga CIUDADID.
+-- Un solo MERGE basado en conjuntos (sin un UPDATE por cliente):
+--  - cada ciudad ocupa el tramo [DESDE, DESDE + PESO) del acumulado de pesos en orden de CIUDADID,
+--    con PESO = POBLACION + 1 para que las localidades sin poblacion registrada no queden fuera
+--    (el mismo peso que usa oltp/generate_synthetic_oltp.py);
+--  - cada cliente cae en el punto ORA_HASH(CLIENTEID, 4294967295, semilla) / 2^32 * total de pesos:
+--    con la misma semilla y los mismos datos la asignacion se repite; otra semilla da otra;
+--  - los inicios de tramo y los puntos se ordenan juntos y cada punto toma la ultima ciudad vista
+--    (LAST_VALUE ... IGNORE NULLS): un solo sort, sin join por rango contra CIUDAD.
 DECLARE
-    TYPE t_city_ids IS TABLE OF CIUDAD.CIUDADID%TYPE;
-    l_city_ids t_city_ids;
-    v_random_city CIUDAD.CIUDADID%TYPE;
+    c_semilla CONSTANT NUMBER := 20240101; -- cambiar para obtener otra asignacion reproducible
+    v_inicio  TIMESTAMP := SYSTIMESTAMP;
+    v_total   NUMBER;
 BEGIN
-    SELECT CIUDADID BULK COLLECT INTO l_city_ids FROM CIUDAD;
+    SELECT SUM(GREATEST(NVL(POBLACION, 0), 0) + 1) INTO v_total FROM CIUDAD;
 
-    IF l_city_ids.COUNT = 0 THEN
+    IF v_total IS NULL THEN
         RAISE_APPLICATION_ERROR(-20001, 'No hay ciudades cargadas en la tabla CIUDAD.');
     END IF;
 
-    FOR rec IN (SELECT CLIENTEID FROM CLIENTES WHERE CIUDADID IS NULL) LOOP
-        v_random_city := l_city_ids(TRUNC(DBMS_RANDOM.VALUE(1, l_city_ids.COUNT + 1)));
-        UPDATE CLIENTES
-        SET CIUDADID = v_random_city
-        WHERE CLIENTEID = rec.CLIENTEID;
-    END LOOP;
+    MERGE INTO CLIENTES c
+    USING (
+        SELECT CLIENTEID, CIUDADID
+        FROM (
+            SELECT p.CLIENTEID,
+                   LAST_VALUE(p.CIUDADID IGNORE NULLS) OVER (
+                       ORDER BY p.PUNTO, p.ORDEN ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW
+                   ) AS CIUDADID
+            FROM (
+                SELECT CIUDADID,
+                       CAST(NULL AS NUMBER) AS CLIENTEID,
+                       SUM(GREATEST(NVL(POBLACION, 0), 0) + 1) OVER (ORDER BY CIUDADID)
+                           - (GREATEST(NVL(POBLACION, 0), 0) + 1) AS PUNTO,
+                       0 AS ORDEN
+                FROM CIUDAD
+                UNION ALL
+                SELECT CAST(NULL AS NUMBER),
+                       CLIENTEID,
+                       ORA_HASH(CLIENTEID, 4294967295, c_semilla) / 4294967296 * v_total,
+                       1
+                FROM CLIENTES
+                WHERE CIUDADID IS NULL
+            ) p
+        )
+        WHERE CLIENTEID IS NOT NULL
+    ) a
+    ON (c.CLIENTEID = a.CLIENTEID)
+    WHEN MATCHED THEN UPDATE SET c.CIUDADID = a.CIUDADID;
 
+    ETL_LOG_FILAS('CLIENTES', SQL%ROWCOUNT, v_inicio);
     COMMIT;
 END;
 /
@@ -1,11 +1,14 @@
 -- Esquema geografico de Ecuador basado en el listado del censo 2016.
 -- Crea PROVINCIAS, CANTONES y PARROQUIAS con claves surrogate y llaves foraneas.
 -- Se separa codigo/nombre para facilitar futuras cargas via CSV/SQL*Loader.
+-- NOMBRE_CLAVE (normalize_key: sin tildes ni mojibake, en mayusculas) permite joins indexados;
+-- NOMBRE_ALIAS traduce variantes de otras fuentes (p.ej. "TUNGURAHUA PROVINCE") a esa clave.
 
 CREATE TABLE PROVINCIAS (
     PROVINCIAID NUMBER(10)    PRIMARY KEY,
     CODIGO      VARCHAR2(10),
     NOMBRE      VARCHAR2(150) NOT NULL,
+    NOMBRE_CLAVE VARCHAR2(150),
     CONSTRAINT UK_PROVINCIAS_CODIGO UNIQUE (CODIGO)
 );
 
@@ -14,6 +17,7 @@ CREATE TABLE CANTONES (
     PROVINCIAID NUMBER(10)    NOT NULL,
     CODIGO      VARCHAR2(10),
     NOMBRE      VARCHAR2(150) NOT NULL,
+    NOMBRE_CLAVE VARCHAR2(150),
     CONSTRAINT FK_CANTON_PROVINCIA FOREIGN KEY (PROVINCIAID) REFERENCES PROVINCIAS(PROVINCIAID),
     CONSTRAINT UK_CANTONES_CODIGO UNIQUE (CODIGO)
 );
@@ -24,13 +28,46 @@ CREATE TABLE PARROQUIAS (
     CODIGO      VARCHAR2(15),
     NOMBRE      VARCHAR2(150) NOT NULL,
     TIPO        VARCHAR2(20),
+    NOMBRE_CLAVE VARCHAR2(150),
     CONSTRAINT FK_PARROQUIA_CANTON FOREIGN KEY (CANTONID) REFERENCES CANTONES(CANTONID),
     CONSTRAINT UK_PARROQUIAS_CODIGO UNIQUE (CODIGO)
 );
 
-CREATE SEQUENCE SEQ_PROVINCIA START WITH 1 INCREMENT BY 1 NOCACHE NOCYCLE;
-CREATE SEQUENCE SEQ_CANTON    START WITH 1 INCREMENT BY 1 NOCACHE NOCYCLE;
-CREATE SEQUENCE SEQ_PARROQUIA START WITH 1 INCREMENT BY 1 NOCACHE NOCYCLE;
+CREATE TABLE NOMBRE_ALIAS (
+    TIPO        VARCHAR2(20)  NOT NULL,
+    ALIAS_CLAVE VARCHAR2(150) NOT NULL,
+    CLAVE       VARCHAR2(150) NOT NULL,
+    CONSTRAINT PK_NOMBRE_ALIAS PRIMARY KEY (TIPO, ALIAS_CLAVE)
+);
+
+-- Esquemas creados antes de las columnas de clave: se agregan si faltan.
+DECLARE
+    PROCEDURE add_key_column(p_table IN VARCHAR2) IS
+        v_exists NUMBER;
+    BEGIN
+        SELECT COUNT(*) INTO v_exists
+        FROM USER_TAB_COLUMNS
+        WHERE TABLE_NAME = p_table
+          AND COLUMN_NAME = 'NOMBRE_CLAVE';
+        IF v_exists = 0 THEN
+            EXECUTE IMMEDIATE 'ALTER TABLE ' || p_table || ' ADD (NOMBRE_CLAVE VARCHAR2(150))';
+        END IF;
+    END;
+BEGIN
+    add_key_column('PROVINCIAS');
+    add_key_column('CANTONES');
+    add_key_column('PARROQUIAS');
+END;
+/
+
+CREATE INDEX IX_PROVINCIAS_NOMBRE_CLAVE ON PROVINCIAS (NOMBRE_CLAVE);
+CREATE INDEX IX_CANTONES_NOMBRE_CLAVE ON CANTONES (NOMBRE_CLAVE);
+CREATE INDEX IX_PARROQUIAS_NOMBRE_CLAVE ON PARROQUIAS (NOMBRE_CLAVE);
+
+-- El CACHE definitivo lo fija insert_jerarquia.sql al realinear (comun/sequences.py).
+CREATE SEQUENCE SEQ_PROVINCIA START WITH 1 INCREMENT BY 1 CACHE 20 NOCYCLE;
+CREATE SEQUENCE SEQ_CANTON    START WITH 1 INCREMENT BY 1 CACHE 20 NOCYCLE;
+CREATE SEQUENCE SEQ_PARROQUIA START WITH 1 INCREMENT BY 1 CACHE 20 NOCYCLE;
 
 CREATE OR REPLACE TRIGGER TRG_PROVINCIA_BI
 BEFORE INSERT ON PROVINCIAS
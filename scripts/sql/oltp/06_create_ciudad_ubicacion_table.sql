@@ -0,0 +1,14 @@
+-- Enlace precalculado CIUDAD -> CANTONES/PARROQUIAS (generado por scripts/python/ciudades/city_linker.py).
+-- La carga del DW lo une por CIUDADID: no hace falta comparar nombres al consultar por canton/parroquia.
+-- Sin llaves foraneas: CIUDAD y la jerarquia se recargan con DELETE + INSERT en cada plan.
+
+CREATE TABLE CIUDAD_UBICACION (
+    CIUDADID     NUMBER(10)   PRIMARY KEY,
+    CANTONID     NUMBER(10),
+    PARROQUIAID  NUMBER(10),
+    DISTANCIA_KM NUMBER(8,3),
+    METODO       VARCHAR2(20)
+);
+
+CREATE INDEX IX_CIUDAD_UBICACION_CANTON ON CIUDAD_UBICACION (CANTONID);
+CREATE INDEX IX_CIUDAD_UBICACION_PARROQUIA ON CIUDAD_UBICACION (PARROQUIAID);